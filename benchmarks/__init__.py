@@ -0,0 +1,11 @@
+"""Benchmark suite for optopsy's hot paths.
+
+Runs every strategy family, calendar spreads, early exits, simulations,
+signals and result storage against a deterministic synthetic option chain
+(see ``synthetic``), reporting median wall time and peak memory per case::
+
+    python -m benchmarks                          # all cases, small chain
+    python -m benchmarks exits simulate --size medium
+    python -m benchmarks --save-baseline base.json
+    python -m benchmarks --baseline base.json     # exit code 1 on regression
+"""
@@ -0,0 +1,227 @@
+"""Benchmark cases: one named, timed workload per hot path.
+
+Each :class:`Case` runs against a shared :class:`Workload` (synthetic chain,
+stock bars and a scratch directory) built once per benchmark run.  Cases
+cover every strategy family, calendar/diagonal spreads, early exits,
+``simulate()``, ``simulate_portfolio()``, ``signal_dates()``, multi-file
+CSV ingestion and ``ResultStore`` round-trips.
+"""
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, List
+
+import numpy as np
+import pandas as pd
+
+import optopsy as op
+
+
+@dataclass(frozen=True)
+class Workload:
+    """Inputs shared by all cases of a run.
+
+    Attributes:
+        chain: Synthetic option chain.
+        stocks: Synthetic OHLCV bars for the chain's underlyings.
+        scratch_dir: Directory cases may write to.
+    """
+
+    chain: pd.DataFrame
+    stocks: pd.DataFrame
+    scratch_dir: str
+
+
+@dataclass(frozen=True)
+class Case:
+    """A named benchmark workload.
+
+    Attributes:
+        name: Unique case name (``group.detail``), used in results.
+        run: Callable executing the workload once; its return value's
+            length, when it has one, is reported as ``rows``.
+    """
+
+    name: str
+    run: Callable[[Workload], Any]
+
+
+def _strategy(strategy: Callable[..., pd.DataFrame], **kwargs: Any) -> Callable:
+    return lambda w: strategy(w.chain, **kwargs)
+
+
+def _simulate(w: Workload) -> pd.DataFrame:
+    result = op.simulate(
+        w.chain, op.short_puts, max_positions=5, max_entry_dte=45, exit_dte=7
+    )
+    return result.trade_log
+
+
+def _simulate_multi_leg(w: Workload) -> pd.DataFrame:
+    result = op.simulate(
+        w.chain, op.iron_condor, max_positions=3, max_entry_dte=45, exit_dte=7
+    )
+    return result.trade_log
+
+
+def _simulate_portfolio(w: Workload) -> pd.DataFrame:
+    result = op.simulate_portfolio(
+        legs=[
+            {
+                "data": w.chain,
+                "strategy": op.short_puts,
+                "weight": 0.5,
+                "max_entry_dte": 45,
+                "exit_dte": 7,
+            },
+            {
+                "data": w.chain,
+                "strategy": op.long_call_spread,
+                "weight": 0.5,
+                "max_entry_dte": 45,
+                "exit_dte": 7,
+            },
+        ]
+    )
+    return result.trade_log
+
+
+def _signal_dates(w: Workload) -> pd.DataFrame:
+    return op.signal_dates(w.stocks, op.rsi_below(threshold=40))
+
+
+def _signal_dates_composed(w: Workload) -> pd.DataFrame:
+    signal = op.Signal(op.sma_above(50)) & op.Signal(op.rsi_below(threshold=50))
+    return op.signal_dates(w.stocks, signal)
+
+
+@functools.lru_cache(maxsize=1)
+def _long_history(rows: int = 500_000) -> pd.DataFrame:
+    """One symbol with *rows* daily closes, built once per process."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "underlying_symbol": "SPX",
+            "quote_date": pd.date_range("1900-01-01", periods=rows, freq="D"),
+            "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows))),
+        }
+    )
+
+
+def _signal_single_symbol(w: Workload) -> pd.Series:
+    # Per-call work on one large caller-built frame, where memoization
+    # must not cost more than the indicators it saves
+    signal = (
+        op.Signal(op.rsi_below(14, 40))
+        & op.Signal(op.rsi_above(14, 20))
+        & op.sustained(op.sma_above(50), days=3)
+    )
+    return signal(_long_history())
+
+
+def _signal_entries(w: Workload) -> pd.DataFrame:
+    entries = op.signal_dates(w.stocks, op.rsi_below(threshold=50))
+    return op.short_puts(w.chain, entry_dates=entries, raw=True)
+
+
+def _csv_directory(w: Workload) -> str:
+    """One CSV per quote date under the scratch directory, written once."""
+    directory = os.path.join(w.scratch_dir, "csv")
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+        for quote_date, day in w.chain.groupby("quote_date"):
+            day.to_csv(
+                os.path.join(directory, f"{quote_date:%Y%m%d}.csv"),
+                index=False,
+                date_format="%Y-%m-%d",
+            )
+    return directory
+
+
+def _csv_ingest(w: Workload) -> pd.DataFrame:
+    columns = list(w.chain.columns)
+    return op.csv_data(
+        _csv_directory(w),
+        date_format="%Y-%m-%d",
+        progress=lambda _: None,
+        **{
+            name: columns.index(name)
+            for name in op.datafeeds.default_kwargs
+            if name in columns
+        },
+    )
+
+
+def _result_store_round_trip(w: Workload) -> pd.DataFrame:
+    from optopsy.data.providers.result_store import ResultStore
+
+    store = ResultStore(results_dir=os.path.join(w.scratch_dir, "results"))
+    trades = op.iron_condor(w.chain, raw=True)
+    key = ResultStore.make_key("iron_condor", {"raw": True}, "synthetic")
+    store.write(key, trades, {"type": "strategy", "strategy": "iron_condor"})
+    loaded = store.read(key)
+    store.clear(key)
+    return loaded
+
+
+CASES: List[Case] = [
+    # Strategy families (aggregated output)
+    Case("singles.long_calls", _strategy(op.long_calls)),
+    Case("singles.short_puts", _strategy(op.short_puts)),
+    Case("singles.short_puts_raw", _strategy(op.short_puts, raw=True)),
+    Case("straddles.long_straddles", _strategy(op.long_straddles)),
+    Case("strangles.short_strangles", _strategy(op.short_strangles)),
+    Case("spreads.long_call_spread", _strategy(op.long_call_spread)),
+    Case("spreads.short_put_spread", _strategy(op.short_put_spread)),
+    Case("butterflies.long_call_butterfly", _strategy(op.long_call_butterfly)),
+    Case("condors.long_call_condor", _strategy(op.long_call_condor)),
+    Case("iron.iron_condor", _strategy(op.iron_condor)),
+    Case("iron.iron_butterfly", _strategy(op.iron_butterfly)),
+    Case("covered.covered_call", _strategy(op.covered_call)),
+    Case("ratio.call_back_spread", _strategy(op.call_back_spread)),
+    # Delta targeting with a narrow band around the target
+    Case(
+        "delta.short_puts_narrow",
+        _strategy(
+            op.short_puts,
+            leg1_delta=op.TargetRange(target=0.25, min=0.2, max=0.3),
+        ),
+    ),
+    # Calendar and diagonal spreads (different expirations per leg)
+    Case("calendar.long_call_calendar", _strategy(op.long_call_calendar)),
+    Case("calendar.long_put_diagonal", _strategy(op.long_put_diagonal)),
+    # Early exits
+    Case(
+        "exits.short_puts_stops",
+        _strategy(op.short_puts, stop_loss=-1.0, take_profit=0.5, raw=True),
+    ),
+    Case(
+        "exits.iron_condor_stops",
+        _strategy(op.iron_condor, stop_loss=-0.5, take_profit=0.5, raw=True),
+    ),
+    Case(
+        "exits.long_calls_max_hold",
+        _strategy(op.long_calls, max_hold_days=10, raw=True),
+    ),
+    # Simulation
+    Case("simulate.short_puts", _simulate),
+    Case("simulate.iron_condor", _simulate_multi_leg),
+    Case("simulate.portfolio", _simulate_portfolio),
+    # Signals
+    Case("signals.rsi_below", _signal_dates),
+    Case("signals.composed", _signal_dates_composed),
+    Case("signals.entry_dates", _signal_entries),
+    Case("signals.single_symbol_large", _signal_single_symbol),
+    # Ingestion
+    Case("ingest.csv_directory", _csv_ingest),
+    # Result storage
+    Case("storage.result_store_round_trip", _result_store_round_trip),
+]
+
+
+def select_cases(patterns: List[str]) -> List[Case]:
+    """Cases whose name contains any of *patterns* (all cases when empty)."""
+    if not patterns:
+        return list(CASES)
+    return [c for c in CASES if any(p in c.name for p in patterns)]
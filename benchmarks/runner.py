@@ -0,0 +1,239 @@
+"""Time and memory-profile benchmark cases; compare runs against a baseline.
+
+Each case is timed ``repeat`` times after one warm-up run (which also
+fills per-frame caches such as the contract index, as repeated strategy
+runs in a session would).  Peak memory is measured in a separate run
+under ``tracemalloc`` so tracing overhead never pollutes the timings.
+
+Results are written as JSON::
+
+    {
+      "meta": {"size": "small", "spec": {...}, "python": "3.12.1", ...},
+      "results": {
+        "singles.long_calls": {
+          "median_s": 0.041, "min_s": 0.039, "peak_mb": 12.3, "rows": 28
+        },
+        ...
+      }
+    }
+
+A result file saved with ``--save-baseline`` can be compared against later
+runs with ``--baseline``; the comparison flags cases whose median time or
+peak memory grew beyond the tolerance.
+"""
+
+import argparse
+import dataclasses
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cases import Case, Workload, select_cases
+from .synthetic import SIZES, generate_chain, generate_stocks
+
+# Differences below these are noise, whatever the ratio
+_MIN_TIME_DELTA_S = 0.005
+_MIN_MEMORY_DELTA_MB = 1.0
+
+
+def _rows(value: Any) -> Optional[int]:
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_case(case: Case, workload: Workload, repeat: int) -> Dict[str, Any]:
+    """Time *case* ``repeat`` times and measure its peak traced memory."""
+    result = case.run(workload)  # warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(workload)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        case.run(workload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "peak_mb": peak / 2**20,
+        "rows": _rows(result),
+    }
+
+
+def run(
+    size: str = "small",
+    patterns: Optional[List[str]] = None,
+    repeat: int = 3,
+    log=print,
+) -> Dict[str, Any]:
+    """Run the selected cases on a synthetic chain of the given size.
+
+    Args:
+        size: Key of ``synthetic.SIZES``.
+        patterns: Substrings selecting cases by name; all cases when empty.
+        repeat: Timed runs per case.
+        log: Callable receiving progress lines.
+
+    Returns:
+        Result document (``meta`` and ``results``), JSON-serializable.
+    """
+    if size not in SIZES:
+        raise ValueError(f"Unknown size '{size}'. Choose from: {list(SIZES)}")
+    cases = select_cases(patterns or [])
+    if not cases:
+        raise ValueError(f"No benchmark case matches {patterns}")
+
+    spec = SIZES[size]
+    start = time.perf_counter()
+    chain = generate_chain(spec)
+    stocks = generate_stocks(spec)
+    log(f"generated {len(chain):,} chain rows in {time.perf_counter() - start:.2f}s")
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        workload = Workload(chain=chain, stocks=stocks, scratch_dir=scratch)
+        for case in cases:
+            results[case.name] = run_case(case, workload, repeat)
+            r = results[case.name]
+            log(
+                f"{case.name:<40} {r['median_s'] * 1000:>10.1f} ms "
+                f"{r['peak_mb']:>9.1f} MB  rows={r['rows']}"
+            )
+
+    return {
+        "meta": {
+            "size": size,
+            "spec": dataclasses.asdict(spec),
+            "chain_rows": len(chain),
+            "repeat": repeat,
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """Compare two result documents case by case.
+
+    A case regresses when its median time or peak memory exceeds the
+    baseline by more than ``tolerance`` (as a fraction) and by more than
+    a small absolute margin.
+
+    Returns:
+        One row per case present in both documents, with ``time_ratio``,
+        ``memory_ratio`` and a ``regressed`` flag.
+    """
+    rows = []
+    for name, cur in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        time_ratio = cur["median_s"] / base["median_s"] if base["median_s"] else None
+        memory_ratio = cur["peak_mb"] / base["peak_mb"] if base["peak_mb"] else None
+        slower = (
+            time_ratio is not None
+            and time_ratio > 1 + tolerance
+            and cur["median_s"] - base["median_s"] > _MIN_TIME_DELTA_S
+        )
+        larger = (
+            memory_ratio is not None
+            and memory_ratio > 1 + tolerance
+            and cur["peak_mb"] - base["peak_mb"] > _MIN_MEMORY_DELTA_MB
+        )
+        rows.append(
+            {
+                "name": name,
+                "time_ratio": time_ratio,
+                "memory_ratio": memory_ratio,
+                "regressed": slower or larger,
+            }
+        )
+    return rows
+
+
+def _format_ratio(ratio: Optional[float]) -> str:
+    return "n/a" if ratio is None else f"{ratio:.2f}x"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run optopsy benchmarks on a synthetic option chain.",
+    )
+    parser.add_argument("patterns", nargs="*", help="only cases containing these")
+    parser.add_argument("--size", default="small", choices=sorted(SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument(
+        "--save-baseline", help="also write results JSON here for later comparison"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed slowdown/memory growth as a fraction (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    document = run(args.size, args.patterns, args.repeat)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(document, f, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("size") != args.size:
+        print(
+            f"warning: baseline size '{baseline['meta'].get('size')}' "
+            f"differs from '{args.size}'",
+            file=sys.stderr,
+        )
+    rows = compare(document, baseline, args.tolerance)
+    print(f"\n{'case':<40} {'time':>8} {'memory':>8}")
+    for row in rows:
+        flag = "  REGRESSED" if row["regressed"] else ""
+        print(
+            f"{row['name']:<40} {_format_ratio(row['time_ratio']):>8} "
+            f"{_format_ratio(row['memory_ratio']):>8}{flag}"
+        )
+    return 1 if any(row["regressed"] for row in rows) else 0
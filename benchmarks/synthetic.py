@@ -0,0 +1,249 @@
+"""Deterministic synthetic option chains and stock prices for benchmarks.
+
+Underlying prices follow a geometric Brownian motion per symbol; options
+are priced with Black-Scholes on a volatility smile, so deltas, greeks and
+bid/ask spreads behave like real end-of-day data.  The same arguments and
+seed always produce the same frames.
+
+Expirations per quote date are the next four weekly Fridays followed by
+monthly (third Friday) expirations, which gives calendar and diagonal
+spreads back-month contracts to work with.  Each expiration's strike
+ladder is centered on the underlying price on the day it is first listed
+and stays fixed afterwards, so contracts can be followed to expiration.
+
+Example::
+
+    from benchmarks.synthetic import ChainSpec, generate_chain, generate_stocks
+
+    spec = ChainSpec(symbols=("SPX", "QQQ"), years=2, strikes_per_expiration=40)
+    chain = generate_chain(spec)
+    stocks = generate_stocks(spec)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Trading days per synthetic year
+_DAYS_PER_YEAR = 252
+
+# Leading weekly expirations before switching to monthlies
+_WEEKLIES = 4
+
+
+@dataclass(frozen=True)
+class ChainSpec:
+    """Shape of a synthetic option chain.
+
+    Attributes:
+        symbols: Underlying symbols to generate.
+        years: Number of years of daily quotes.
+        strikes_per_expiration: Strikes listed per expiration.
+        expirations_per_date: Expirations quoted on each date.
+        start: First quote date.
+        seed: Random seed; identical specs produce identical data.
+    """
+
+    symbols: Tuple[str, ...] = ("SPX",)
+    years: int = 1
+    strikes_per_expiration: int = 20
+    expirations_per_date: int = 6
+    start: str = "2020-01-02"
+    seed: int = 0
+
+    @property
+    def quote_dates(self) -> pd.DatetimeIndex:
+        """Business days covered by the spec."""
+        return pd.bdate_range(self.start, periods=_DAYS_PER_YEAR * self.years)
+
+
+# Presets used by the benchmark runner (``--size``)
+SIZES: Dict[str, ChainSpec] = {
+    "small": ChainSpec(),
+    "medium": ChainSpec(
+        symbols=("SPX", "QQQ"),
+        years=2,
+        strikes_per_expiration=40,
+        expirations_per_date=8,
+    ),
+    "large": ChainSpec(
+        symbols=("SPX", "QQQ", "IWM", "AAPL", "MSFT"),
+        years=5,
+        strikes_per_expiration=60,
+        expirations_per_date=8,
+    ),
+}
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    # Abramowitz & Stegun 7.1.26 (|error| < 1.5e-7) -- avoids a scipy dependency
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (
+        0.254829592
+        + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429)))
+    )
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def _price_paths(spec: ChainSpec) -> Dict[str, np.ndarray]:
+    """Daily closes per symbol (GBM, 20% annualized volatility)."""
+    rng = np.random.default_rng(spec.seed)
+    n = len(spec.quote_dates)
+    paths = {}
+    for i, symbol in enumerate(spec.symbols):
+        returns = rng.normal(0.07 / _DAYS_PER_YEAR, 0.2 / np.sqrt(_DAYS_PER_YEAR), n)
+        paths[symbol] = 100.0 * (i + 1) * np.exp(np.cumsum(returns))
+    return paths
+
+
+def _expiration_schedule(
+    quote_dates: pd.DatetimeIndex, n_expirations: int
+) -> List[np.ndarray]:
+    """Expirations quoted on each date: weeklies first, then monthlies."""
+    fridays = pd.date_range(
+        quote_dates[0], quote_dates[-1] + pd.Timedelta(days=400), freq="W-FRI"
+    )
+    monthlies = fridays[(fridays.day >= 15) & (fridays.day <= 21)]
+    weekly_count = min(_WEEKLIES, n_expirations)
+
+    schedule = []
+    for day in quote_dates:
+        first = fridays.searchsorted(day)
+        weeklies = fridays[first : first + weekly_count]
+        later = monthlies[monthlies > weeklies[-1]]
+        schedule.append(
+            np.concatenate(
+                [
+                    weeklies.to_numpy(),
+                    later[: n_expirations - weekly_count].to_numpy(),
+                ]
+            )
+        )
+    return schedule
+
+
+def generate_chain(spec: ChainSpec = ChainSpec()) -> pd.DataFrame:
+    """Build a synthetic end-of-day option chain.
+
+    Args:
+        spec: Shape of the chain.
+
+    Returns:
+        DataFrame with ``underlying_symbol``, ``underlying_price``,
+        ``option_type`` (``"c"``/``"p"``), ``expiration``, ``quote_date``,
+        ``strike``, ``bid``, ``ask``, ``delta``, ``gamma``, ``theta``,
+        ``vega``, ``implied_volatility``, ``volume`` and ``open_interest``.
+    """
+    rng = np.random.default_rng(spec.seed + 1)
+    quote_dates = spec.quote_dates
+    schedule = _expiration_schedule(quote_dates, spec.expirations_per_date)
+    offsets = np.arange(spec.strikes_per_expiration) - spec.strikes_per_expiration // 2
+
+    # (date index, expiration) pairs shared by all symbols
+    date_idx = np.repeat(np.arange(len(quote_dates)), [len(s) for s in schedule])
+    expirations = np.concatenate(schedule)
+
+    frames = []
+    for symbol, closes in _price_paths(spec).items():
+        step = max(1.0, round(closes[0] * 0.01))
+        # Center each expiration's ladder on the price when first listed
+        listed = pd.Series(date_idx).groupby(expirations).transform("min").to_numpy()
+        centers = np.round(closes[listed] / step) * step
+
+        n_pairs = len(date_idx)
+        pair = np.repeat(np.arange(n_pairs), len(offsets))
+        strike = centers[pair] + np.tile(offsets, n_pairs) * step
+        keep = strike > 0
+        pair, strike = pair[keep], strike[keep]
+
+        spot = closes[date_idx[pair]]
+        quote_date = quote_dates.to_numpy()[date_idx[pair]]
+        expiration = expirations[pair]
+        years = np.maximum(
+            (expiration - quote_date) / np.timedelta64(365, "D"), 0.5 / 365
+        )
+
+        # Smile: volatility rises away from the money
+        moneyness = np.log(strike / spot)
+        iv = 0.18 + 0.4 * moneyness**2 - 0.05 * moneyness
+        sqrt_t = np.sqrt(years)
+        d1 = (moneyness * -1 + 0.5 * iv**2 * years) / (iv * sqrt_t)
+        d2 = d1 - iv * sqrt_t
+        call = spot * _norm_cdf(d1) - strike * _norm_cdf(d2)
+        put = call - spot + strike
+        gamma = _norm_pdf(d1) / (spot * iv * sqrt_t)
+        vega = spot * _norm_pdf(d1) * sqrt_t / 100
+        theta = -spot * _norm_pdf(d1) * iv / (2 * sqrt_t) / 365
+
+        for option_type, price, delta in (
+            ("c", call, _norm_cdf(d1)),
+            ("p", put, _norm_cdf(d1) - 1),
+        ):
+            mid = np.maximum(price, 0.05)
+            half_spread = np.maximum(0.025, mid * 0.02)
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "underlying_symbol": symbol,
+                        "underlying_price": spot,
+                        "option_type": option_type,
+                        "expiration": expiration,
+                        "quote_date": quote_date,
+                        "strike": strike,
+                        "bid": np.round(mid - half_spread, 2),
+                        "ask": np.round(mid + half_spread, 2),
+                        "delta": delta,
+                        "gamma": gamma,
+                        "theta": theta,
+                        "vega": vega,
+                        "implied_volatility": iv,
+                        "volume": rng.poisson(200 * np.exp(-8 * np.abs(moneyness))),
+                        "open_interest": rng.poisson(
+                            2000 * np.exp(-6 * np.abs(moneyness))
+                        ),
+                    }
+                )
+            )
+
+    chain = pd.concat(frames, ignore_index=True)
+    return chain.sort_values(
+        ["underlying_symbol", "quote_date", "expiration", "option_type", "strike"],
+        ignore_index=True,
+    )
+
+
+def generate_stocks(spec: ChainSpec = ChainSpec()) -> pd.DataFrame:
+    """Daily OHLCV bars for the underlyings of ``generate_chain(spec)``.
+
+    Returns:
+        DataFrame with ``underlying_symbol``, ``quote_date``, ``open``,
+        ``high``, ``low``, ``close`` and ``volume``.
+    """
+    rng = np.random.default_rng(spec.seed + 2)
+    quote_dates = spec.quote_dates
+    frames = []
+    for symbol, closes in _price_paths(spec).items():
+        opens = np.concatenate([[closes[0]], closes[:-1]])
+        wick = np.abs(rng.normal(0, 0.005, len(closes))) * closes
+        frames.append(
+            pd.DataFrame(
+                {
+                    "underlying_symbol": symbol,
+                    "quote_date": quote_dates,
+                    "open": opens,
+                    "high": np.maximum(opens, closes) + wick,
+                    "low": np.minimum(opens, closes) - wick,
+                    "close": closes,
+                    "volume": rng.integers(1_000_000, 5_000_000, len(closes)),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
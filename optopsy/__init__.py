@@ -20,7 +20,17 @@ For detailed documentation, visit: https://github.com/goldspanlabs/optopsy
 
 __version__ = "2.2.0"
 
-from .datafeeds import csv_data, load_cached_options, load_cached_stocks, options_data
+from .chunked import ChunkedChain, chunk_chain
+from .compact import compact_chain
+from .datafeeds import (
+    csv_data,
+    ingest_csv,
+    load_cached_options,
+    load_cached_options_chunked,
+    load_cached_stocks,
+    options_data,
+)
+from .ingest import IngestProgress
 from .metrics import (
     calmar_ratio,
     compute_risk_metrics,
@@ -35,6 +45,7 @@ from .metrics import (
     value_at_risk,
     win_rate,
 )
+from .prepared import PreparedChain, prepare
 from .signals import (
     Signal,
     ad_cross_above_sma,
@@ -129,7 +140,13 @@ from .signals import (
     zlma_cross_above,
     zlma_cross_below,
 )
-from .simulator import PortfolioResult, SimulationResult, simulate, simulate_portfolio
+from .simulator import (
+    PortfolioResult,
+    ScoreSelector,
+    SimulationResult,
+    simulate,
+    simulate_portfolio,
+)
 from .strategies import (
     # Ratio spreads
     call_back_spread,
@@ -181,6 +198,7 @@ from .strategies import (
     short_straddles,
     short_strangles,
 )
+from .sweep import sweep
 from .timestamps import normalize_dates
 from .types import (
     CalendarStrategyParams,
@@ -241,9 +259,18 @@ __all__ = [
     "long_put_diagonal",
     "short_put_diagonal",
     "csv_data",
+    "ingest_csv",
+    "IngestProgress",
     "options_data",
     "load_cached_options",
+    "load_cached_options_chunked",
     "load_cached_stocks",
+    "prepare",
+    "PreparedChain",
+    "compact_chain",
+    "chunk_chain",
+    "ChunkedChain",
+    "sweep",
     # Type definitions
     "Commission",
     "StrategyParams",
@@ -356,6 +383,7 @@ __all__ = [
     "simulate_portfolio",
     "SimulationResult",
     "PortfolioResult",
+    "ScoreSelector",
     # Risk metrics
     "compute_risk_metrics",
     "sharpe_ratio",
@@ -0,0 +1,272 @@
+"""Mergeable per-bucket aggregates behind the grouped statistics output.
+
+Aggregated strategy output reports, per ``(dte_range, delta_range, ...)``
+bucket, the ``describe()`` statistics of ``pct_change`` plus ``win_rate``
+and ``profit_factor``.  Computing those directly needs every trade of the
+bucket at once.  Instead, each bucket is summarized by a partial aggregate
+that can be merged with partials built from other trades:
+
+- ``count``, ``mean`` and ``m2`` (sum of squared deviations) -- merged with
+  the parallel form of Welford's algorithm, giving ``std`` exactly
+- ``min`` and ``max``
+- ``wins``, ``gross_win`` and ``gross_loss`` for ``win_rate`` and
+  ``profit_factor``
+- a :class:`_QuantileSketch` for the quartiles
+
+Partials built from separate chunks, worker processes or incremental runs
+combine with ``_merge_aggregates()``; ``_finalize_aggregates()`` turns
+them into the output columns.  Everything except the quartiles merges
+exactly.  A partial built from trades in memory keeps every value, so a
+single run (one partial) reports the exact ``describe()`` quartiles.  Only
+merging compacts a sketch: merged quartiles are exact while a bucket holds
+at most ``_SKETCH_K`` trades and have rank error of roughly
+``1 / _SKETCH_K`` beyond that.
+"""
+
+from functools import reduce
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Values a quantile sketch keeps exactly before it starts compacting.
+_SKETCH_K = 2048
+
+_QUANTILES = (0.25, 0.5, 0.75)
+
+
+class _QuantileSketch:
+    """Mergeable quantile sketch (KLL-style hierarchy of compactors).
+
+    ``from_values()`` stores every value exactly; merging stores values
+    exactly until more than ``k`` have been combined.  Beyond that, items at level ``h`` stand for ``2**h`` values: when a
+    level outgrows its capacity it is sorted and every other item (with
+    alternating offset) is promoted to the next level.  Capacities shrink
+    geometrically towards the lower levels, so the sketch holds
+    ``O(k)`` items regardless of how many values it summarizes.
+
+    Attributes:
+        k: Capacity of the top level.
+        levels: Items per level; level ``h`` items have weight ``2**h``.
+    """
+
+    __slots__ = ("k", "levels", "_offset")
+
+    def __init__(self, k: int = _SKETCH_K) -> None:
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._offset = 0
+
+    @classmethod
+    def from_values(
+        cls, values: Sequence[float], k: int = _SKETCH_K
+    ) -> "_QuantileSketch":
+        """Build an exact sketch of *values*, ignoring NaNs.
+
+        Nothing is compacted until the sketch is merged with another.
+        """
+        sketch = cls(k)
+        array = np.asarray(values, dtype=float)
+        sketch.levels[0] = array[~np.isnan(array)]
+        return sketch
+
+    @property
+    def count(self) -> int:
+        """Number of values summarized."""
+        return sum(len(level) << h for h, level in enumerate(self.levels))
+
+    @property
+    def exact(self) -> bool:
+        """Whether every value is still stored (nothing compacted yet)."""
+        return len(self.levels) == 1
+
+    def merge(self, other: "_QuantileSketch") -> "_QuantileSketch":
+        """Return a new sketch summarizing the values of both sketches."""
+        merged = _QuantileSketch(min(self.k, other.k))
+        height = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([s.levels[h] for s in (self, other) if h < len(s.levels)])
+            for h in range(height)
+        ]
+        merged._offset = self._offset ^ other._offset
+        merged._compress()
+        return merged
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Return the *qs* quantiles (linear interpolation while exact)."""
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+        if self.exact:
+            return np.quantile(self.levels[0], qs)
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 1 << h) for h, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+        ranks = np.asarray(qs) * (cumulative[-1] - 1)
+        positions = np.searchsorted(cumulative, ranks, side="right")
+        return values[np.minimum(positions, len(values) - 1)]
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self.levels) - 1 - height
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                level = np.sort(level)
+                # An odd item out stays behind at this level
+                keep = level[len(level) - len(level) % 2 :]
+                promoted = level[: len(level) - len(keep)][self._offset :: 2]
+                self._offset ^= 1
+                self.levels[h] = keep
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+
+def _merge_sketches(sketches: pd.Series) -> _QuantileSketch:
+    return reduce(_QuantileSketch.merge, sketches)
+
+
+def _partial_aggregates(data: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
+    """Summarize ``pct_change`` per group of *cols* as mergeable partials.
+
+    Returns:
+        DataFrame indexed by group with columns ``count``, ``mean``, ``m2``,
+        ``min``, ``max``, ``wins``, ``gross_win``, ``gross_loss`` and
+        ``sketch``.
+    """
+    # Use observed=True to only return groups with actual data (avoids pandas 3.0
+    # issue where observed=False returns all category combinations as empty rows)
+    pct = data["pct_change"]
+    grouped = pct.groupby([data[c] for c in cols], observed=True)
+    mean = grouped.transform("mean")
+
+    # Pre-compute masked columns once, then let groupby.sum() run at C
+    # level -- no per-group Python lambdas for the moments and win counts.
+    frame = pd.DataFrame(
+        {
+            "_sq_dev": (pct - mean) ** 2,
+            "wins": (pct > 0).astype(int),
+            "gross_win": pct.where(pct > 0, 0.0).fillna(0.0),
+            "gross_loss": pct.where(pct < 0, 0.0).fillna(0.0),
+        },
+        index=data.index,
+    )
+    sums = frame.groupby([data[c] for c in cols], observed=True).sum()
+
+    partials = pd.DataFrame(
+        {
+            "count": grouped.count(),
+            "mean": grouped.mean(),
+            "m2": sums["_sq_dev"],
+            "min": grouped.min(),
+            "max": grouped.max(),
+            "wins": sums["wins"],
+            "gross_win": sums["gross_win"],
+            "gross_loss": sums["gross_loss"],
+        }
+    )
+    partials["sketch"] = grouped.agg(_QuantileSketch.from_values)
+    return partials
+
+
+def _merge_aggregates(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine partial aggregates of the same grouping into one per group.
+
+    Args:
+        parts: Outputs of ``_partial_aggregates()`` (or of earlier merges)
+            over disjoint sets of trades.
+
+    Returns:
+        Partial aggregates with one row per group present in any part.
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    stacked = pd.concat(parts)
+    levels = list(range(stacked.index.nlevels))
+    grouped = stacked.groupby(level=levels, observed=True, sort=True)
+
+    count = grouped["count"].sum()
+    weighted = (
+        (stacked["count"] * stacked["mean"].fillna(0.0))
+        .groupby(level=levels, observed=True, sort=True)
+        .sum()
+    )
+    mean = (weighted / count.where(count > 0)).rename("mean")
+
+    # Chan et al.: M2 = sum(M2_i) + sum(n_i * (mean_i - mean)^2)
+    shift = stacked["mean"] - mean.reindex(stacked.index).to_numpy()
+    spread = (
+        (stacked["count"] * shift.fillna(0.0) ** 2)
+        .groupby(level=levels, observed=True, sort=True)
+        .sum()
+    )
+
+    merged = pd.DataFrame(
+        {
+            "count": count,
+            "mean": mean,
+            "m2": grouped["m2"].sum() + spread,
+            "min": grouped["min"].min(),
+            "max": grouped["max"].max(),
+            "wins": grouped["wins"].sum(),
+            "gross_win": grouped["gross_win"].sum(),
+            "gross_loss": grouped["gross_loss"].sum(),
+        }
+    )
+    merged["sketch"] = grouped["sketch"].agg(_merge_sketches)
+    return merged
+
+
+def _finalize_aggregates(
+    partials: pd.DataFrame, drop_na: Optional[bool] = False
+) -> pd.DataFrame:
+    """Turn partial aggregates into ``describe()`` columns plus win metrics.
+
+    Returns:
+        DataFrame indexed by group with ``count``, ``mean``, ``std``,
+        ``min``, ``25%``, ``50%``, ``75%``, ``max``, ``win_rate`` and
+        ``profit_factor``.
+    """
+    count = partials["count"].astype(float)
+    quartiles = np.array(
+        [s.quantiles(_QUANTILES) for s in partials["sketch"]], dtype=float
+    ).reshape(len(partials), len(_QUANTILES))
+    gross_wins = partials["gross_win"]
+    gross_losses = partials["gross_loss"]
+
+    result = pd.DataFrame(
+        {
+            "count": count,
+            "mean": partials["mean"].where(count > 0),
+            "std": np.sqrt(partials["m2"] / (count - 1)).where(count > 1),
+            "min": partials["min"],
+            "25%": quartiles[:, 0],
+            "50%": quartiles[:, 1],
+            "75%": quartiles[:, 2],
+            "max": partials["max"],
+            "win_rate": np.where(count > 0, partials["wins"] / count, np.nan),
+            "profit_factor": np.where(
+                gross_losses != 0,
+                np.abs(gross_wins / gross_losses),
+                np.where(gross_wins > 0, np.inf, 0.0),
+            ),
+        },
+        index=partials.index,
+    )
+
+    # if any non-count columns return NaN remove the row
+    if drop_na:
+        subset = [col for col in result.columns if "_count" not in col]
+        result = result.dropna(subset=subset, how="all")
+
+    return result
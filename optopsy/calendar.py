@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+from .contracts import _contract_index
 from .filters import _remove_min_bid_ask, _select_closest_delta, _trim
 from .pricing import _calculate_fill_price
 
@@ -118,47 +119,6 @@ def _merge_calendar_legs(
     return pd.merge(front[front_cols], back[back_cols], on=join_cols, how="inner")
 
 
-def _get_exit_leg_subset(
-    exit_data: pd.DataFrame, leg_num: int, same_strike: bool
-) -> Tuple[pd.DataFrame, List[str]]:
-    """
-    Prepare exit data for joining with a specific leg.
-
-    Args:
-        exit_data: DataFrame with exit date prices
-        leg_num: Leg number (1 or 2)
-        same_strike: True for calendar spreads, False for diagonal
-
-    Returns:
-        Tuple of (subset DataFrame, join columns)
-    """
-    strike_col = _get_strike_column(same_strike, leg_num)
-
-    renamed = exit_data.rename(
-        columns={
-            "quote_date": "exit_date",
-            "expiration": f"expiration_leg{leg_num}",
-            "bid": f"exit_bid_leg{leg_num}",
-            "ask": f"exit_ask_leg{leg_num}",
-        }
-    )
-
-    if not same_strike:
-        renamed = renamed.rename(columns={"strike": strike_col})
-
-    join_cols = [
-        "underlying_symbol",
-        "exit_date",
-        "option_type",
-        f"expiration_leg{leg_num}",
-        strike_col,
-    ]
-
-    subset_cols = join_cols + [f"exit_bid_leg{leg_num}", f"exit_ask_leg{leg_num}"]
-
-    return renamed[subset_cols], join_cols
-
-
 def _find_calendar_exit_prices(
     merged: pd.DataFrame,
     data: pd.DataFrame,
@@ -189,7 +149,7 @@ def _find_calendar_exit_prices(
 
     if exit_dte_tolerance == 0:
         # Exact date matching (original behavior)
-        exit_data = data[data["quote_date"].isin(all_exit_dates)]
+        exit_dates = np.asarray(all_exit_dates)
     else:
         # Tolerance-based matching: snap each target exit_date to the
         # closest available quote_date within tolerance using vectorized
@@ -226,21 +186,111 @@ def _find_calendar_exit_prices(
         merged["exit_date"] = (
             merged["exit_date"].map(date_map).fillna(merged["exit_date"])
         )
-        exit_data = data[data["quote_date"].isin(date_map.values())]
+        exit_dates = np.array(list(date_map.values()))
 
-    if exit_data.empty:
+    index = _contract_index(data)
+    if not np.isin(index.dates, np.asarray(exit_dates, dtype=index.dates.dtype)).any():
         return merged.iloc[:0]
 
-    # Merge exit prices for each leg
+    # Look up each leg's exit quote through the contract index.  All quotes
+    # on the exit date are kept, as an inner merge on the contract and date
+    # columns would.
+    entries = merged
+    for leg_num in [1, 2]:
+        strike_col = _get_strike_column(same_strike, leg_num)
+        ids = index.contract_ids(
+            [
+                merged["underlying_symbol"],
+                merged["option_type"],
+                merged[f"expiration_leg{leg_num}"],
+                merged[strike_col],
+            ]
+        )
+        rows, positions = index.locate_all(ids, merged["exit_date"])
+        if (np.diff(rows) == 0).any():
+            # Duplicate quotes pair up in an order only pd.merge reproduces
+            return _merge_exit_prices(entries, data, exit_dates, same_strike)
+        merged = merged.take(rows).reset_index(drop=True)
+        merged[f"exit_bid_leg{leg_num}"] = data["bid"].to_numpy()[positions]
+        merged[f"exit_ask_leg{leg_num}"] = data["ask"].to_numpy()[positions]
+        if merged.empty:
+            return merged
+
+    return merged
+
+
+def _merge_exit_prices(
+    merged: pd.DataFrame,
+    data: pd.DataFrame,
+    exit_dates: np.ndarray,
+    same_strike: bool,
+) -> pd.DataFrame:
+    """
+    Merge both legs' exit quotes onto positions, as an inner merge orders them.
+
+    Used by ``_find_calendar_exit_prices()`` when the chain quotes a
+    contract more than once on an exit date: pairing duplicates in the order
+    ``pd.merge`` does is not a sort of the contract index lookup's rows.
+
+    Args:
+        merged: DataFrame with merged entry positions and their exit_date
+        data: Original DataFrame with all option data
+        exit_dates: Quote dates any position exits on
+        same_strike: True for calendar spreads, False for diagonal
+
+    Returns:
+        DataFrame with exit prices merged in
+    """
+    exit_data = data[data["quote_date"].isin(exit_dates)]
     for leg_num in [1, 2]:
         exit_subset, join_cols = _get_exit_leg_subset(exit_data, leg_num, same_strike)
         merged = pd.merge(merged, exit_subset, on=join_cols, how="inner")
         if merged.empty:
             return merged
-
     return merged
 
 
+def _get_exit_leg_subset(
+    exit_data: pd.DataFrame, leg_num: int, same_strike: bool
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Prepare exit data for joining with a specific leg.
+
+    Args:
+        exit_data: DataFrame with exit date prices
+        leg_num: Leg number (1 or 2)
+        same_strike: True for calendar spreads, False for diagonal
+
+    Returns:
+        Tuple of (subset DataFrame, join columns)
+    """
+    strike_col = _get_strike_column(same_strike, leg_num)
+
+    renamed = exit_data.rename(
+        columns={
+            "quote_date": "exit_date",
+            "expiration": f"expiration_leg{leg_num}",
+            "bid": f"exit_bid_leg{leg_num}",
+            "ask": f"exit_ask_leg{leg_num}",
+        }
+    )
+
+    if not same_strike:
+        renamed = renamed.rename(columns={"strike": strike_col})
+
+    join_cols = [
+        "underlying_symbol",
+        "exit_date",
+        "option_type",
+        f"expiration_leg{leg_num}",
+        strike_col,
+    ]
+
+    subset_cols = join_cols + [f"exit_bid_leg{leg_num}", f"exit_ask_leg{leg_num}"]
+
+    return renamed[subset_cols], join_cols
+
+
 def _calculate_calendar_pnl(
     merged: pd.DataFrame,
     leg_def: List[Tuple],
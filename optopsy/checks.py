@@ -69,10 +69,16 @@ optional_liquidity_types: Dict[str, Tuple[str, ...]] = {
 
 
 def _validate_and_check(
-    model_cls: Type[BaseModel], params: Dict[str, Any], data: pd.DataFrame
+    model_cls: Type[BaseModel],
+    params: Dict[str, Any],
+    data: pd.DataFrame,
+    check_schema: bool = True,
 ) -> Dict[str, Any]:
     """Validate parameters via Pydantic model and check DataFrame schema.
 
+    *check_schema* is ``False`` for chains built by ``prepared.prepare()``,
+    whose required columns were already validated.
+
     Returns a validated params dict with defaults applied.
     """
     try:
@@ -80,7 +86,8 @@ def _validate_and_check(
     except ValidationError as e:
         raise ValueError(_format_validation_error(e)) from e
 
-    _check_data_types(data)
+    if check_schema:
+        _check_data_types(data)
 
     validated = model.model_dump()
 
@@ -90,20 +97,24 @@ def _validate_and_check(
     return validated
 
 
-def _run_checks(params: Dict[str, Any], data: pd.DataFrame) -> Dict[str, Any]:
+def _run_checks(
+    params: Dict[str, Any], data: pd.DataFrame, check_schema: bool = True
+) -> Dict[str, Any]:
     """Validate parameters and DataFrame for standard strategies.
 
     Returns a validated params dict with defaults applied by the Pydantic model.
     """
-    return _validate_and_check(StrategyParams, params, data)
+    return _validate_and_check(StrategyParams, params, data, check_schema)
 
 
-def _run_calendar_checks(params: Dict[str, Any], data: pd.DataFrame) -> Dict[str, Any]:
+def _run_calendar_checks(
+    params: Dict[str, Any], data: pd.DataFrame, check_schema: bool = True
+) -> Dict[str, Any]:
     """Validate parameters and DataFrame for calendar/diagonal strategies.
 
     Returns a validated params dict with defaults applied by the Pydantic model.
     """
-    return _validate_and_check(CalendarStrategyParams, params, data)
+    return _validate_and_check(CalendarStrategyParams, params, data, check_schema)
 
 
 def _check_data_types(data: pd.DataFrame) -> None:
@@ -0,0 +1,144 @@
+"""Out-of-core backtests over expiration-aligned chunks of an option chain.
+
+Strategy runs normally need the whole chain in memory at once.  Every
+non-calendar strategy, however, only ever combines quotes of contracts that
+share an expiration: legs are joined on ``expiration``, exits and early
+exits look up the same contract's later quotes.  Splitting a chain by
+expiration -- so that each contract's full life sits inside one chunk --
+therefore splits the backtest into independent pieces.
+
+A :class:`ChunkedChain` describes such a split without loading it.  Every
+strategy function accepts one in place of a DataFrame and then:
+
+- reads one chunk, runs the usual pipeline on it and releases it
+- keeps only the raw trade rows (``raw=True``) or the chunk's mergeable
+  per-bucket aggregates (see ``aggregates``)
+- concatenates raw trades, or merges the aggregates into the grouped
+  statistics
+
+Peak memory therefore scales with the largest chunk plus the retained
+results, not with the full history.  Raw trades come back ordered by chunk (ascending
+expiration) rather than in whole-chain order.
+
+Example::
+
+    import optopsy as op
+
+    chain = op.load_cached_options_chunked("SPX", chunk_rows=5_000_000)
+    stats = op.short_puts(chain, max_entry_dte=45, exit_dte=7)
+"""
+
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Iterator, List, Tuple
+
+import pandas as pd
+
+from .timestamps import normalize_dates
+
+# Half-open [start, stop) range of normalized expiration dates.
+ExpirationRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+@dataclass(frozen=True)
+class ChunkedChain:
+    """Option chain read lazily in expiration-aligned chunks.
+
+    Created by :func:`chunk_chain` or ``load_cached_options_chunked()``.
+    Iterating yields one DataFrame per range, each read on demand.
+
+    Attributes:
+        ranges: Ascending, non-overlapping ``[start, stop)`` expiration
+            ranges, one per chunk.
+        read: Callable returning the chain rows whose expiration falls in
+            a range, called as ``read(start, stop)``.
+    """
+
+    ranges: Tuple[ExpirationRange, ...]
+    read: Callable[[pd.Timestamp, pd.Timestamp], pd.DataFrame] = field(repr=False)
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for start, stop in self.ranges:
+            yield self.read(start, stop)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    @property
+    def empty(self) -> bool:
+        """Whether the chain has no chunks (mirrors ``DataFrame.empty``)."""
+        return not self.ranges
+
+
+def _plan_chunks(
+    expirations: pd.Series, chunk_rows: int
+) -> Tuple[ExpirationRange, ...]:
+    """Pack consecutive expirations into ranges of at most *chunk_rows* rows.
+
+    Each expiration date is kept whole, so a single expiration with more
+    than *chunk_rows* quotes becomes a chunk of its own.
+
+    Args:
+        expirations: Normalized expiration of every row of the chain.
+        chunk_rows: Target maximum number of rows per chunk.
+
+    Returns:
+        Half-open ``[start, stop)`` ranges covering every expiration.
+    """
+    if isinstance(chunk_rows, bool) or not isinstance(chunk_rows, int):
+        raise ValueError(f"chunk_rows must be a positive integer, got {chunk_rows!r}")
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be a positive integer, got {chunk_rows!r}")
+
+    counts = expirations.value_counts().sort_index()
+    days = pd.DatetimeIndex(counts.index)
+    ranges: List[ExpirationRange] = []
+    start = None
+    rows = 0
+    for day, n in zip(days, counts.to_numpy()):
+        if start is not None and rows + n > chunk_rows:
+            ranges.append((start, day))
+            start = None
+        if start is None:
+            start, rows = day, 0
+        rows += n
+    if start is not None:
+        ranges.append((start, days[-1] + pd.Timedelta(days=1)))
+    return tuple(ranges)
+
+
+def _slice_chain(
+    data: pd.DataFrame,
+    expirations: pd.Series,
+    start: pd.Timestamp,
+    stop: pd.Timestamp,
+) -> pd.DataFrame:
+    """Rows of *data* whose normalized expiration is in ``[start, stop)``."""
+    return data[(expirations >= start) & (expirations < stop)]
+
+
+def chunk_chain(data: pd.DataFrame, chunk_rows: int) -> ChunkedChain:
+    """Split an in-memory option chain into expiration-aligned chunks.
+
+    Useful when the chain fits in memory but the pipeline's intermediate
+    frames for the whole history do not.  For chains that do not fit in
+    memory, use ``load_cached_options_chunked()``, which reads each chunk
+    from the cache on demand.
+
+    Args:
+        data: Option chain DataFrame (as returned by ``csv_data()`` or
+            ``options_data()``).
+        chunk_rows: Target maximum number of rows per chunk.  Chunks never
+            split an expiration, so one may exceed this.
+
+    Returns:
+        A :class:`ChunkedChain` over *data*.
+
+    Raises:
+        ValueError: If ``chunk_rows`` is not a positive integer.
+    """
+    expirations = normalize_dates(data["expiration"])
+    return ChunkedChain(
+        ranges=_plan_chunks(expirations, chunk_rows),
+        read=partial(_slice_chain, data, expirations),
+    )
@@ -0,0 +1,203 @@
+"""Compact in-memory schema for option chains.
+
+A chain loaded with default dtypes keeps ``underlying_symbol`` and
+``option_type`` as strings and every number as a 64-bit float, which is
+roughly 2.5x the memory the data needs.  ``compact_chain()`` re-encodes
+it column by column:
+
+- ``underlying_symbol`` / ``option_type`` → categoricals
+- ``strike``, ``bid``, ``ask``, ``underlying_price`` → int32 cents
+- Greeks and ``implied_volatility`` → float32
+- ``volume`` / ``open_interest`` → int32
+- ``expiration`` / ``quote_date`` → int32 day numbers (days since 1970-01-01)
+
+A column is only re-encoded when the encoding is lossless for its values
+(prices quoted in whole cents, Greeks with at most six significant
+digits, midnight dates, counts that fit in 32 bits); any other column is
+left as it is.  The re-encoded columns are recorded in ``DataFrame.attrs``.
+A chain that was not built by ``compact_chain()`` is never decoded, even
+if it happens to hold int32 prices.
+
+The compact schema is a storage format for chains held between runs, not
+one the engine computes on.  Strategy entry points and ``prepare()``
+expand the recorded columns back to the standard schema with
+``_expand_compact()`` before validating it, so no filter, merge or
+groupby sees a compact dtype and results are identical to the
+uncompacted chain.  Each run therefore holds the compact chain plus an
+expanded copy of its encoded columns while it executes, and a
+``PreparedChain`` built from a compact chain holds standard dtypes.
+
+Example::
+
+    import optopsy as op
+
+    chain = op.compact_chain(op.csv_data("SPX_2018.csv"))
+    results = op.short_puts(chain)
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+_CATEGORY_COLUMNS: Tuple[str, ...] = ("underlying_symbol", "option_type")
+_CENT_COLUMNS: Tuple[str, ...] = ("strike", "bid", "ask", "underlying_price")
+_FLOAT32_COLUMNS: Tuple[str, ...] = (
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied_volatility",
+)
+_COUNT_COLUMNS: Tuple[str, ...] = ("volume", "open_interest")
+_DATE_COLUMNS: Tuple[str, ...] = ("expiration", "quote_date")
+
+# Significant digits float32 columns are decoded to
+_FLOAT32_DIGITS = 6
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+# Unit compact dates decode to (the pandas default for parsed dates)
+_DATE_DTYPE = "datetime64[us]"
+
+# ``DataFrame.attrs`` key listing the columns ``compact_chain()`` encoded
+_COMPACT_ATTR = "optopsy_compact"
+
+
+def compact_chain(data: pd.DataFrame) -> pd.DataFrame:
+    """Re-encode an option chain in the compact schema.
+
+    Args:
+        data: Option chain with the standard schema (as returned by
+            ``csv_data()``, ``options_data()`` or ``load_cached_options()``).
+
+    Returns:
+        A new DataFrame whose columns use compact dtypes wherever the
+        encoding is lossless; it can be passed to any strategy function,
+        ``prepare()`` or ``simulate()`` in place of *data*.
+    """
+    encoded = {}
+    for col in data.columns:
+        series = data[col]
+        if col in _CATEGORY_COLUMNS:
+            encoded[col] = _encode_category(series)
+        elif col in _CENT_COLUMNS:
+            encoded[col] = _encode_cents(series)
+        elif col in _FLOAT32_COLUMNS:
+            encoded[col] = _encode_float32(series)
+        elif col in _COUNT_COLUMNS:
+            encoded[col] = _encode_count(series)
+        elif col in _DATE_COLUMNS:
+            encoded[col] = _encode_days(series)
+    changed = [
+        col for col, series in encoded.items() if series.dtype != data[col].dtype
+    ]
+    if not changed:
+        return data
+    result = data.assign(**{col: encoded[col] for col in changed})
+    result.attrs[_COMPACT_ATTR] = tuple(changed)
+    return result
+
+
+def _expand_compact(data: pd.DataFrame) -> pd.DataFrame:
+    """Expand the columns ``compact_chain()`` encoded back to standard dtypes.
+
+    Only columns listed under ``_COMPACT_ATTR`` in ``data.attrs`` are
+    decoded.  Returns *data* itself when it is not a compact chain.
+    """
+    compacted = data.attrs.get(_COMPACT_ATTR)
+    if not compacted:
+        return data
+    decoded = {}
+    for col in data.columns:
+        if col not in compacted:
+            continue
+        dtype = data[col].dtype
+        if col in _CATEGORY_COLUMNS and isinstance(dtype, pd.CategoricalDtype):
+            decoded[col] = data[col].astype(dtype.categories.dtype)
+        elif col in _CENT_COLUMNS and dtype == np.int32:
+            decoded[col] = data[col].to_numpy(np.float64) / 100
+        elif col in _FLOAT32_COLUMNS and dtype == np.float32:
+            decoded[col] = _decode_float32(data[col].to_numpy())
+        elif col in _COUNT_COLUMNS and dtype == np.int32:
+            decoded[col] = data[col].astype(np.int64)
+        elif col in _DATE_COLUMNS and dtype == np.int32:
+            decoded[col] = (
+                data[col].to_numpy(np.int64).astype("datetime64[D]").astype(_DATE_DTYPE)
+            )
+    result = data.assign(**decoded)
+    del result.attrs[_COMPACT_ATTR]
+    return result
+
+
+def _encode_category(series: pd.Series) -> pd.Series:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if not (pd.api.types.is_string_dtype(series) or series.dtype == object):
+        return series
+    encoded = series.astype("category")
+    # Decoding must restore the original dtype
+    if encoded.cat.categories.dtype != series.dtype:
+        return series
+    return encoded
+
+
+def _encode_cents(series: pd.Series) -> pd.Series:
+    if series.dtype != np.float64:
+        return series
+    values = series.to_numpy()
+    cents = np.rint(values * 100)
+    if not (np.isfinite(cents).all() and (np.abs(cents) <= _INT32_MAX).all()):
+        return series
+    if not np.array_equal(cents / 100, values):
+        return series
+    return pd.Series(cents.astype(np.int32), index=series.index, name=series.name)
+
+
+def _encode_float32(series: pd.Series) -> pd.Series:
+    if series.dtype != np.float64:
+        return series
+    encoded = series.to_numpy().astype(np.float32)
+    if not np.array_equal(_decode_float32(encoded), series.to_numpy(), equal_nan=True):
+        return series
+    return pd.Series(encoded, index=series.index, name=series.name)
+
+
+def _decode_float32(values: np.ndarray) -> np.ndarray:
+    """Nearest float64 to each float32 value rounded to ``_FLOAT32_DIGITS``.
+
+    A float64 with at most that many significant digits survives the
+    float32 round trip exactly: float32 keeps over seven digits, so
+    rounding recovers the original decimal, and dividing by an exact
+    power of ten yields the float64 closest to it.
+    """
+    wide = values.astype(np.float64)
+    finite = np.isfinite(wide) & (wide != 0)
+    magnitude = np.floor(np.log10(np.abs(wide, where=finite, out=np.ones_like(wide))))
+    decimals = np.clip(_FLOAT32_DIGITS - 1 - magnitude, 0, 15)
+    scale = 10.0**decimals
+    return np.where(finite, np.rint(wide * scale) / scale, wide)
+
+
+def _encode_count(series: pd.Series) -> pd.Series:
+    if series.dtype != np.int64:
+        return series
+    values = series.to_numpy()
+    if len(values) and np.abs(values).max() > _INT32_MAX:
+        return series
+    return series.astype(np.int32)
+
+
+def _encode_days(series: pd.Series) -> pd.Series:
+    if series.dtype != _DATE_DTYPE:
+        return series
+    values = series.to_numpy()
+    if np.isnat(values).any():
+        return series
+    days = values.astype("datetime64[D]")
+    if not np.array_equal(days.astype(_DATE_DTYPE), values):
+        return series
+    return pd.Series(
+        days.astype(np.int64).astype(np.int32), index=series.index, name=series.name
+    )
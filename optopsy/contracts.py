@@ -0,0 +1,289 @@
+"""Sorted contract index for point and range lookups into an option chain.
+
+Entry/exit matching, early-exit scanning and calendar exit pricing all ask
+the same question: *which rows does contract C have on (or between) given
+quote dates?*  Answering it with ``DataFrame.merge`` rebuilds a hash table
+over the chain on every call.  ``_ContractIndex`` instead:
+
+- assigns every contract ``(underlying_symbol, option_type, expiration,
+  strike)`` an integer id once
+- encodes each row as ``contract_id * n_dates + date_code`` and sorts the
+  chain by that key (stable, so duplicates keep their original order)
+- keeps ``offsets`` so each contract's rows form one contiguous,
+  chronologically sorted block
+
+Lookups are then ``np.searchsorted`` calls -- O(log n) per query row with
+no per-call hash-table construction.  Indexes are cached only for frames
+registered with ``_pin_index()`` -- the frames of a prepared chain (see
+``prepared``) and the chain a strategy call normalizes for itself, none of
+which is ever modified in place -- so a prepared chain is indexed once and
+reused by every strategy run on it, and a cache hit costs a dict lookup.
+Any other frame is indexed afresh on every call.
+"""
+
+import weakref
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+CONTRACT_COLS: List[str] = ["underlying_symbol", "option_type", "expiration", "strike"]
+
+# id(frame) -> (weak reference to frame, index once built) for pinned
+# frames.  Entries are dropped when the frame is garbage collected.
+_INDEX_CACHE: Dict[int, Tuple[weakref.ref, Optional["_ContractIndex"]]] = {}
+
+
+class _ContractIndex:
+    """Rows of an option chain sorted by ``(contract_id, quote_date)``.
+
+    The index stores row *positions*, never the frame itself, so caching
+    it does not keep the frame alive.
+
+    Attributes:
+        contracts: Unique contract keys; position ``i`` is contract id ``i``.
+        dates: Sorted unique quote dates; position is the date code.
+        order: Row positions of the source frame in sorted order.
+        keys: Sorted ``contract_id * n_dates + date_code`` per row.
+        offsets: ``offsets[i]:offsets[i + 1]`` is contract ``i``'s block
+            within ``order``/``keys``.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        codes, contracts = pd.factorize(
+            pd.MultiIndex.from_frame(data[CONTRACT_COLS]), use_na_sentinel=False
+        )
+        quote_dates = data["quote_date"].to_numpy()
+        dates = np.unique(quote_dates)
+
+        self.contracts: pd.Index = contracts
+        self.dates: np.ndarray = dates
+        self._n_dates = max(len(dates), 1)
+
+        row_keys = codes.astype(np.int64) * self._n_dates + np.searchsorted(
+            dates, quote_dates
+        )
+        self.order: np.ndarray = np.argsort(row_keys, kind="stable")
+        self.keys: np.ndarray = row_keys[self.order]
+        self.offsets: np.ndarray = np.searchsorted(
+            self.keys, np.arange(len(contracts) + 1, dtype=np.int64) * self._n_dates
+        )
+
+    def contract_ids(self, contracts: List[pd.Series]) -> np.ndarray:
+        """Map contract key columns (in ``CONTRACT_COLS`` order) to ids.
+
+        Returns ``-1`` for contracts that do not occur in the chain.
+        """
+        if len(contracts[0]) == 0:
+            return np.empty(0, dtype=np.int64)
+        query = pd.MultiIndex.from_arrays(contracts)
+        return self.contracts.get_indexer(query).astype(np.int64)
+
+    def _date_codes(
+        self, dates: pd.Series, side: Literal["left", "right"] = "left"
+    ) -> np.ndarray:
+        values = np.asarray(dates, dtype=self.dates.dtype)
+        return np.searchsorted(self.dates, values, side=side)
+
+    def _query_keys(
+        self, ids: np.ndarray, dates: pd.Series
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Sort keys for (id, date) queries and whether each key can exist."""
+        values = np.asarray(dates, dtype=self.dates.dtype)
+        codes = np.searchsorted(self.dates, values)
+        valid = (ids >= 0) & (codes < len(self.dates))
+        valid[valid] = self.dates[codes[valid]] == values[valid]
+        return ids * self._n_dates + codes, valid
+
+    def _expand(
+        self, lo: np.ndarray, lengths: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Expand per-query ``[lo, lo + length)`` windows into row positions."""
+        query_rows = np.repeat(np.arange(len(lo)), lengths)
+        starts = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+        return query_rows, self.order[starts + np.arange(lengths.sum())]
+
+    def locate(self, ids: np.ndarray, dates: pd.Series) -> np.ndarray:
+        """Return the first row position quoting each contract on each date.
+
+        Args:
+            ids: Contract ids from ``contract_ids()``.
+            dates: Quote date per query row.
+
+        Returns:
+            Row positions into the indexed frame, ``-1`` where the contract
+            has no quote on that date.
+        """
+        if len(self.keys) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        query, valid = self._query_keys(ids, dates)
+        pos = np.searchsorted(self.keys, query, side="left")
+        hit = valid & (pos < len(self.keys))
+        hit[hit] = self.keys[pos[hit]] == query[hit]
+        return np.where(hit, self.order[np.minimum(pos, len(self.keys) - 1)], -1)
+
+    def locate_all(
+        self, ids: np.ndarray, dates: pd.Series
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return every row quoting each contract on each date.
+
+        Unlike ``locate()``, duplicate quotes are all returned, matching an
+        inner merge on the contract and date columns.
+
+        Args:
+            ids: Contract ids from ``contract_ids()``.
+            dates: Quote date per query row.
+
+        Returns:
+            Tuple of (query row number, row position into the indexed
+            frame), grouped by query row with duplicates in source order.
+        """
+        if len(self.keys) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        query, valid = self._query_keys(ids, dates)
+        lo = np.searchsorted(self.keys, query, side="left")
+        hi = np.searchsorted(self.keys, query, side="right")
+        return self._expand(lo, np.where(valid, hi - lo, 0))
+
+    def locate_latest(
+        self,
+        ids: np.ndarray,
+        latest: pd.Series,
+        earliest: Optional[pd.Series] = None,
+    ) -> np.ndarray:
+        """Return the first row of each contract's last quote date <= ``latest``.
+
+        Args:
+            ids: Contract ids from ``contract_ids()``.
+            latest: Upper bound on the quote date per query row (inclusive).
+            earliest: Optional lower bound per query row (inclusive).
+
+        Returns:
+            Row positions into the indexed frame, ``-1`` where no quote
+            falls in the window.
+        """
+        if len(self.keys) == 0:
+            return np.full(len(ids), -1, dtype=np.int64)
+        query = ids * self._n_dates + self._date_codes(latest, side="right")
+        # Last sorted position strictly below the query key
+        pos = np.searchsorted(self.keys, query, side="left") - 1
+        safe = np.maximum(ids, 0)
+        hit = (ids >= 0) & (pos >= self.offsets[safe])
+        if earliest is not None:
+            floor = ids * self._n_dates + self._date_codes(earliest)
+            hit &= self.keys[np.maximum(pos, 0)] >= floor
+        # Step back to the first of any duplicate quotes on that date
+        first = np.searchsorted(self.keys, self.keys[np.maximum(pos, 0)], side="left")
+        return np.where(hit, self.order[first], -1)
+
+    def last_dates(self, ids: np.ndarray) -> np.ndarray:
+        """Return each contract's last quote date (``NaT`` for ``-1`` ids)."""
+        result = np.full(len(ids), self.dates.dtype.type("NaT"), dtype=self.dates.dtype)
+        valid = ids >= 0
+        if len(self.keys) == 0 or not valid.any():
+            return result
+        last = self.keys[self.offsets[ids[valid] + 1] - 1]
+        result[valid] = self.dates[last - ids[valid] * self._n_dates]
+        return result
+
+    def _windows(
+        self, ids: np.ndarray, after: pd.Series
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Start and length of each query's ``between()`` window in ``order``."""
+        valid = ids >= 0
+        safe = np.where(valid, ids, 0)
+        lo = np.searchsorted(
+            self.keys,
+            safe * self._n_dates + self._date_codes(after, side="right"),
+            side="left",
+        )
+        block_end = self.offsets[safe + 1]
+        last_key = self.keys[np.maximum(block_end - 1, 0)]
+        hi = np.searchsorted(self.keys, last_key, side="left")
+        lengths = np.where(valid & (block_end > self.offsets[safe]), hi - lo, 0)
+        return lo, np.maximum(lengths, 0)
+
+    def between(
+        self, ids: np.ndarray, after: pd.Series
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows strictly after ``after`` and strictly before the contract's last date.
+
+        This is the early-exit scan window: every quote after entry, up to
+        but excluding the last quote date the chain has for the contract.
+
+        Args:
+            ids: Contract ids from ``contract_ids()``.
+            after: Exclusive lower bound on the quote date per query row.
+
+        Returns:
+            Tuple of (query row number, row position into the indexed
+            frame) for every row in each query's window, grouped by query
+            row and chronological within each group.
+        """
+        if len(self.keys) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        return self._expand(*self._windows(ids, after))
+
+    def between_batches(
+        self, ids: np.ndarray, after: pd.Series, max_rows: int
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """``between()`` in batches of consecutive queries.
+
+        Each batch holds at most ``max_rows`` rows, unless a single query's
+        window is longer; windows are never split.  Only one batch is
+        materialised at a time.
+
+        Yields:
+            Tuple of (query row number, row position into the indexed
+            frame), as ``between()`` returns them for the batch's queries.
+        """
+        if len(self.keys) == 0:
+            return
+        lo, lengths = self._windows(ids, after)
+        ends = np.cumsum(lengths)
+        start = 0
+        while start < len(ids):
+            floor = ends[start] - lengths[start]
+            stop = max(
+                int(np.searchsorted(ends, floor + max_rows, side="right")), start + 1
+            )
+            if ends[stop - 1] > floor:
+                rows, positions = self._expand(lo[start:stop], lengths[start:stop])
+                yield rows + start, positions
+            start = stop
+
+
+def _pin_index(data: pd.DataFrame) -> pd.DataFrame:
+    """Let *data*'s contract index be cached for the lifetime of the frame.
+
+    Only frames the engine owns and never modifies in place may be pinned:
+    a cached index is not revalidated against the frame.
+
+    Returns:
+        *data* itself.
+    """
+    key = id(data)
+    cached = _INDEX_CACHE.get(key)
+    if cached is None or cached[0]() is not data:
+        ref = weakref.ref(data, lambda _, key=key: _INDEX_CACHE.pop(key, None))
+        _INDEX_CACHE[key] = (ref, None)
+    return data
+
+
+def _contract_index(data: pd.DataFrame) -> _ContractIndex:
+    """Return the contract index for *data*.
+
+    The index of a pinned frame (see ``_pin_index()``) is built on first use
+    and cached; any other frame is indexed on every call.
+    """
+    key = id(data)
+    cached = _INDEX_CACHE.get(key)
+    if cached is None or cached[0]() is not data:
+        return _ContractIndex(data)
+    index = cached[1]
+    if index is None:
+        index = _ContractIndex(data)
+        _INDEX_CACHE[key] = (cached[0], index)
+    return index
@@ -24,11 +24,12 @@ Implementation details are split across focused submodules:
 - ``output`` -- result formatting and grouping
 """
 
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .aggregates import _finalize_aggregates, _merge_aggregates, _partial_aggregates
 from .calendar import (
     _calculate_calendar_pnl,
     _evaluate_calendar_options,
@@ -37,12 +38,68 @@ from .calendar import (
     _prepare_calendar_leg,
 )
 from .checks import _run_calendar_checks, _run_checks
-from .evaluation import _evaluate_all_options
+from .chunked import ChunkedChain
+from .compact import _expand_compact
+from .contracts import _pin_index
+from .evaluation import _evaluate_all_options, _evaluate_all_options_staged
 from .exits import _apply_early_exits
-from .filters import _apply_signal_filter, _assign_dte
+from .filters import _apply_signal_filter
 from .output import _format_calendar_output, _format_output
+from .prepared import (
+    ChainLike,
+    PreparedChain,
+    _normalize_chain,
+    _restore_dtypes,
+    _stage_cache,
+)
 from .pricing import _assign_profit, _calculate_commission, _calculate_fill_price
-from .timestamps import normalize_dates
+from .stages import _freeze
+
+
+def _prepare_inputs(
+    data: ChainLike, params: Dict[str, Any], checker: Callable[..., Dict[str, Any]]
+) -> Tuple[Dict[str, Any], pd.DataFrame, Callable[[Callable], pd.DataFrame]]:
+    """Validate parameters and normalize the chain once at the pipeline root.
+
+    Normalizing here means all downstream merges (signal filtering,
+    entry/exit matching) work regardless of source, and ``dte`` is assigned
+    once instead of per leg.  A chain in the compact schema (see
+    ``compact.py``) is expanded to standard dtypes first.  A :class:`~optopsy.prepared.PreparedChain` is
+    used as-is: its schema was validated by ``prepare()`` and its call/put
+    partitions are reused.
+
+    Args:
+        data: Raw option chain DataFrame or a prepared chain.
+        params: User-supplied strategy parameters.
+        checker: ``_run_checks`` or ``_run_calendar_checks``.
+
+    Returns:
+        Tuple of (validated params, normalized chain, partition function).
+        The partition function maps a leg's option filter (``_calls`` or
+        ``_puts``) to the matching rows, computing each at most once.
+
+    Raises:
+        ValueError: If *data* is a ``ChunkedChain``, which is run chunk by
+            chunk and never reaches the pipeline root as a whole.
+    """
+    if isinstance(data, ChunkedChain):
+        raise ValueError("A chunked chain cannot be used by this strategy")
+    if isinstance(data, PreparedChain):
+        validated = checker(params, data.data, check_schema=False)
+        return validated, data.data, data.partition
+
+    data = _expand_compact(data)
+    validated = checker(params, data)
+    # Private to this call, so its contract index may be cached
+    normalized = _pin_index(_normalize_chain(data))
+    partitions: Dict[Callable, pd.DataFrame] = {}
+
+    def partition(option_filter: Callable) -> pd.DataFrame:
+        if option_filter not in partitions:
+            partitions[option_filter] = option_filter(normalized)
+        return partitions[option_filter]
+
+    return validated, normalized, partition
 
 
 def _rename_leg_columns(
@@ -119,8 +176,8 @@ def _strategy_engine(
         side = leg_def[0][0]
         has_bid_ask = "bid_entry" in data.columns and "ask_entry" in data.columns
 
+        data = data.copy()  # Avoid modifying original DataFrame
         if has_bid_ask and slippage != "mid":
-            data = data.copy()  # Avoid modifying original DataFrame
             # Calculate fill prices with slippage
             volume_entry = (
                 data.get("volume_entry") if "volume_entry" in data.columns else None
@@ -186,7 +243,7 @@ def _strategy_engine(
     )
 
 
-def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
+def _process_strategy(data: ChainLike, **context: Any) -> pd.DataFrame:
     """
     Main entry point for processing option strategies.
 
@@ -194,22 +251,83 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
     then legs are joined via _strategy_engine().
 
     Args:
-        data: DataFrame containing raw option chain data
+        data: DataFrame containing raw option chain data, a
+            ``PreparedChain`` from ``prepare()`` or a ``ChunkedChain``
         **context: Dictionary containing strategy parameters, leg definitions,
                    and formatting options
 
     Returns:
         DataFrame with processed strategy results
     """
-    params = _run_checks(context["params"], data)
+    if isinstance(data, ChunkedChain):
+        return _process_chunked_strategy(data, **context)
+
+    result, params, external_cols = _strategy_trades(data, **context)
+    output = _format_output(
+        result,
+        params,
+        context["internal_cols"],
+        external_cols,
+    )
+    return _restore_dtypes(data, output)
 
-    # Normalize date columns once at the root so all downstream merges
-    # (signal filtering, entry/exit matching) work regardless of source.
-    data = data.copy()
-    data["quote_date"] = normalize_dates(data["quote_date"])
-    data["expiration"] = normalize_dates(data["expiration"])
-    # Normalize option_type once so _calls/_puts avoid repeated .str.lower() calls
-    data["option_type"] = data["option_type"].str.lower()
+
+def _process_chunked_strategy(chain: ChunkedChain, **context: Any) -> pd.DataFrame:
+    """
+    Run a strategy chunk by chunk and combine the results.
+
+    Each chunk holds every quote of the contracts it contains, so trades
+    never span chunks.  Between chunks only the formatted raw rows, or the
+    mergeable per-bucket aggregates (see ``aggregates``) for aggregated
+    output, are kept.
+
+    Args:
+        chain: Expiration-aligned chunks of the option chain
+        **context: Same as ``_process_strategy``
+
+    Returns:
+        DataFrame with processed strategy results
+    """
+    internal_cols = context["internal_cols"]
+    kept = []
+    merged: Optional[pd.DataFrame] = None
+    result = params = external_cols = None
+    for chunk in chain:
+        result, params, external_cols = _strategy_trades(chunk, **context)
+        if result.empty:
+            continue
+        if params["raw"]:
+            kept.append(_format_output(result, params, internal_cols, external_cols))
+            continue
+        # Fold each chunk in as it arrives: merging compacts the quantile
+        # sketches, so retained state stays bounded across chunks.  A single
+        # chunk with trades keeps its exact partial.
+        partial = _partial_aggregates(result, external_cols)
+        merged = partial if merged is None else _merge_aggregates([merged, partial])
+
+    if result is None or params is None or external_cols is None:
+        raise ValueError("Chunked chain contains no data")
+    if params["raw"]:
+        if not kept:
+            return _format_output(result, params, internal_cols, external_cols)
+        return pd.concat(kept, ignore_index=True)
+    if merged is None:
+        return _format_output(result, params, internal_cols, external_cols)
+    return _finalize_aggregates(merged, params["drop_nan"]).reset_index()
+
+
+def _strategy_trades(
+    data: ChainLike, **context: Any
+) -> Tuple[pd.DataFrame, Dict[str, Any], List[str]]:
+    """
+    Build the unformatted trades of a (non-calendar) strategy.
+
+    Returns:
+        Tuple of (trades, validated params, grouping columns for
+        aggregated output)
+    """
+    stages = _stage_cache(data)
+    params, data, partition = _prepare_inputs(data, context["params"], _run_checks)
 
     leg_def = context["leg_def"]
     leg_deltas = [params.get(f"leg{i}_delta") for i in range(1, 5)]
@@ -225,22 +343,11 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
     # Build join_on from context
     join_on = context.get("join_on")
 
-    # Pre-filter only the option types actually needed by this strategy
-    from .evaluation import _calls, _puts
-
-    needed_filters = {leg[1] for leg in leg_def}
-    _prefiltered = {f: f(data) for f in needed_filters if f in (_calls, _puts)}
-
-    # Evaluate each leg independently
+    # Evaluate each leg independently; partitions are shared between legs
+    # of the same option type
     leg_results = []
     for leg, delta_target in zip(leg_def, leg_deltas[: len(leg_def)]):
-        option_filter = leg[1]  # _calls or _puts
-        leg_data = _prefiltered.get(option_filter)
-        if leg_data is None:
-            leg_data = option_filter(data)
-
-        evaluated = _evaluate_all_options(
-            leg_data,
+        eval_kwargs = dict(
             dte_interval=params["dte_interval"],
             max_entry_dte=params["max_entry_dte"],
             exit_dte=params["exit_dte"],
@@ -253,6 +360,12 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
             entry_dates=params["entry_dates"],
             exit_dates=params["exit_dates"],
         )
+        if stages is not None:
+            evaluated = _evaluate_all_options_staged(
+                partition(leg[1]), stages, leg[1], **eval_kwargs
+            )
+        else:
+            evaluated = _evaluate_all_options(partition(leg[1]), **eval_kwargs)
         leg_results.append(evaluated)
 
     # Build external_cols with delta_range_legN
@@ -266,30 +379,33 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
     # Commission is already a plain dict after _run_checks() -> model_dump()
     commission = params.get("commission")
 
-    # For single-leg, use _strategy_engine directly
-    if len(leg_def) == 1:
-        result = _strategy_engine(
-            leg_results[0],
-            leg_def,
-            slippage=params["slippage"],
-            fill_ratio=params["fill_ratio"],
-            reference_volume=params["reference_volume"],
-            commission=commission,
-            per_leg_slippage=params["per_leg_slippage"],
-        )
-    else:
-        if not join_on:
-            join_on = ["underlying_symbol", "expiration", "dte_entry", "dte_range"]
+    def _build_trades() -> pd.DataFrame:
+        # For single-leg, use _strategy_engine directly
+        if len(leg_def) == 1:
+            return _strategy_engine(
+                leg_results[0],
+                leg_def,
+                slippage=params["slippage"],
+                fill_ratio=params["fill_ratio"],
+                reference_volume=params["reference_volume"],
+                commission=commission,
+                per_leg_slippage=params["per_leg_slippage"],
+            )
 
+        leg_join_on = join_on or [
+            "underlying_symbol",
+            "expiration",
+            "dte_entry",
+            "dte_range",
+        ]
         partials = [
-            _rename_leg_columns(lr, idx, join_on)
+            _rename_leg_columns(lr, idx, leg_join_on)
             for idx, lr in enumerate(leg_results, start=1)
         ]
-
-        result = _merge_legs(
+        return _merge_legs(
             partials,
             leg_def,
-            join_on,
+            leg_join_on,
             context.get("rules"),
             params["slippage"],
             params["fill_ratio"],
@@ -298,6 +414,26 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
             params["per_leg_slippage"],
         )
 
+    if stages is None:
+        result = _build_trades()
+    else:
+        # Leg frames are memoized by identity, so the joined trades depend
+        # only on which leg frames went in plus the pricing parameters.
+        trades_key = (
+            "trades",
+            tuple(id(lr) for lr in leg_results),
+            _freeze(leg_def),
+            _freeze(join_on),
+            context.get("rules"),
+            params["slippage"],
+            params["fill_ratio"],
+            params["reference_volume"],
+            _freeze(commission),
+            params["per_leg_slippage"],
+        )
+        # Copy so downstream stages never write into the memoized frame
+        result = stages.get(trades_key, _build_trades).copy()
+
     # Apply early exits (stop-loss / take-profit / max-hold-days) if configured
     if (
         params.get("stop_loss") is not None
@@ -306,15 +442,10 @@ def _process_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
     ):
         result = _apply_early_exits(result, data, leg_def, params)
 
-    return _format_output(
-        result,
-        params,
-        context["internal_cols"],
-        external_cols,
-    )
+    return result, params, external_cols
 
 
-def _process_calendar_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFrame:
+def _process_calendar_strategy(data: ChainLike, **context: Any) -> pd.DataFrame:
     """
     Process calendar/diagonal spread strategies with different expirations.
 
@@ -322,13 +453,28 @@ def _process_calendar_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFra
     Diagonal spreads have different strikes and different expirations.
 
     Args:
-        data: DataFrame containing raw option chain data
+        data: DataFrame containing raw option chain data, or a
+            ``PreparedChain`` from ``prepare()``
         **context: Dictionary containing strategy parameters, leg definitions, and formatting options
 
     Returns:
         DataFrame with processed calendar/diagonal strategy results
+
+    Raises:
+        ValueError: If *data* is a ``ChunkedChain``; calendar legs span
+            expirations, so expiration-aligned chunks would split trades.
     """
-    params = _run_calendar_checks(context["params"], data)
+    if isinstance(data, ChunkedChain):
+        raise ValueError(
+            "Calendar and diagonal strategies cannot run on a chunked chain: "
+            "their legs span expirations that may fall in different chunks"
+        )
+
+    chain = data
+    stages = _stage_cache(data)
+    params, data, partition = _prepare_inputs(
+        data, context["params"], _run_calendar_checks
+    )
 
     leg_def = context["leg_def"]
     same_strike = context.get("same_strike", True)
@@ -348,43 +494,46 @@ def _process_calendar_strategy(data: pd.DataFrame, **context: Any) -> pd.DataFra
         raise ValueError("leg2_delta is required for diagonal strategies")
 
     def _fmt(df: pd.DataFrame) -> pd.DataFrame:
-        return _format_calendar_output(
+        output = _format_calendar_output(
             df, params, internal_cols, external_cols, same_strike
         )
+        return _restore_dtypes(chain, output)
 
-    # Normalize dates/option_type once at the root; _assign_dte returns a new
-    # DataFrame via .assign(), so no explicit .copy() needed.
-    data = data.assign(
-        quote_date=normalize_dates(data["quote_date"]),
-        expiration=normalize_dates(data["expiration"]),
-        option_type=data["option_type"].str.lower(),
-    )
-    data = _assign_dte(data)
-
-    # Get front and back leg options with delta targeting
+    # Get front and back leg options with delta targeting.  Both legs share
+    # the option type of the leg definition (calls or puts).
     front_delta = leg1_delta
     back_delta = leg2_delta if leg2_delta is not None else leg1_delta
+    option_filter = leg_def[0][1]
+    leg_data = partition(option_filter)
+
+    def _leg_options(dte_min: int, dte_max: int, delta: Dict) -> pd.DataFrame:
+        def _evaluate() -> pd.DataFrame:
+            return _evaluate_calendar_options(
+                leg_data,
+                dte_min,
+                dte_max,
+                min_bid_ask=params["min_bid_ask"],
+                delta_target=delta,
+            )
 
-    front_options = _evaluate_calendar_options(
-        data,
-        params["front_dte_min"],
-        params["front_dte_max"],
-        min_bid_ask=params["min_bid_ask"],
-        delta_target=front_delta,
-    )
+        if stages is None:
+            return _evaluate()
+        key = (
+            "calendar_leg",
+            option_filter,
+            dte_min,
+            dte_max,
+            params["min_bid_ask"],
+            _freeze(delta),
+        )
+        return stages.get(key, _evaluate)
 
-    back_options = _evaluate_calendar_options(
-        data,
-        params["back_dte_min"],
-        params["back_dte_max"],
-        min_bid_ask=params["min_bid_ask"],
-        delta_target=back_delta,
+    front_options = _leg_options(
+        params["front_dte_min"], params["front_dte_max"], front_delta
+    )
+    back_options = _leg_options(
+        params["back_dte_min"], params["back_dte_max"], back_delta
     )
-
-    # Filter by option type (calls or puts) based on leg definition
-    option_filter = leg_def[0][1]
-    front_options = option_filter(front_options)
-    back_options = option_filter(back_options)
 
     # Prepare and merge legs
     front_renamed = _prepare_calendar_leg(front_options, 1, same_strike)
@@ -306,12 +306,11 @@ def _cmd_import(args: argparse.Namespace) -> None:
     """Import local parquet files into the PostgreSQL data store."""
     import os
 
-    import pandas as pd
     from rich.console import Console
 
     _load_env()
 
-    from optopsy.data.providers.cache import get_store
+    from optopsy.data.providers.cache import get_store, read_dataset
 
     console = Console()
     store = get_store()
@@ -346,7 +345,7 @@ def _cmd_import(args: argparse.Namespace) -> None:
         symbol = os.path.basename(fpath).replace(".parquet", "").upper()
 
         with console.status(f"Importing {symbol} ({category})..."):
-            df = pd.read_parquet(fpath)
+            df = read_dataset(fpath)
             store.write(category, symbol, df)
 
         console.print(
@@ -442,7 +441,7 @@ def _build_data_subparsers(
     import_parser.add_argument(
         "files",
         nargs="+",
-        help="Parquet file paths (e.g. ~/.optopsy/cache/options/SPY.parquet)",
+        help="Parquet file or cache dataset paths (e.g. ~/.optopsy/cache/options/SPY.parquet)",
     )
     import_parser.add_argument(
         "-c",
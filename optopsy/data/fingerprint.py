@@ -0,0 +1,150 @@
+"""Cheap, cached identities for DataFrames.
+
+The chat agent keys cached strategy results on the active dataset, and
+``ResultStore.make_key()`` on any DataFrame argument (e.g. signal dates).
+Hashing every cell with ``pd.util.hash_pandas_object`` costs seconds per
+tool call on a chain of tens of millions of rows, so identities are
+derived as cheaply as the frame allows:
+
+1. **Provenance** — a frame read from a data store is identified by where
+   it came from: the dataset's path and stored version (manifest hash or
+   file mtime, see ``DataStore.dataset_version()``).  ``remember()``
+   records such an identity, and ``derive()`` extends a parent's identity
+   with the operation that produced a child (filters applied, columns
+   selected), without touching the data.
+2. **Content** — any other frame is hashed.  Frames of up to
+   ``_FULL_HASH_ROWS`` rows are hashed in full; larger ones hash their
+   shape, columns and dtypes, a checksum of every numeric column and
+   ``_SAMPLE_BLOCKS`` evenly spaced blocks of rows.
+
+Provenance fingerprints are cached against the frame object until it is
+garbage-collected, and dropped when the frame's shape, columns or dtypes
+change.  Values edited in place are not detected, so frames returned by a
+loader are treated as immutable — as the tools treat every dataset.
+Content hashes are not cached: a frame the caller built may be edited in
+place between calls, so it is hashed again on every call.
+"""
+
+import hashlib
+import json
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from optopsy import __version__
+
+# Frames up to this many rows are hashed in full
+_FULL_HASH_ROWS = 1_000_000
+
+# Larger frames hash this many evenly spaced blocks of rows in full
+_SAMPLE_BLOCKS = 64
+_BLOCK_ROWS = 4096
+
+# Dtype kinds whose values are checksummed over every row of large frames
+_CHECKSUM_KINDS = "biufmM"
+
+_lock = threading.Lock()
+# id(frame) -> (stamp, fingerprint); entries are removed when the frame is
+# garbage-collected, before its id can be reused.
+_known: dict[int, tuple[tuple, str]] = {}
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Identity of *df*, equal for frames with the same content or provenance.
+
+    Returns the fingerprint recorded by ``remember()`` / ``derive()``,
+    hashing the content otherwise.
+    """
+    fp = recorded(df)
+    return _content_hash(df) if fp is None else fp
+
+
+def recorded(df: pd.DataFrame) -> str | None:
+    """Fingerprint recorded for *df* by ``remember()`` / ``derive()``, if any.
+
+    Never hashes: returns None for a frame without a recorded provenance.
+    """
+    with _lock:
+        entry = _known.get(id(df))
+    if entry is not None and entry[0] == _stamp(df):
+        return entry[1]
+    return None
+
+
+def remember(df: pd.DataFrame, **provenance: object) -> pd.DataFrame:
+    """Record the fingerprint of *df* as derived from *provenance*.
+
+    *provenance* must pin the data down exactly — e.g. a dataset path and
+    version as returned by ``DataStore.dataset_version()``.  The optopsy
+    version is included, since loaders may transform stored data
+    differently across releases.
+
+    Returns:
+        *df* itself.
+    """
+    _record(df, _digest({"provenance": provenance, "optopsy": __version__}))
+    return df
+
+
+def derive(
+    parent: pd.DataFrame, child: pd.DataFrame, **operation: object
+) -> pd.DataFrame:
+    """Record the fingerprint of *child* as *parent*'s extended with *operation*.
+
+    *operation* must determine *child* from *parent* exactly (the filters
+    applied, the columns selected, ...), and *child* must not be edited in
+    place afterwards.  Costs one ``fingerprint()`` of *parent*, which is
+    free when *parent* has a recorded provenance.
+
+    Returns:
+        *child* itself.
+    """
+    parent_fp = fingerprint(parent)
+    _record(child, _digest({"parent": parent_fp, "operation": operation}))
+    return child
+
+
+def _record(df: pd.DataFrame, fp: str) -> str:
+    key = id(df)
+    with _lock:
+        if key not in _known:
+            weakref.finalize(df, _known.pop, key, None)
+        _known[key] = (_stamp(df), fp)
+    return fp
+
+
+def _stamp(df: pd.DataFrame) -> tuple:
+    """Cheap summary of *df* whose change invalidates its cached fingerprint."""
+    return df.shape, tuple(df.columns), tuple(df.dtypes)
+
+
+def _digest(payload: dict) -> str:
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def _content_hash(df: pd.DataFrame) -> str:
+    """Hash of the values of *df*, exact up to ``_FULL_HASH_ROWS`` rows."""
+    digest = hashlib.sha256()
+    header = (df.shape, [str(c) for c in df.columns], [str(t) for t in df.dtypes])
+    digest.update(repr(header).encode())
+    rows = df
+    if len(df) > _FULL_HASH_ROWS:
+        for name, series in df.items():
+            if series.dtype.kind not in _CHECKSUM_KINDS:
+                continue
+            values = series.to_numpy()
+            if values.dtype.kind in _CHECKSUM_KINDS:
+                digest.update(f"{name}:{_checksum(values)};".encode())
+        starts = np.linspace(0, len(df) - _BLOCK_ROWS, _SAMPLE_BLOCKS).astype(np.int64)
+        rows = df.iloc[(starts[:, None] + np.arange(_BLOCK_ROWS)).ravel()]
+    digest.update(pd.util.hash_pandas_object(rows, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:32]
+
+
+def _checksum(values: np.ndarray) -> int:
+    """Wrapping sum of the bit patterns of *values*."""
+    bits = np.ascontiguousarray(values).view(f"u{values.dtype.itemsize}")
+    return int(np.add.reduce(bits, dtype=np.uint64))
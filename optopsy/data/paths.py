@@ -23,6 +23,7 @@ def _resolve_data_dir() -> Path:
 DATA_DIR: Path = _resolve_data_dir()
 
 CACHE_DIR: Path = DATA_DIR / "cache"
+HOT_CACHE_DIR: Path = DATA_DIR / "hot_cache"
 RESULTS_DIR: Path = DATA_DIR / "results"
 STORAGE_DIR: Path = DATA_DIR / "storage"
 DB_PATH: Path = DATA_DIR / "chat.db"
@@ -1,23 +1,67 @@
 """Parquet-based file cache for immutable historical market data.
 
-Each ``(category, symbol)`` pair maps to a single parquet file at
-``~/.optopsy/cache/{category}/{SYMBOL}.parquet``.  There is no TTL or
-eviction — historical data is immutable, so cached files are only ever
-appended to (via ``merge_and_save``) or explicitly cleared.
+Each ``(category, symbol)`` pair maps to a hive-partitioned parquet dataset
+at ``~/.optopsy/cache/{category}/{SYMBOL}.parquet/``, split into
+``year=YYYY/month=MM`` directories by expiration (options) or bar date
+(stocks).  Reads go through ``pyarrow.dataset``: date, option-type and
+other filters are pushed down so non-matching partitions and row groups
+are skipped, and only the requested columns are decoded.  There is no TTL
+or eviction — historical data is immutable, so cached datasets are only
+ever appended to (via ``append``/``merge_and_save``) or explicitly cleared.
+
+Appends are O(new rows): each one writes its rows as a new immutable
+segment (one ``part-{segment}.parquet`` per partition touched) and then
+atomically replaces ``_manifest.json``, the list of live segments.
+Manifest updates hold an exclusive lock on a ``.{SYMBOL}.parquet.lock``
+file beside the dataset, so appends from several processes never lose
+each other's segments.  Rows duplicated across segments are resolved
+when the dataset is read — the newest segment wins per dedup key — and
+removed for good by ``compact()``.  A crash mid-append leaves only unlisted files behind,
+which readers ignore and the next compaction deletes.  Rewrites
+(``write()``, compaction) build the new dataset beside the old one and
+swap it in by renaming the old one aside first; readers fall back to the
+retired copy for the instant neither is in place, and the next write
+restores it if a crash interrupted the swap.
+
+The manifest also indexes which calendar days each dataset covers: for
+its ``quote_date``/``date`` column, the covered days as sorted runs of
+consecutive days (a week of quotes is one run).  Writes compute it and
+appends merge the new rows' runs in, so ``ParquetCache.coverage()``
+answers from the manifest without reading any rows.
 
 The module also exports ``compute_date_gaps()``, which inspects a cached
 DataFrame and returns the date ranges that need to be fetched to fill
-coverage gaps (before, after, or interior holes).
+coverage gaps (before, after, or interior holes), and ``coverage_gaps()``,
+which does the same from a coverage index in time proportional to the
+number of runs.
 """
 
+import hashlib
+import json
 import logging
 import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
-from optopsy.data.paths import CACHE_DIR
-from optopsy.data.providers.store import DataStore
+from optopsy.data.paths import CACHE_DIR, HOT_CACHE_DIR
+from optopsy.data.providers.store import (
+    DataStore,
+    check_filters,
+    date_intervals,
+    filter_mask,
+    merge_intervals,
+)
+
+if TYPE_CHECKING:
+    from optopsy.data.providers.hot_cache import ArrowHotCache
 
 _log = logging.getLogger(__name__)
 
@@ -27,6 +71,26 @@ _CACHE_DIR = str(CACHE_DIR)
 # weekends and are NOT re-fetched.  Gaps larger than this indicate missing data.
 _INTERIOR_GAP_THRESHOLD = 5
 
+# Year/month partition fields of a cache dataset directory
+_PARTITION_FIELDS = ("year", "month")
+
+# Candidate partition columns, in order of preference: options partition by
+# expiration (the column strategy loads and chunked reads trim on), stock
+# bars by their date.
+_PARTITION_COLUMNS = ("expiration", "quote_date", "date")
+
+# Rows per parquet row group; small enough for statistics to prune well
+_ROW_GROUP_SIZE = 100_000
+
+# Segment list of a cache dataset directory
+_MANIFEST = "_manifest.json"
+
+# Appends beyond this many segments trigger a compaction
+_MAX_SEGMENTS = 64
+
+# Date columns whose covered days are indexed in the manifest
+_COVERAGE_COLUMNS = ("quote_date", "date")
+
 
 def compute_date_gaps(
     cached_df: pd.DataFrame | None,
@@ -50,13 +114,37 @@ def compute_date_gaps(
 
     Returns ``[(None, None)]`` to mean "fetch everything" (no cache), or a
     list of ``(start_str, end_str)`` tuples for each missing range.
+
+    The cached dates are reduced to runs of consecutive days with
+    ``date_intervals()`` and the gaps computed by ``coverage_gaps()``; use
+    that directly with ``DataStore.coverage()`` to avoid loading the cache.
     """
     if cached_df is None or cached_df.empty or date_column not in cached_df.columns:
         return [(str(start_dt) if start_dt else None, str(end_dt) if end_dt else None)]
+    return coverage_gaps(
+        date_intervals(cached_df[date_column]), start_dt, end_dt, check_interior
+    )
+
+
+def coverage_gaps(
+    coverage: list[tuple[date, date]] | None,
+    start_dt: date | None,
+    end_dt: date | None,
+    check_interior: bool = True,
+) -> list[tuple[str | None, str | None]]:
+    """Compute date ranges missing from *coverage* that need to be fetched.
+
+    *coverage* is a list of ``(first, last)`` runs of cached days as
+    returned by ``DataStore.coverage()``; ``None`` or an empty list means
+    nothing is cached.  Gaps are the same as ``compute_date_gaps()``
+    reports for the underlying data, found in time proportional to the
+    number of runs.
+    """
+    if not coverage:
+        return [(str(start_dt) if start_dt else None, str(end_dt) if end_dt else None)]
 
-    cached_dates = pd.to_datetime(cached_df[date_column]).dt.date
-    cached_min = cached_dates.min()
-    cached_max = cached_dates.max()
+    cached_min = coverage[0][0]
+    cached_max = coverage[-1][1]
 
     gaps: list[tuple[str | None, str | None]] = []
 
@@ -64,23 +152,27 @@ def compute_date_gaps(
     if start_dt and start_dt < cached_min:
         gaps.append((str(start_dt), str(cached_min - timedelta(days=1))))
 
-    # Interior gaps — check consecutive cached dates for holes that overlap
-    # with the requested range.  A gap between (prev, curr) is relevant when
-    # it *intersects* [overlap_start, overlap_end].
+    # Interior gaps — days within a run are consecutive, so only the spaces
+    # between runs can be holes.  A hole between (prev, curr) is relevant
+    # when it *intersects* [overlap_start, overlap_end].
     overlap_start = max(start_dt, cached_min) if start_dt else cached_min
     overlap_end = min(end_dt, cached_max) if end_dt else cached_max
-    if check_interior and overlap_start <= overlap_end:
-        unique_dates = sorted(cached_dates.unique())
-        for prev, curr in zip(unique_dates, unique_dates[1:]):
-            day_gap = (curr - prev).days
-            if day_gap <= _INTERIOR_GAP_THRESHOLD:
-                continue
-            hole_start = prev + timedelta(days=1)
-            hole_end = curr - timedelta(days=1)
-            clamped_start = max(hole_start, overlap_start)
-            clamped_end = min(hole_end, overlap_end)
-            if clamped_start <= clamped_end:
-                gaps.append((str(clamped_start), str(clamped_end)))
+    if check_interior and overlap_start <= overlap_end and len(coverage) > 1:
+        runs = np.array(coverage, dtype="datetime64[D]")
+        prev, curr = runs[:-1, 1], runs[1:, 0]
+        holes = curr - prev > np.timedelta64(_INTERIOR_GAP_THRESHOLD, "D")
+        one_day = np.timedelta64(1, "D")
+        clamped_start = np.maximum(
+            prev[holes] + one_day, np.datetime64(overlap_start, "D")
+        )
+        clamped_end = np.minimum(curr[holes] - one_day, np.datetime64(overlap_end, "D"))
+        keep = clamped_start <= clamped_end
+        gaps.extend(
+            (str(hole_start), str(hole_end))
+            for hole_start, hole_end in zip(
+                clamped_start[keep].tolist(), clamped_end[keep].tolist()
+            )
+        )
 
     # Gap after cached range.
     # Only fetch beyond cached_max when the user explicitly requested an end
@@ -100,16 +192,43 @@ def compute_date_gaps(
 
 
 class ParquetCache(DataStore):
-    """Simple parquet-based cache for immutable historical data.
+    """Partitioned parquet cache for immutable historical data.
 
-    Each (category, symbol) pair maps to a single parquet file at:
-        ~/.optopsy/cache/{category}/{SYMBOL}.parquet
+    Each (category, symbol) pair maps to a dataset directory at:
+        ~/.optopsy/cache/{category}/{SYMBOL}.parquet/
+
+    Rows are partitioned by year and month of their partition column
+    (``expiration`` for options, the bar date for stocks), and each
+    partition file is sorted by ``option_type`` first so its row-group
+    statistics skip the other type.  Filters passed to ``read_filtered()``
+    prune partition directories and row groups before anything is
+    decoded.  A single-file ``{SYMBOL}.parquet`` written by older versions
+    is still readable and is replaced by a dataset on the next write.
+
+    ``append()`` adds a segment without touching existing ones;
+    ``compact()`` merges a dataset's segments back into one.
+
+    With a *hot_cache*, full datasets are also kept as memory-mapped Arrow
+    copies (see ``hot_cache.py``) and read from there while the dataset is
+    unchanged.
 
     No TTL, no eviction — historical data is immutable.
     """
 
-    def __init__(self, cache_dir: str = _CACHE_DIR):
+    def __init__(
+        self, cache_dir: str = _CACHE_DIR, hot_cache: "ArrowHotCache | None" = None
+    ):
         self._cache_dir = cache_dir
+        self._hot_cache = hot_cache
+        # Serializes manifest updates from concurrent appends in this
+        # process; _file_lock() does the same across processes.
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _writing(self, path: str):
+        """Hold the in-process and inter-process write locks of *path*."""
+        with self._lock, _file_lock(path):
+            yield
 
     def _path(self, category: str, symbol: str) -> str:
         safe_category = os.path.basename(category)
@@ -119,25 +238,208 @@ class ParquetCache(DataStore):
         )
 
     def read(self, category: str, symbol: str) -> pd.DataFrame | None:
-        path = self._path(category, symbol)
-        if not os.path.exists(path):
+        return self.read_filtered(category, symbol)
+
+    def read_filtered(
+        self,
+        category: str,
+        symbol: str,
+        columns: list[str] | None = None,
+        filters: list[tuple[str, str, object]] | None = None,
+    ) -> pd.DataFrame | None:
+        check_filters(filters)
+        target = self._path(category, symbol)
+        path = _live_path(target)
+        if path is None:
             return None
         try:
-            df = pd.read_parquet(path)
-            _log.debug("Cache hit: %s (%d rows)", path, len(df))
-            return df
+            df = self._read_path(category, symbol, path, columns, filters)
         except Exception as exc:
-            _log.warning("Failed to read cache %s: %s", path, exc)
+            # The retired copy vanishes once its replacement is in place
+            if path == target or not os.path.exists(target):
+                _log.warning("Failed to read cache %s: %s", path, exc)
+                return None
+            path = target
+            try:
+                df = self._read_path(category, symbol, path, columns, filters)
+            except Exception as exc:
+                _log.warning("Failed to read cache %s: %s", path, exc)
+                return None
+        _log.debug("Cache hit: %s (%d rows)", path, len(df))
+        return df
+
+    def _read_path(
+        self,
+        category: str,
+        symbol: str,
+        path: str,
+        columns: list[str] | None,
+        filters: list[tuple[str, str, object]] | None,
+    ) -> pd.DataFrame:
+        if self._hot_cache is not None:
+            return self._read_hot(category, symbol, path, columns, filters)
+        return read_dataset(path, columns=columns, filters=filters)
+
+    def dataset_version(self, category: str, symbol: str) -> str | None:
+        """Path of the dataset plus a hash of its manifest (or file mtimes).
+
+        The manifest carries a fresh ``write_id`` per save, so the version
+        changes on every write -- including one that keeps the same shape.
+        """
+        target = self._path(category, symbol)
+        path = _live_path(target)
+        if path is None:
             return None
+        return f"{os.path.abspath(target)}@{_fingerprint(path)}"
+
+    def _read_hot(
+        self,
+        category: str,
+        symbol: str,
+        path: str,
+        columns: list[str] | None,
+        filters: list[tuple[str, str, object]] | None,
+    ) -> pd.DataFrame:
+        """Read through the hot tier, filling it from parquet on a miss."""
+        import pyarrow as pa
+
+        fingerprint = _fingerprint(path)
+        table = self._hot_cache.get(category, symbol, fingerprint)
+        if table is None:
+            table = pa.Table.from_pandas(read_dataset(path), preserve_index=False)
+            self._hot_cache.put(category, symbol, fingerprint, table)
+        # Filters and column selection run on the mapped buffers; only the
+        # selected rows are copied into the DataFrame.
+        expression = _filter_expression(table, filters or [], partitioned=False)
+        if expression is not None:
+            table = table.filter(expression)
+        if columns is not None:
+            wanted = set(columns)
+            table = table.select([c for c in table.column_names if c in wanted])
+        return table.to_pandas()
 
     def write(self, category: str, symbol: str, df: pd.DataFrame) -> None:
         path = self._path(category, symbol)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._writing(path):
+            _recover(path)
+            self._rewrite(path, df, dedup_cols=None)
+            self._discard_hot(category, symbol)
+
+    def _discard_hot(self, category: str, symbol: str) -> None:
+        """Drop the hot copies of *(category, symbol)* after a change."""
+        if self._hot_cache is not None:
+            self._hot_cache.discard(category, symbol)
+
+    def _rewrite(
+        self, path: str, df: pd.DataFrame, dedup_cols: list[str] | None
+    ) -> None:
+        """Replace the dataset at *path* with a single segment holding *df*."""
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+        # Build the new dataset beside the old one, then swap it in, so a
+        # failed write never leaves a half-written dataset behind.
+        staging = tempfile.mkdtemp(dir=parent, prefix=".staging-")
         try:
-            df.to_parquet(path, index=False, engine="pyarrow")
+            files = _write_partitions(df, staging, segment=0)
+            _save_manifest(
+                staging,
+                {
+                    "version": 1,
+                    "dedup_cols": dedup_cols,
+                    "segments": [{"id": 0, "rows": len(df), "files": files}],
+                    "coverage": _coverage(df),
+                },
+            )
+            _replace(staging, path)
             _log.debug("Cache written: %s (%d rows)", path, len(df))
         except Exception as exc:
             _log.warning("Failed to write cache %s: %s", path, exc)
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def append(
+        self,
+        category: str,
+        symbol: str,
+        new_df: pd.DataFrame,
+        dedup_cols: list[str] | None = None,
+    ) -> None:
+        """Add *new_df* to the cache as a new segment.
+
+        Only *new_df* is written; existing segments are never read or
+        rewritten.  Readers keep the **last** row per *dedup_cols* key
+        across segments (full-row dedup when ``None``), and the dataset is
+        compacted once it has ``_MAX_SEGMENTS`` segments.
+        """
+        if new_df.empty:
+            return
+        keys = _dedup_keys(new_df, dedup_cols)
+        new_df = new_df.drop_duplicates(subset=keys, keep="last")
+        path = self._path(category, symbol)
+        with self._writing(path):
+            _recover(path)
+            self._discard_hot(category, symbol)
+            if not os.path.isdir(path):
+                if not os.path.exists(path):
+                    self._rewrite(path, new_df, keys)
+                    return
+                # Convert a legacy single-file cache before appending to it
+                self._rewrite(path, read_dataset(path), keys)
+            try:
+                manifest = _load_manifest(path)
+                segment = max(seg["id"] for seg in manifest["segments"]) + 1
+                files = _write_partitions(new_df, path, segment=segment)
+                manifest["segments"].append(
+                    {"id": segment, "rows": len(new_df), "files": files}
+                )
+                manifest["dedup_cols"] = keys
+                if "coverage" in manifest:
+                    manifest["coverage"] = _extend_coverage(
+                        manifest["coverage"], new_df
+                    )
+                _save_manifest(path, manifest)
+                _log.debug("Cache appended: %s (%d rows)", path, len(new_df))
+            except Exception as exc:
+                _log.warning("Failed to append to cache %s: %s", path, exc)
+                return
+            if len(manifest["segments"]) >= _MAX_SEGMENTS:
+                self._compact(path)
+
+    def coverage(
+        self, category: str, symbol: str, column: str = "quote_date"
+    ) -> list[tuple[date, date]] | None:
+        """Calendar days of *column* stored for *(category, symbol)*.
+
+        Answered from the coverage index in the dataset's manifest without
+        reading any rows.  Datasets whose manifest has no index (written by
+        older versions, or *column* is not indexed) read the column
+        instead; they gain an index on their next rewrite or compaction.
+        """
+        path = self._path(category, symbol)
+        manifest = _read_manifest(path) if os.path.isdir(path) else None
+        runs = (manifest or {}).get("coverage", {}).get(column)
+        if runs is not None:
+            return _decode_runs(runs)
+        return super().coverage(category, symbol, column)
+
+    def compact(self, category: str, symbol: str) -> None:
+        """Merge the segments of *(category, symbol)* into one, dropping duplicates."""
+        path = self._path(category, symbol)
+        with self._writing(path):
+            _recover(path)
+            if os.path.isdir(path):
+                self._compact(path)
+                self._discard_hot(category, symbol)
+
+    def _compact(self, path: str) -> None:
+        manifest = _read_manifest(path)
+        if manifest is not None and len(manifest["segments"]) == 1:
+            return
+        try:
+            df = read_dataset(path)
+        except Exception as exc:
+            _log.warning("Failed to compact cache %s: %s", path, exc)
+            return
+        self._rewrite(path, df, manifest["dedup_cols"] if manifest else None)
 
     def merge_and_save(
         self,
@@ -146,36 +448,28 @@ class ParquetCache(DataStore):
         new_df: pd.DataFrame,
         dedup_cols: list[str] | None = None,
     ) -> pd.DataFrame:
-        """Merge *new_df* with any existing cache and deduplicate.
+        """Append *new_df* to the cache and return the merged, deduplicated data.
 
         *dedup_cols* — columns that form a natural key for dedup.  When
         provided, only the **last** occurrence of each key is kept so that
         newer data wins.  Falls back to full-row dedup when ``None``.
-        """
-        existing = self.read(category, symbol)
-        if existing is not None and not existing.empty:
-            merged = pd.concat([existing, new_df], ignore_index=True)
-        else:
-            merged = new_df.copy()
 
-        if dedup_cols:
-            present = [c for c in dedup_cols if c in merged.columns]
-            if present:
-                merged = merged.drop_duplicates(subset=present, keep="last")
-            else:
-                merged = merged.drop_duplicates()
-        else:
-            merged = merged.drop_duplicates()
-
-        self.write(category, symbol, merged)
+        Writing costs the same as ``append()``; returning the merged frame
+        reads the whole dataset, so callers that do not need it should use
+        ``append()`` instead.
+        """
+        self.append(category, symbol, new_df, dedup_cols)
+        merged = self.read(category, symbol)
+        if merged is None:
+            return new_df.drop_duplicates(subset=_dedup_keys(new_df, dedup_cols))
         return merged
 
     def clear(self, symbol: str | None = None, category: str | None = None) -> int:
-        """Remove cached files.
+        """Remove cached datasets.
 
         *symbol* — restrict to a single symbol (across categories).
         *category* — restrict to a single category subdirectory.
-        Both ``None`` removes everything.  Returns number of files deleted.
+        Both ``None`` removes everything.  Returns number of datasets deleted.
         """
         count = 0
         if not os.path.exists(self._cache_dir):
@@ -189,19 +483,22 @@ class ParquetCache(DataStore):
             if not os.path.isdir(cat_path):
                 continue
             if symbol:
-                target = os.path.join(cat_path, f"{symbol.upper()}.parquet")
+                targets = [f"{symbol.upper()}.parquet"]
+            else:
+                targets = [f for f in os.listdir(cat_path) if f.endswith(".parquet")]
+            for fname in targets:
+                target = os.path.join(cat_path, fname)
+                if os.path.exists(_retired(target)):
+                    _remove(_retired(target))
                 if os.path.exists(target):
-                    os.remove(target)
+                    _remove(target)
                     count += 1
-            else:
-                for fname in os.listdir(cat_path):
-                    if fname.endswith(".parquet"):
-                        os.remove(os.path.join(cat_path, fname))
-                        count += 1
+                if self._hot_cache is not None:
+                    self._hot_cache.discard(cat, fname.removesuffix(".parquet"))
         return count
 
     def size(self) -> dict[str, int]:
-        """Return ``{category/SYMBOL.parquet: bytes}`` for all cached files."""
+        """Return ``{category/SYMBOL.parquet: bytes}`` for all cached datasets."""
         result: dict[str, int] = {}
         if not os.path.exists(self._cache_dir):
             return result
@@ -212,7 +509,7 @@ class ParquetCache(DataStore):
             for fname in sorted(os.listdir(cat_path)):
                 if fname.endswith(".parquet"):
                     fpath = os.path.join(cat_path, fname)
-                    result[f"{category}/{fname}"] = os.path.getsize(fpath)
+                    result[f"{category}/{fname}"] = _disk_usage(fpath)
         return result
 
     def total_size_bytes(self) -> int:
@@ -220,15 +517,435 @@ class ParquetCache(DataStore):
         return sum(self.size().values())
 
 
+def read_dataset(
+    path: str,
+    columns: list[str] | None = None,
+    filters: list[tuple[str, str, object]] | None = None,
+) -> pd.DataFrame:
+    """Read a cache dataset directory (or legacy single file) at *path*.
+
+    Args:
+        path: ``{SYMBOL}.parquet`` dataset directory or parquet file.
+        columns: Columns to load, in stored order; names absent from the
+            data are ignored.  ``None`` loads every column.
+        filters: ``(column, op, value)`` conditions ANDed together, with
+            *op* one of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` or
+            ``in``.  Date bounds on the partition column also prune whole
+            partition directories.
+
+    Returns:
+        The matching rows, without the year/month partition fields.
+    """
+    import pyarrow.dataset as ds
+
+    partitioned = os.path.isdir(path)
+    manifest = _read_manifest(path) if partitioned else None
+    if manifest is None:
+        dataset = ds.dataset(
+            path,
+            format="parquet",
+            partitioning=_partitioning() if partitioned else None,
+        )
+    else:
+        dataset = ds.dataset(
+            [
+                os.path.join(path, f)
+                for seg in manifest["segments"]
+                for f in seg["files"]
+            ],
+            format="parquet",
+            partitioning=_partitioning(),
+            partition_base_dir=path,
+        )
+    stored = [
+        name
+        for name in dataset.schema.names
+        if not (partitioned and name in _PARTITION_FIELDS)
+    ]
+    names = stored
+    if columns is not None:
+        wanted = set(columns)
+        names = [name for name in stored if name in wanted]
+    filters = list(filters or [])
+
+    if manifest is None or len(manifest["segments"]) == 1:
+        table = dataset.to_table(
+            columns=names, filter=_filter_expression(dataset, filters, partitioned)
+        )
+        return table.to_pandas()
+
+    # Several segments: keep the newest row per key.  Filters on non-key
+    # columns must run after dedup, or they could surface a row a newer
+    # segment replaced.
+    keys = [k for k in manifest["dedup_cols"] or [] if k in stored] or None
+    if keys is None:
+        pushed, deferred, load = filters, [], stored
+    else:
+        pushed = [f for f in filters if f[0] in keys]
+        deferred = [f for f in filters if f[0] not in keys]
+        needed = set(names) | set(keys) | {f[0] for f in deferred}
+        load = [name for name in stored if name in needed]
+    df = (
+        dataset.to_table(
+            columns=load, filter=_filter_expression(dataset, pushed, partitioned)
+        )
+        .to_pandas()
+        .drop_duplicates(subset=keys, keep="last", ignore_index=True)
+    )
+    if deferred:
+        df = df[filter_mask(df, deferred)].reset_index(drop=True)
+    return df[names]
+
+
+def _filter_expression(dataset, filters: list[tuple[str, str, object]], partitioned):
+    """AND of *filters* as an arrow expression (``None`` when empty).
+
+    *dataset* is a ``pyarrow.dataset.Dataset`` or ``pyarrow.Table``.
+    """
+    partition_column = next(
+        (c for c in _PARTITION_COLUMNS if c in dataset.schema.names), None
+    )
+    expression = None
+    for column, op, value in filters:
+        term = _filter_term(dataset.schema, column, op, value)
+        if partitioned and column == partition_column:
+            prune = _partition_term(op, value)
+            if prune is not None:
+                term = term & prune
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(
+        pa.schema([("year", pa.int32()), ("month", pa.int32())]), flavor="hive"
+    )
+
+
+def _partition_column(df: pd.DataFrame) -> str | None:
+    """First candidate date column of *df*, or ``None`` to skip partitioning."""
+    if any(field in df.columns for field in _PARTITION_FIELDS):
+        return None
+    return next(
+        (
+            c
+            for c in _PARTITION_COLUMNS
+            if c in df.columns and pd.api.types.is_datetime64_any_dtype(df[c])
+        ),
+        None,
+    )
+
+
+def _write_partitions(df: pd.DataFrame, root: str, segment: int) -> list[str]:
+    """Write *df* under *root* as ``year=YYYY/month=MM/part-{segment}.parquet``.
+
+    Rows without a partition date (or frames without a date column) go to
+    ``root/part-{segment}.parquet``.  Returns the written paths, relative
+    to *root*.
+    """
+    fname = f"part-{segment}.parquet"
+    column = _partition_column(df)
+    if column is None or df.empty:
+        _write_file(df, os.path.join(root, fname))
+        return [fname]
+
+    files = []
+    dates = df[column]
+    keys = dates.dt.year * 100 + dates.dt.month
+    undated = keys.isna()
+    if undated.any():
+        _write_file(df[undated], os.path.join(root, fname))
+        files.append(fname)
+    for key, group in df[~undated].groupby(keys[~undated], sort=True):
+        year, month = divmod(int(key), 100)
+        relative = os.path.join(f"year={year}", f"month={month:02d}", fname)
+        os.makedirs(os.path.dirname(os.path.join(root, relative)), exist_ok=True)
+        _write_file(group, os.path.join(root, relative))
+        files.append(relative)
+    return files
+
+
+def _dedup_keys(df: pd.DataFrame, dedup_cols: list[str] | None) -> list[str] | None:
+    """Columns of *dedup_cols* present in *df*; ``None`` means full-row dedup."""
+    return [c for c in dedup_cols or [] if c in df.columns] or None
+
+
+def _read_manifest(path: str) -> dict | None:
+    """Manifest of the dataset at *path*, or ``None`` if it has none."""
+    try:
+        with open(os.path.join(path, _MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _load_manifest(path: str) -> dict:
+    """Manifest of the dataset at *path*, listing its files if it has none."""
+    manifest = _read_manifest(path)
+    if manifest is not None:
+        return manifest
+    files = sorted(
+        os.path.relpath(os.path.join(dirpath, fname), path)
+        for dirpath, _, fnames in os.walk(path)
+        for fname in fnames
+        if fname.endswith(".parquet") and not fname.startswith((".", "_"))
+    )
+    return {
+        "version": 1,
+        "dedup_cols": None,
+        "segments": [{"id": 0, "rows": None, "files": files}],
+    }
+
+
+def _save_manifest(path: str, manifest: dict) -> None:
+    """Atomically replace the manifest of the dataset at *path*.
+
+    Every save stamps a fresh ``write_id``, so the manifest -- and with it
+    ``_fingerprint()`` -- changes on every write, even one that rewrites
+    the same rows and dates with new values.
+    """
+    manifest["write_id"] = uuid.uuid4().hex
+    target = os.path.join(path, _MANIFEST)
+    staging = f"{target}.tmp"
+    with open(staging, "w") as f:
+        json.dump(manifest, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(staging, target)
+
+
+def _coverage(df: pd.DataFrame) -> dict[str, list[list[str]]]:
+    """Manifest coverage index of *df*: runs of covered days per date column."""
+    return {
+        column: _encode_runs(date_intervals(df[column]))
+        for column in _COVERAGE_COLUMNS
+        if column in df.columns and pd.api.types.is_datetime64_any_dtype(df[column])
+    }
+
+
+def _extend_coverage(
+    index: dict[str, list[list[str]]], new_df: pd.DataFrame
+) -> dict[str, list[list[str]]]:
+    """Coverage *index* updated with the days of appended rows *new_df*.
+
+    Appends only add days, so each column's runs are the union of the old
+    and new ones.  Columns missing from *new_df* can no longer be vouched
+    for and are dropped from the index.
+    """
+    added = _coverage(new_df)
+    return {
+        column: _encode_runs(
+            merge_intervals(_decode_runs(runs), _decode_runs(added[column]))
+        )
+        for column, runs in index.items()
+        if column in added
+    }
+
+
+def _encode_runs(runs: list[tuple[date, date]]) -> list[list[str]]:
+    return [[first.isoformat(), last.isoformat()] for first, last in runs]
+
+
+def _decode_runs(runs: list[list[str]]) -> list[tuple[date, date]]:
+    return [
+        (date.fromisoformat(first), date.fromisoformat(last)) for first, last in runs
+    ]
+
+
+def _write_file(df: pd.DataFrame, path: str) -> None:
+    if "option_type" in df.columns:
+        df = df.sort_values("option_type", kind="stable")
+    df.to_parquet(path, index=False, engine="pyarrow", row_group_size=_ROW_GROUP_SIZE)
+
+
+def _filter_term(schema, column: str, op: str, value: object):
+    """Arrow expression for one ``(column, op, value)`` filter."""
+    import pyarrow.dataset as ds
+
+    if column not in schema.names:
+        raise ValueError(f"Filter column '{column}' not found in stored data")
+    field = ds.field(column)
+    dtype = schema.field(column).type
+    if op == "in":
+        return field.isin([_scalar(v, dtype) for v in value])
+    scalar = _scalar(value, dtype)
+    if op == "==":
+        return field == scalar
+    if op == "!=":
+        return field != scalar
+    if op == "<":
+        return field < scalar
+    if op == "<=":
+        return field <= scalar
+    if op == ">":
+        return field > scalar
+    return field >= scalar
+
+
+def _scalar(value: object, dtype):
+    import pyarrow as pa
+
+    if pa.types.is_timestamp(dtype) or pa.types.is_date(dtype):
+        return pa.scalar(pd.Timestamp(value).to_pydatetime())
+    return value
+
+
+def _partition_term(op: str, value: object):
+    """Year/month expression selecting the partitions a date filter can match."""
+    import pyarrow.dataset as ds
+
+    if op not in ("==", "<", "<=", ">", ">="):
+        return None
+    ts = pd.Timestamp(value)
+    year, month = ds.field("year"), ds.field("month")
+    same_year = year == ts.year
+    if op == "==":
+        return same_year & (month == ts.month)
+    if op in (">", ">="):
+        return (year > ts.year) | (same_year & (month >= ts.month))
+    return (year < ts.year) | (same_year & (month <= ts.month))
+
+
+def _replace(source: str, target: str) -> None:
+    """Move *source* to *target*, replacing any existing file or directory.
+
+    The old version is renamed aside to ``_retired(target)`` before the new
+    one moves in and is deleted only afterwards.  Readers that find no
+    *target* in between read the retired copy (see ``_live_path()``), and a
+    crash in between leaves it for ``_recover()`` to restore.
+    """
+    _recover(target)
+    if not os.path.exists(target):
+        os.rename(source, target)
+        return
+    retired = _retired(target)
+    os.rename(target, retired)
+    os.rename(source, target)
+    _remove(retired)
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive inter-process lock guarding writes to the dataset at *path*.
+
+    Locks a ``.{name}.lock`` file beside the dataset, so two processes
+    appending to the same symbol (parallel ingest, the chat UI and a
+    notebook) never lose each other's manifest updates.
+    """
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    lock_path = os.path.join(parent, f".{os.path.basename(path)}.lock")
+    with open(lock_path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _retired(path: str) -> str:
+    """Where ``_replace()`` parks the previous version of *path*."""
+    return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.retired")
+
+
+def _live_path(path: str) -> str | None:
+    """*path*, or its retired copy while a replace is swapping it out."""
+    if os.path.exists(path):
+        return path
+    retired = _retired(path)
+    return retired if os.path.exists(retired) else None
+
+
+def _recover(path: str) -> None:
+    """Finish a replace of *path* that was interrupted by a crash.
+
+    Restores the retired copy when the new version never moved in, and
+    drops it when the swap completed but the delete did not.  Callers hold
+    the write locks, so no replace is in progress.
+    """
+    retired = _retired(path)
+    if not os.path.exists(retired):
+        return
+    if os.path.exists(path):
+        _remove(retired)
+    else:
+        os.rename(retired, path)
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _fingerprint(path: str) -> str:
+    """Identifier of the current version of the dataset at *path*.
+
+    Hashes the manifest, which every write and append replaces with a new
+    ``write_id``; datasets without one (legacy files and directories) hash their files' sizes
+    and modification times instead.
+    """
+    digest = hashlib.sha1()
+    manifest = os.path.join(path, _MANIFEST)
+    if os.path.isfile(manifest):
+        with open(manifest, "rb") as f:
+            digest.update(f.read())
+    else:
+        paths = [path] if os.path.isfile(path) else _walk_files(path)
+        for fpath in paths:
+            stat = os.stat(fpath)
+            digest.update(f"{fpath}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:16]
+
+
+def _walk_files(path: str) -> list[str]:
+    return sorted(
+        os.path.join(dirpath, fname)
+        for dirpath, _, fnames in os.walk(path)
+        for fname in fnames
+    )
+
+
+def _disk_usage(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(fpath) for fpath in _walk_files(path))
+
+
 def get_store() -> DataStore:
     """Return the appropriate data store backend.
 
     Uses ``PostgresStore`` when ``DATABASE_URL`` is set to a PostgreSQL URL,
-    otherwise falls back to the file-based ``ParquetCache``.
+    otherwise falls back to the file-based ``ParquetCache``.  Setting
+    ``OPTOPSY_HOT_CACHE_MB`` puts a memory-mapped Arrow tier of that size in
+    front of the parquet cache.
     """
     db_url = os.environ.get("DATABASE_URL", "")
     if db_url.startswith(("postgres://", "postgresql://")):
         from optopsy.data.providers.pg_store import PostgresStore
 
         return PostgresStore(db_url)
+    hot_mb = os.environ.get("OPTOPSY_HOT_CACHE_MB", "")
+    if hot_mb:
+        from optopsy.data.providers.hot_cache import ArrowHotCache
+
+        hot_cache = ArrowHotCache(str(HOT_CACHE_DIR), int(float(hot_mb) * 2**20))
+        return ParquetCache(hot_cache=hot_cache)
     return ParquetCache()
@@ -7,10 +7,20 @@ EODHD Marketplace API.  Key features:
   historical options chain for a symbol, split by option type and paginated
   in ~30-day windows to stay within the 10K-offset API cap.  Supports
   resumable downloads: only rows newer than the latest cached date are fetched.
+- **Pipelined concurrency** — the windows of both option types are fetched
+  by a thread pool, while a separate writer thread normalizes the fetched
+  windows and appends them to the cache, so network time and
+  normalization/IO overlap.  A bounded queue between the stages keeps
+  memory flat.
+- **Columnar decoding** — compact-mode pages are transposed into NumPy
+  columns (numeric ones coerced in bulk) as they arrive, never into
+  per-row dicts, so a window costs about its final columnar size.
 - **Local read** (``fetch_options_data``) — reads previously downloaded data
   from the parquet cache and applies date/type/expiration filters.
-- **Rate limiting** — adaptive throttle based on ``X-RateLimit-Remaining``
-  header, with exponential backoff on 429 and 5xx errors.
+- **Rate limiting** — a token bucket shared by all fetch threads keeps the
+  request rate under the per-minute cap; the bucket is drained when
+  ``X-RateLimit-Remaining`` runs low or on a 429, with exponential backoff
+  on 429 and 5xx errors.
 - **Progress callbacks** — ``download_with_progress()`` accepts callbacks for
   Rich live-display integration in the CLI.
 """
@@ -19,14 +29,19 @@ from __future__ import annotations
 
 import logging
 import os
+import queue
 import re
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 import requests
 
+from .. import fingerprint as fingerprints
 from .base import DataProvider
 from .cache import get_store
 
@@ -55,8 +70,12 @@ _MAX_OFFSET = 10000  # EODHD rejects offsets beyond ~10K
 _TIMEOUT = 60
 _MAX_RETRIES = 5
 _API_CALLS_PER_REQUEST = 10  # EODHD Marketplace/Options endpoints cost 10 calls each
-_MIN_REQUEST_INTERVAL = 0.1  # seconds between requests (600/min, under 1000/min cap)
+_REQUESTS_PER_MINUTE = 900  # shared by all fetch threads (EODHD caps at 1,000/min)
+_BURST = 10  # requests that may be sent back to back after an idle period
+_MAX_WORKERS = 8  # concurrent window fetches
+_WRITE_QUEUE_SIZE = 16  # fetched windows buffered ahead of the writer thread
 _RATE_LIMIT_SLOW_THRESHOLD = 50  # slow down when fewer than this many requests remain
+_RATE_LIMIT_SLOW_DOWN = 1.0  # seconds of request budget dropped when slowing down
 _FIELDS = (
     "underlying_symbol,type,exp_date,expiration_type,tradetime,strike,"
     "bid,ask,last,open,high,low,"
@@ -82,7 +101,7 @@ _COLUMN_MAP = {
     "volatility": "implied_volatility",
 }
 
-_OPTIONS_NUMERIC_COLS = [
+_NUMERIC_COLUMNS = {
     "strike",
     "bid",
     "ask",
@@ -102,7 +121,7 @@ _OPTIONS_NUMERIC_COLS = [
     "moneyness",
     "theoretical",
     "dte",
-]
+}
 
 
 def _parse_date(value: str | None):
@@ -115,12 +134,63 @@ def _parse_date(value: str | None):
         return None
 
 
-def _coerce_numeric(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
-    """Coerce columns to numeric in-place, ignoring missing columns."""
-    for col in cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-    return df
+# One decoded API page: standardized column name -> values
+_Page = dict[str, np.ndarray]
+
+
+def _decode_page(fields: list[str], rows: list) -> _Page:
+    """Decode one API page column-wise.
+
+    Compact rows are transposed once into per-field tuples instead of
+    being turned into one dict per row; each column becomes a NumPy array,
+    numeric ones coerced in bulk (unparseable values become NaN).  Pages
+    without ``fields`` (compact mode not applied) hold attribute dicts.
+    """
+    if fields:
+        columns = dict(zip(fields, zip(*rows)))
+    else:
+        # Fallback to standard format if compact somehow not applied
+        records = [row.get("attributes", row) for row in rows]
+        names = dict.fromkeys(name for record in records for name in record)
+        columns = {name: [r.get(name) for r in records] for name in names}
+
+    page: _Page = {}
+    for field, values in columns.items():
+        name = _COLUMN_MAP.get(field, field)
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        if name in _NUMERIC_COLUMNS:
+            array = pd.to_numeric(array, errors="coerce")
+        page[name] = array
+    return page
+
+
+def _page_rows(pages: list[_Page]) -> int:
+    return sum(len(next(iter(page.values()), ())) for page in pages)
+
+
+def _concat_pages(pages: list[_Page]) -> pd.DataFrame:
+    """One DataFrame from a window's decoded pages.
+
+    Columns missing from some pages are filled with NaN (numeric) or None;
+    each column is concatenated once, so an int64 column only widens to
+    float64 when some page holds missing or fractional values.
+    """
+    names = dict.fromkeys(name for page in pages for name in page)
+    columns = {}
+    for name in names:
+        parts = []
+        for page in pages:
+            if name in page:
+                parts.append(page[name])
+            else:
+                size = len(next(iter(page.values()), ()))
+                fill = np.nan if name in _NUMERIC_COLUMNS else None
+                parts.append(
+                    np.full(size, fill, dtype=object if fill is None else float)
+                )
+        columns[name] = np.concatenate(parts) if len(parts) > 1 else parts[0]
+    return pd.DataFrame(columns)
 
 
 def _check_response(resp: requests.Response) -> str | None:
@@ -145,11 +215,144 @@ def _safe_raise_for_status(resp: requests.Response) -> None:
         raise requests.HTTPError(sanitized, response=resp) from None
 
 
+class _TokenBucket:
+    """Thread-safe token bucket allowing *rate* requests per second.
+
+    Up to *capacity* tokens accumulate while idle.  A caller that finds the
+    bucket empty reserves the next token anyway (the balance goes negative)
+    and sleeps until it is due, so waiting threads are served in order.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait_s = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait_s > 0:
+            time.sleep(wait_s)
+
+    def drain(self, seconds: float) -> None:
+        """Drop *seconds* worth of tokens, delaying every caller."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self._rate
+
+
+class _WindowWriter:
+    """Pipeline stage saving fetched windows on its own thread.
+
+    Fetch threads hand over each window's pages with ``put``; the writer
+    calls *save(pages, symbol)* for them in arrival order.  The queue is
+    bounded, so fetching pauses when saving falls behind.  After a failed
+    save the remaining windows are discarded and the exception is kept in
+    ``error``.
+    """
+
+    def __init__(self, save: Callable[[list, str], Any], symbol: str) -> None:
+        self.error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._run, args=(save, symbol), name="eodhd-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, save: Callable[[list, str], Any], symbol: str) -> None:
+        while (pages := self._queue.get()) is not None:
+            if self.error is not None:
+                continue
+            try:
+                save(pages, symbol)
+            except Exception as exc:
+                _log.warning("Failed to save %s options window: %s", symbol, exc)
+                self.error = exc
+
+    def put(self, pages: list) -> None:
+        self._queue.put(pages)
+
+    def close(self) -> None:
+        """Wait for every queued window to be saved."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class _DownloadProgress:
+    """Thread-safe per-option-type row counts and date coverage.
+
+    Calls ``on_progress(symbol, option_type, rows, pct)`` under a lock, so
+    callers never see interleaved updates; *pct* is the share of the
+    type's date range whose windows have completed.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        total_days: dict[str, int],
+        on_progress: Callable[[str, str, int, float], None] | None,
+    ) -> None:
+        self._symbol = symbol
+        self._total_days = total_days
+        self._on_progress = on_progress
+        self.rows = dict.fromkeys(total_days, 0)
+        self._covered = dict.fromkeys(total_days, 0)
+        self._lock = threading.Lock()
+
+    def pct(self, option_type: str) -> float:
+        total = self._total_days[option_type]
+        if total <= 0:
+            return 100.0
+        return min(100.0, self._covered[option_type] / total * 100)
+
+    def update(self, option_type: str, rows: int = 0, days: int = 0) -> None:
+        """Add *rows* fetched (negative to retract) and *days* covered."""
+        with self._lock:
+            self.rows[option_type] += rows
+            self._covered[option_type] += days
+            if self._on_progress:
+                self._on_progress(
+                    self._symbol,
+                    option_type,
+                    self.rows[option_type],
+                    self.pct(option_type),
+                )
+
+    def finish(self, option_type: str) -> None:
+        with self._lock:
+            if self._on_progress:
+                self._on_progress(
+                    self._symbol, option_type, self.rows[option_type], 100.0
+                )
+
+
 class EODHDProvider(DataProvider):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        base_url: str = _BASE_URL,
+        max_workers: int = _MAX_WORKERS,
+        requests_per_minute: float = _REQUESTS_PER_MINUTE,
+    ) -> None:
         self._cache = get_store()
-        self._session = requests.Session()
-        self._last_request_time: float = 0.0
+        self._base_url = base_url.rstrip("/")
+        self._max_workers = max_workers
+        self._rate_limiter = _TokenBucket(requests_per_minute / 60, _BURST)
+        self._local = threading.local()
+        self._count_lock = threading.Lock()
         self._request_count: int = 0
 
     @property
@@ -167,7 +370,7 @@ class EODHDProvider(DataProvider):
             return None
         try:
             resp = self._throttled_get(
-                f"{_BASE_URL}/options/underlying-symbols",
+                f"{self._base_url}/options/underlying-symbols",
                 {"api_token": api_key},
             )
             error = _check_response(resp)
@@ -228,23 +431,27 @@ class EODHDProvider(DataProvider):
     def _get_api_key(self) -> str | None:
         return os.environ.get(self.env_key)
 
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session of the calling thread (sessions are not thread-safe)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
     def _throttled_get(self, url: str, params: dict) -> requests.Response:
         """Rate-limited GET with retry on transient errors and 429 backoff.
 
-        Enforces a minimum interval between requests to stay under the
-        1,000 requests/minute EODHD cap.  Reads ``X-RateLimit-Remaining``
-        and slows down when the quota is nearly exhausted.
+        Takes a token from the bucket shared by all threads to stay under
+        the 1,000 requests/minute EODHD cap.  Reads ``X-RateLimit-Remaining``
+        and slows every thread down when the quota is nearly exhausted.
         """
         for attempt in range(_MAX_RETRIES + 1):
-            # Enforce minimum interval between requests
-            elapsed = time.monotonic() - self._last_request_time
-            if elapsed < _MIN_REQUEST_INTERVAL:
-                time.sleep(_MIN_REQUEST_INTERVAL - elapsed)
-
+            self._rate_limiter.acquire()
             try:
-                self._last_request_time = time.monotonic()
                 resp = self._session.get(url, params=params, timeout=_TIMEOUT)
-                self._request_count += 1
+                with self._count_lock:
+                    self._request_count += 1
             except requests.RequestException:
                 if attempt == _MAX_RETRIES:
                     raise
@@ -277,7 +484,7 @@ class EODHDProvider(DataProvider):
                     attempt + 1,
                     _MAX_RETRIES,
                 )
-                time.sleep(wait)
+                self._rate_limiter.drain(wait)
                 continue
 
             # Adaptive throttle: slow down when approaching the per-minute cap
@@ -289,7 +496,7 @@ class EODHDProvider(DataProvider):
                         _log.info(
                             "EODHD rate limit remaining: %d, throttling", remaining_int
                         )
-                        time.sleep(1.0)
+                        self._rate_limiter.drain(_RATE_LIMIT_SLOW_DOWN)
                 except ValueError:
                     pass
 
@@ -301,15 +508,18 @@ class EODHDProvider(DataProvider):
         api_key: str,
         base_params: dict[str, Any],
         on_progress: Callable[[int], None] | None = None,
-    ) -> tuple[list[dict], bool, str | None]:
+    ) -> tuple[list[_Page], bool, str | None]:
         """Paginate through a single date window using compact mode.
 
-        Returns ``(rows, hit_cap, error_or_none)``.  ``hit_cap`` is True when
-        the offset limit was reached, signalling that more data likely exists
-        beyond this window.
+        Returns ``(pages, hit_cap, error_or_none)``.  Each page is decoded
+        into columnar arrays (``_decode_page``) as soon as it arrives, so a
+        window is never held as Python row objects beyond the page in hand.
+        ``hit_cap`` is True when the offset limit was reached, signalling
+        that more data likely exists beyond this window.
         """
-        rows: list[dict] = []
-        url = f"{_BASE_URL}/options/eod"
+        pages: list[_Page] = []
+        rows_fetched = 0
+        url = f"{self._base_url}/options/eod"
         params = {
             **base_params,
             "api_token": api_key,
@@ -339,18 +549,11 @@ class EODHDProvider(DataProvider):
             if not page_rows:
                 break
 
-            if fields:
-                # Compact format — zip field names with each row array
-                for row in page_rows:
-                    rows.append(dict(zip(fields, row)))
-            else:
-                # Fallback to standard format if compact somehow not applied
-                for row in page_rows:
-                    attrs = row.get("attributes", row)
-                    rows.append(attrs)
+            pages.append(_decode_page(fields, page_rows))
+            rows_fetched += len(page_rows)
 
             if on_progress:
-                on_progress(len(rows))
+                on_progress(rows_fetched)
 
             offset += _PAGE_LIMIT
             next_url = data.get("links", {}).get("next")
@@ -361,7 +564,7 @@ class EODHDProvider(DataProvider):
             url = next_url
             params = {"api_token": api_key, "compact": 1}
 
-        return rows, hit_cap, None
+        return pages, hit_cap, None
 
     # -- bulk download --
 
@@ -391,16 +594,18 @@ class EODHDProvider(DataProvider):
         _status = on_status or (lambda msg: None)
 
         # Check for existing cached data to enable resume
-        cached_df = self._cache.read("options", symbol)
+        cached_df = self._cache.read_filtered(
+            "options", symbol, columns=["option_type", "quote_date"]
+        )
         cached_rows = len(cached_df) if cached_df is not None else 0
         is_resume = cached_rows > 0
 
         errors: list[str] = []
-        new_rows_total = 0
 
+        resume_from: dict[str, str | None] = {}
         for option_type in ("call", "put"):
             # Determine resume point from cache
-            resume_from: str | None = None
+            resume_from[option_type] = None
             if cached_df is not None and not cached_df.empty:
                 type_mask = (
                     cached_df["option_type"].str.lower().str.startswith(option_type[0])
@@ -408,53 +613,56 @@ class EODHDProvider(DataProvider):
                 type_cached = cached_df.loc[type_mask]
                 if not type_cached.empty:
                     max_date = pd.to_datetime(type_cached["quote_date"]).max()
-                    resume_from = str((max_date + timedelta(days=1)).date())
+                    resume_from[option_type] = str(
+                        (max_date + timedelta(days=1)).date()
+                    )
                     _status(
-                        f"Resuming {symbol} {option_type} options from {resume_from} "
+                        f"Resuming {symbol} {option_type} options from "
+                        f"{resume_from[option_type]} "
                         f"({len(type_cached):,} cached rows)"
                     )
                     _log.info(
                         "Resuming %s %s options from %s (%s cached rows)",
                         symbol,
                         option_type,
-                        resume_from,
+                        resume_from[option_type],
                         f"{len(type_cached):,}",
                     )
 
-            _status(f"Downloading {symbol} {option_type} options…")
-            _log.info("Downloading %s %s options from EODHD…", symbol, option_type)
-            new_rows, error = self._fetch_all_for_type(
-                api_key,
+        _status(f"Downloading {symbol} call and put options…")
+        _log.info("Downloading %s call and put options from EODHD…", symbol)
+        new_rows, error = self._fetch_all(
+            api_key,
+            symbol,
+            resume_from,
+            on_progress=on_progress,
+            on_status=on_status,
+        )
+        new_rows_total = sum(new_rows.values())
+        if error:
+            errors.append(error)
+            _status(
+                f"Error saving {symbol} options "
+                f"(fetched {new_rows_total:,} rows before error): {error}"
+            )
+            _log.warning(
+                "Error saving %s options (fetched %s rows before error): %s",
                 symbol,
+                f"{new_rows_total:,}",
+                error,
+            )
+        for option_type, rows in new_rows.items():
+            _status(f"Done: {rows:,} new {option_type} rows for {symbol}")
+            _log.info(
+                "Downloaded %s new %s rows for %s",
+                f"{rows:,}",
                 option_type,
-                resume_from=resume_from,
-                on_progress=on_progress,
-                on_status=on_status,
+                symbol,
             )
-            if error:
-                errors.append(f"{option_type}: {error}")
-                _status(
-                    f"Error fetching {symbol} {option_type} options "
-                    f"(saved {new_rows:,} rows before error): {error}"
-                )
-                _log.warning(
-                    "Error fetching %s %s options (saved %s rows before error): %s",
-                    symbol,
-                    option_type,
-                    f"{new_rows:,}",
-                    error,
-                )
-            else:
-                _status(f"Done: {new_rows:,} new {option_type} rows for {symbol}")
-                _log.info(
-                    "Downloaded %s new %s rows for %s",
-                    f"{new_rows:,}",
-                    option_type,
-                    symbol,
-                )
-            new_rows_total += new_rows
 
-        # Re-read the cache to build summary (includes both old + new data)
+        # Merge the segments appended per window, then re-read the cache to
+        # build summary (includes both old + new data)
+        self._cache.compact("options", symbol)
         df = self._cache.read("options", symbol)
 
         if df is None or df.empty:
@@ -516,18 +724,18 @@ class EODHDProvider(DataProvider):
         "expiration_type",
     ]
 
-    def _normalize_and_save_window(self, rows: list[dict], symbol: str) -> pd.DataFrame:
-        """Normalize raw API rows and incrementally merge into the cache."""
-        df = pd.DataFrame(rows)
-        df = df.rename(columns=_COLUMN_MAP)
+    def _normalize_and_save_window(
+        self, pages: list[_Page], symbol: str
+    ) -> pd.DataFrame:
+        """Combine a window's decoded pages, normalize them and append to the cache."""
+        df = _concat_pages(pages)
         if "expiration" in df.columns:
             df["expiration"] = pd.to_datetime(df["expiration"])
         if "quote_date" in df.columns:
             df["quote_date"] = pd.to_datetime(df["quote_date"])
-        _coerce_numeric(df, _OPTIONS_NUMERIC_COLS)
 
         dedup_cols = [c for c in self._DEDUP_COLS if c in df.columns]
-        self._cache.merge_and_save("options", symbol, df, dedup_cols or None)
+        self._cache.append("options", symbol, df, dedup_cols or None)
         return df
 
     @staticmethod
@@ -543,53 +751,27 @@ class EODHDProvider(DataProvider):
 
     _MIN_WINDOW_DAYS = 1  # stop subdividing at single-day windows
 
-    def _fetch_window_recursive(
+    def _fetch_window(
         self,
         api_key: str,
         symbol: str,
         option_type: str,
         win_from: str,
         win_to: str,
-        rows_fetched: int,
-        on_progress: Callable[[str, str, int, float], None] | None = None,
-        on_status: Callable[[str], None] | None = None,
-        date_range: tuple[datetime, datetime] | None = None,
-    ) -> tuple[int, str | None]:
-        """Fetch a single date window, subdividing if the offset cap is hit."""
-        from_dt = _parse_date(win_from)
-        to_dt = _parse_date(win_to)
-        if not from_dt or not to_dt:
-            return 0, None
-
-        _status = on_status or (lambda msg: None)
-        span_days = (to_dt - from_dt).days
-
-        def _pct_at(d: str) -> float:
-            """Compute date-range percentage for a given date string."""
-            if not date_range:
-                return 0.0
-            total = (date_range[1] - date_range[0]).days
-            if total <= 0:
-                return 100.0
-            parsed = _parse_date(d)
-            if not parsed:
-                return 0.0
-            # Newest-first: percentage = how far back from end we've reached
-            remaining = (
-                datetime(parsed.year, parsed.month, parsed.day) - date_range[0]
-            ).days
-            return min(100.0, max(0.0, (1 - remaining / total) * 100))
+        progress: _DownloadProgress,
+    ) -> tuple[list[_Page], bool, str | None]:
+        """Fetch every page of one date window (runs on a fetch thread).
 
+        Rows are added to *progress* page by page and taken back out if the
+        window fails.  Returns ``_paginate_window``'s result.
+        """
         _log.info(
-            "Fetching %s %s options: %s to %s (%d days) — %s total rows so far",
+            "Fetching %s %s options: %s to %s",
             symbol,
             option_type,
             win_from,
             win_to,
-            span_days,
-            f"{rows_fetched:,}",
         )
-
         base_params: dict[str, Any] = {
             "filter[underlying_symbol]": symbol,
             "filter[type]": option_type,
@@ -600,126 +782,149 @@ class EODHDProvider(DataProvider):
             "sort": "exp_date",
         }
 
-        pct = _pct_at(win_from)
+        reported = 0
 
-        def _page_progress(page_rows: int) -> None:
-            if on_progress:
-                on_progress(symbol, option_type, rows_fetched + page_rows, pct)
+        def _page_progress(window_rows: int) -> None:
+            nonlocal reported
+            progress.update(option_type, rows=window_rows - reported)
+            reported = window_rows
 
-        rows, hit_cap, error = self._paginate_window(
+        pages, hit_cap, error = self._paginate_window(
             api_key, base_params, on_progress=_page_progress
         )
+        if error and reported:
+            progress.update(option_type, rows=-reported)
+        return pages, hit_cap, error
 
-        window_rows = len(rows)
-        if rows:
-            self._normalize_and_save_window(rows, symbol)
-            rows_fetched += window_rows
-            if on_progress:
-                on_progress(symbol, option_type, rows_fetched, pct)
-
-        if error:
-            _status(f"  Error {win_from}–{win_to} ({option_type}): {error} — skipping")
-            _log.warning(
-                "Error fetching %s to %s for %s %s: %s — continuing",
-                win_from,
-                win_to,
-                symbol,
-                option_type,
-                error,
-            )
-            return rows_fetched, None  # continue, don't abort
-
-        if hit_cap and span_days > self._MIN_WINDOW_DAYS:
-            # Undo the partial count — subdivision will re-fetch this range fully
-            rows_fetched -= window_rows
-            # Window too large — subdivide into two halves and retry
-            _status(f"  Window {win_from}–{win_to} hit 10K cap, subdividing…")
-            _log.warning(
-                "Offset cap hit for %s %s (%s to %s), subdividing into smaller windows",
-                symbol,
-                option_type,
-                win_from,
-                win_to,
-            )
-            mid = from_dt + timedelta(days=span_days // 2)
-            # First half: already fetched partial data, re-fetch with smaller window
-            rows_fetched, _ = self._fetch_window_recursive(
-                api_key,
-                symbol,
-                option_type,
-                win_from,
-                str(mid),
-                rows_fetched,
-                on_progress,
-                on_status,
-                date_range,
-            )
-            # Second half
-            rows_fetched, _ = self._fetch_window_recursive(
-                api_key,
-                symbol,
-                option_type,
-                str(mid + timedelta(days=1)),
-                win_to,
-                rows_fetched,
-                on_progress,
-                on_status,
-                date_range,
-            )
-
-        return rows_fetched, None
-
-    def _fetch_all_for_type(
+    def _fetch_all(
         self,
         api_key: str,
         symbol: str,
-        option_type: str,
-        resume_from: str | None = None,
+        resume_from: dict[str, str | None],
         on_progress: Callable[[str, str, int, float], None] | None = None,
         on_status: Callable[[str], None] | None = None,
-    ) -> tuple[int, str | None]:
-        """Fetch all rows for a single option type using date windows.
-
-        Returns ``(rows_fetched, error_or_none)``.  Downloads data in ~30-day
-        chunks.  If a window hits the 10K offset cap, it automatically
-        subdivides into smaller windows to avoid gaps.
+    ) -> tuple[dict[str, int], str | None]:
+        """Fetch all rows for each option type in *resume_from*.
+
+        Returns ``(rows_fetched_per_type, error_or_none)``.  Downloads ~30-day
+        windows starting at each type's resume date (or two years back);
+        the windows of all types are fetched concurrently on a thread pool
+        and handed to a ``_WindowWriter`` that saves them to the cache.  If a
+        window hits the 10K offset cap, it is subdivided into two halves
+        that are fetched in turn to avoid gaps.  Windows that fail are
+        logged and skipped; the returned error reports a failed cache
+        write, which stops the download.
         """
-        rows_fetched = 0
         _status = on_status or (lambda msg: None)
 
-        # EODHD provides ~2 years of historical options data
-        start = datetime.now() - timedelta(days=730)
-        if resume_from:
-            parsed = _parse_date(resume_from)
+        end = datetime.now()
+        windows: list[tuple[str, str, str]] = []
+        total_days: dict[str, int] = {}
+        for option_type, resume in resume_from.items():
+            # EODHD provides ~2 years of historical options data
+            start = end - timedelta(days=730)
+            parsed = _parse_date(resume)
             if parsed:
                 start = datetime(parsed.year, parsed.month, parsed.day)
-        end = datetime.now()
-        date_range = (start, end)
+            total_days[option_type] = (end.date() - start.date()).days + 1
+            windows.extend(
+                (option_type, win_from, win_to)
+                for win_from, win_to in self._quarter_windows(start, end)
+            )
 
-        windows = self._quarter_windows(start, end)
-        total_windows = len(windows)
+        progress = _DownloadProgress(symbol, total_days, on_progress)
+        writer = _WindowWriter(self._normalize_and_save_window, symbol)
+        pending: dict[Future, tuple[str, str, str]] = {}
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="eodhd-fetch"
+            ) as pool:
+
+                def _submit(option_type: str, win_from: str, win_to: str) -> None:
+                    future = pool.submit(
+                        self._fetch_window,
+                        api_key,
+                        symbol,
+                        option_type,
+                        win_from,
+                        win_to,
+                        progress,
+                    )
+                    pending[future] = (option_type, win_from, win_to)
 
-        for i, (win_from, win_to) in enumerate(windows, 1):
-            _status(
-                f"  {option_type} window {i}/{total_windows}: {win_from} to {win_to}"
-            )
-            rows_fetched, _ = self._fetch_window_recursive(
-                api_key,
-                symbol,
-                option_type,
-                win_from,
-                win_to,
-                rows_fetched,
-                on_progress,
-                on_status,
-                date_range,
-            )
+                for window in windows:
+                    _submit(*window)
 
-        # Final 100% update
-        if on_progress:
-            on_progress(symbol, option_type, rows_fetched, 100.0)
+                try:
+                    while pending and writer.error is None:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            option_type, win_from, win_to = pending.pop(future)
+                            pages, hit_cap, error = future.result()
+                            from_dt = _parse_date(win_from)
+                            span_days = (_parse_date(win_to) - from_dt).days
+                            window_rows = _page_rows(pages)
+                            if pages:
+                                writer.put(pages)
+
+                            if error:
+                                _status(
+                                    f"  Error {win_from}–{win_to} ({option_type}): "
+                                    f"{error} — skipping"
+                                )
+                                _log.warning(
+                                    "Error fetching %s to %s for %s %s: %s "
+                                    "— continuing",
+                                    win_from,
+                                    win_to,
+                                    symbol,
+                                    option_type,
+                                    error,
+                                )
+                                progress.update(option_type, days=span_days + 1)
+                            elif hit_cap and span_days > self._MIN_WINDOW_DAYS:
+                                # Undo the partial count — subdivision will
+                                # re-fetch this range fully
+                                progress.update(option_type, rows=-window_rows)
+                                _status(
+                                    f"  Window {win_from}–{win_to} hit 10K cap, "
+                                    "subdividing…"
+                                )
+                                _log.warning(
+                                    "Offset cap hit for %s %s (%s to %s), "
+                                    "subdividing into smaller windows",
+                                    symbol,
+                                    option_type,
+                                    win_from,
+                                    win_to,
+                                )
+                                mid = from_dt + timedelta(days=span_days // 2)
+                                _submit(option_type, win_from, str(mid))
+                                _submit(
+                                    option_type,
+                                    str(mid + timedelta(days=1)),
+                                    win_to,
+                                )
+                            else:
+                                progress.update(option_type, days=span_days + 1)
+                                _status(
+                                    f"  {option_type} {win_from} to {win_to}: "
+                                    f"{window_rows:,} rows"
+                                )
+                finally:
+                    # Stop queued windows after an error; running ones finish
+                    for future in pending:
+                        future.cancel()
+        finally:
+            writer.close()
+
+        if writer.error is not None:
+            return progress.rows, f"failed to save to cache: {writer.error}"
 
-        return rows_fetched, None
+        # Final 100% update
+        for option_type in resume_from:
+            progress.finish(option_type)
+        return progress.rows, None
 
     # -- local read + filter --
 
@@ -731,10 +936,16 @@ class EODHDProvider(DataProvider):
         option_type: str | None = None,
         expiration_type: str = "monthly",
     ) -> tuple[str, pd.DataFrame | None]:
-        """Read locally stored options data, filter, and prepare for backtesting."""
+        """Read locally stored options data, filter, and prepare for backtesting.
+
+        The result is fingerprinted from the cached dataset's version and
+        the arguments (see ``optopsy.data.fingerprint``), so the agent never
+        has to hash it.
+        """
         symbol = symbol.upper()
 
-        df = self._cache.read("options", symbol)
+        version = self._cache.dataset_version("options", symbol)
+        df = cached = self._cache.read("options", symbol)
         if df is None or df.empty:
             return (
                 f"No local options data for {symbol}. "
@@ -758,7 +969,25 @@ class EODHDProvider(DataProvider):
                 f"Check the date range against what was downloaded."
             ), None
 
-        return self._apply_options_transforms(df, symbol, option_type, expiration_type)
+        summary, result = self._apply_options_transforms(
+            df, symbol, option_type, expiration_type
+        )
+        # A write between reading the version and the data would make the
+        # version describe other data; the agent then hashes the content.
+        if (
+            result is not None
+            and version is not None
+            and version == self._cache.dataset_version("options", symbol)
+        ):
+            fingerprints.derive(
+                fingerprints.remember(cached, dataset=version),
+                result,
+                start_date=start_date,
+                end_date=end_date,
+                option_type=option_type,
+                expiration_type=expiration_type,
+            )
+        return summary, result
 
     def _apply_options_transforms(
         self,
@@ -0,0 +1,141 @@
+"""Memory-mapped Arrow IPC tier in front of the parquet cache.
+
+Decoding a multi-GB parquet dataset costs tens of seconds of decompression
+on every notebook restart or UI session, for data that never changes.
+``ArrowHotCache`` keeps an uncompressed Arrow IPC copy of recently used
+datasets and memory-maps it on read: opening is near-instant, column
+selection and filters run on the mapped buffers without copying, and
+every process mapping the same file shares its page-cache pages.
+
+Each copy is stored as ``{category}/{SYMBOL}-{fingerprint}.arrow``, where
+the fingerprint identifies the parquet version it was built from, so a
+changed dataset simply misses and its stale copy is replaced.  Files are
+written to a temporary name and renamed into place, so concurrent readers
+never see a partial copy.  The tier is bounded in bytes; the least
+recently read copies are evicted first (reads refresh a file's mtime).
+
+Enable it for ``get_store()`` by setting ``OPTOPSY_HOT_CACHE_MB``.
+"""
+
+import logging
+import os
+import tempfile
+
+import pyarrow as pa
+
+_log = logging.getLogger(__name__)
+
+
+class ArrowHotCache:
+    """Size-bounded LRU store of memory-mapped Arrow IPC tables.
+
+    Args:
+        directory: Root directory of the tier.
+        max_bytes: Total size the tier may occupy; tables larger than this
+            are never stored.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self._dir = directory
+        self._max_bytes = max_bytes
+
+    def _prefix(self, category: str, symbol: str) -> str:
+        return os.path.join(
+            self._dir,
+            os.path.basename(category),
+            f"{os.path.basename(symbol).upper()}-",
+        )
+
+    def get(self, category: str, symbol: str, fingerprint: str) -> pa.Table | None:
+        """Memory-map the copy of *(category, symbol)* at *fingerprint*, if any."""
+        path = f"{self._prefix(category, symbol)}{fingerprint}.arrow"
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            _log.warning("Failed to map hot cache %s: %s", path, exc)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return table
+
+    def put(
+        self, category: str, symbol: str, fingerprint: str, table: pa.Table
+    ) -> None:
+        """Store *table* as the copy of *(category, symbol)* at *fingerprint*."""
+        if table.nbytes > self._max_bytes:
+            return
+        prefix = self._prefix(category, symbol)
+        path = f"{prefix}{fingerprint}.arrow"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, staging = tempfile.mkstemp(
+            dir=os.path.dirname(path), prefix=".staging-", suffix=".arrow"
+        )
+        try:
+            with os.fdopen(fd, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(staging, path)
+        except Exception as exc:
+            _log.warning("Failed to write hot cache %s: %s", path, exc)
+            _unlink(staging)
+            return
+        self.discard(category, symbol, keep=path)
+        self._evict(keep=path)
+
+    def discard(self, category: str, symbol: str, keep: str | None = None) -> None:
+        """Remove the copies of *(category, symbol)*, except *keep*."""
+        prefix = self._prefix(category, symbol)
+        directory = os.path.dirname(prefix)
+        if not os.path.isdir(directory):
+            return
+        for fname in os.listdir(directory):
+            path = os.path.join(directory, fname)
+            if path.startswith(prefix) and fname.endswith(".arrow") and path != keep:
+                _unlink(path)
+
+    def size_bytes(self) -> int:
+        """Total size of the stored copies."""
+        return sum(size for _, size, _ in self._entries())
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """``(mtime, size, path)`` of every stored copy."""
+        entries = []
+        if not os.path.isdir(self._dir):
+            return entries
+        for dirpath, _, fnames in os.walk(self._dir):
+            for fname in fnames:
+                if fname.endswith(".arrow") and not fname.startswith("."):
+                    path = os.path.join(dirpath, fname)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used copies until the tier fits its budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            if path == keep:
+                continue
+            _unlink(path)
+            total -= size
+
+
+def _unlink(path: str) -> None:
+    # Mapped files cannot be removed on Windows; they are retried on the
+    # next eviction.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
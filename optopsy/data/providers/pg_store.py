@@ -5,8 +5,18 @@ files, making it easy to inspect and manage data on production deployments
 (e.g. Railway).
 
 Tables are created lazily on first use via ``ensure_tables()``.
+
+Bulk writes stream rows with ``COPY ... FROM STDIN`` — into the table for
+``write()``, or into a temporary staging table for ``append()`` and
+``merge_and_save()``.  Staged rows are merged with a single set-based
+``INSERT ... SELECT ... ON CONFLICT`` upsert when they carry the table's
+whole unique key, and otherwise replace the stored rows sharing their
+dedup key with one ``DELETE ... USING`` followed by an ``INSERT``.  ``read_filtered()`` turns column selections and
+filters into the ``SELECT`` list and ``WHERE`` clause, served by the
+composite indexes below.
 """
 
+import io
 import logging
 import os
 
@@ -26,9 +36,8 @@ from sqlalchemy import (
     select,
     text,
 )
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from optopsy.data.providers.store import DataStore
+from optopsy.data.providers.store import DataStore, check_filters
 
 _log = logging.getLogger(__name__)
 
@@ -90,6 +99,14 @@ Index(
     options_data.c.quote_date,
 )
 
+# Serves strategy loads, which filter on expiration range and option type
+Index(
+    "ix_options_data_symbol_expiration",
+    options_data.c.underlying_symbol,
+    options_data.c.expiration,
+    options_data.c.option_type,
+)
+
 stocks_data = Table(
     "stocks_data",
     metadata,
@@ -125,9 +142,34 @@ _CATEGORY_TABLE = {
 def ensure_tables(engine) -> None:
     """Create tables and indexes if they don't already exist."""
     metadata.create_all(engine)
+    # create_all skips indexes of tables that already exist
+    for tbl in metadata.tables.values():
+        for index in tbl.indexes:
+            index.create(engine, checkfirst=True)
     _log.debug("Data store tables ensured")
 
 
+def _conflict_columns(tbl: Table) -> list[str]:
+    """Columns of the unique dedup index of *tbl* (the upsert target)."""
+    unique = next(index for index in tbl.indexes if index.unique)
+    return [c.name for c in unique.columns]
+
+
+def _copy_rows(conn, table_name: str, df: pd.DataFrame) -> None:
+    """Stream *df* into *table_name* with ``COPY ... FROM STDIN`` (CSV)."""
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False)
+    buf.seek(0)
+    cols = ", ".join(f'"{c}"' for c in df.columns)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({cols}) FROM STDIN WITH (FORMAT csv)", buf
+        )
+    finally:
+        cursor.close()
+
+
 def _normalize_db_url(url: str) -> str:
     """Normalize a database URL for SQLAlchemy sync usage."""
     if url.startswith("postgres://"):
@@ -164,91 +206,167 @@ class PostgresStore(DataStore):
         return [c.name for c in table.columns if c.name != "id"]
 
     def read(self, category: str, symbol: str) -> pd.DataFrame | None:
+        return self.read_filtered(category, symbol)
+
+    def read_filtered(
+        self,
+        category: str,
+        symbol: str,
+        columns: list[str] | None = None,
+        filters: list[tuple[str, str, object]] | None = None,
+    ) -> pd.DataFrame | None:
+        check_filters(filters)
         tbl = self._table(category)
-        stmt = select(*[tbl.c[c] for c in self._data_columns(tbl)]).where(
-            tbl.c.underlying_symbol == symbol.upper()
+        data_cols = self._data_columns(tbl)
+        if columns is not None:
+            wanted = set(columns)
+            data_cols = [c for c in data_cols if c in wanted]
+        stmt = select(*[tbl.c[c] for c in data_cols]).where(
+            tbl.c.underlying_symbol == symbol.upper(),
+            *[_where(tbl, column, op, value) for column, op, value in filters or []],
         )
         with self._engine.connect() as conn:
             df = pd.read_sql(stmt, conn)
-        if df.empty:
-            return None
+            # A filtered read may legitimately match nothing; only a symbol
+            # without any rows counts as absent.
+            if df.empty and (not filters or not self._has_symbol(conn, tbl, symbol)):
+                return None
         _log.debug("PG read: %s/%s (%d rows)", category, symbol, len(df))
         return df
 
+    def _has_symbol(self, conn, tbl: Table, symbol: str) -> bool:
+        stmt = select(tbl.c.id).where(tbl.c.underlying_symbol == symbol.upper())
+        return conn.execute(stmt.limit(1)).first() is not None
+
     def write(self, category: str, symbol: str, df: pd.DataFrame) -> None:
         tbl = self._table(category)
-        data_cols = self._data_columns(tbl)
-        # Only keep columns that exist in both the DataFrame and the table
-        cols_to_write = [c for c in data_cols if c in df.columns]
-        write_df = df[cols_to_write].copy()
+        write_df = self._write_frame(tbl, df)
 
         with self._engine.begin() as conn:
             conn.execute(delete(tbl).where(tbl.c.underlying_symbol == symbol.upper()))
             if not write_df.empty:
-                write_df.to_sql(
-                    tbl.name,
-                    conn,
-                    if_exists="append",
-                    index=False,
-                    method="multi",
-                    chunksize=10_000,
-                )
+                _copy_rows(conn, tbl.name, write_df)
         _log.debug("PG write: %s/%s (%d rows)", category, symbol, len(write_df))
 
-    def merge_and_save(
+    def _write_frame(self, tbl: Table, df: pd.DataFrame) -> pd.DataFrame:
+        """Columns of *df* that exist in *tbl*, in table order."""
+        return df[[c for c in self._data_columns(tbl) if c in df.columns]]
+
+    def append(
         self,
         category: str,
         symbol: str,
         new_df: pd.DataFrame,
         dedup_cols: list[str] | None = None,
-    ) -> pd.DataFrame:
+    ) -> None:
+        """Bulk-load *new_df*, newer rows winning per *dedup_cols* key.
+
+        With *dedup_cols*, rows are copied into a temporary staging table
+        and keyed on the *dedup_cols* present in the frame, plus
+        ``underlying_symbol``.  When that key is the table's unique index
+        and holds no nulls, rows are merged in one ``INSERT ... ON CONFLICT
+        DO UPDATE``.  Otherwise no index can arbitrate conflicts -- without
+        ``expiration_type``, say -- so stored rows sharing a staged row's
+        key are deleted before the staged rows are inserted.  Without
+        *dedup_cols*, rows are copied straight into the table.
+        """
         tbl = self._table(category)
-        data_cols = self._data_columns(tbl)
-        cols_to_write = [c for c in data_cols if c in new_df.columns]
-        write_df = new_df[cols_to_write].copy()
-
+        write_df = self._write_frame(tbl, new_df)
         if write_df.empty:
-            existing = self.read(category, symbol)
-            return existing if existing is not None else pd.DataFrame()
+            return
+
+        cols = list(write_df.columns)
+        keys = [c for c in dedup_cols or [] if c in cols] or cols
+        if "underlying_symbol" in cols and "underlying_symbol" not in keys:
+            # The table holds every symbol, so a key is always per symbol
+            keys = ["underlying_symbol", *keys]
+        conflict_cols = _conflict_columns(tbl)
+        with self._engine.begin() as conn:
+            if not dedup_cols:
+                # No dedup columns — just append
+                _copy_rows(conn, tbl.name, write_df)
+            else:
+                # One statement cannot update a row twice: keep the last
+                # occurrence of each key, as newer data wins.
+                write_df = write_df.drop_duplicates(subset=keys, keep="last")
+                if set(keys) == set(conflict_cols) and not (
+                    write_df[keys].isna().any().any()
+                ):
+                    self._upsert(conn, tbl, write_df, conflict_cols)
+                else:
+                    self._replace(conn, tbl, write_df, keys)
+        _log.debug("PG merge: %s/%s (%d new rows)", category, symbol, len(write_df))
 
-        # Find the unique constraint columns that are present in the data
-        if dedup_cols:
-            conflict_cols = [c for c in dedup_cols if c in cols_to_write]
+    def _stage(self, conn, tbl: Table, df: pd.DataFrame) -> str:
+        """Copy *df* into a temporary table dropped on commit; return its name."""
+        staging = f"_staging_{tbl.name}"
+        col_list = ", ".join(f'"{c}"' for c in df.columns)
+        conn.execute(
+            text(
+                f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                f"SELECT {col_list} FROM {tbl.name} WITH NO DATA"
+            )
+        )
+        _copy_rows(conn, staging, df)
+        return staging
+
+    def _upsert(
+        self, conn, tbl: Table, df: pd.DataFrame, conflict_cols: list[str]
+    ) -> None:
+        staging = self._stage(conn, tbl, df)
+        col_list = ", ".join(f'"{c}"' for c in df.columns)
+        update_cols = [c for c in df.columns if c not in conflict_cols]
+        conflict = ", ".join(f'"{c}"' for c in conflict_cols)
+        if update_cols:
+            assignments = ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in update_cols)
+            action = f"DO UPDATE SET {assignments}"
         else:
-            conflict_cols = []
+            action = "DO NOTHING"
+        conn.execute(
+            text(
+                f"INSERT INTO {tbl.name} ({col_list}) "
+                f"SELECT {col_list} FROM {staging} "
+                f"ON CONFLICT ({conflict}) {action}"
+            )
+        )
 
-        if conflict_cols:
-            # Use PostgreSQL upsert: INSERT ... ON CONFLICT DO UPDATE
-            update_cols = [c for c in cols_to_write if c not in conflict_cols]
-            rows = write_df.to_dict(orient="records")
-            with self._engine.begin() as conn:
-                for i in range(0, len(rows), 10_000):
-                    chunk = rows[i : i + 10_000]
-                    stmt = pg_insert(tbl).values(chunk)
-                    if update_cols:
-                        stmt = stmt.on_conflict_do_update(
-                            index_elements=conflict_cols,
-                            set_={c: stmt.excluded[c] for c in update_cols},
-                        )
-                    else:
-                        stmt = stmt.on_conflict_do_nothing(index_elements=conflict_cols)
-                    conn.execute(stmt)
-        else:
-            # No dedup columns — just append
-            with self._engine.begin() as conn:
-                write_df.to_sql(
-                    tbl.name,
-                    conn,
-                    if_exists="append",
-                    index=False,
-                    method="multi",
-                    chunksize=10_000,
-                )
+    def _replace(self, conn, tbl: Table, df: pd.DataFrame, keys: list[str]) -> None:
+        """Delete stored rows sharing a *keys* value with *df*, then insert *df*."""
+        staging = self._stage(conn, tbl, df)
+        col_list = ", ".join(f'"{c}"' for c in df.columns)
+        # Nullable key columns match NULL to NULL, as the parquet cache does
+        match = " AND ".join(
+            f't."{c}" IS NOT DISTINCT FROM s."{c}"'
+            if tbl.c[c].nullable
+            else f't."{c}" = s."{c}"'
+            for c in keys
+        )
+        conn.execute(
+            text(f"DELETE FROM {tbl.name} AS t USING {staging} AS s WHERE {match}")
+        )
+        conn.execute(
+            text(
+                f"INSERT INTO {tbl.name} ({col_list}) SELECT {col_list} FROM {staging}"
+            )
+        )
 
-        _log.debug("PG merge: %s/%s (%d new rows)", category, symbol, len(write_df))
-        # Return the full dataset for this symbol
+    def merge_and_save(
+        self,
+        category: str,
+        symbol: str,
+        new_df: pd.DataFrame,
+        dedup_cols: list[str] | None = None,
+    ) -> pd.DataFrame:
+        """Upsert *new_df* (see ``append()``) and return the symbol's full data.
+
+        Returning the merged frame reads every row of the symbol; callers
+        that do not need it should use ``append()`` instead.
+        """
+        self.append(category, symbol, new_df, dedup_cols)
         result = self.read(category, symbol)
-        return result if result is not None else write_df
+        if result is not None:
+            return result
+        return new_df if not new_df.empty else pd.DataFrame()
 
     def clear(self, symbol: str | None = None, category: str | None = None) -> int:
         total = 0
@@ -288,3 +406,23 @@ class PostgresStore(DataStore):
                 if row:
                     total += row
         return total
+
+
+def _where(tbl: Table, column: str, op: str, value: object):
+    """SQL condition for one ``read_filtered()`` filter."""
+    if column not in tbl.c:
+        raise ValueError(f"Filter column '{column}' not found in {tbl.name}")
+    col = tbl.c[column]
+    if op == "in":
+        return col.in_(list(value))
+    if op == "==":
+        return col == value
+    if op == "!=":
+        return col != value
+    if op == "<":
+        return col < value
+    if op == "<=":
+        return col <= value
+    if op == ">":
+        return col > value
+    return col >= value
@@ -1,60 +1,156 @@
 """Global parquet cache for result DataFrames (strategies + simulations).
 
 Keys are SHA-256 content hashes of (name, params, dataset_fingerprint).
-A JSON index maps hashes to human-readable metadata (type, strategy, params,
-display_key, and for simulations: summary).
+An SQLite index maps hashes to human-readable metadata (type, strategy,
+params, display_key, and for simulations: summary) together with each
+result's size, last access time and a summary record computed when the
+result is written:
+
+- ``rows`` and ``columns`` (name -> dtype) of the result
+- ``stats``: count, mean_return, std, win_rate and profit_factor, as
+  reported by the chat tools (see ``result_stats()``)
+- ``quantiles`` of ``pct_change`` for raw results
+- ``date_span``: first and last timestamp across the datetime columns
+- ``row_groups`` and per-column ``min`` / ``max`` / ``nulls`` from the
+  parquet row-group statistics
+
+Listing and ranking stored results reads these records instead of the
+parquet files, and ``read()`` loads only the requested columns, passing
+filters down to pyarrow so row groups whose statistics exclude them are
+skipped.
 
 Storage layout::
 
     ~/.optopsy/results/
       {hash}.parquet          # full result DataFrame
-      _index.json             # hash -> metadata mapping
+      _index.sqlite           # hash -> metadata, summary, bytes, access time
+
+The index runs in WAL mode, so readers never wait for a writer and each
+write touches one row instead of rewriting the whole index.  Writes made
+inside ``batch()`` (e.g. by a strategy scan) are committed in a single
+transaction; their parquet files keep a temporary name until then, so a
+process that dies mid-batch leaves no untracked results behind, and
+temporary files abandoned that way are removed by a later commit once
+they are a day old.  After every commit the store evicts least recently used
+results until it fits its size budget (``OPTOPSY_RESULTS_MAX_MB``,
+default 2048) and drops results unused for longer than
+``OPTOPSY_RESULTS_MAX_AGE_DAYS`` when that is set.  A JSON index
+(``_index.json``) left by older versions is imported on first use.
 """
 
-import fcntl
+import contextlib
 import hashlib
 import json
 import logging
 import os
+import sqlite3
 import tempfile
+import threading
+import time
+from collections.abc import Iterator
 
+import numpy as np
 import pandas as pd
 
 from optopsy.data._dataframe_utils import stringify_interval_cols
+from optopsy.data.fingerprint import fingerprint
 from optopsy.data.paths import RESULTS_DIR
+from optopsy.metrics import profit_factor, win_rate
 
 _log = logging.getLogger(__name__)
 
 _RESULTS_DIR = str(RESULTS_DIR)
 
+_INDEX = "_index.sqlite"
+_LEGACY_INDEX = "_index.json"
+
+# Default size budget of the results directory
+_DEFAULT_MAX_MB = 2048
+
+# Seconds a writer waits for another writer's transaction to finish
+_BUSY_TIMEOUT_S = 30.0
+
+# Reads refresh an entry's access time at most this often
+_TOUCH_INTERVAL_S = 60.0
+
+# Temporary parquet files older than this were abandoned by a dead writer
+_STALE_TMP_S = 86400.0
+
+_TMP_SUFFIX = ".parquet.tmp"
+
+# A written result awaiting its commit: the index row (key, metadata,
+# bytes, time, summary) and the temporary parquet file holding it
+_Pending = tuple[tuple[str, str, int, float, str], str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    metadata TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    summary TEXT
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+_QUANTILES = {"min": 0.0, "25%": 0.25, "50%": 0.5, "75%": 0.75, "max": 1.0}
+
 
 class ResultStore:
     """Global parquet cache for result DataFrames (strategies + simulations).
 
     Keys are SHA-256 hashes of (name, params, dataset_fingerprint).
-    A JSON index maps hashes to human-readable metadata.
-
-    Index mutations are protected by a file lock (``_index.lock``) to
-    prevent concurrent writes from clobbering each other.
+    An SQLite index maps hashes to human-readable metadata and tracks each
+    result's size and last access for LRU eviction.
+
+    Args:
+        results_dir: Directory of the store (default ``~/.optopsy/results``).
+        max_bytes: Size budget of the stored results; least recently used
+            results are evicted beyond it.  Defaults to
+            ``OPTOPSY_RESULTS_MAX_MB`` (2048 MB when unset).
+        max_age_days: Results not read or written for this many days are
+            evicted.  Defaults to ``OPTOPSY_RESULTS_MAX_AGE_DAYS`` (no age
+            limit when unset).
     """
 
-    def __init__(self, results_dir: str | None = None):
+    def __init__(
+        self,
+        results_dir: str | None = None,
+        max_bytes: int | None = None,
+        max_age_days: float | None = None,
+    ):
         self._dir = results_dir or _RESULTS_DIR
+        if max_bytes is None:
+            max_mb = os.environ.get("OPTOPSY_RESULTS_MAX_MB", "")
+            max_bytes = int(float(max_mb or _DEFAULT_MAX_MB) * 2**20)
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        if max_age_days is None:
+            max_age = os.environ.get("OPTOPSY_RESULTS_MAX_AGE_DAYS", "")
+            max_age_days = float(max_age) if max_age else None
+        self._max_bytes = max_bytes
+        self._max_age_days = max_age_days
+        # Index rows and temporary parquet paths queued by write() inside
+        # batch()
+        self._pending: list[_Pending] | None = None
+        self._batch_lock = threading.Lock()
 
     @staticmethod
     def make_key(name: str, arguments: dict, dataset_fingerprint: str) -> str:
         """Deterministic cache key for any result (strategy or simulation).
 
-        DataFrame values (e.g. signal columns) are fingerprinted via
-        ``pd.util.hash_pandas_object`` so that different signals produce
-        different cache keys.
+        DataFrame values (e.g. signal columns) are fingerprinted with
+        ``optopsy.data.fingerprint.fingerprint`` so that different signals
+        produce different cache keys; the fingerprint is cached on the
+        frame, so a signal reused across calls is hashed once.
         """
         param_keys = sorted(k for k in arguments.keys() if k not in ("strategy_name",))
         serializable = {}
         for k in param_keys:
             v = arguments[k]
             if isinstance(v, pd.DataFrame):
-                serializable[k] = str(pd.util.hash_pandas_object(v, index=False).sum())
+                serializable[k] = fingerprint(v)
             else:
                 serializable[k] = v
         params_str = json.dumps(serializable, sort_keys=True, default=str)
@@ -65,69 +161,133 @@ class ResultStore:
         return os.path.join(self._dir, f"{key}.parquet")
 
     def _index_path(self) -> str:
-        return os.path.join(self._dir, "_index.json")
+        return os.path.join(self._dir, _INDEX)
 
-    def _lock_path(self) -> str:
-        return os.path.join(self._dir, "_index.lock")
-
-    def _read_index(self) -> dict[str, dict]:
-        path = self._index_path()
-        if not os.path.exists(path):
-            return {}
-        try:
-            with open(path) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return {}
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, creating it (and importing a JSON index) if needed.
 
-    def _write_index(self, index: dict[str, dict]) -> None:
-        """Atomically write the index via temp file + rename."""
-        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        Connections are in autocommit mode; writers open transactions
+        explicitly with ``BEGIN IMMEDIATE``.
+        """
+        os.makedirs(self._dir, exist_ok=True)
+        conn = sqlite3.connect(
+            self._index_path(), timeout=_BUSY_TIMEOUT_S, isolation_level=None
+        )
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(index, f, indent=2, default=str)
-            os.replace(tmp, self._index_path())
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+            if "summary" not in columns:
+                # Index created before summaries were recorded
+                conn.execute("ALTER TABLE results ADD COLUMN summary TEXT")
+            legacy = os.path.join(self._dir, _LEGACY_INDEX)
+            if os.path.exists(legacy):
+                self._import_legacy(conn, legacy)
         except BaseException:
-            try:
-                os.unlink(tmp)
-            except OSError:
-                pass
+            conn.close()
             raise
+        return conn
 
-    def _locked_index_update(self, updater):
-        """Run *updater(index)* while holding an exclusive file lock.
-
-        This prevents concurrent writes from clobbering each other's
-        index entries.  The lock file is ``_index.lock`` alongside the
-        index itself.
+    def _connect_for_write(self) -> sqlite3.Connection:
+        """Open the index for writing, rebuilding it if it is corrupt."""
+        try:
+            return self._connect()
+        except sqlite3.OperationalError:
+            raise
+        except sqlite3.DatabaseError as exc:
+            _log.warning("ResultStore: rebuilding unreadable index: %s", exc)
+        for suffix in ("", "-wal", "-shm"):
+            with contextlib.suppress(OSError):
+                os.remove(self._index_path() + suffix)
+        conn = self._connect()
+        # Metadata is lost, but stored results stay tracked for eviction
+        self._register(
+            conn,
+            {
+                fname.removesuffix(".parquet"): {}
+                for fname in os.listdir(self._dir)
+                if fname.endswith(".parquet")
+            },
+        )
+        return conn
+
+    def _import_legacy(self, conn: sqlite3.Connection, legacy: str) -> None:
+        """Move the entries of a JSON index into *conn*, then delete it."""
+        try:
+            with open(legacy) as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            index = {}
+        self._register(conn, index)
+        with contextlib.suppress(OSError):
+            os.remove(legacy)
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(self._dir, "_index.lock"))
+        _log.info("ResultStore: imported %d entries from %s", len(index), legacy)
+
+    def _register(self, conn: sqlite3.Connection, index: dict[str, dict]) -> None:
+        """Add the stored results in *index* (key -> metadata) to *conn*.
+
+        Sizes and access times are taken from the parquet files; keys
+        without a file are skipped.
         """
-        os.makedirs(self._dir, exist_ok=True)
-        lock_fd = os.open(self._lock_path(), os.O_CREAT | os.O_RDWR)
+        rows = []
+        for key, metadata in index.items():
+            try:
+                stat = os.stat(self._parquet_path(key))
+            except OSError:
+                continue
+            meta = json.dumps(metadata, default=str)
+            rows.append((key, meta, stat.st_size, stat.st_mtime, stat.st_mtime))
+        with _transaction(conn):
+            conn.executemany(
+                "INSERT OR IGNORE INTO results (key, metadata, bytes, created, "
+                "accessed) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a read-only query; an unreadable index reads as empty."""
+        if not os.path.exists(self._index_path()) and not os.path.exists(
+            os.path.join(self._dir, _LEGACY_INDEX)
+        ):
+            return []
         try:
-            fcntl.flock(lock_fd, fcntl.LOCK_EX)
-            index = self._read_index()
-            updater(index)
-            self._write_index(index)
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
+            with contextlib.closing(self._connect()) as conn:
+                return conn.execute(sql, params).fetchall()
+        except sqlite3.DatabaseError as exc:
+            _log.warning("ResultStore: failed to read index: %s", exc)
+            return []
 
     def write(self, key: str, df: pd.DataFrame, metadata: dict) -> None:
         """Persist a result DataFrame and its metadata.
 
-        Writes the parquet file to a temporary name first, updates the
-        index under a file lock, then atomically renames the parquet file
-        into place.  This prevents orphaned parquet files without index
-        entries.
+        Writes the parquet file to a temporary name first, records it in
+        the index together with its summary record, then atomically
+        renames the parquet file into place.  This prevents orphaned
+        parquet files without index entries.  Inside ``batch()`` both the
+        index row and the rename wait until the batch ends.
         """
         os.makedirs(self._dir, exist_ok=True)
-        fd, tmp_parquet = tempfile.mkstemp(dir=self._dir, suffix=".parquet.tmp")
+        fd, tmp_parquet = tempfile.mkstemp(dir=self._dir, suffix=_TMP_SUFFIX)
         os.close(fd)
         try:
             df = stringify_interval_cols(df)
             df.to_parquet(tmp_parquet, index=False, engine="pyarrow")
-            self._locked_index_update(lambda idx: idx.__setitem__(key, metadata))
-            os.replace(tmp_parquet, self._parquet_path(key))
+            row = (
+                key,
+                json.dumps(metadata, default=str),
+                os.path.getsize(tmp_parquet),
+                time.time(),
+                json.dumps(_summarize(df, tmp_parquet), default=str),
+            )
+            with self._batch_lock:
+                batched = self._pending is not None
+                if batched:
+                    self._pending.append((row, tmp_parquet))
+            if not batched:
+                self._commit([(row, tmp_parquet)])
             _log.debug("ResultStore: wrote %s (%d rows)", key, len(df))
         except BaseException:
             try:
@@ -136,16 +296,168 @@ class ResultStore:
                 pass
             raise
 
-    def read(self, key: str) -> pd.DataFrame | None:
-        """Load a result DataFrame by key, or None if not found."""
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Commit the index rows of all ``write()`` calls inside in one transaction.
+
+        Results written inside become readable, and their metadata appears
+        in ``get_metadata()`` / ``list_all()``, when the batch ends.
+        Nested batches join the outermost one.
+        """
+        with self._batch_lock:
+            outer = self._pending is None
+            if outer:
+                self._pending = []
+        if not outer:
+            yield
+            return
+        try:
+            yield
+        finally:
+            with self._batch_lock:
+                pending, self._pending = self._pending, None
+            if pending:
+                try:
+                    self._commit(pending)
+                except BaseException:
+                    for _, tmp_parquet in pending:
+                        with contextlib.suppress(OSError):
+                            os.unlink(tmp_parquet)
+                    raise
+
+    def _commit(self, pending: list[_Pending]) -> None:
+        """Index *pending* results, evict, then move their files into place."""
+        rows = [row for row, _ in pending]
+        with contextlib.closing(self._connect_for_write()) as conn:
+            with _transaction(conn):
+                conn.executemany(
+                    "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET metadata = excluded.metadata, "
+                    "bytes = excluded.bytes, accessed = excluded.accessed, "
+                    "summary = excluded.summary",
+                    [
+                        (key, meta, size, now, now, summary)
+                        for key, meta, size, now, summary in rows
+                    ],
+                )
+                self._evict(conn, keep={row[0] for row in rows})
+        # A file is only moved into place once its index row is committed
+        for row, tmp_parquet in pending:
+            os.replace(tmp_parquet, self._parquet_path(row[0]))
+        self._remove_stale_tmp()
+
+    def _remove_stale_tmp(self) -> None:
+        """Delete temporary parquet files abandoned by writers that died."""
+        cutoff = time.time() - _STALE_TMP_S
+        for fname in os.listdir(self._dir):
+            if not fname.endswith(_TMP_SUFFIX):
+                continue
+            path = os.path.join(self._dir, fname)
+            with contextlib.suppress(OSError):
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+
+    def _evict(self, conn: sqlite3.Connection, keep: set[str]) -> None:
+        """Delete expired and least recently used results beyond the budget.
+
+        Runs inside the caller's transaction; entries in *keep* (just
+        written) are never evicted.
+        """
+        doomed = []
+        if self._max_age_days is not None:
+            cutoff = time.time() - self._max_age_days * 86400
+            doomed = [
+                key
+                for (key,) in conn.execute(
+                    "SELECT key FROM results WHERE accessed < ?", (cutoff,)
+                )
+                if key not in keep
+            ]
+        (total,) = conn.execute(
+            "SELECT COALESCE(SUM(bytes), 0) FROM results"
+        ).fetchone()
+        if total > self._max_bytes:
+            expired = set(doomed)
+            for key, size in conn.execute(
+                "SELECT key, bytes FROM results ORDER BY accessed"
+            ).fetchall():
+                if total <= self._max_bytes:
+                    break
+                if key in keep:
+                    continue
+                if key not in expired:
+                    doomed.append(key)
+                total -= size
+        if not doomed:
+            return
+        conn.executemany("DELETE FROM results WHERE key = ?", [(k,) for k in doomed])
+        for key in doomed:
+            with contextlib.suppress(OSError):
+                os.remove(self._parquet_path(key))
+        _log.debug("ResultStore: evicted %d results", len(doomed))
+
+    def _touch(self, key: str) -> None:
+        """Refresh the access time of *key* without ever waiting on a writer."""
+        now = time.time()
+        try:
+            conn = sqlite3.connect(self._index_path(), timeout=0, isolation_level=None)
+            with contextlib.closing(conn):
+                conn.execute(
+                    "UPDATE results SET accessed = ? WHERE key = ? AND accessed < ?",
+                    (now, key, now - _TOUCH_INTERVAL_S),
+                )
+        except sqlite3.Error:
+            # Busy or unreadable: the next read refreshes it instead
+            pass
+
+    def read(
+        self,
+        key: str,
+        columns: list[str] | None = None,
+        filters: list[tuple[str, str, object]] | None = None,
+    ) -> pd.DataFrame | None:
+        """Load a result DataFrame by key, or None if not found.
+
+        Args:
+            key: Cache key of the result.
+            columns: Columns to load (default: all).
+            filters: ``(column, op, value)`` predicates, all of which rows
+                must satisfy, with ``op`` one of ``==``, ``!=``, ``<``,
+                ``<=``, ``>``, ``>=``.  They are evaluated by pyarrow, which
+                skips row groups whose statistics exclude them.
+        """
         path = self._parquet_path(key)
         if not os.path.exists(path):
             return None
         try:
-            return pd.read_parquet(path)
+            df = pd.read_parquet(path, columns=columns, filters=filters or None)
         except Exception as exc:
             _log.warning("ResultStore: failed to read %s: %s", key, exc)
             return None
+        if os.path.exists(self._index_path()):
+            self._touch(key)
+        return df
+
+    def dtypes(self, key: str) -> dict[str, str]:
+        """Return {column -> dtype} of a stored result without reading its rows.
+
+        Taken from the summary record, or from the parquet schema for
+        results stored without one.  Empty if the result is not found.
+        """
+        columns = self.get_summary(key).get("columns")
+        if columns is not None:
+            return columns
+        path = self._parquet_path(key)
+        if not os.path.exists(path):
+            return {}
+        try:
+            import pyarrow.parquet as pq
+
+            empty = pq.read_schema(path).empty_table().to_pandas()
+        except Exception as exc:
+            _log.warning("ResultStore: failed to read schema of %s: %s", key, exc)
+            return {}
+        return {str(c): str(t) for c, t in empty.dtypes.items()}
 
     def has(self, key: str) -> bool:
         """Check if a result exists on disk."""
@@ -153,11 +465,27 @@ class ResultStore:
 
     def get_metadata(self, key: str) -> dict:
         """Return metadata for a key, or empty dict if not found."""
-        return self._read_index().get(key, {})
+        rows = self._query("SELECT metadata FROM results WHERE key = ?", (key,))
+        return json.loads(rows[0][0]) if rows else {}
+
+    def get_summary(self, key: str) -> dict:
+        """Return the summary record of a key (see module docstring).
+
+        Empty if the key is unknown or was stored before summaries were
+        recorded.
+        """
+        rows = self._query("SELECT summary FROM results WHERE key = ?", (key,))
+        return json.loads(rows[0][0]) if rows and rows[0][0] else {}
 
     def list_all(self) -> dict[str, dict]:
         """Return the full index: {hash -> metadata}."""
-        return self._read_index()
+        rows = self._query("SELECT key, metadata FROM results ORDER BY created")
+        return {key: json.loads(meta) for key, meta in rows}
+
+    def list_summaries(self) -> dict[str, dict]:
+        """Return {hash -> summary record} for every result, oldest first."""
+        rows = self._query("SELECT key, summary FROM results ORDER BY created")
+        return {key: json.loads(summary) if summary else {} for key, summary in rows}
 
     def clear(self, key: str | None = None) -> int:
         """Remove cached results. If key is given, remove just that entry.
@@ -167,34 +495,24 @@ class ResultStore:
         if not os.path.exists(self._dir):
             return 0
 
-        if key:
-            count = 0
-            path = self._parquet_path(key)
-            if os.path.exists(path):
-                os.remove(path)
-                count = 1
-
-            def _remove_key(index):
-                index.pop(key, None)
-
-            self._locked_index_update(_remove_key)
-            return count
-
-        # Clear everything under the index lock to avoid races with writers.
-        count = 0
-
-        def _clear_all(index):
-            nonlocal count
-            for fname in os.listdir(self._dir):
-                if not fname.endswith(".parquet"):
-                    continue
-                fpath = os.path.join(self._dir, fname)
-                if os.path.isfile(fpath):
-                    os.remove(fpath)
-                    count += 1
-            index.clear()
-
-        self._locked_index_update(_clear_all)
+        with contextlib.closing(self._connect_for_write()) as conn:
+            with _transaction(conn):
+                if key:
+                    conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    paths = [self._parquet_path(key)]
+                else:
+                    # Delete under the write lock to avoid races with writers.
+                    conn.execute("DELETE FROM results")
+                    paths = [
+                        os.path.join(self._dir, fname)
+                        for fname in os.listdir(self._dir)
+                        if fname.endswith(".parquet")
+                    ]
+                count = 0
+                for path in paths:
+                    if os.path.isfile(path):
+                        os.remove(path)
+                        count += 1
         return count
 
     def total_size_bytes(self) -> int:
@@ -207,3 +525,131 @@ class ResultStore:
             if os.path.isfile(fpath):
                 total += os.path.getsize(fpath)
         return total
+
+
+def result_stats(df: pd.DataFrame) -> dict:
+    """Headline stats of a strategy result, rounded to 4 places.
+
+    Handles both raw-mode (``pct_change`` column) and aggregated-mode
+    (``mean`` column) results.
+
+    Returns:
+        Dict of ``count``, ``mean_return``, ``std``, ``win_rate`` and
+        ``profit_factor``; stats that do not apply to *df* are None.
+    """
+    if "pct_change" in df.columns:
+        pct = df["pct_change"].dropna()
+        return {
+            "count": len(pct),
+            "mean_return": round(float(pct.mean()), 4),
+            "std": round(float(pct.std()), 4),
+            "win_rate": round(win_rate(pct), 4),
+            "profit_factor": round(profit_factor(pct), 4),
+        }
+    if "mean" not in df.columns:
+        return {
+            "count": len(df),
+            "mean_return": None,
+            "std": None,
+            "win_rate": None,
+            "profit_factor": None,
+        }
+    if "count" in df.columns:
+        total = int(df["count"].sum())
+        wt_mean = float((df["mean"] * df["count"]).sum() / total)
+    else:
+        total = len(df)
+        wt_mean = float(df["mean"].mean())
+    # Compute aggregated profit_factor by combining gross wins and
+    # losses across all groups, then dividing.  This avoids the
+    # pitfall of weighted-averaging per-group profit factors where
+    # inf values (groups with no losses) would dominate or need
+    # filtering — which would make the aggregate not equal the true
+    # all-trades combined ratio.
+    agg_pf = None
+    if "count" in df.columns:
+        group_pnl = df["mean"] * df["count"]
+        total_wins = float(group_pnl[group_pnl > 0].sum())
+        total_losses = float(group_pnl[group_pnl < 0].sum())
+        if total_losses != 0:
+            agg_pf = round(abs(total_wins) / abs(total_losses), 4)
+        elif total_wins > 0:
+            agg_pf = float("inf")
+        else:
+            agg_pf = 0.0
+    return {
+        "count": total,
+        "mean_return": round(wt_mean, 4),
+        "std": round(float(df["std"].mean()), 4) if "std" in df.columns else None,
+        "win_rate": (
+            round(float((df["win_rate"] * df["count"]).sum() / total), 4)
+            if "win_rate" in df.columns and "count" in df.columns
+            else round(float((df["mean"] > 0).mean()), 4)
+        ),
+        "profit_factor": agg_pf,
+    }
+
+
+def _summarize(df: pd.DataFrame, path: str) -> dict:
+    """Summary record of *df*, just written to the parquet file at *path*."""
+    import pyarrow.parquet as pq
+
+    summary: dict = {
+        "rows": len(df),
+        "columns": {str(c): str(t) for c, t in df.dtypes.items()},
+        "stats": result_stats(df),
+    }
+    if "pct_change" in df.columns:
+        pct = df["pct_change"].dropna()
+        if len(pct):
+            values = np.quantile(pct.to_numpy(dtype=float), list(_QUANTILES.values()))
+            summary["quantiles"] = {
+                name: round(float(v), 4) for name, v in zip(_QUANTILES, values)
+            }
+
+    stamps = [
+        (df[c].min(), df[c].max())
+        for c in df.columns
+        if df[c].dtype.kind == "M" and df[c].notna().any()
+    ]
+    if stamps:
+        summary["date_span"] = [
+            min(s[0] for s in stamps).isoformat(),
+            max(s[1] for s in stamps).isoformat(),
+        ]
+
+    metadata = pq.ParquetFile(path).metadata
+    summary["row_groups"] = metadata.num_row_groups
+    column_stats: dict[str, dict] = {}
+    for i in range(metadata.num_row_groups):
+        group = metadata.row_group(i)
+        for j in range(group.num_columns):
+            chunk = group.column(j)
+            entry = column_stats.setdefault(
+                chunk.path_in_schema, {"min": None, "max": None, "nulls": 0}
+            )
+            stats = chunk.statistics
+            if stats is None:
+                continue
+            entry["nulls"] += stats.null_count or 0
+            if not stats.has_min_max:
+                continue
+            lo, hi = stats.min, stats.max
+            if isinstance(lo, float) and (np.isnan(lo) or np.isnan(hi)):
+                continue
+            entry["min"] = lo if entry["min"] is None else min(entry["min"], lo)
+            entry["max"] = hi if entry["max"] is None else max(entry["max"], hi)
+    summary["column_stats"] = column_stats
+    return summary
+
+
+@contextlib.contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """Write transaction on an autocommit connection, rolled back on error."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
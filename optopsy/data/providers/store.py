@@ -6,7 +6,9 @@ backend selection via ``get_store()``.
 """
 
 from abc import ABC, abstractmethod
+from datetime import date
 
+import numpy as np
 import pandas as pd
 
 
@@ -17,6 +19,74 @@ class DataStore(ABC):
     def read(self, category: str, symbol: str) -> pd.DataFrame | None:
         """Load stored data for *(category, symbol)*, or ``None`` if absent."""
 
+    def read_column(self, category: str, symbol: str, column: str) -> pd.Series | None:
+        """Load a single column of *(category, symbol)*, or ``None`` if absent."""
+        df = self.read_filtered(category, symbol, columns=[column])
+        if df is None or column not in df.columns:
+            return None
+        return df[column]
+
+    def dataset_version(self, category: str, symbol: str) -> str | None:
+        """Identifier of the stored version of *(category, symbol)*.
+
+        Changes whenever the data is written or appended to, so it can
+        stand in for the data in cache keys (see ``optopsy.data.fingerprint``).
+        ``None`` when nothing is stored or the backend cannot tell versions
+        apart, which is the default.
+        """
+        return None
+
+    def coverage(
+        self, category: str, symbol: str, column: str = "quote_date"
+    ) -> list[tuple[date, date]] | None:
+        """Calendar days of *column* stored for *(category, symbol)*.
+
+        Returns the covered days as sorted, disjoint ``(first, last)`` runs
+        (see ``date_intervals()``), or ``None`` if nothing is stored.  The
+        default reads the column; backends override it to answer from an
+        index without loading any rows.
+        """
+        dates = self.read_column(category, symbol, column)
+        if dates is None:
+            return None
+        return date_intervals(dates)
+
+    def read_range(
+        self, category: str, symbol: str, column: str, start: object, stop: object
+    ) -> pd.DataFrame | None:
+        """Load rows of *(category, symbol)* with ``start <= column < stop``."""
+        return self.read_filtered(
+            category, symbol, filters=[(column, ">=", start), (column, "<", stop)]
+        )
+
+    def read_filtered(
+        self,
+        category: str,
+        symbol: str,
+        columns: list[str] | None = None,
+        filters: list[tuple[str, str, object]] | None = None,
+    ) -> pd.DataFrame | None:
+        """Load selected columns and rows of *(category, symbol)*.
+
+        *columns* — columns to load, in stored order; names absent from the
+        data are ignored.  ``None`` loads every column.
+        *filters* — ``(column, op, value)`` conditions ANDed together, with
+        *op* one of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` or ``in``.
+
+        The default reads everything and filters; backends override it to
+        push the column selection and filters into the read.
+        """
+        check_filters(filters)
+        df = self.read(category, symbol)
+        if df is None:
+            return None
+        if filters:
+            df = df[filter_mask(df, filters)]
+        if columns is not None:
+            wanted = set(columns)
+            df = df[[c for c in df.columns if c in wanted]]
+        return df
+
     @abstractmethod
     def write(self, category: str, symbol: str, df: pd.DataFrame) -> None:
         """Persist *df* for *(category, symbol)*, replacing any existing data."""
@@ -31,6 +101,27 @@ class DataStore(ABC):
     ) -> pd.DataFrame:
         """Merge *new_df* with existing data, deduplicate, and persist."""
 
+    def append(
+        self,
+        category: str,
+        symbol: str,
+        new_df: pd.DataFrame,
+        dedup_cols: list[str] | None = None,
+    ) -> None:
+        """Add *new_df* to stored data, newer rows winning per *dedup_cols* key.
+
+        Like ``merge_and_save()`` without returning the merged data.  The
+        default delegates to it; backends override it to write only the
+        new rows.
+        """
+        self.merge_and_save(category, symbol, new_df, dedup_cols)
+
+    def compact(self, category: str, symbol: str) -> None:
+        """Physically merge data written by ``append()``.
+
+        A no-op for backends that deduplicate on write.
+        """
+
     @abstractmethod
     def clear(self, symbol: str | None = None, category: str | None = None) -> int:
         """Remove stored data.  Returns count of items deleted.
@@ -46,3 +137,74 @@ class DataStore(ABC):
     @abstractmethod
     def total_size_bytes(self) -> int:
         """Return total storage size in bytes."""
+
+
+_FILTER_OPS = ("==", "!=", "<", "<=", ">", ">=", "in")
+
+
+def check_filters(filters: list[tuple[str, str, object]] | None) -> None:
+    """Raise ``ValueError`` for a ``read_filtered()`` filter with a bad operator."""
+    for _, op, _ in filters or []:
+        if op not in _FILTER_OPS:
+            raise ValueError(
+                f"Unsupported filter operator '{op}'. "
+                f"Use one of: {', '.join(_FILTER_OPS)}"
+            )
+
+
+def filter_mask(df: pd.DataFrame, filters: list[tuple[str, str, object]]) -> pd.Series:
+    """Boolean mask of the rows of *df* matching all *filters*."""
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column not in df.columns:
+            raise ValueError(f"Filter column '{column}' not found in stored data")
+        values = df[column]
+        if op == "in":
+            mask &= values.isin(list(value))
+        elif op == "==":
+            mask &= values == value
+        elif op == "!=":
+            mask &= values != value
+        elif op == "<":
+            mask &= values < value
+        elif op == "<=":
+            mask &= values <= value
+        elif op == ">":
+            mask &= values > value
+        else:
+            mask &= values >= value
+    return mask
+
+
+def date_intervals(dates: pd.Series) -> list[tuple[date, date]]:
+    """Calendar days present in *dates* as sorted, disjoint ``(first, last)`` runs.
+
+    Consecutive days form one run, so the runs are a lossless encoding of
+    the set of dates: a Monday-to-Friday week of quotes is one interval,
+    and a cache spanning years is a few hundred.  Missing values are
+    ignored; timezone-aware dates use their local day.
+    """
+    values = pd.to_datetime(pd.Series(dates)).dropna()
+    if getattr(values.dt, "tz", None) is not None:
+        values = values.dt.tz_localize(None)
+    days = np.unique(values.to_numpy().astype("datetime64[D]"))
+    if not len(days):
+        return []
+    breaks = np.flatnonzero(np.diff(days) > np.timedelta64(1, "D"))
+    firsts = days[np.r_[0, breaks + 1]].tolist()
+    lasts = days[np.r_[breaks, len(days) - 1]].tolist()
+    return list(zip(firsts, lasts))
+
+
+def merge_intervals(
+    *coverages: list[tuple[date, date]],
+) -> list[tuple[date, date]]:
+    """Union of ``date_intervals()`` run lists, merging touching runs."""
+    merged: list[tuple[date, date]] = []
+    for first, last in sorted(run for runs in coverages for run in runs):
+        if merged and (first - merged[-1][1]).days <= 1:
+            if last > merged[-1][1]:
+                merged[-1] = (merged[-1][0], last)
+        else:
+            merged.append((first, last))
+    return merged
@@ -2,10 +2,16 @@
 
 Entry points:
 
-- ``csv_data()`` — reads a CSV file and maps columns by integer index.
+- ``csv_data()`` — reads a CSV file and maps columns by integer index.  A
+  directory or glob pattern is read as many files parsed in parallel
+  (see ``ingest``).
+- ``ingest_csv()`` — streams such a collection of CSV files into the
+  parquet cache instead of returning it.
 - ``options_data()`` — validates/normalizes an already-loaded DataFrame.
 - ``load_cached_options()`` — reads from the parquet cache produced by
   ``optopsy-data download`` and returns a normalized DataFrame.
+- ``load_cached_options_chunked()`` — opens the same cache as a
+  ``ChunkedChain`` that is read one expiration-aligned chunk at a time.
 
 The module also handles:
 - Date column inference (``_infer_date_cols``)
@@ -13,11 +19,16 @@ The module also handles:
 - Optional Greek and liquidity columns (gamma, theta, vega, volume, etc.); delta is required
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from .chunked import ChunkedChain, _plan_chunks
+from .compact import compact_chain
 from .filters import _ltrim, _rtrim, _trim
+from .ingest import IngestProgress, is_multi_file, iter_csv_tables, resolve_files
+from .timestamps import normalize_dates
 
 default_kwargs: Dict[str, Any] = {
     "start_date": None,
@@ -77,13 +88,62 @@ def _standardize_cols(
     return data.rename(columns=cols)
 
 
-def _infer_date_cols(data: pd.DataFrame) -> pd.DataFrame:
+def _infer_date_cols(
+    data: pd.DataFrame, date_format: Optional[str] = None
+) -> pd.DataFrame:
     """Convert date columns to datetime format."""
-    data["expiration"] = pd.to_datetime(data.expiration)
-    data["quote_date"] = pd.to_datetime(data.quote_date)
+    data["expiration"] = pd.to_datetime(data.expiration, format=date_format)
+    data["quote_date"] = pd.to_datetime(data.quote_date, format=date_format)
     return data
 
 
+def _column_mapping(params: Dict[str, Any]) -> List[Tuple[Optional[int], str]]:
+    """``(column index, standard name)`` pairs for the CSV column parameters."""
+    # Required columns
+    column_mapping: List[Tuple[Optional[int], str]] = [
+        (params["underlying_symbol"], "underlying_symbol"),
+        (params["option_type"], "option_type"),
+        (params["expiration"], "expiration"),
+        (params["quote_date"], "quote_date"),
+        (params["strike"], "strike"),
+        (params["bid"], "bid"),
+        (params["ask"], "ask"),
+        (params["delta"], "delta"),
+    ]
+
+    # Add optional underlying_price and Greek columns if specified
+    for col in ["underlying_price", "gamma", "theta", "vega", "implied_volatility"]:
+        col_idx = params.get(col)
+        if col_idx is not None:
+            column_mapping.append((int(col_idx), col))
+
+    # Add optional liquidity columns if specified
+    for col in ["volume", "open_interest"]:
+        col_idx = params.get(col)
+        if col_idx is not None:
+            column_mapping.append((int(col_idx), col))
+
+    return column_mapping
+
+
+def _read_csv_files(
+    source: str,
+    column_mapping: List[Tuple[Optional[int], str]],
+    date_format: Optional[str],
+    workers: Optional[int],
+    progress: Optional[Callable[[IngestProgress], None]],
+) -> pd.DataFrame:
+    """Read every CSV file named by a directory or glob into one DataFrame."""
+    tables = list(
+        iter_csv_tables(
+            resolve_files(source), column_mapping, date_format, workers, progress
+        )
+    )
+    import pyarrow as pa
+
+    return pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+
 def csv_data(
     file_path: str,
     start_date: Optional[str] = None,
@@ -103,6 +163,10 @@ def csv_data(
     implied_volatility: Optional[int] = None,
     volume: Optional[int] = None,
     open_interest: Optional[int] = None,
+    compact: bool = False,
+    date_format: Optional[str] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[IngestProgress], None]] = None,
 ) -> pd.DataFrame:
     """
     Import option chain data from CSV files with standardized column names.
@@ -110,8 +174,15 @@ def csv_data(
     Uses pandas DataFrame.read_csv function to import data from CSV files.
     Automatically generates standardized headers for library use.
 
+    When *file_path* is a directory or a glob pattern (e.g.
+    ``"chains/SPX_*.csv"``), every matching file is parsed in parallel with
+    the pyarrow CSV reader (requires ``optopsy[data]``) and the results are
+    concatenated in file-name order.  All files must share the column
+    layout of the mapping.
+
     Args:
-        file_path: Path to CSV file
+        file_path: Path to CSV file, a directory of ``*.csv`` files or a glob
+            pattern
         start_date: Optional start date of dataset to consider (inclusive)
         end_date: Optional end date of dataset to consider (inclusive)
         underlying_symbol: Column index containing underlying symbol
@@ -129,6 +200,13 @@ def csv_data(
         implied_volatility: Optional column index containing implied volatility
         volume: Optional column index containing trading volume (used by liquidity slippage)
         open_interest: Optional column index containing open interest (reserved for future use)
+        compact: Return the chain in the compact schema (see ``compact_chain()``)
+        date_format: Optional ``strptime`` format of the expiration and quote
+            date columns (e.g. ``"%Y-%m-%d"``); inferred when omitted
+        workers: Parser threads for a multi-file source (default: CPU count)
+        progress: Optional callable receiving an ``IngestProgress`` (rows/s,
+            MB/s) after each file of a multi-file source; logged at INFO level
+            when omitted
 
     Returns:
         DataFrame with option chains and standardized column names
@@ -159,39 +237,26 @@ def csv_data(
         "open_interest": open_interest,
     }
 
-    # Required columns
-    column_mapping: List[Tuple[Optional[int], str]] = [
-        (params["underlying_symbol"], "underlying_symbol"),
-        (params["option_type"], "option_type"),
-        (params["expiration"], "expiration"),
-        (params["quote_date"], "quote_date"),
-        (params["strike"], "strike"),
-        (params["bid"], "bid"),
-        (params["ask"], "ask"),
-        (params["delta"], "delta"),
-    ]
-
-    # Add optional underlying_price and Greek columns if specified
-    for col in ["underlying_price", "gamma", "theta", "vega", "implied_volatility"]:
-        col_idx = params.get(col)
-        if col_idx is not None:
-            column_mapping.append((int(col_idx), col))
+    column_mapping = _column_mapping(params)
 
-    # Add optional liquidity columns if specified
-    for col in ["volume", "open_interest"]:
-        col_idx = params.get(col)
-        if col_idx is not None:
-            column_mapping.append((int(col_idx), col))
+    if is_multi_file(file_path):
+        data = (
+            _read_csv_files(file_path, column_mapping, date_format, workers, progress)
+            .pipe(_infer_date_cols, date_format)
+            .pipe(_trim_dates, params["start_date"], params["end_date"])
+        )
+        return compact_chain(data) if compact else data
 
     try:
         # Only read the columns we need from the CSV to save memory and I/O
         col_indices = sorted(c for c, _ in column_mapping if c is not None)
-        return (
+        data = (
             pd.read_csv(file_path, usecols=col_indices)
             .pipe(_standardize_cols, column_mapping)
-            .pipe(_infer_date_cols)
+            .pipe(_infer_date_cols, date_format)
             .pipe(_trim_dates, params["start_date"], params["end_date"])
         )
+        return compact_chain(data) if compact else data
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file not found at path: {file_path}")
     except pd.errors.EmptyDataError:
@@ -204,6 +269,106 @@ def csv_data(
         raise ValueError(f"Unexpected error reading CSV file {file_path}: {str(e)}")
 
 
+# Columns identifying one quote when CSV rows are appended to the cache
+_INGEST_DEDUP_COLS = [
+    "underlying_symbol",
+    "quote_date",
+    "expiration",
+    "strike",
+    "option_type",
+]
+
+# csv_data() parameters that map a CSV column
+_CSV_COLUMN_PARAMS = [k for k in default_kwargs if k not in ("start_date", "end_date")]
+
+
+def ingest_csv(
+    source: str,
+    symbol: str,
+    date_format: Optional[str] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[IngestProgress], None]] = None,
+    batch_rows: int = 2_000_000,
+    **columns: Optional[int],
+) -> int:
+    """Parse CSV files in parallel straight into the options cache.
+
+    Reads the files named by *source* like ``csv_data()`` does for a
+    directory or glob, but instead of building one DataFrame appends the
+    rows to the cache under *symbol* in batches of about ``batch_rows``,
+    so memory stays bounded whatever the size of the collection.  Rows
+    re-ingested for the same underlying symbol, quote date, expiration,
+    strike and option type replace the cached ones, so roots sharing a
+    cache symbol (e.g. SPX and SPXW) are kept apart.  The result is then read with
+    ``load_cached_options(symbol)``.
+    Requires the ``optopsy[data]`` extra (pyarrow).
+
+    Args:
+        source: A CSV file, a directory of ``*.csv`` files or a glob pattern.
+        symbol: Ticker symbol to store the rows under (e.g. ``"SPX"``).
+        date_format: Optional ``strptime`` format of the expiration and
+            quote date columns; inferred per batch when omitted.
+        workers: Parser threads (default: CPU count).
+        progress: Optional callable receiving an ``IngestProgress``
+            (rows/s, MB/s) after each file; logged at INFO level when omitted.
+        batch_rows: Rows accumulated before each cache append.
+        **columns: Column indices, as for ``csv_data()`` (e.g.
+            ``underlying_price=8``); unspecified columns use its defaults.
+
+    Returns:
+        Number of rows written to the cache.  A quote repeated within a
+        batch is stored, and counted, once.
+
+    Raises:
+        FileNotFoundError: If *source* matches no file.
+        ImportError: If pyarrow is not installed.
+        ValueError: If a column parameter is unknown, ``batch_rows`` is not
+            positive, or a file cannot be parsed with the mapping.
+    """
+    unknown = sorted(set(columns) - set(_CSV_COLUMN_PARAMS))
+    if unknown:
+        raise ValueError(f"Unknown column parameters: {unknown}")
+    if batch_rows < 1:
+        raise ValueError(f"batch_rows must be a positive integer, got {batch_rows}")
+    try:
+        import pyarrow as pa
+
+        from .data.providers.cache import get_store
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for ingest_csv. "
+            "Install it with: pip install optopsy[data]"
+        ) from exc
+
+    params = {k: default_kwargs[k] for k in _CSV_COLUMN_PARAMS} | columns
+    column_mapping = _column_mapping(params)
+    store = get_store()
+
+    def _flush(tables: List[Any]) -> int:
+        df = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+        df = _infer_date_cols(df, date_format)
+        dedup_cols = [c for c in _INGEST_DEDUP_COLS if c in df.columns]
+        df = df.drop_duplicates(subset=dedup_cols, keep="last")
+        store.append("options", symbol, df, dedup_cols)
+        return len(df)
+
+    total = 0
+    batch: List[Any] = []
+    batch_size = 0
+    for table in iter_csv_tables(
+        resolve_files(source), column_mapping, date_format, workers, progress
+    ):
+        batch.append(table)
+        batch_size += table.num_rows
+        if batch_size >= batch_rows:
+            total += _flush(batch)
+            batch, batch_size = [], 0
+    if batch:
+        total += _flush(batch)
+    store.compact("options", symbol)
+    return total
+
+
 _REQUIRED_COLUMNS = [
     "underlying_symbol",
     "option_type",
@@ -220,6 +385,7 @@ def options_data(
     df: pd.DataFrame,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """Validate and normalize an existing DataFrame for use with strategies.
 
@@ -234,6 +400,8 @@ def options_data(
             passed through unchanged.
         start_date: Optional start date for filtering (inclusive).
         end_date: Optional end date for filtering (inclusive).
+        compact: Return the chain in the compact schema (see
+            ``compact_chain()``).
 
     Returns:
         Normalized DataFrame with date columns converted to datetime64 and
@@ -246,23 +414,51 @@ def options_data(
     if missing:
         raise ValueError(f"Missing required columns: {', '.join(missing)}")
 
-    return df.pipe(_infer_date_cols).pipe(_trim_dates, start_date, end_date)
+    data = df.pipe(_infer_date_cols).pipe(_trim_dates, start_date, end_date)
+    return compact_chain(data) if compact else data
 
 
 def load_cached_options(
     symbol: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    option_type: Optional[str] = None,
+    max_dte: Optional[int] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """Load cached options data downloaded by ``optopsy-data download``.
 
     Reads from the parquet cache and normalizes the DataFrame for use with
-    strategy functions.  Requires the ``optopsy[data]`` extra (pyarrow).
+    strategy functions.  Only the strategy columns are read, and the date
+    range, option type and *filters* are pushed down to the reader, so
+    partitions and row groups outside them are never decoded — a one-year
+    backtest on a fifteen-year cache reads about a fifteenth of it.
+    Requires the ``optopsy[data]`` extra (pyarrow).
 
     Args:
         symbol: Ticker symbol (e.g. ``"SPY"``).
         start_date: Optional start date for filtering (inclusive).
         end_date: Optional end date for filtering (inclusive).
+        columns: Optional Greek/liquidity columns to load (e.g.
+            ``["delta", "volume"]``) besides the required ones.  ``None``
+            loads all that are cached.
+        option_type: Only load calls (``"c"``/``"call"``) or puts
+            (``"p"``/``"put"``).
+        max_dte: Only keep quotes at most this many days to expiration.
+            Must be at least the strategy's ``max_entry_dte``; calendar
+            and diagonal back months need it larger still.  With
+            *start_date*, quotes older than ``start_date - max_dte`` are
+            skipped by the reader.
+        filters: Extra ``(column, op, value)`` conditions pushed down to
+            the reader, with *op* one of ``==``, ``!=``, ``<``, ``<=``,
+            ``>``, ``>=`` or ``in``.  They apply to every quote, including
+            the ones trades exit on, so filter on columns that do not
+            change over a contract's life (``strike``, ``expiration``) —
+            a delta filter would also drop exit quotes.
+        compact: Return the chain in the compact schema (see
+            ``compact_chain()``).
 
     Returns:
         Normalized DataFrame ready for strategy functions.
@@ -270,6 +466,7 @@ def load_cached_options(
     Raises:
         FileNotFoundError: If no cached data exists for *symbol*.
         ImportError: If pyarrow is not installed.
+        ValueError: If *option_type* or a filter operator is invalid.
     """
     try:
         from .data.providers.cache import get_store
@@ -279,35 +476,168 @@ def load_cached_options(
             "Install it with: pip install optopsy[data]"
         ) from exc
 
+    read_filters = _cache_filters(start_date, end_date, option_type, filters, max_dte)
+    optional = _OPTIONAL_CACHED_COLUMNS if columns is None else columns
     store = get_store()
-    df = store.read("options", symbol)
-    if df is None or df.empty:
+    df = store.read_filtered(
+        "options",
+        symbol,
+        columns=_REQUIRED_CACHED_COLUMNS + list(optional),
+        filters=read_filters or None,
+    )
+    if df is None or (df.empty and not read_filters):
         raise FileNotFoundError(
             f"No cached options data for '{symbol}'. "
             f"Download it first with: optopsy-data download {symbol}"
         )
 
-    # Select columns matching _select_options_columns from EODHDProvider
-    keep = [
-        "underlying_symbol",
-        "option_type",
-        "expiration",
-        "quote_date",
-        "strike",
-        "bid",
-        "ask",
-    ]
-    optional = [
-        "delta",
-        "gamma",
-        "theta",
-        "vega",
-        "rho",
-        "implied_volatility",
-        "volume",
-        "open_interest",
+    df = _normalize_cached_options(df, start_date, end_date)
+    if max_dte is not None:
+        df = df[(df["expiration"] - df["quote_date"]).dt.days <= max_dte]
+    return compact_chain(df) if compact else df
+
+
+# Spellings of each option type found in cached data (normalized to c/p on load)
+_OPTION_TYPE_SPELLINGS = {
+    "c": ["c", "C", "call", "Call", "CALL"],
+    "p": ["p", "P", "put", "Put", "PUT"],
+}
+
+
+def _cache_filters(
+    start_date: Optional[str],
+    end_date: Optional[str],
+    option_type: Optional[str],
+    filters: Optional[List[Tuple[str, str, Any]]],
+    max_dte: Optional[int] = None,
+) -> List[Tuple[str, str, Any]]:
+    """Reader filters for a cached options load.
+
+    The date range bounds ``expiration``, the cache's partition column.
+    *max_dte* cannot be pushed down as it is (it compares two columns),
+    but it implies a quote_date floor: a quote at most *max_dte* days
+    before an expiration on or after *start_date* is quoted on or after
+    ``start_date - max_dte``.  That floor skips the row groups of cache
+    segments downloaded before it.
+    """
+    read_filters = list(filters or [])
+    if start_date is not None:
+        read_filters.append(("expiration", ">=", pd.Timestamp(start_date)))
+        if max_dte is not None:
+            floor = pd.Timestamp(start_date) - pd.Timedelta(days=max_dte)
+            read_filters.append(("quote_date", ">=", floor))
+    if end_date is not None:
+        read_filters.append(("expiration", "<=", pd.Timestamp(end_date)))
+    if option_type is not None:
+        key = str(option_type).strip().lower()[:1]
+        if key not in _OPTION_TYPE_SPELLINGS:
+            raise ValueError(
+                f"option_type must be 'c'/'call' or 'p'/'put', got '{option_type}'"
+            )
+        read_filters.append(("option_type", "in", _OPTION_TYPE_SPELLINGS[key]))
+    return read_filters
+
+
+def load_cached_options_chunked(
+    symbol: str,
+    chunk_rows: int = 2_000_000,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> ChunkedChain:
+    """Open cached options data as expiration-aligned chunks for out-of-core runs.
+
+    Only the ``expiration`` column is read up front, to plan chunks of about
+    ``chunk_rows`` rows that never split an expiration.  Each chunk is read
+    from the cache (with the expiration range pushed down to the parquet
+    reader) and normalized like ``load_cached_options()`` when a strategy
+    iterates it, so memory scales with one chunk rather than the full file.
+    Pass the result to any non-calendar strategy function.
+    Requires the ``optopsy[data]`` extra (pyarrow).
+
+    Args:
+        symbol: Ticker symbol (e.g. ``"SPX"``).
+        chunk_rows: Target maximum number of rows per chunk.
+        start_date: Optional start date for filtering (inclusive).
+        end_date: Optional end date for filtering (inclusive).
+
+    Returns:
+        A ``ChunkedChain`` over the cached data.
+
+    Raises:
+        FileNotFoundError: If no cached data exists for *symbol*.
+        ImportError: If pyarrow is not installed.
+        ValueError: If ``chunk_rows`` is not a positive integer.
+    """
+    try:
+        from .data.providers.cache import get_store
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for load_cached_options_chunked. "
+            "Install it with: pip install optopsy[data]"
+        ) from exc
+
+    expirations = get_store().read_column("options", symbol, "expiration")
+    if expirations is None or expirations.empty:
+        raise FileNotFoundError(
+            f"No cached options data for '{symbol}'. "
+            f"Download it first with: optopsy-data download {symbol}"
+        )
+
+    expirations = _trim_dates(
+        pd.to_datetime(expirations).to_frame(), start_date, end_date
+    )["expiration"]
+    return ChunkedChain(
+        ranges=_plan_chunks(normalize_dates(expirations), chunk_rows),
+        read=partial(_read_cached_chunk, symbol, start_date, end_date),
+    )
+
+
+def _read_cached_chunk(
+    symbol: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    start: pd.Timestamp,
+    stop: pd.Timestamp,
+) -> pd.DataFrame:
+    """Read and normalize cached options expiring in ``[start, stop)``."""
+    from .data.providers.cache import get_store
+
+    df = get_store().read_range("options", symbol, "expiration", start, stop)
+    if df is None:
+        raise FileNotFoundError(f"No cached options data for '{symbol}'.")
+    return _normalize_cached_options(df, start_date, end_date)
+
+
+# Columns read from cached options data, matching _select_options_columns
+# from EODHDProvider
+_REQUIRED_CACHED_COLUMNS = [
+    "underlying_symbol",
+    "option_type",
+    "expiration",
+    "quote_date",
+    "strike",
+    "bid",
+    "ask",
+    "delta",
+]
+_OPTIONAL_CACHED_COLUMNS = [
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied_volatility",
+    "volume",
+    "open_interest",
+]
+
+
+def _normalize_cached_options(
+    df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str]
+) -> pd.DataFrame:
+    """Select strategy columns from cached options data and normalize them."""
+    keep = _REQUIRED_CACHED_COLUMNS + [
+        c for c in _OPTIONAL_CACHED_COLUMNS if c in df.columns
     ]
-    keep.extend([c for c in optional if c in df.columns])
     df = df[[c for c in keep if c in df.columns]]
 
     # Normalize option_type to lowercase single char (c/p)
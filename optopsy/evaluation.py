@@ -6,87 +6,103 @@ DataFrame ready for strategy construction.  It also provides the
 ``_calls`` and ``_puts`` convenience filters used by ``strategies.py``.
 """
 
-from typing import Any
+from typing import Any, Callable
 
+import numpy as np
 import pandas as pd
 
+from .contracts import CONTRACT_COLS, _contract_index
 from .definitions import evaluated_cols
 from .filters import (
     _apply_signal_filter,
-    _assign_dte,
     _cut_options_by_delta,
     _cut_options_by_dte,
-    _get,
     _remove_invalid_evaluated_options,
     _remove_min_bid_ask,
     _select_closest_delta,
     _trim,
 )
+from .stages import _freeze, _StageCache
+
+# Quote columns carried for both the entry and the exit side of a trade
+_PAIRED_COLS = (
+    "quote_date",
+    "dte",
+    "bid",
+    "ask",
+    "delta",
+    "implied_volatility",
+    "volume",
+)
 
 
-def _get_exits(
-    data: pd.DataFrame, exit_dte: int, exit_dte_tolerance: int = 0
+def _match_entries_exits(
+    entries: pd.DataFrame, data: pd.DataFrame, **kwargs: Any
 ) -> pd.DataFrame:
     """
-    Get exit rows from option data, optionally using tolerance-based DTE matching.
+    Match filtered entries with their exit quotes, compute midpoint prices, and select output columns.
 
-    When tolerance is 0 (default), only rows with exactly the target exit_dte are
-    returned. When tolerance > 0, rows within [max(0, exit_dte - tolerance),
-    exit_dte + tolerance] are considered, and for each contract the row with DTE
-    closest to exit_dte is selected.
+    Exit rows are found through the chain's contract index rather than a
+    merge: each entry's exit is its own contract's quote ``exit_dte`` days
+    before expiration.  When ``exit_dte_tolerance`` > 0, the contract's
+    latest quote at or before that date is used if it is no more than
+    ``exit_dte_tolerance`` days earlier (and within ``max_entry_dte``).
+    Entries whose contract has no such quote are dropped.
 
     Args:
-        data: DataFrame containing option data with 'dte' column
-        exit_dte: Target DTE for exit
-        exit_dte_tolerance: Maximum allowed deviation from exit_dte (default 0)
+        entries: Selected entry rows.
+        data: Option chain the entries were selected from (untrimmed, so
+            its contract index is shared across calls).
+        **kwargs: ``exit_dte``, optional ``exit_dte_tolerance``,
+            ``max_entry_dte``, ``entry_dates`` and ``exit_dates``.
 
     Returns:
-        DataFrame of exit rows
+        DataFrame with one row per matched entry and ``_entry``/``_exit``
+        suffixed quote columns.
     """
-    if exit_dte_tolerance == 0:
-        return _get(data, "dte", exit_dte)
-
-    lower = max(0, exit_dte - exit_dte_tolerance)
-    upper = exit_dte + exit_dte_tolerance
-    candidates = _trim(data, "dte", lower, upper)
-
-    if candidates.empty:
-        return candidates
-
-    # For each contract, pick the row with DTE closest to exit_dte
-    contract_cols = ["underlying_symbol", "option_type", "expiration", "strike"]
-    candidates = candidates.copy()
-    candidates["_dte_diff"] = (candidates["dte"] - exit_dte).abs()
-    idx = candidates.groupby(contract_cols, observed=True)["_dte_diff"].idxmin()
-    exits = candidates.loc[idx].drop(columns=["_dte_diff"])
-    return exits
-
-
-def _match_entries_exits(
-    entries: pd.DataFrame, data: pd.DataFrame, **kwargs: Any
-) -> pd.DataFrame:
-    """Match filtered entries with exit rows, compute midpoint prices, and select output columns."""
     entry_dates = kwargs.get("entry_dates")
     exit_dates = kwargs.get("exit_dates")
 
     if entry_dates is not None:
         entries = _apply_signal_filter(entries, entry_dates)
 
-    exits = _get_exits(data, kwargs["exit_dte"], kwargs.get("exit_dte_tolerance", 0))
+    exit_dte = kwargs["exit_dte"]
+    tolerance = kwargs.get("exit_dte_tolerance", 0)
+
+    index = _contract_index(data)
+    ids = index.contract_ids([entries[col] for col in CONTRACT_COLS])
+    target = entries["expiration"] - pd.Timedelta(days=exit_dte)
+    if tolerance == 0:
+        # Every quote on the exit date, like an inner merge would pair them
+        rows, positions = index.locate_all(ids, target)
+    else:
+        upper = exit_dte + tolerance
+        max_entry_dte = kwargs.get("max_entry_dte")
+        if max_entry_dte is not None:
+            upper = min(upper, max_entry_dte)
+        earliest = entries["expiration"] - pd.Timedelta(days=upper)
+        positions = index.locate_latest(ids, target, earliest)
+        rows = np.flatnonzero(positions >= 0)
+        positions = positions[rows]
+
+    entries = entries.take(rows).reset_index(drop=True)
+    exits = data.take(positions).reset_index(drop=True)
+
+    # Same layout a merge on the contract columns would produce
+    columns = {col: entries[col] for col in CONTRACT_COLS}
+    for col in _PAIRED_COLS:
+        if col in data.columns:
+            columns[f"{col}_entry"] = entries[col]
+            columns[f"{col}_exit"] = exits[col]
+    result = pd.DataFrame(columns)
 
     if exit_dates is not None:
-        exits = _apply_signal_filter(exits, exit_dates)
+        result = _apply_signal_filter(result, exit_dates, date_col="quote_date_exit")
 
-    merge_cols = ["underlying_symbol", "option_type", "expiration", "strike"]
-
-    result = (
-        entries.merge(right=exits, on=merge_cols, suffixes=("_entry", "_exit"))
-        .assign(
-            entry=lambda r: (r["bid_entry"] + r["ask_entry"]) / 2,
-            exit=lambda r: (r["bid_exit"] + r["ask_exit"]) / 2,
-        )
-        .pipe(_remove_invalid_evaluated_options)
-    )
+    result = result.assign(
+        entry=lambda r: (r["bid_entry"] + r["ask_entry"]) / 2,
+        exit=lambda r: (r["bid_exit"] + r["ask_exit"]) / 2,
+    ).pipe(_remove_invalid_evaluated_options)
 
     # Build output columns, including only those present in the result
     output_cols = [c for c in evaluated_cols if c in result.columns]
@@ -102,39 +118,103 @@ def _match_entries_exits(
     return result[output_cols]
 
 
-def _evaluate_options(data: pd.DataFrame, **kwargs: Any) -> pd.DataFrame:
+def _select_entries(data: pd.DataFrame, **kwargs: Any) -> pd.DataFrame:
     """
-    Evaluate options by filtering and selecting entries via delta targeting.
+    Select entry candidates via delta targeting.
 
-    Selects the closest-delta option per group within [min, max] range,
-    then matches with exit rows.
+    Drops quotes at or below ``min_bid_ask``, then selects the closest-delta
+    option per group within the [min, max] range.
     """
     entries = _remove_min_bid_ask(data, kwargs["min_bid_ask"])
-    entries = _select_closest_delta(
+    return _select_closest_delta(
         entries,
         kwargs["delta_target"],
         kwargs["delta_range_min"],
         kwargs["delta_range_max"],
     )
-    return _match_entries_exits(entries, data, **kwargs)
 
 
 def _evaluate_all_options(data: pd.DataFrame, **kwargs: Any) -> pd.DataFrame:
     """
     Complete pipeline to evaluate all options with DTE and delta categorization.
 
-    Filters by DTE, selects entries via delta targeting, then groups by
-    DTE intervals and delta intervals.
+    Filters entries by DTE, selects them via delta targeting, matches exits
+    from the full chain, then groups by DTE intervals and delta intervals.
+    Expects ``dte`` to be assigned already (done once per chain by
+    ``prepared._normalize_chain``).
     """
+    entries = _select_entries(
+        _trim(data, "dte", kwargs["exit_dte"], kwargs["max_entry_dte"]), **kwargs
+    )
     return (
-        data.pipe(_assign_dte)
-        .pipe(_trim, "dte", kwargs["exit_dte"], kwargs["max_entry_dte"])
-        .pipe(_evaluate_options, **kwargs)
+        _match_entries_exits(entries, data, **kwargs)
         .pipe(_cut_options_by_dte, kwargs["dte_interval"], kwargs["max_entry_dte"])
         .pipe(_cut_options_by_delta, kwargs.get("delta_interval", 0.05))
     )
 
 
+def _evaluate_all_options_staged(
+    data: pd.DataFrame, stages: _StageCache, option_filter: Callable, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Memoized equivalent of ``_evaluate_all_options`` for parameter sweeps.
+
+    Produces the same frame as ``_evaluate_all_options`` but splits the
+    pipeline into stages keyed only by the parameters each depends on:
+
+    - delta selection depends on (leg, min_bid_ask, delta target) and is run
+      once on the whole partition; because ``dte`` is constant within each
+      (symbol, quote_date, expiration, type) selection group, trimming the
+      selected rows by DTE afterwards gives the same entries as trimming
+      first.
+    - the evaluated leg depends on all of the above plus the exit, bucketing
+      and signal parameters.  Exit matching goes through the partition's
+      contract index, which is built once and shared by every grid point.
+
+    Args:
+        data: Partition of the prepared chain selected by ``option_filter``.
+        stages: Stage memo attached to the prepared chain.
+        option_filter: The leg's option filter (``_calls`` or ``_puts``),
+            used to key stages per partition.
+        **kwargs: Same parameters as ``_evaluate_all_options``.
+
+    Returns:
+        DataFrame of evaluated options for the leg.
+    """
+    exit_dte = kwargs["exit_dte"]
+    max_entry_dte = kwargs["max_entry_dte"]
+    selection_key = (
+        "entries",
+        option_filter,
+        kwargs["min_bid_ask"],
+        kwargs["delta_target"],
+        kwargs["delta_range_min"],
+        kwargs["delta_range_max"],
+    )
+    leg_key = (
+        "leg",
+        *selection_key[1:],
+        exit_dte,
+        max_entry_dte,
+        kwargs.get("exit_dte_tolerance", 0),
+        kwargs["dte_interval"],
+        kwargs.get("delta_interval", 0.05),
+        _freeze(kwargs.get("entry_dates")),
+        _freeze(kwargs.get("exit_dates")),
+    )
+
+    def _evaluate() -> pd.DataFrame:
+        selected = stages.get(selection_key, lambda: _select_entries(data, **kwargs))
+        entries = _trim(selected, "dte", exit_dte, max_entry_dte)
+        return (
+            _match_entries_exits(entries, data, **kwargs)
+            .pipe(_cut_options_by_dte, kwargs["dte_interval"], max_entry_dte)
+            .pipe(_cut_options_by_delta, kwargs.get("delta_interval", 0.05))
+        )
+
+    return stages.get(leg_key, _evaluate)
+
+
 def _calls(data: pd.DataFrame) -> pd.DataFrame:
     """Filter dataframe for call options only."""
     return data[data["option_type"].str[0] == "c"]
@@ -5,16 +5,29 @@ It scans intermediate quote dates between each trade's entry and planned exit
 to find the first date where unrealized P&L crosses a stop-loss or take-profit
 threshold, or the position has been held for ``max_hold_days`` calendar days.
 
+When every leg carries a full contract key, each trade's quote path is
+read straight off the chain's sorted contract index (see ``contracts``) and
+scanned as flat arrays, without merging trades against the chain.  Trades
+are scanned in batches of bounded size, so peak memory does not grow with
+the total length of every trade's path.  Results
+lacking a full key fall back to the merge-based scan.
+
 The main entry point is ``_apply_early_exits()``, called from
 ``core._process_strategy()`` when ``stop_loss``, ``take_profit``, or
 ``max_hold_days`` is set.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
 import numpy as np
 import pandas as pd
 
+from .contracts import CONTRACT_COLS, _contract_index
+
+# Path points (trade x intermediate quote date) materialised at once by the
+# early-exit scan.  Trades are scanned in batches of about this many points.
+_PATH_BATCH_POINTS = 1_000_000
+
 
 def _scalar_float(val: Any) -> float:
     """Extract a scalar float from a DataFrame.at[] value."""
@@ -84,7 +97,34 @@ def _apply_single_leg_exits(
     result["exit_type"] = "expiration"
     result["_early_exit_date"] = pd.NaT
 
-    # Get intermediate snapshots
+    if all(c in result.columns for c in CONTRACT_COLS):
+        entry_prices = result["entry"].to_numpy()
+
+        def unrealized(rows: np.ndarray, mids: List[np.ndarray]) -> np.ndarray:
+            entry = entry_prices[rows]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(
+                    np.abs(entry) > 0,
+                    side_value * (mids[0] - entry) / np.abs(entry),
+                    np.nan,
+                )
+
+        triggered = _scan_paths(
+            data,
+            [([result[c] for c in CONTRACT_COLS], result["quote_date_entry"])],
+            unrealized,
+            result["_trade_id"].to_numpy(),
+            result["quote_date_entry"],
+            stop_loss,
+            take_profit,
+            max_hold_days,
+        )
+        if not triggered.empty:
+            result = _replace_exits_single_leg(result, triggered, data, side_value)
+        result.drop(columns=["_trade_id"], inplace=True)
+        return result
+
+    # Fallback for results without a full contract key
     contract_cols = ["underlying_symbol", "option_type", "expiration", "strike"]
     intermediates = _get_intermediate_snapshots(
         data, result, contract_cols, "quote_date_entry"
@@ -141,26 +181,11 @@ def _apply_multi_leg_exits(
     result["exit_type"] = "expiration"
     result["_early_exit_date"] = pd.NaT
 
-    # For each leg, get intermediate snapshots and compute per-leg unrealized P&L
     contract_cols = ["underlying_symbol", "option_type", "expiration", "strike"]
 
-    # Pre-compute max_dates once for all legs
-    available_cols = [c for c in contract_cols if c in data.columns]
-    precomputed_max_dates = (
-        data.groupby(available_cols, observed=True)["quote_date"]
-        .max()
-        .reset_index()
-        .rename(columns={"quote_date": "_max_date"})
-    )
-
-    # Build per-leg intermediate DataFrames
-    leg_intermediates = []
+    # Build per-leg lookup frames with generic contract column names
+    trade_lookups = []
     for idx in range(1, n_legs + 1):
-        leg = leg_def[idx - 1]
-        side_value = leg[0].value
-        quantity = leg[2] if len(leg) > 2 else 1
-        multiplier = side_value * quantity
-
         # Map leg-specific columns back to generic names for lookup
         leg_contract_cols = {
             "option_type": f"option_type_leg{idx}",
@@ -186,6 +211,82 @@ def _apply_multi_leg_exits(
         if "strike" not in trades_lookup.columns and "strike" in result.columns:
             trades_lookup["strike"] = result["strike"]
 
+        trade_lookups.append(trades_lookup)
+
+    # Entry date for max_hold_days calculation
+    # Calendar strategies use plain "quote_date" as the entry date column
+    entry_date_col = None
+    for col in [
+        "quote_date_entry",
+        "quote_date_entry_leg1",
+        "quote_date",
+    ]:
+        if col in result.columns:
+            entry_date_col = col
+            break
+
+    if all(
+        all(c in lookup.columns for c in CONTRACT_COLS + ["quote_date_entry"])
+        for lookup in trade_lookups
+    ):
+        # entry_legN already has multiplier baked in (from _apply_ratios)
+        entry_prices = [
+            result[f"entry_leg{idx}"].to_numpy() for idx in range(1, n_legs + 1)
+        ]
+        multipliers = [
+            leg[0].value * (leg[2] if len(leg) > 2 else 1) for leg in leg_def
+        ]
+
+        def unrealized(rows: np.ndarray, mids: List[np.ndarray]) -> np.ndarray:
+            total_entry = np.nansum(
+                np.column_stack([prices[rows] for prices in entry_prices]), axis=1
+            )
+            total_exit = np.nansum(
+                np.column_stack([m * k for m, k in zip(mids, multipliers)]), axis=1
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(
+                    np.abs(total_entry) > 0,
+                    (total_exit - total_entry) / np.abs(total_entry),
+                    np.nan,
+                )
+
+        triggered = _scan_paths(
+            data,
+            [
+                ([lookup[c] for c in CONTRACT_COLS], lookup["quote_date_entry"])
+                for lookup in trade_lookups
+            ],
+            unrealized,
+            result["_trade_id"].to_numpy(),
+            result[entry_date_col] if entry_date_col is not None else None,
+            stop_loss,
+            take_profit,
+            max_hold_days,
+        )
+        if not triggered.empty:
+            result = _replace_exits_multi_leg(result, triggered, data, leg_def)
+        result.drop(columns=["_trade_id"], inplace=True)
+        return result
+
+    # Fallback: get intermediate snapshots per leg and merge them.
+    # Pre-compute max_dates once for all legs
+    available_cols = [c for c in contract_cols if c in data.columns]
+    precomputed_max_dates = (
+        data.groupby(available_cols, observed=True)["quote_date"]
+        .max()
+        .reset_index()
+        .rename(columns={"quote_date": "_max_date"})
+    )
+
+    # Build per-leg intermediate DataFrames
+    leg_intermediates = []
+    for idx, trades_lookup in enumerate(trade_lookups, start=1):
+        leg = leg_def[idx - 1]
+        side_value = leg[0].value
+        quantity = leg[2] if len(leg) > 2 else 1
+        multiplier = side_value * quantity
+
         intermediates = _get_intermediate_snapshots(
             data,
             trades_lookup,
@@ -231,16 +332,6 @@ def _apply_multi_leg_exits(
         return result
 
     # Merge entry date for max_hold_days calculation
-    # Calendar strategies use plain "quote_date" as the entry date column
-    entry_date_col = None
-    for col in [
-        "quote_date_entry",
-        "quote_date_entry_leg1",
-        "quote_date",
-    ]:
-        if col in result.columns:
-            entry_date_col = col
-            break
     if entry_date_col is not None:
         trade_dates = result[["_trade_id", entry_date_col]].rename(
             columns={entry_date_col: "_entry_date"}
@@ -298,16 +389,11 @@ def _get_intermediate_snapshots(
     if trades.empty:
         return pd.DataFrame(columns=["_trade_id", "quote_date", "_mid"])
 
-    # Get the exit date column — for evaluated options, it's the expiration
-    # matched at exit_dte. We need to compute exit quote_date from the result.
-    # The exit quote date is determined by looking at what quote dates exist
-    # for each contract in the original data.
-
-    # Semi-join: get all rows from data that match trade contracts
     available_cols = [c for c in contract_cols if c in trades.columns]
     if not available_cols:
         return pd.DataFrame(columns=["_trade_id", "quote_date", "_mid"])
 
+    # The planned exit boundary is the max quote_date per contract group.
     # Build mapping from trades to contracts
     trade_contracts = trades[["_trade_id"] + [entry_date_col] + available_cols].copy()
 
@@ -318,15 +404,7 @@ def _get_intermediate_snapshots(
         return pd.DataFrame(columns=["_trade_id", "quote_date", "_mid"])
 
     # Filter to dates strictly between entry and the trade's planned exit
-    # Entry date comes from the trade; we need to find the exit date per trade
-    # The exit is the max quote_date per contract in the original data that was used
     merged = merged[merged["quote_date"] > merged[entry_date_col]]
-
-    # For each trade, find the planned exit date (max quote_date in the data
-    # for this contract that was actually used as an exit)
-    # The planned exit is the quote date at exit_dte — we can get it from the
-    # original result's exit info. But we don't have that here directly.
-    # Instead, get max quote_date per contract from the data as the "end" boundary.
     if max_dates is None:
         max_dates = (
             data.groupby(available_cols, observed=True)["quote_date"]
@@ -347,6 +425,207 @@ def _get_intermediate_snapshots(
     return merged[["_trade_id", "quote_date", "_mid"]].reset_index(drop=True)
 
 
+def _trade_paths(
+    data: pd.DataFrame,
+    legs: List[Tuple[List[pd.Series], pd.Series]],
+    max_points: Optional[int] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, List[np.ndarray]]]:
+    """Walk each trade's quote path between entry and planned exit.
+
+    Each leg's window is a slice of the chain's contract index: quotes
+    strictly after the leg's entry date and strictly before the last date
+    the chain has for its contract.  Legs after the first are point
+    lookups on the first leg's dates, so a date only survives when every
+    leg is quoted on it.  Duplicate quotes expand like an inner merge
+    would.
+
+    Paths are produced for batches of consecutive trades holding about
+    ``max_points`` first-leg quotes, so peak memory stays bounded however
+    long the backtest.
+
+    Args:
+        data: Full option chain data with all quote dates.
+        legs: Per leg, the contract key columns (in ``CONTRACT_COLS``
+            order) and the entry date of every trade.
+        max_points: Path points per batch (default ``_PATH_BATCH_POINTS``).
+
+    Yields:
+        Tuple of (trade row number, quote date, per-leg midpoint prices),
+        grouped by trade row and chronological within each trade.  Trade
+        rows increase across batches.
+    """
+    index = _contract_index(data)
+    bid = data["bid"].to_numpy()
+    ask = data["ask"].to_numpy()
+    all_dates = data["quote_date"].to_numpy()
+
+    contracts, entry_dates = legs[0]
+    others = []
+    for leg_contracts, leg_entry_dates in legs[1:]:
+        ids = index.contract_ids(leg_contracts)
+        entry = np.asarray(leg_entry_dates, dtype=index.dates.dtype)
+        others.append((ids, entry, index.last_dates(ids)))
+
+    for rows, positions in index.between_batches(
+        index.contract_ids(contracts),
+        entry_dates,
+        max_points or _PATH_BATCH_POINTS,
+    ):
+        quote_dates = all_dates[positions]
+        leg_positions = [positions]
+        for ids, entry, last in others:
+            window = (quote_dates > entry[rows]) & (quote_dates < last[rows])
+            rows, quote_dates = rows[window], quote_dates[window]
+            leg_positions = [p[window] for p in leg_positions]
+
+            hits, positions = index.locate_all(ids[rows], quote_dates)
+            rows, quote_dates = rows[hits], quote_dates[hits]
+            leg_positions = [p[hits] for p in leg_positions] + [positions]
+
+        yield rows, quote_dates, [(bid[p] + ask[p]) / 2 for p in leg_positions]
+
+
+def _scan_paths(
+    data: pd.DataFrame,
+    legs: List[Tuple[List[pd.Series], pd.Series]],
+    unrealized: Callable[[np.ndarray, List[np.ndarray]], np.ndarray],
+    trade_ids: np.ndarray,
+    entry_dates: Optional[pd.Series],
+    stop_loss: Optional[float],
+    take_profit: Optional[float],
+    max_hold_days: Optional[int] = None,
+) -> pd.DataFrame:
+    """Find the first crossing of every trade, one batch of paths at a time.
+
+    Args:
+        data: Full option chain data with all quote dates.
+        legs: Per leg contract keys and entry dates, as for ``_trade_paths()``.
+        unrealized: Maps (trade row numbers, per-leg midpoints) of a batch
+            to the unrealized P&L percentage per path point.
+        trade_ids: ``_trade_id`` of every trade row.
+        entry_dates: Entry date of every trade row, or None to skip the
+            ``max_hold_days`` check.
+        stop_loss: Negative float threshold (e.g., -0.50).
+        take_profit: Positive float threshold (e.g., 0.50).
+        max_hold_days: Maximum calendar days to hold a position.
+
+    Returns:
+        DataFrame with _trade_id, quote_date, _exit_type for triggered trades.
+    """
+    found = []
+    for rows, quote_dates, mids in _trade_paths(data, legs):
+        triggered = _first_crossing(
+            trade_ids,
+            rows,
+            quote_dates,
+            unrealized(rows, mids),
+            entry_dates,
+            stop_loss,
+            take_profit,
+            max_hold_days,
+        )
+        if not triggered.empty:
+            found.append(triggered)
+    if not found:
+        return pd.DataFrame(columns=["_trade_id", "quote_date", "_exit_type"])
+    return pd.concat(found, ignore_index=True)
+
+
+def _first_crossing(
+    trade_ids: np.ndarray,
+    rows: np.ndarray,
+    quote_dates: np.ndarray,
+    pct: np.ndarray,
+    entry_dates: Optional[pd.Series],
+    stop_loss: Optional[float],
+    take_profit: Optional[float],
+    max_hold_days: Optional[int] = None,
+) -> pd.DataFrame:
+    """Array form of ``_find_first_threshold_crossing()``.
+
+    Works on the output of ``_trade_paths()``: since rows are already
+    grouped by trade and chronological, the first crossing per trade is
+    the first flagged position of each group -- no sort needed.
+
+    Args:
+        trade_ids: ``_trade_id`` of every trade row.
+        rows: Trade row number per path point.
+        quote_dates: Quote date per path point.
+        pct: Unrealized P&L percentage per path point.
+        entry_dates: Entry date of every trade row, or None to skip the
+            ``max_hold_days`` check.
+        stop_loss: Negative float threshold (e.g., -0.50).
+        take_profit: Positive float threshold (e.g., 0.50).
+        max_hold_days: Maximum calendar days to hold a position.
+
+    Returns:
+        DataFrame with _trade_id, quote_date, _exit_type for triggered trades.
+    """
+    mask = np.zeros(len(rows), dtype=bool)
+    if stop_loss is not None:
+        mask |= pct <= stop_loss
+    if take_profit is not None:
+        mask |= pct >= take_profit
+    if max_hold_days is not None and entry_dates is not None:
+        entry = np.asarray(entry_dates, dtype=quote_dates.dtype)[rows]
+        hold_duration = pd.Series(quote_dates - entry).dt.days
+        mask |= (hold_duration >= max_hold_days).to_numpy()
+
+    hits = np.flatnonzero(mask)
+    if len(hits) == 0:
+        return pd.DataFrame(columns=["_trade_id", "quote_date", "_exit_type"])
+
+    hit_rows = rows[hits]
+    first = hits[np.r_[True, hit_rows[1:] != hit_rows[:-1]]]
+
+    # Determine exit type — priority: stop_loss > take_profit > max_hold
+    conditions = []
+    choices = []
+    if stop_loss is not None:
+        conditions.append(pct[first] <= stop_loss)
+        choices.append("stop_loss")
+    if take_profit is not None:
+        conditions.append(pct[first] >= take_profit)
+        choices.append("take_profit")
+    if max_hold_days is not None:
+        conditions.append(np.ones(len(first), dtype=bool))
+        choices.append("max_hold")
+
+    return pd.DataFrame(
+        {
+            "_trade_id": trade_ids[rows[first]],
+            "quote_date": quote_dates[first],
+            "_exit_type": np.select(conditions, choices, default=""),
+        }
+    )
+
+
+def _quotes_on_date(
+    data: pd.DataFrame, lookup: pd.DataFrame, merge_cols: List[str]
+) -> pd.DataFrame:
+    """Inner-join *lookup* with the first quote in *data* per ``merge_cols``.
+
+    Adds ``bid`` and ``ask`` columns and drops lookup rows without a quote.
+    Taking the first quote keeps duplicated chain rows from expanding
+    trades.  When ``merge_cols`` is a full contract key plus ``quote_date``
+    the contract index answers the lookup instead of a merge.
+    """
+    if set(merge_cols) == {"quote_date", *CONTRACT_COLS}:
+        index = _contract_index(data)
+        ids = index.contract_ids([lookup[c] for c in CONTRACT_COLS])
+        positions = index.locate(ids, lookup["quote_date"])
+        found = positions >= 0
+        matched = lookup[found].reset_index(drop=True)
+        matched["bid"] = data["bid"].to_numpy()[positions[found]]
+        matched["ask"] = data["ask"].to_numpy()[positions[found]]
+        return matched
+
+    data_exit = data[merge_cols + ["bid", "ask"]].drop_duplicates(
+        subset=merge_cols, keep="first"
+    )
+    return lookup.merge(data_exit, on=merge_cols, how="inner")
+
+
 def _find_first_threshold_crossing(
     intermediates: pd.DataFrame,
     stop_loss: Optional[float],
@@ -444,16 +723,7 @@ def _replace_exits_single_leg(
         data_merge_cols.append("option_type")
 
     lookup = lookup.rename(columns={"_exit_quote_date": "quote_date"})
-    # Deduplicate data on merge keys to avoid expanding trades
-    data_exit_keys = ["quote_date"] + data_merge_cols
-    data_exit = data[data_exit_keys + ["bid", "ask"]].drop_duplicates(
-        subset=data_exit_keys, keep="first"
-    )
-    lookup = lookup.merge(
-        data_exit,
-        on=data_exit_keys,
-        how="inner",
-    )
+    lookup = _quotes_on_date(data, lookup, ["quote_date"] + data_merge_cols)
 
     if lookup.empty:
         return result
@@ -558,11 +828,7 @@ def _replace_exits_multi_leg(
         # Merge with data at exit date
         leg_lookup = leg_lookup.rename(columns={"_exit_quote_date": "quote_date"})
 
-        data_merge = data[
-            ["quote_date", "underlying_symbol", "expiration", "strike", "bid", "ask"]
-        ].copy()
         if "option_type" in data.columns:
-            data_merge["option_type"] = data["option_type"]
             leg_lookup_merge = leg_lookup.rename(
                 columns={"_strike": "strike", "_opt_type": "option_type"}
             )
@@ -577,11 +843,7 @@ def _replace_exits_multi_leg(
             leg_lookup_merge = leg_lookup.rename(columns={"_strike": "strike"})
             merge_cols = ["quote_date", "underlying_symbol", "expiration", "strike"]
 
-        # Deduplicate data on merge keys to avoid expanding trades
-        data_merge = data_merge.drop_duplicates(subset=merge_cols, keep="first")
-        merged = leg_lookup_merge.merge(
-            data_merge, on=merge_cols, how="inner", suffixes=("", "_data")
-        )
+        merged = _quotes_on_date(data, leg_lookup_merge, merge_cols)
 
         # Remove trade_ids that had no data match for this leg
         bid_col_data = "bid_data" if "bid_data" in merged.columns else "bid"
@@ -0,0 +1,356 @@
+"""Process-pool execution helpers for sweeps, scans and portfolio legs.
+
+Strategy runs over the same option chain are independent, so batches of
+them (sweep blocks, scan combinations, portfolio legs) can be fanned out
+across a :mod:`concurrent.futures` executor.  Pickling the chain into every
+task would dominate the cost, so each distinct chain is written once into
+a :class:`multiprocessing.shared_memory.SharedMemory` block as raw NumPy
+column buffers:
+
+- numeric, boolean and ``datetime64`` columns are stored as-is
+- categorical columns store their integer codes; the (small) categories
+  travel with the handle
+- any other column (strings, tz-aware datetimes, nullable extension types)
+  is dictionary-encoded the same way and cast back to its original dtype
+
+Tasks receive only a small picklable :class:`_SharedFrame` handle.  Each
+worker process decodes a handle once and keeps the frame for later tasks.
+A prepared chain that carries a stage memo (see ``stages``) is rebuilt with
+a fresh memo of its own, so tasks landing on the same worker share stages
+just as sequential runs do.
+Workers that already hold the original object -- threads in the parent
+process, or processes forked after the frame was shared -- use it directly.
+
+Results are always returned in submission order, so parallel runs merge
+exactly like sequential ones.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from .chunked import ChunkedChain
+from .evaluation import _calls, _puts
+from .prepared import ChainLike, PreparedChain
+from .stages import _StageCache
+
+# Frames shared by this process, keyed by shared-memory block name.
+_OWNED: Dict[str, ChainLike] = {}
+
+# Frames decoded by this (worker) process; small LRU since a worker only
+# ever serves a handful of distinct chains.
+_ATTACHED: "OrderedDict[str, ChainLike]" = OrderedDict()
+_MAX_ATTACHED = 4
+
+# A task: (function, chain, keyword arguments) run as fn(chain, **kwargs).
+Task = Tuple[Callable[..., Any], ChainLike, Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class _ColumnSpec:
+    """Location and dtype of one column inside a shared-memory block."""
+
+    name: Any
+    offset: int
+    length: int
+    buffer_dtype: str
+    dtype: Any = None
+    categories: Optional[pd.Index] = None
+    ordered: bool = False
+
+
+@dataclass(frozen=True)
+class _SharedFrame:
+    """Picklable handle to a DataFrame stored in shared memory."""
+
+    shm_name: str
+    columns: Tuple[_ColumnSpec, ...]
+    index: Any
+    prepared: bool
+    staged: bool = False
+    source_dtypes: Tuple[Tuple[str, Any], ...] = ()
+    attrs: Tuple[Tuple[Hashable, Any], ...] = ()
+
+
+def _resolve_workers(n_jobs: Optional[int]) -> int:
+    """Translate ``n_jobs`` into a worker count (``-1`` means all cores)."""
+    if n_jobs is None:
+        return 1
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int):
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs!r}")
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs!r}")
+    return n_jobs
+
+
+def _worker_count(n_jobs: Optional[int], executor: Executor, n_items: int) -> int:
+    """Number of blocks to split *n_items* into for *executor*.
+
+    Uses ``n_jobs`` when the pool was created from it; for injected
+    executors (whose size is not public API) assumes one worker per core.
+    """
+    workers = _resolve_workers(n_jobs) if n_jobs is not None else os.cpu_count()
+    return max(1, min(n_items, workers or 1))
+
+
+@contextmanager
+def _executor_scope(
+    n_jobs: Optional[int] = None, executor: Optional[Executor] = None
+) -> Iterator[Optional[Executor]]:
+    """Yield the executor to use, or ``None`` for in-process execution.
+
+    An injected ``executor`` is used as-is and left running.  Otherwise a
+    :class:`ProcessPoolExecutor` with ``n_jobs`` workers is created and shut
+    down on exit; ``n_jobs`` of ``None`` or ``1`` runs sequentially.
+    """
+    if executor is not None:
+        yield executor
+        return
+    workers = _resolve_workers(n_jobs)
+    if workers == 1:
+        yield None
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield pool
+
+
+def _column_buffer(series: pd.Series) -> Tuple[np.ndarray, _ColumnSpec]:
+    """Return the NumPy buffer for *series* and a spec without an offset."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        values = np.ascontiguousarray(series.to_numpy())
+        return values, _ColumnSpec(series.name, 0, len(values), values.dtype.str)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        cat = series.array
+        target = None
+    else:
+        cat = pd.Categorical(series)
+        target = dtype
+    codes = np.ascontiguousarray(cat.codes)
+    spec = _ColumnSpec(
+        series.name,
+        0,
+        len(codes),
+        codes.dtype.str,
+        dtype=target,
+        categories=cat.categories,
+        ordered=bool(cat.ordered),
+    )
+    return codes, spec
+
+
+def _share_frame(data: ChainLike, stack: ExitStack) -> _SharedFrame:
+    """Copy *data* into a new shared-memory block and return its handle.
+
+    The block is closed and unlinked when *stack* unwinds.
+    """
+    if isinstance(data, ChunkedChain):
+        raise TypeError("Chunked chains are sent to workers as-is")
+    frame = data.data if isinstance(data, PreparedChain) else data
+
+    buffers: List[np.ndarray] = []
+    specs: List[_ColumnSpec] = []
+    offset = 0
+    for name in frame.columns:
+        values, spec = _column_buffer(frame.loc[:, name])
+        # Keep every buffer 8-byte aligned for the widest dtypes
+        offset = -(-offset // 8) * 8
+        specs.append(
+            _ColumnSpec(
+                spec.name,
+                offset,
+                spec.length,
+                spec.buffer_dtype,
+                spec.dtype,
+                spec.categories,
+                spec.ordered,
+            )
+        )
+        buffers.append(values)
+        offset += values.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    for values, spec in zip(buffers, specs):
+        target = np.ndarray(
+            spec.length, dtype=spec.buffer_dtype, buffer=shm.buf, offset=spec.offset
+        )
+        target[:] = values
+        del target
+
+    if isinstance(data, PreparedChain):
+        return _SharedFrame(
+            shm.name,
+            tuple(specs),
+            frame.index,
+            prepared=True,
+            staged=data.stages is not None,
+            source_dtypes=tuple(data.source_dtypes.items()),
+            attrs=tuple(frame.attrs.items()),
+        )
+    return _SharedFrame(
+        shm.name,
+        tuple(specs),
+        frame.index,
+        prepared=False,
+        attrs=tuple(frame.attrs.items()),
+    )
+
+
+def _decode_frame(handle: _SharedFrame, buf: memoryview) -> pd.DataFrame:
+    """Rebuild the DataFrame described by *handle* from *buf* (copying)."""
+    columns = {}
+    for spec in handle.columns:
+        values = np.ndarray(
+            spec.length, dtype=spec.buffer_dtype, buffer=buf, offset=spec.offset
+        ).copy()
+        if spec.categories is None:
+            columns[spec.name] = values
+            continue
+        cat = pd.Categorical.from_codes(
+            values, categories=spec.categories, ordered=spec.ordered
+        )
+        series = pd.Series(cat, copy=False)
+        if spec.dtype is not None:
+            series = series.astype(spec.dtype)
+        columns[spec.name] = series.array
+    frame = pd.DataFrame(columns, index=handle.index, copy=False)
+    frame.attrs.update(handle.attrs)
+    return frame
+
+
+def _attach(handle: _SharedFrame) -> ChainLike:
+    """Return the chain behind *handle*, decoding it at most once per process."""
+    if handle.shm_name in _OWNED:
+        return _OWNED[handle.shm_name]
+    if handle.shm_name in _ATTACHED:
+        _ATTACHED.move_to_end(handle.shm_name)
+        return _ATTACHED[handle.shm_name]
+
+    # Pool workers share the parent's resource tracker, so attaching here
+    # does not transfer ownership: the parent still unlinks the block.
+    shm = shared_memory.SharedMemory(name=handle.shm_name)
+    try:
+        if shm.buf is None:
+            raise RuntimeError(f"Shared memory block {handle.shm_name} is closed")
+        frame = _decode_frame(handle, shm.buf)
+    finally:
+        shm.close()
+
+    chain: ChainLike = frame
+    if handle.prepared:
+        chain = PreparedChain(
+            data=frame,
+            calls=_calls(frame),
+            puts=_puts(frame),
+            stages=_StageCache() if handle.staged else None,
+            source_dtypes=dict(handle.source_dtypes),
+        )
+    _ATTACHED[handle.shm_name] = chain
+    while len(_ATTACHED) > _MAX_ATTACHED:
+        _ATTACHED.popitem(last=False)
+    return chain
+
+
+def _call_shared(
+    fn: Callable[..., Any],
+    handle: Union[_SharedFrame, ChunkedChain],
+    kwargs: Dict[str, Any],
+    return_exceptions: bool,
+) -> Any:
+    """Worker entry point: resolve the shared chain and run one task.
+
+    Chunked chains are sent as-is; they read their chunks lazily, so there
+    is nothing to share.
+    """
+    try:
+        chain = _attach(handle) if isinstance(handle, _SharedFrame) else handle
+        return fn(chain, **kwargs)
+    except Exception as e:
+        if return_exceptions:
+            return e
+        raise
+
+
+def _run_tasks(
+    tasks: List[Task],
+    executor: Optional[Executor] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Run ``fn(chain, **kwargs)`` for every task, returning results in order.
+
+    With no executor the tasks run in this process.  Otherwise each distinct
+    chain (by identity) is placed in shared memory once and tasks are
+    submitted in order; results are collected in the same order regardless
+    of completion order.
+
+    Args:
+        tasks: ``(fn, chain, kwargs)`` tuples; ``fn`` must be picklable for
+            process executors (any module-level function).
+        executor: Executor to submit to, or ``None`` for sequential runs.
+        return_exceptions: Return a task's exception in its result slot
+            instead of raising it.
+
+    Returns:
+        One result per task, in task order.
+    """
+    if executor is None:
+        results = []
+        for fn, chain, kwargs in tasks:
+            try:
+                results.append(fn(chain, **kwargs))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    with ExitStack() as stack:
+        handles: Dict[int, Union[_SharedFrame, ChunkedChain]] = {}
+        for _, chain, _ in tasks:
+            if id(chain) in handles:
+                continue
+            if isinstance(chain, ChunkedChain):
+                handles[id(chain)] = chain
+                continue
+            handle = _share_frame(chain, stack)
+            handles[id(chain)] = handle
+            _OWNED[handle.shm_name] = chain
+            stack.callback(_OWNED.pop, handle.shm_name, None)
+
+        futures = [
+            executor.submit(
+                _call_shared, fn, handles[id(chain)], kwargs, return_exceptions
+            )
+            for fn, chain, kwargs in tasks
+        ]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            # Make sure no task still reads the blocks before they go away
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                if not future.cancelled():
+                    future.exception()
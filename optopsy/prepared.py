@@ -0,0 +1,201 @@
+"""Prepared option chains for repeated strategy runs.
+
+Every strategy call normally validates the input schema, normalizes
+``quote_date``/``expiration``, lowercases ``option_type`` and assigns ``dte``
+before any filtering happens.  When the same chain is backtested many times
+(scanning strategies, sweeping parameters) that setup dominates wall time
+and memory.
+
+``prepare()`` performs it once and returns a :class:`PreparedChain` that
+every strategy function and ``simulate()`` accept in place of a DataFrame:
+
+- the schema is validated up front, so strategy calls skip ``_check_data_types``
+- dates are normalized and ``dte`` is precomputed
+- ``underlying_symbol`` and ``option_type`` are categoricals
+- rows are sorted by contract key ``(symbol, type, expiration, strike, quote_date)``
+- call and put partitions are split once and reused by ``_calls``/``_puts`` legs
+
+Example::
+
+    import optopsy as op
+
+    chain = op.prepare(op.csv_data("SPX_2018.csv"))
+    for strategy in (op.short_puts, op.iron_condor, op.long_call_spread):
+        results = strategy(chain, max_entry_dte=45, exit_dte=14)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from .checks import _check_data_types
+from .chunked import ChunkedChain
+from .compact import _expand_compact
+from .contracts import _pin_index
+from .evaluation import _calls, _puts
+from .filters import _assign_dte
+from .stages import _StageCache
+from .timestamps import normalize_dates
+
+# Sort order of a prepared chain: every contract's quotes are contiguous and
+# chronological.
+_CONTRACT_SORT_COLS: List[str] = [
+    "underlying_symbol",
+    "option_type",
+    "expiration",
+    "strike",
+    "quote_date",
+]
+
+# Columns stored as categoricals on a prepared chain.
+_CATEGORICAL_COLS: List[str] = ["underlying_symbol", "option_type"]
+
+
+@dataclass(frozen=True)
+class PreparedChain:
+    """Validated, normalized option chain produced by :func:`prepare`.
+
+    Instances are immutable: the dataclass is frozen and pandas copy-on-write
+    guarantees the engine's derived frames never write back into ``data``,
+    ``calls`` or ``puts``, so one chain can safely be shared across any
+    number of strategy calls.
+
+    Attributes:
+        data: Full chain with normalized dates, lowercase categorical
+            ``option_type``, categorical ``underlying_symbol`` and a ``dte``
+            column, sorted by contract key.
+        calls: Call rows of ``data``.
+        puts: Put rows of ``data``.
+        stages: Optional memo of intermediate pipeline frames, set by
+            ``sweep()`` for the duration of a parameter sweep.
+        source_dtypes: Dtypes the categorical columns had before
+            ``prepare()``; strategy output is cast back to them.
+    """
+
+    data: pd.DataFrame
+    calls: pd.DataFrame
+    puts: pd.DataFrame
+    stages: Optional[_StageCache] = field(default=None, repr=False, compare=False)
+    source_dtypes: Dict[str, Any] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for frame in (self.data, self.calls, self.puts):
+            _pin_index(frame)
+
+    @property
+    def empty(self) -> bool:
+        """Whether the chain has no rows (mirrors ``DataFrame.empty``)."""
+        return self.data.empty
+
+    @property
+    def columns(self) -> pd.Index:
+        """Columns of the underlying chain (mirrors ``DataFrame.columns``)."""
+        return self.data.columns
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def partition(self, option_filter: Callable) -> pd.DataFrame:
+        """Return the rows selected by a leg's option filter.
+
+        ``_calls`` and ``_puts`` map to the pre-split partitions; any other
+        filter is applied to the full chain.
+        """
+        if option_filter is _calls:
+            return self.calls
+        if option_filter is _puts:
+            return self.puts
+        return option_filter(self.data)
+
+    def restore_dtypes(self, result: pd.DataFrame) -> pd.DataFrame:
+        """Cast categorical columns of *result* back to their source dtypes.
+
+        Covers both the plain column names and their per-leg variants
+        (``underlying_symbol_leg1`` etc.), so strategy output matches what
+        the unprepared DataFrame produces.
+        """
+        casts = {}
+        for col in result.columns:
+            base = str(col).split("_leg")[0]
+            dtype = self.source_dtypes.get(base)
+            if dtype is not None and isinstance(result[col].dtype, pd.CategoricalDtype):
+                casts[col] = dtype
+        return result.astype(casts) if casts else result
+
+
+# Accepted by every strategy entry point.
+ChainLike = Union[pd.DataFrame, PreparedChain, ChunkedChain]
+
+
+def _normalize_chain(data: pd.DataFrame) -> pd.DataFrame:
+    """Normalize dates and option_type, then assign ``dte``.
+
+    This is the per-call setup shared by ``prepare()`` and the unprepared
+    strategy path.  ``.assign()`` returns a new DataFrame, so the caller's
+    data is never modified.
+    """
+    return data.assign(
+        quote_date=normalize_dates(data["quote_date"]),
+        expiration=normalize_dates(data["expiration"]),
+        option_type=data["option_type"].str.lower(),
+    ).pipe(_assign_dte)
+
+
+def _restore_dtypes(data: ChainLike, result: pd.DataFrame) -> pd.DataFrame:
+    """Undo the categorical dtypes *data* introduced into *result*."""
+    return data.restore_dtypes(result) if isinstance(data, PreparedChain) else result
+
+
+def _stage_cache(data: ChainLike) -> Optional[_StageCache]:
+    """Return the stage memo attached to *data*, if any."""
+    return data.stages if isinstance(data, PreparedChain) else None
+
+
+def prepare(data: ChainLike) -> PreparedChain:
+    """Validate and normalize option chain data once for repeated strategy runs.
+
+    Pass the returned chain to any strategy function or ``simulate()`` in
+    place of the raw DataFrame; results are identical, but schema checks,
+    date normalization and DTE assignment are not repeated per call.
+
+    Args:
+        data: Option chain DataFrame (as returned by ``csv_data()``,
+            ``options_data()`` or ``load_cached_options()``), in the
+            standard or compact schema; a compact chain is expanded, so
+            the prepared chain holds standard dtypes.  An existing
+            :class:`PreparedChain` is returned unchanged.
+
+    Returns:
+        An immutable :class:`PreparedChain`.
+
+    Raises:
+        ValueError: If required columns are missing or have invalid dtypes,
+            or if *data* is a ``ChunkedChain`` (which is never held in
+            memory as a whole).
+    """
+    if isinstance(data, PreparedChain):
+        return data
+    if isinstance(data, ChunkedChain):
+        raise ValueError(
+            "A chunked chain cannot be prepared; pass it to strategies directly"
+        )
+
+    data = _expand_compact(data)
+    _check_data_types(data)
+
+    normalized = _normalize_chain(data)
+    source_dtypes = {col: normalized[col].dtype for col in _CATEGORICAL_COLS}
+    normalized = (
+        normalized.sort_values(_CONTRACT_SORT_COLS, kind="mergesort")
+        .reset_index(drop=True)
+        .astype(dict.fromkeys(_CATEGORICAL_COLS, "category"))
+    )
+    return PreparedChain(
+        data=normalized,
+        calls=_calls(normalized),
+        puts=_puts(normalized),
+        source_dtypes=source_dtypes,
+    )
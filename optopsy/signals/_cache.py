@@ -0,0 +1,298 @@
+"""Memoized symbol groups and indicators shared across signal evaluations.
+
+Composed signals evaluate every child against the same frame: in
+``signal(rsi_below(14)) & signal(rsi_above(14, 20)) & sustained(sma_above(200))``
+each child would otherwise split the frame by ``underlying_symbol`` again
+and recompute its indicator from scratch.  This module memoizes both
+steps:
+
+- ``symbol_groups()`` splits a frame once per key.  ``symbol_segments()``
+  does the same for the whole-frame indicators of ``_vectorized``.
+- ``cached_indicator()`` memoizes an indicator keyed by
+  ``(indicator, params, symbol, key of the input frame)``.
+
+Keys must cost O(1) — a cache hit that hashes the frame costs more than
+the indicator it saves — so a frame is keyed in one of two ways:
+
+- **Provenance**: a frame returned by a loader carries a fingerprint (see
+  ``optopsy.data.fingerprint``), and frames split from it derive theirs
+  without touching the data.  These entries are shared across calls, in
+  an LRU bounded by ``OPTOPSY_INDICATOR_CACHE_MB`` (default 256; ``0``
+  disables caching).
+- **Identity within an evaluation**: ``evaluation()`` opens a scope —
+  ``Signal.__call__`` opens one per call — in which any other frame is
+  keyed by the object itself.  Its entries are dropped when the scope
+  closes, so a frame the caller edits in place between calls is never
+  served stale indicators.
+
+Outside a scope, a frame without provenance is not memoized.  The signal
+skeletons in ``_helpers`` take an optional ``key`` — the indicator name
+and parameters — and pass it here; the chart traces in
+``optopsy.ui.tools._indicators`` use the same cache.  Cached indicators
+are shared between callers, so they must never be modified in place.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, TypeVar, cast
+
+import numpy as np
+import pandas as pd
+
+from ..data.fingerprint import derive, recorded
+from ._vectorized import Segments, split
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_MB = 256
+
+# Frames whose symbol groups are kept; groups hold a copy of the frame, and
+# a composed signal only ever evaluates one frame at a time.
+_MAX_GROUPED = 2
+
+_lock = threading.Lock()
+# fingerprint -> (index of the frame, [(symbol, group), ...])
+_groups: "OrderedDict[str, tuple[pd.Index, list]]" = OrderedDict()
+# fingerprint -> (index of the frame, split(frame))
+_segments: "OrderedDict[str, tuple[pd.Index, tuple]]" = OrderedDict()
+# (name, params, symbol, fingerprint) -> (indicator, bytes, index of the source)
+_indicators: "OrderedDict[tuple, tuple[object, int, pd.Index]]" = OrderedDict()
+_indicator_bytes = 0
+
+
+class _Scope:
+    """Memo of one evaluation, keying frames by identity.
+
+    Holds a reference to every keyed object, so no id is reused while the
+    scope is open.
+    """
+
+    def __init__(self) -> None:
+        self.keys: dict[int, tuple[object, str]] = {}
+        self.groups: "OrderedDict[str, tuple[pd.Index, list]]" = OrderedDict()
+        self.segments: "OrderedDict[str, tuple[pd.Index, tuple]]" = OrderedDict()
+        self.indicators: dict[tuple, tuple[object, pd.Index]] = {}
+
+    def key(self, obj: object) -> str:
+        entry = self.keys.get(id(obj))
+        if entry is None:
+            entry = (obj, f"#{len(self.keys)}")
+            self.keys[id(obj)] = entry
+        return entry[1]
+
+    def bind(self, child: object, key: str) -> None:
+        self.keys[id(child)] = (child, key)
+
+
+_scope: ContextVar["_Scope | None"] = ContextVar("optopsy_signal_scope", default=None)
+
+
+@contextmanager
+def evaluation() -> Iterator[None]:
+    """Share groups and indicators between the signals run inside the block.
+
+    Frames are keyed by identity, so they must not be modified until the
+    block exits.  Nested blocks share the outermost scope.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    token = _scope.set(_Scope())
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def bind(parent: object, child: T, **operation: object) -> T:
+    """Key *child* as *parent*'s with *operation* applied, without hashing.
+
+    *operation* must determine *child* from *parent* exactly.  Does nothing
+    when *parent* has neither a recorded fingerprint nor a scope key.
+
+    Returns:
+        *child* itself.
+    """
+    if isinstance(parent, pd.DataFrame) and isinstance(child, pd.DataFrame):
+        if recorded(parent) is not None:
+            derive(parent, child, **operation)
+            return child
+    scope = _scope.get()
+    if scope is not None:
+        scope.bind(child, f"{scope.key(parent)}|{sorted(operation.items())!r}")
+    return child
+
+
+def _frame_key(data: pd.DataFrame) -> "tuple[str, _Scope | None] | None":
+    """O(1) memo key of *data* and the scope holding its entries, if any.
+
+    Provenance keys live in the shared LRU (scope None); other frames are
+    keyed within the open scope, or not at all outside one.
+    """
+    fp = recorded(data)
+    if fp is not None:
+        return fp, None
+    scope = _scope.get()
+    if scope is None:
+        return None
+    return scope.key(data), scope
+
+
+def symbol_groups(data: pd.DataFrame) -> list[tuple[object, pd.DataFrame]]:
+    """Split *data* by ``underlying_symbol``, reusing an earlier split.
+
+    Rows with a missing symbol belong to no group, as with ``groupby``.
+    A frame holding a single symbol is its own group.
+    """
+    if data.empty:
+        return []
+    found = _frame_key(data)
+    if found is None:
+        return _split_groups(data)
+    key, scope = found
+    return _split_once(
+        _groups if scope is None else scope.groups, key, data, _split_groups
+    )
+
+
+def symbol_segments(
+    data: pd.DataFrame,
+) -> tuple[pd.DataFrame, Segments, np.ndarray | None]:
+    """``_vectorized.split(data)``, reusing an earlier split."""
+    found = _frame_key(data)
+    if found is None:
+        return split(data)
+    key, scope = found
+    return _split_once(
+        _segments if scope is None else scope.segments, key, data, _split_segments
+    )
+
+
+def _split_once(
+    store: "OrderedDict[str, tuple[pd.Index, T]]",
+    key: str,
+    data: pd.DataFrame,
+    compute: Callable[[pd.DataFrame], T],
+) -> T:
+    with _lock:
+        entry = store.get(key)
+        if entry is not None:
+            store.move_to_end(key)
+    # Equal content under a different index needs its own split
+    if entry is not None and entry[0].equals(data.index):
+        return entry[1]
+
+    value = compute(data)
+    with _lock:
+        store[key] = (data.index, value)
+        while len(store) > _MAX_GROUPED:
+            store.popitem(last=False)
+    return value
+
+
+def _split_groups(data: pd.DataFrame) -> list[tuple[object, pd.DataFrame]]:
+    symbols = data["underlying_symbol"]
+    first = symbols.iat[0]
+    if pd.notna(first) and bool((symbols == first).all()):
+        return [(first, data)]
+    return [
+        (symbol, bind(data, group, symbol=symbol))
+        for symbol, group in data.groupby("underlying_symbol", sort=False)
+    ]
+
+
+def _split_segments(
+    data: pd.DataFrame,
+) -> tuple[pd.DataFrame, Segments, np.ndarray | None]:
+    frame, segs, order = split(data)
+    if order is not None:
+        bind(data, frame, by="symbol")
+    return frame, segs, order
+
+
+def cached_indicator(
+    name: str, params: tuple, source: pd.DataFrame, compute: Callable[[], T]
+) -> T:
+    """Return ``compute()``, memoized for the indicator *name* over *source*.
+
+    Args:
+        name: Indicator name, e.g. ``"rsi"``.
+        params: Every parameter ``compute`` depends on besides *source*.
+        source: Frame the indicator is computed from: one symbol's rows,
+            or every symbol's for the whole-frame indicators.
+        compute: Computes the indicator: a Series, a tuple of Series (or
+            None) or None, indexed like *source*.
+    """
+    max_bytes = _max_bytes()
+    found = _frame_key(source) if max_bytes > 0 else None
+    if found is None:
+        return compute()
+    frame_key, scope = found
+    symbol = (
+        source["underlying_symbol"].iat[0]
+        if "underlying_symbol" in source.columns and len(source)
+        else None
+    )
+    key = (name, params, symbol, frame_key)
+    if scope is not None:
+        hit = scope.indicators.get(key)
+        if hit is not None and hit[1].equals(source.index):
+            return cast(T, hit[0])
+        value = compute()
+        scope.indicators[key] = (value, source.index)
+        return value
+
+    with _lock:
+        entry = _indicators.get(key)
+        if entry is not None:
+            _indicators.move_to_end(key)
+    # Equal content under a different index is computed again, since an
+    # indicator may be indexed by any subset of its source's index.
+    if entry is not None and entry[2].equals(source.index):
+        return cast(T, entry[0])
+
+    value = compute()
+    _store(key, value, source.index, max_bytes)
+    return value
+
+
+def clear() -> None:
+    """Drop every memoized group and indicator."""
+    global _indicator_bytes
+    with _lock:
+        _groups.clear()
+        _segments.clear()
+        _indicators.clear()
+        _indicator_bytes = 0
+
+
+def _max_bytes() -> int:
+    max_mb = os.environ.get("OPTOPSY_INDICATOR_CACHE_MB", "")
+    return int(float(max_mb or _DEFAULT_MAX_MB) * 2**20)
+
+
+def _store(key: tuple, value: object, index: pd.Index, max_bytes: int) -> None:
+    global _indicator_bytes
+    size = _nbytes(value)
+    if size > max_bytes:
+        return
+    with _lock:
+        old = _indicators.pop(key, None)
+        if old is not None:
+            _indicator_bytes -= old[1]
+        _indicators[key] = (value, size, index)
+        _indicator_bytes += size
+        while _indicator_bytes > max_bytes:
+            _, (_, evicted, _) = _indicators.popitem(last=False)
+            _indicator_bytes -= evicted
+
+
+def _nbytes(value: object) -> int:
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=False)))
+    return 0
@@ -1,43 +1,47 @@
 """Signal combinators, the Signal class, signal_dates, and custom_signal."""
 
+from typing import Callable, Mapping
+
 import pandas as pd
 
 from ..timestamps import normalize_dates
-from ._helpers import SignalFunc, _groupby_symbol
+from ._cache import bind, evaluation
+from ._expr import (
+    And,
+    Leaf,
+    Node,
+    Or,
+    Sustained,
+    as_node,
+    evaluate,
+    from_dict,
+    named,
+    optimize,
+    to_dict,
+)
+from ._helpers import ROW, SignalFunc, _scoped
 
 # ---------------------------------------------------------------------------
 # Signal combinators
 # ---------------------------------------------------------------------------
 
 
-def and_signals(*signals: SignalFunc) -> SignalFunc:
+def and_signals(*signals: SignalFunc) -> "Signal":
     """Combine multiple signals with logical AND.
 
-    All signals must be True for a date to be valid.
+    All signals must be True for a date to be valid.  Returns a ``Signal``
+    whose expression tree is optimised before it runs (see ``_expr``).
     """
-
-    def combined(data: pd.DataFrame) -> "pd.Series[bool]":
-        result = pd.Series(True, index=data.index)
-        for sig in signals:
-            result = result & sig(data)
-        return result
-
-    return combined
+    return Signal(And(tuple(as_node(sig) for sig in signals)))
 
 
-def or_signals(*signals: SignalFunc) -> SignalFunc:
+def or_signals(*signals: SignalFunc) -> "Signal":
     """Combine multiple signals with logical OR.
 
-    At least one signal must be True for a date to be valid.
+    At least one signal must be True for a date to be valid.  Returns a
+    ``Signal`` whose expression tree is optimised before it runs.
     """
-
-    def combined(data: pd.DataFrame) -> "pd.Series[bool]":
-        result = pd.Series(False, index=data.index)
-        for sig in signals:
-            result = result | sig(data)
-        return result
-
-    return combined
+    return Signal(Or(tuple(as_node(sig) for sig in signals)))
 
 
 # ---------------------------------------------------------------------------
@@ -45,11 +49,12 @@ def or_signals(*signals: SignalFunc) -> SignalFunc:
 # ---------------------------------------------------------------------------
 
 
-def sustained(signal_func: SignalFunc, days: int = 5) -> SignalFunc:
+def sustained(signal_func: SignalFunc, days: int = 5) -> "Signal":
     """True only when signal_func has been True for at least ``days`` consecutive bars.
 
-    Uses a rolling minimum over the boolean output of the inner signal: the
-    window minimum is 1 only when every bar in the window was True.
+    Uses a rolling minimum over the boolean output of the inner signal, per
+    symbol: the window minimum is 1 only when every bar in the window was
+    True.  Nested and AND-ed ``sustained`` windows are fused into one pass.
 
     Args:
         signal_func: Any SignalFunc to wrap
@@ -60,15 +65,7 @@ def sustained(signal_func: SignalFunc, days: int = 5) -> SignalFunc:
     """
     if days < 1:
         raise ValueError(f"days must be >= 1, got {days}")
-
-    def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
-        def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            raw = signal_func(group)
-            return raw.astype(int).rolling(days).min().fillna(0).astype(bool)
-
-        return _groupby_symbol(data, _compute_group)
-
-    return _signal
+    return Signal(Sustained(as_node(signal_func), days))
 
 
 # ---------------------------------------------------------------------------
@@ -101,7 +98,7 @@ def custom_signal(df: pd.DataFrame, flag_col: str = "signal") -> SignalFunc:
         lookup = pd.MultiIndex.from_arrays([data["underlying_symbol"], dates])
         return pd.Series(lookup.isin(valid_idx), index=data.index, dtype=bool)
 
-    return _signal
+    return _scoped(_signal, ROW)
 
 
 # ---------------------------------------------------------------------------
@@ -110,32 +107,87 @@ def custom_signal(df: pd.DataFrame, flag_col: str = "signal") -> SignalFunc:
 
 
 class Signal:
-    """Composable wrapper around a SignalFunc with & and | operator support."""
+    """Composable wrapper around a SignalFunc with & and | operator support.
 
-    def __init__(self, func: SignalFunc) -> None:
-        self._func = func
+    A Signal holds an expression tree (see ``_expr``) rather than a closure:
+    ``&`` and ``|`` build ``And`` / ``Or`` nodes, and the tree is optimised
+    once, on the first call.  Trees built from named signals serialise with
+    ``to_dict()`` / ``from_dict()``.
+    """
+
+    def __init__(self, func: "SignalFunc | Node") -> None:
+        self.node = as_node(func)
+        self._plan: Node | None = None
 
     def __call__(self, data: pd.DataFrame) -> "pd.Series[bool]":
-        return self._func(data)
+        if self._plan is None:
+            self._plan = optimize(self.node)
+        return evaluate(self._plan, data)
 
     def __and__(self, other: "Signal | SignalFunc") -> "Signal":
-        def combined(data: pd.DataFrame) -> "pd.Series[bool]":
-            return self(data) & other(data)
-
-        return Signal(combined)
+        return Signal(And((self.node, as_node(other))))
 
     def __or__(self, other: "Signal | SignalFunc") -> "Signal":
-        def combined(data: pd.DataFrame) -> "pd.Series[bool]":
-            return self(data) | other(data)
-
-        return Signal(combined)
+        return Signal(Or((self.node, as_node(other))))
+
+    def to_dict(self) -> dict:
+        """JSON-serialisable expression tree; every leaf must be named.
+
+        Raises:
+            ValueError: If a leaf is a plain function rather than a signal
+                built with ``signal(name, **params)``.
+        """
+        return to_dict(self.node)
+
+    @classmethod
+    def from_dict(
+        cls,
+        spec: dict,
+        factories: "Mapping[str, Callable[..., SignalFunc]] | None" = None,
+    ) -> "Signal":
+        """Rebuild a Signal from ``to_dict()`` output.
+
+        Args:
+            spec: Serialised expression tree.
+            factories: Maps signal names to factories, instead of the
+                signal functions of ``optopsy.signals``.
+
+        Raises:
+            ValueError: If a name or its parameters are invalid.
+        """
+        return cls(from_dict(spec, factories))
 
     def __repr__(self) -> str:
-        return f"Signal({self._func!r})"
+        return f"Signal({_describe(self.node)})"
+
+
+def _describe(node: "Node") -> str:
+    if isinstance(node, Leaf):
+        if node.name is None:
+            return repr(node.func)
+        params = ", ".join(f"{k}={v!r}" for k, v in node.params.items())
+        return f"{node.name}({params})"
+    if isinstance(node, Sustained):
+        return f"sustained({_describe(node.child)}, days={node.days})"
+    joiner = " & " if isinstance(node, And) else " | "
+    return "(" + joiner.join(_describe(child) for child in node.children) + ")"
 
 
-def signal(func: SignalFunc) -> Signal:
-    """Wrap a signal function in a Signal for fluent operator chaining."""
+def signal(func: "SignalFunc | str", **params: object) -> Signal:
+    """Wrap a signal function in a Signal for fluent operator chaining.
+
+    *func* may also be the name of a signal of ``optopsy.signals``, built
+    with *params*: ``signal("rsi_below", threshold=30)`` is
+    ``signal(rsi_below(threshold=30))``, and can be serialised with
+    ``Signal.to_dict()``.
+
+    Raises:
+        ValueError: If *func* is an unknown name or *params* do not fit it.
+    """
+    if isinstance(func, str):
+        return Signal(named(func, params))
+    if params:
+        raise TypeError("signal() takes parameters only with a signal name")
     return Signal(func)
 
 
@@ -183,7 +235,11 @@ def signal_dates(
         .sort_values(["underlying_symbol", "quote_date"])
         .reset_index(drop=True)
     )
-    mask = signal_func(df)
+    # Loaded stock data keeps its provenance, so indicators are reused
+    # across calls
+    df = bind(stock_data, df, signal_dates=True)
+    with evaluation():
+        mask = signal_func(df)
     return (
         df.loc[mask, ["underlying_symbol", "quote_date"]]
         .drop_duplicates()
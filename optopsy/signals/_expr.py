@@ -0,0 +1,445 @@
+"""Signal expression trees, optimised before they run.
+
+``Signal`` operators, ``and_signals()``, ``or_signals()`` and ``sustained()``
+build a tree instead of nested closures:
+
+- ``Leaf`` wraps one signal function, optionally with the name and
+  parameters it was built from (``signal("rsi_below", period=14)``);
+- ``And`` / ``Or`` combine their children;
+- ``Sustained`` requires its child to hold for ``days`` consecutive bars.
+
+``optimize()`` rewrites a tree once, before its first run:
+
+1. Nested ``And`` / ``Or`` nodes are flattened and duplicate children
+   dropped.  Keys ignore child order, so ``a & b`` and ``b & a`` match.
+2. ``sustained`` windows are fused: ``sustained(sustained(x, a), b)`` is
+   ``sustained(x, a + b - 1)``; an ``And`` keeps only the longest
+   ``sustained(x, ...)`` of the same ``x`` and an ``Or`` the shortest; and
+   an ``And`` of several ``sustained(..., days)`` becomes one
+   ``sustained(And(...), days)`` — one rolling pass instead of several.
+3. Children are ordered cheapest first, by the scope a signal reads (see
+   ``_helpers.ROW``): calendar and price-level predicates, then
+   indicators, then functions of unknown scope.
+
+``evaluate()`` then runs the tree on a frame.  Each distinct subtree is
+computed at most once per frame (common-subexpression elimination), and
+``And`` / ``Or`` short-circuit on a row mask: once earlier children have
+decided some rows, row-scoped children run on the undecided rows only,
+symbol-scoped children on the undecided symbols only, and evaluation stops
+when no row is left undecided.  Functions of unknown scope always see the
+full frame — except inside ``sustained``, which evaluates them per symbol
+as it always has.
+
+Trees whose leaves are all named serialise with ``to_dict()`` /
+``from_dict()``, so callers such as the chat UI's ``build_signal`` tool can
+cache compiled plans by their JSON.
+"""
+
+import hashlib
+import inspect
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+from ._cache import bind, evaluation, symbol_segments
+from ._helpers import FRAME, ROW, SYMBOL, SignalFunc, _groupby_symbol
+from ._vectorized import rolling, scatter
+
+# Evaluation order of children by scope: cheapest first
+_RANK = {ROW: 0, SYMBOL: 1, FRAME: 2}
+
+# Public names of optopsy.signals that are not signal factories
+_NOT_FACTORIES = frozenset(
+    {
+        "SignalFunc",
+        "Signal",
+        "signal",
+        "signal_dates",
+        "and_signals",
+        "or_signals",
+        "sustained",
+        "custom_signal",
+    }
+)
+
+
+# ---------------------------------------------------------------------------
+# Nodes
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, eq=False)
+class Leaf:
+    """A signal function, named when built from a name and parameters."""
+
+    func: SignalFunc
+    name: str | None = None
+    params: dict = field(default_factory=dict)
+
+    @cached_property
+    def key(self) -> tuple:
+        """Identity for deduplication: the name and parameters, if any."""
+        if self.name is None:
+            return ("func", id(self.func))
+        return (
+            "signal",
+            self.name,
+            json.dumps(self.params, sort_keys=True, default=str),
+        )
+
+    @property
+    def scope(self) -> str:
+        return getattr(self.func, "signal_scope", FRAME)
+
+
+@dataclass(frozen=True, eq=False)
+class And:
+    """True where every child is True."""
+
+    children: tuple
+
+    @cached_property
+    def key(self) -> tuple:
+        return ("and", _unordered(self.children))
+
+    @cached_property
+    def scope(self) -> str:
+        return _widest(self.children)
+
+
+@dataclass(frozen=True, eq=False)
+class Or:
+    """True where any child is True."""
+
+    children: tuple
+
+    @cached_property
+    def key(self) -> tuple:
+        return ("or", _unordered(self.children))
+
+    @cached_property
+    def scope(self) -> str:
+        return _widest(self.children)
+
+
+@dataclass(frozen=True, eq=False)
+class Sustained:
+    """True where *child* has been True for ``days`` consecutive bars."""
+
+    child: "Node"
+    days: int
+
+    @cached_property
+    def key(self) -> tuple:
+        return ("sustained", self.days, self.child.key)
+
+    @property
+    def scope(self) -> str:
+        # Reads each symbol's history; its child is evaluated per symbol
+        return SYMBOL
+
+
+Node = Union[Leaf, And, Or, Sustained]
+
+
+def _unordered(children: tuple) -> tuple:
+    return tuple(sorted((child.key for child in children), key=repr))
+
+
+def _widest(children: tuple) -> str:
+    return max(
+        (child.scope for child in children),
+        key=lambda scope: _RANK[scope],
+        default=ROW,
+    )
+
+
+def as_node(func: "SignalFunc | Node") -> "Node":
+    """The tree of a ``Signal``, a node itself, or a leaf wrapping *func*."""
+    if isinstance(func, (Leaf, And, Or, Sustained)):
+        return func
+    node = getattr(func, "node", None)
+    if isinstance(node, (Leaf, And, Or, Sustained)):
+        return node
+    return Leaf(func)
+
+
+# ---------------------------------------------------------------------------
+# Named leaves and serialisation
+# ---------------------------------------------------------------------------
+
+
+def named(
+    name: str,
+    params: Mapping[str, object] | None = None,
+    factories: Mapping[str, Callable[..., SignalFunc]] | None = None,
+) -> Leaf:
+    """Build the signal *name* with *params* as a named leaf.
+
+    Args:
+        name: A signal factory of ``optopsy.signals`` (e.g. ``"rsi_below"``),
+            or a key of *factories*.
+        params: Keyword arguments for the factory.  Library factories fill
+            in their defaults, so ``rsi_below`` and ``rsi_below(period=14)``
+            are the same leaf.
+        factories: Maps names to factories taking keyword arguments (e.g.
+            the chat UI's ``SIGNAL_REGISTRY``), instead of the library's.
+
+    Raises:
+        ValueError: If *name* is unknown or *params* do not fit its factory.
+    """
+    params = dict(params or {})
+    if factories is not None:
+        if name not in factories:
+            raise ValueError(f"Unknown signal '{name}'")
+        return Leaf(factories[name](**params), name, params)
+
+    import optopsy.signals as signals
+
+    if name not in signals.__all__ or name in _NOT_FACTORIES:
+        raise ValueError(f"Unknown signal '{name}'")
+    factory = getattr(signals, name)
+    sig = inspect.signature(factory)
+    args: list = []
+    for param in sig.parameters.values():
+        # day_of_week(*days) takes {"days": [...]}
+        if param.kind is param.VAR_POSITIONAL and param.name in params:
+            args = list(params.pop(param.name))
+    try:
+        bound = sig.bind(*args, **params)
+    except TypeError as exc:
+        raise ValueError(f"Invalid parameters for signal '{name}': {exc}") from exc
+    bound.apply_defaults()
+    canonical = {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in bound.arguments.items()
+    }
+    return Leaf(factory(*bound.args, **bound.kwargs), name, canonical)
+
+
+def to_dict(node: "Node") -> dict:
+    """JSON-serialisable form of *node*.
+
+    Raises:
+        ValueError: If a leaf is an unnamed function.
+    """
+    if isinstance(node, Leaf):
+        if node.name is None:
+            raise ValueError(
+                f"Cannot serialise signal function {node.func!r}; build it "
+                f"by name with signal(name, **params) instead."
+            )
+        return {"signal": node.name, "params": dict(node.params)}
+    if isinstance(node, Sustained):
+        return {"sustained": to_dict(node.child), "days": node.days}
+    kind = "and" if isinstance(node, And) else "or"
+    return {kind: [to_dict(child) for child in node.children]}
+
+
+def from_dict(
+    spec: Mapping, factories: Mapping[str, Callable[..., SignalFunc]] | None = None
+) -> "Node":
+    """Rebuild a tree serialised by ``to_dict()``; see ``named()``."""
+    if "signal" in spec:
+        return named(spec["signal"], spec.get("params"), factories)
+    if "sustained" in spec:
+        days = int(spec.get("days", 1))
+        if days < 1:
+            raise ValueError(f"days must be >= 1, got {days}")
+        return Sustained(from_dict(spec["sustained"], factories), days)
+    for kind, cls in (("and", And), ("or", Or)):
+        if kind in spec:
+            return cls(tuple(from_dict(child, factories) for child in spec[kind]))
+    raise ValueError(f"Unknown signal expression: {dict(spec)!r}")
+
+
+# ---------------------------------------------------------------------------
+# Optimiser
+# ---------------------------------------------------------------------------
+
+
+def optimize(node: "Node") -> "Node":
+    """Rewrite *node* into an equivalent tree that is cheaper to evaluate."""
+    if isinstance(node, Leaf):
+        return node
+    if isinstance(node, Sustained):
+        child = optimize(node.child)
+        if isinstance(child, Sustained):
+            return Sustained(child.child, child.days + node.days - 1)
+        return Sustained(child, node.days)
+
+    kind = type(node)
+    children: list = []
+    for child in map(optimize, node.children):
+        children.extend(child.children if isinstance(child, kind) else [child])
+    children = _fuse_sustained(kind, children)
+    unique = list({child.key: child for child in reversed(children)}.values())
+    unique.reverse()
+    unique.sort(key=lambda child: _RANK[child.scope])
+    if len(unique) == 1:
+        return unique[0]
+    return kind(tuple(unique))
+
+
+def _fuse_sustained(kind: type, children: list) -> list:
+    """Merge the ``Sustained`` children of an ``And`` / ``Or``."""
+    windows: dict = {}
+    others = []
+    for child in children:
+        if not isinstance(child, Sustained):
+            others.append(child)
+            continue
+        # x held for the longer window implies it held for the shorter
+        best = windows.get(child.child.key)
+        pick = max if kind is And else min
+        if best is None or pick(best.days, child.days) != best.days:
+            windows[child.child.key] = child
+    sustained = list(windows.values())
+    if kind is And:
+        by_days: dict = {}
+        for child in sustained:
+            by_days.setdefault(child.days, []).append(child)
+        sustained = [
+            group[0]
+            if len(group) == 1
+            else Sustained(optimize(And(tuple(c.child for c in group))), days)
+            for days, group in by_days.items()
+        ]
+    return others + sustained
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+def evaluate(node: "Node", data: pd.DataFrame) -> "pd.Series[bool]":
+    """Boolean Series of *node* over *data* (optimise *node* first)."""
+    if data.empty:
+        return pd.Series(False, index=data.index, dtype=bool)
+    run = _Run(data)
+    with evaluation():
+        result = run.eval(node)
+    # Named like its leaves' results when they agree, as ``a & b`` would be
+    name = run.names.pop() if len(run.names) == 1 else None
+    return pd.Series(result, index=data.index, name=name)
+
+
+class _Run:
+    """One evaluation of a tree over one frame.
+
+    Results are boolean arrays over the rows of the frame.  A node given an
+    *active* mask only needs to be right on those rows and is False
+    elsewhere; results computed for every row are memoized by node key.
+    """
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+        self.memo: dict = {}
+        self.names: set = set()
+
+    @cached_property
+    def codes(self) -> np.ndarray:
+        return pd.factorize(self.data["underlying_symbol"])[0]
+
+    def eval(
+        self,
+        node: "Node",
+        active: np.ndarray | None = None,
+        per_symbol: bool = False,
+    ) -> np.ndarray:
+        # Unscoped functions differ when evaluated per symbol (in sustained)
+        memo_key = (node.key, per_symbol) if node.scope == FRAME else node.key
+        cached = self.memo.get(memo_key)
+        if cached is not None:
+            return cached
+        if active is not None and active.all():
+            active = None
+        if isinstance(node, Leaf):
+            result, complete = self._leaf(node, active, per_symbol)
+        elif isinstance(node, And):
+            result, complete = self._and(node, active, per_symbol), active is None
+        elif isinstance(node, Or):
+            result, complete = self._or(node, active, per_symbol), active is None
+        else:
+            result, complete = self._sustained(node, active), active is None
+        if complete:
+            self.memo[memo_key] = result
+        return result
+
+    def _leaf(
+        self, node: Leaf, active: np.ndarray | None, per_symbol: bool
+    ) -> tuple[np.ndarray, bool]:
+        scope = node.scope
+        if scope == FRAME:
+            if per_symbol:
+                return self._call(_per_symbol(node.func), self.data), True
+            return self._call(node.func, self.data), True
+        rows = None if active is None else self._rows(active, scope)
+        if rows is None or rows.all():
+            return self._call(node.func, self.data), True
+        out = np.zeros(len(self.data), dtype=bool)
+        if rows.any():
+            digest = hashlib.sha256(np.packbits(rows).tobytes()).hexdigest()[:16]
+            subset = bind(self.data, self.data[rows], rows=digest)
+            out[rows] = self._call(node.func, subset)
+        return out, False
+
+    def _and(
+        self, node: And, active: np.ndarray | None, per_symbol: bool
+    ) -> np.ndarray:
+        result = (
+            np.ones(len(self.data), dtype=bool) if active is None else active.copy()
+        )
+        for child in node.children:
+            result &= self.eval(child, result, per_symbol)
+            if not result.any():
+                break
+        return result
+
+    def _or(self, node: Or, active: np.ndarray | None, per_symbol: bool) -> np.ndarray:
+        result = np.zeros(len(self.data), dtype=bool)
+        undecided = (
+            np.ones(len(self.data), dtype=bool) if active is None else active.copy()
+        )
+        for child in node.children:
+            result |= self.eval(child, undecided, per_symbol)
+            undecided &= ~result
+            if not undecided.any():
+                break
+        return result if active is None else result & active
+
+    def _sustained(self, node: Sustained, active: np.ndarray | None) -> np.ndarray:
+        rows = None if active is None else self._rows(active, SYMBOL)
+        held = self.eval(node.child, rows, per_symbol=True)
+        frame, segs, order = symbol_segments(self.data)
+        if frame.empty:
+            return np.zeros(len(self.data), dtype=bool)
+        values = held if order is None else held[order]
+        streak = rolling(pd.Series(values.astype(np.int8)), segs, node.days).min()
+        return scatter(streak == 1, order, self.data.index).to_numpy()
+
+    def _rows(self, active: np.ndarray, scope: str) -> np.ndarray:
+        """Rows a node of *scope* must see to decide the *active* rows."""
+        if scope == ROW:
+            return active
+        symbols = np.unique(self.codes[active])
+        return np.isin(self.codes, symbols[symbols >= 0])
+
+    def _call(self, func: SignalFunc, data: pd.DataFrame) -> np.ndarray:
+        result = func(data)
+        self.names.add(result.name)
+        if not result.index.equals(data.index):
+            result = result.reindex(data.index)
+        return result.fillna(False).astype(bool).to_numpy()
+
+
+def _per_symbol(func: SignalFunc) -> SignalFunc:
+    def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
+        return _groupby_symbol(data, lambda group: func(group).astype(bool))
+
+    return _signal
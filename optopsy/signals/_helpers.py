@@ -4,14 +4,33 @@ All signal modules import from here to avoid circular dependencies.
 """
 
 import operator
-from typing import Callable
+from typing import Any, Callable, TypeGuard, TypeVar
 
 import pandas as pd
 
+from ._cache import cached_indicator, symbol_groups, symbol_segments
+from ._vectorized import INDICATORS, Segments, scatter
+from ._vectorized import shift as _segment_shift
+
 # Signal function type: takes a DataFrame with (underlying_symbol, quote_date,
 # close) columns and returns a boolean Series indicating valid entry/exit dates.
 SignalFunc = Callable[[pd.DataFrame], "pd.Series[bool]"]
 
+T = TypeVar("T")
+
+# How much of a frame a signal reads to decide one row.  The expression
+# optimiser (``_expr``) runs cheap signals first and evaluates the rest on
+# the rows — or the symbols — still undecided.
+ROW = "row"  # the row alone (calendar days, fixed price levels)
+SYMBOL = "symbol"  # every row of the row's symbol (indicators)
+FRAME = "frame"  # anything; assumed for signal functions without a scope
+
+
+def _scoped(func: SignalFunc, scope: str) -> SignalFunc:
+    """Record on *func* the scope it reads (``ROW``, ``SYMBOL`` or ``FRAME``)."""
+    func.signal_scope = scope  # type: ignore[attr-defined]
+    return func
+
 
 # ---------------------------------------------------------------------------
 # Per-symbol grouping
@@ -25,19 +44,60 @@ def _groupby_symbol(
     """Apply *compute_group* per underlying_symbol and concatenate results.
 
     Handles the empty-DataFrame and empty-groups (all-NA symbols) edge cases
-    that every per-symbol signal needs.
+    that every per-symbol signal needs.  The split is memoized (see
+    ``_cache.symbol_groups``), so the signals of a composed signal share
+    one groupby pass.
     """
     if data.empty:
         return pd.Series(False, index=data.index, dtype=bool)
-    parts = [
-        compute_group(group)
-        for _, group in data.groupby("underlying_symbol", sort=False)
-    ]
+    parts = [compute_group(group) for _, group in symbol_groups(data)]
     if not parts:
         return pd.Series(False, index=data.index, dtype=bool)
     return pd.concat(parts).reindex(data.index, fill_value=False)
 
 
+def _memoized(key: tuple | None, group: pd.DataFrame, compute: Callable[[], T]) -> T:
+    """Return ``compute()``, memoized per symbol when *key* names the indicator.
+
+    *key* is ``(name, *params)`` and must identify what ``compute`` returns
+    for *group*: signals computing the same indicator share a key, and
+    different indicators (or different return shapes) never do.
+    """
+    if key is None:
+        return compute()
+    return cached_indicator(key[0], key[1:], group, compute)
+
+
+def _whole_frame(key: tuple | None) -> TypeGuard[tuple]:
+    """Whether *key* names an indicator with a whole-frame implementation."""
+    return key is not None and key[0] in INDICATORS
+
+
+def _over_symbols(
+    data: pd.DataFrame,
+    key: tuple,
+    evaluate: Callable[[pd.DataFrame, Segments, Any], "pd.Series[bool]"],
+) -> "pd.Series[bool]":
+    """Evaluate the whole-frame indicator named by *key* for all symbols at once.
+
+    The counterpart of ``_groupby_symbol`` for the indicators in
+    ``_vectorized.INDICATORS``: the frame is ordered by symbol once, the
+    indicator is computed over it in one pass (memoized like ``_memoized``)
+    and ``evaluate(frame, segments, indicator)`` turns it into a boolean
+    Series over that frame.
+    """
+    if data.empty:
+        return pd.Series(False, index=data.index, dtype=bool)
+    frame, segs, order = symbol_segments(data)
+    if frame.empty:
+        return pd.Series(False, index=data.index, dtype=bool)
+    compute = INDICATORS[key[0]]
+    indicator = cached_indicator(
+        key[0], key[1:], frame, lambda: compute(frame, segs, *key[1:])
+    )
+    return scatter(evaluate(frame, segs, indicator), order, data.index)
+
+
 # ---------------------------------------------------------------------------
 # Signal skeleton builders
 # ---------------------------------------------------------------------------
@@ -46,63 +106,94 @@ def _groupby_symbol(
 def _per_symbol_signal(
     indicator_fn: Callable[[pd.Series], pd.Series],
     compare_fn: Callable[[pd.Series, pd.Series], "pd.Series[bool]"],
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a signal that computes an indicator per symbol and applies a comparison.
 
     This is the shared skeleton behind RSI, SMA, and similar per-symbol signals.
-    NaN indicator values default to False (never trigger a signal).
+    NaN indicator values default to False (never trigger a signal).  When
+    *key* names a whole-frame indicator (see ``_vectorized``), it is
+    computed for all symbols at once instead of calling *indicator_fn*.
 
     Args:
         indicator_fn: Takes a price Series, returns an indicator Series (or None)
         compare_fn: Takes (prices, indicator), returns a boolean Series
+        key: ``(name, *params)`` of the indicator, to memoize it per symbol
+            (see ``_memoized``)
     """
 
+    def _compare(
+        frame: pd.DataFrame, indicator: "pd.Series | None"
+    ) -> "pd.Series[bool]":
+        prices = _get_close(frame)
+        if prices is None or indicator is None:
+            return pd.Series(False, index=frame.index)
+        return compare_fn(prices, indicator).fillna(False)
+
     def signal(data: pd.DataFrame) -> "pd.Series[bool]":
+        if _whole_frame(key):
+            return _over_symbols(data, key, lambda frame, _, ind: _compare(frame, ind))
+
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
             prices = _get_close(group)
             if prices is None:
                 return pd.Series(False, index=group.index)
-            indicator = indicator_fn(prices)
-            if indicator is None:
-                return pd.Series(False, index=group.index)
-            return compare_fn(prices, indicator).fillna(False)
+            return _compare(group, _memoized(key, group, lambda: indicator_fn(prices)))
 
         return _groupby_symbol(data, _compute_group)
 
-    return signal
+    return _scoped(signal, SYMBOL)
 
 
 def _crossover_signal(
     compute_lines_fn: Callable[[pd.Series], tuple[pd.Series | None, pd.Series | None]],
     above: bool,
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a crossover signal that fires when line_a crosses line_b.
 
-    Shared skeleton for MACD, EMA, and similar crossover signals.
+    Shared skeleton for MACD, EMA, and similar crossover signals.  Whole-frame
+    indicators are handled as in ``_per_symbol_signal``.
 
     Args:
         compute_lines_fn: Takes prices, returns (line_a, line_b) or (None, None)
         above: True -> line_a crosses above line_b; False -> line_a crosses below
+        key: ``(name, *params)`` of the lines, to memoize them per symbol
     """
     if above:
         cur_op, prev_op = operator.gt, operator.le
     else:
         cur_op, prev_op = operator.lt, operator.ge
 
+    def _cross(
+        frame: pd.DataFrame, lines: tuple, shift: Callable[[pd.Series], pd.Series]
+    ) -> "pd.Series[bool]":
+        line_a, line_b = lines
+        if line_a is None or line_b is None:
+            return pd.Series(False, index=frame.index)
+        cross = cur_op(line_a, line_b) & prev_op(shift(line_a), shift(line_b))
+        return cross.fillna(False)
+
     def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
+        if _whole_frame(key):
+            return _over_symbols(
+                data,
+                key,
+                lambda frame, segs, lines: _cross(
+                    frame, lines, lambda line: _segment_shift(line, segs)
+                ),
+            )
+
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
             prices = _get_close(group)
             if prices is None:
                 return pd.Series(False, index=group.index)
-            line_a, line_b = compute_lines_fn(prices)
-            if line_a is None or line_b is None:
-                return pd.Series(False, index=group.index)
-            cross = cur_op(line_a, line_b) & prev_op(line_a.shift(1), line_b.shift(1))
-            return cross.fillna(False)
+            lines = _memoized(key, group, lambda: compute_lines_fn(prices))
+            return _cross(group, lines, lambda line: line.shift(1))
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -113,6 +204,7 @@ def _crossover_signal(
 def _ohlcv_signal(
     indicator_fn: Callable[[pd.DataFrame], "pd.Series | None"],
     compare_fn: Callable[["pd.Series"], "pd.Series[bool]"],
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a signal from an OHLCV-based indicator per symbol.
 
@@ -123,18 +215,19 @@ def _ohlcv_signal(
     Args:
         indicator_fn: Takes a group DataFrame, returns an indicator Series (or None)
         compare_fn: Takes the indicator Series, returns a boolean Series
+        key: ``(name, *params)`` of the indicator, to memoize it per symbol
     """
 
     def signal(data: pd.DataFrame) -> "pd.Series[bool]":
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            indicator = indicator_fn(group)
+            indicator = _memoized(key, group, lambda: indicator_fn(group))
             if indicator is None:
                 return pd.Series(False, index=group.index)
             return compare_fn(indicator).fillna(False)
 
         return _groupby_symbol(data, _compute_group)
 
-    return signal
+    return _scoped(signal, SYMBOL)
 
 
 def _ohlcv_crossover_signal(
@@ -142,6 +235,7 @@ def _ohlcv_crossover_signal(
         [pd.DataFrame], tuple["pd.Series | None", "pd.Series | None"]
     ],
     above: bool,
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a crossover signal from OHLCV data.
 
@@ -155,7 +249,7 @@ def _ohlcv_crossover_signal(
 
     def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            line_a, line_b = compute_lines_fn(group)
+            line_a, line_b = _memoized(key, group, lambda: compute_lines_fn(group))
             if line_a is None or line_b is None:
                 return pd.Series(False, index=group.index)
             cross = cur_op(line_a, line_b) & prev_op(line_a.shift(1), line_b.shift(1))
@@ -163,7 +257,7 @@ def _ohlcv_crossover_signal(
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def _band_signal(
@@ -171,15 +265,18 @@ def _band_signal(
         [pd.DataFrame], tuple["pd.Series | None", "pd.Series | None"]
     ],
     above: bool,
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a band-breakout signal (price above upper / below lower).
 
     Generalised version of the Bollinger Band pattern for Keltner, Donchian, etc.
+    Whole-frame indicators are handled as in ``_per_symbol_signal``.
 
     Args:
         compute_bands_fn: Takes a group DataFrame, returns (upper_band, lower_band).
                           Either may be None on failure.
         above: True -> price > upper band; False -> price < lower band
+        key: ``(name, *params)`` of the bands, to memoize them per symbol
     """
     if above:
         fill_val = float("inf")
@@ -188,25 +285,33 @@ def _band_signal(
         fill_val = float("-inf")
         cmp = operator.lt
 
+    def _breakout(frame: pd.DataFrame, bands: tuple) -> "pd.Series[bool]":
+        upper, lower = bands
+        band = upper if above else lower
+        prices = _get_close(frame)
+        if band is None or prices is None:
+            return pd.Series(False, index=frame.index)
+        return cmp(prices, band.fillna(fill_val)).fillna(False)
+
     def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
+        if _whole_frame(key):
+            return _over_symbols(
+                data, key, lambda frame, _, bands: _breakout(frame, bands)
+            )
+
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            upper, lower = compute_bands_fn(group)
-            band = upper if above else lower
-            if band is None:
-                return pd.Series(False, index=group.index)
-            prices = _get_close(group)
-            if prices is None:
-                return pd.Series(False, index=group.index)
-            return cmp(prices, band.fillna(fill_val)).fillna(False)
+            bands = _memoized(key, group, lambda: compute_bands_fn(group))
+            return _breakout(group, bands)
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def _direction_signal(
     compute_fn: Callable[[pd.DataFrame], "pd.Series | None"],
     buy: bool,
+    key: tuple | None = None,
 ) -> SignalFunc:
     """Build a direction-change signal (Supertrend flip, PSAR flip).
 
@@ -218,12 +323,13 @@ def _direction_signal(
                     Returns None on failure.
         buy: True -> fires when direction changes to bullish (1);
              False -> fires when direction changes to bearish (-1)
+        key: ``(name, *params)`` of the direction, to memoize it per symbol
     """
     target = 1 if buy else -1
 
     def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
         def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            direction = compute_fn(group)
+            direction = _memoized(key, group, lambda: compute_fn(group))
             if direction is None:
                 return pd.Series(False, index=group.index)
             # Fire when direction changes to target value
@@ -232,7 +338,7 @@ def _direction_signal(
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,350 @@
+"""Whole-frame evaluation of common indicators across all symbols at once.
+
+The signal skeletons in ``_helpers`` split a frame by ``underlying_symbol``
+and run a pandas_ta indicator once per symbol.  For the indicators every
+strategy reaches for — SMA, EMA, RSI, MACD, Bollinger Bands, ATR and
+Donchian Channels — that per-symbol loop dominates: with hundreds of
+symbols, Python overhead costs more than the arithmetic.
+
+This module computes them over the whole frame in one pass instead.  The
+frame is ordered so each symbol's rows are contiguous (``split()``), and
+every rolling, EWM and shift step runs through a kernel that restarts at
+symbol boundaries (``Segments``): rolling windows are clipped to the
+current symbol with a custom ``BaseIndexer`` and EWMs run through
+``groupby().ewm()``, so both reach pandas' compiled window routines in a
+single call.  Each indicator mirrors the pandas_ta formula it replaces —
+warm-up NaNs, the SMA seed of ``ta.ema``, Wilder smoothing in ``ta.rma``,
+and ``verify_series()`` rejecting symbols with too few rows — so results
+match the per-symbol path exactly.  That holds for the pandas-ta-classic
+0.3 series allowed by ``pyproject.toml``; the parity tests in
+``tests/test_signals_vectorized.py`` must pass before the bound is raised.
+
+``INDICATORS`` maps a signal's indicator key name (see ``_memoized``) to
+its whole-frame implementation; indicators without one keep the
+per-symbol path.
+"""
+
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas.api.indexers import BaseIndexer
+
+# ---------------------------------------------------------------------------
+# Symbol segments
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, eq=False)
+class Segments:
+    """Contiguous runs of rows holding one symbol each.
+
+    Attributes:
+        bounds: Segment ``i`` spans rows ``bounds[i]:bounds[i + 1]``.
+    """
+
+    bounds: np.ndarray
+
+    @cached_property
+    def ids(self) -> np.ndarray:
+        """Segment number of every row."""
+        return np.repeat(np.arange(len(self.bounds) - 1), np.diff(self.bounds))
+
+    @cached_property
+    def starts(self) -> np.ndarray:
+        """First row of the segment of every row."""
+        return self.bounds[:-1][self.ids]
+
+    @cached_property
+    def position(self) -> np.ndarray:
+        """Offset of every row within its segment."""
+        return np.arange(len(self.ids)) - self.starts
+
+    def shorter_than(self, length: int) -> np.ndarray:
+        """Mask of rows whose segment has fewer than *length* rows."""
+        return (np.diff(self.bounds) < length)[self.ids]
+
+
+def split(data: pd.DataFrame) -> tuple[pd.DataFrame, Segments, np.ndarray | None]:
+    """Order *data* so each symbol's rows are contiguous.
+
+    Rows keep their relative order within a symbol, as with ``groupby``,
+    and rows with a missing symbol are dropped.
+
+    Returns:
+        ``(frame, segments, order)``: *order* holds the positions in *data*
+        of the rows of *frame*, or is None when *frame* is *data* itself
+        (already contiguous, as ``signal_dates`` sorts it).
+    """
+    codes, _ = pd.factorize(data["underlying_symbol"])
+    order = None
+    if len(codes) and (codes[0] < 0 or bool((np.diff(codes) < 0).any())):
+        order = np.argsort(codes, kind="stable")
+        order = order[codes[order] >= 0]
+        codes = codes[order]
+    frame = data if order is None else data.iloc[order]
+    changes = np.flatnonzero(np.diff(codes)) + 1
+    bounds = np.concatenate(([0], changes, [len(codes)])) if len(codes) else [0]
+    return frame, Segments(np.asarray(bounds, dtype=np.int64)), order
+
+
+def scatter(
+    values: "pd.Series[bool]", order: np.ndarray | None, index: pd.Index
+) -> "pd.Series[bool]":
+    """Place per-row results of ``split()``'s frame back on *index*.
+
+    Rows dropped by ``split()`` are False.
+    """
+    if order is None:
+        return pd.Series(values.to_numpy(dtype=bool), index=index)
+    out = np.zeros(len(index), dtype=bool)
+    out[order] = values.to_numpy(dtype=bool)
+    return pd.Series(out, index=index)
+
+
+# ---------------------------------------------------------------------------
+# Segment-aware kernels
+# ---------------------------------------------------------------------------
+
+
+class _SegmentWindow(BaseIndexer):
+    """Trailing windows of ``window_size`` rows, clipped to the row's segment."""
+
+    window_size: int
+    starts: np.ndarray
+
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: int | None = None,
+        center: bool | None = None,
+        closed: str | None = None,
+        step: int | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.starts)
+        return start, end
+
+
+def rolling(
+    values: pd.Series, segs: Segments, window: int, min_periods: int | None = None
+) -> "pd.api.typing.Rolling":
+    """``values.rolling(window, min_periods)`` restarted at every segment."""
+    indexer = _SegmentWindow(window_size=window, starts=segs.starts)
+    return values.rolling(
+        indexer, min_periods=window if min_periods is None else min_periods
+    )
+
+
+def ewm(values: pd.Series, segs: Segments, **kwargs) -> pd.Series:
+    """``values.ewm(**kwargs).mean()`` restarted at every segment."""
+    result = values.groupby(segs.ids, sort=False).ewm(**kwargs).mean()
+    return pd.Series(result.to_numpy(), index=values.index)
+
+
+def shift(values: pd.Series, segs: Segments, periods: int = 1) -> pd.Series:
+    """``values.shift(periods)`` within every segment."""
+    shifted = values.shift(periods)
+    return shifted.mask(segs.position < periods)
+
+
+def _blank_short(values: pd.Series, segs: Segments, length: int) -> pd.Series:
+    """NaN out segments pandas_ta would reject as shorter than *length*."""
+    short = segs.shorter_than(length)
+    return values.mask(short) if short.any() else values
+
+
+def _float(series: pd.Series) -> pd.Series:
+    return pd.Series(
+        series.to_numpy(dtype=np.float64, na_value=np.nan), index=series.index
+    )
+
+
+# ---------------------------------------------------------------------------
+# Indicators (each mirrors its pandas_ta_classic counterpart)
+# ---------------------------------------------------------------------------
+
+
+def sma(close: pd.Series, segs: Segments, length: int) -> pd.Series:
+    """``ta.sma(close, length)``."""
+    return _blank_short(rolling(close, segs, length).mean(), segs, length)
+
+
+def ema(
+    close: pd.Series, segs: Segments, length: int, begin: np.ndarray | None = None
+) -> pd.Series:
+    """``ta.ema(close, length)``: an EWM seeded with the first window's mean.
+
+    *begin* holds, per row, the first row of the series the EMA runs over
+    (the segment start by default); rows before it are NaN.
+    """
+    if begin is None:
+        begin, position = segs.starts, segs.position
+    else:
+        position = np.arange(len(close)) - begin
+    seed = rolling(close, segs, length, min_periods=1).mean()
+    seeded = close.where(position >= length, seed).mask(position < length - 1)
+    result = ewm(seeded, segs, span=length, adjust=False)
+    return _blank_short(result.mask(position < 0), segs, length)
+
+
+def rma(close: pd.Series, segs: Segments, length: int) -> pd.Series:
+    """``ta.rma(close, length)``: Wilder's moving average."""
+    alpha = (1.0 / length) if length > 0 else 0.5
+    return ewm(close, segs, alpha=alpha, min_periods=length)
+
+
+def rsi(close: pd.Series, segs: Segments, length: int) -> pd.Series:
+    """``ta.rsi(close, length)``, NaN where pandas_ta returns None."""
+    change = close - shift(close, segs)
+    positive_avg = rma(change.clip(lower=0), segs, length)
+    negative_avg = rma(change.clip(upper=0), segs, length)
+    result = 100 * positive_avg / (positive_avg + negative_avg.abs())
+    return _blank_short(result, segs, length)
+
+
+def macd(
+    close: pd.Series, segs: Segments, fast: int, slow: int, signal: int
+) -> tuple[pd.Series, pd.Series]:
+    """``(MACD line, signal line)`` of ``ta.macd(close, fast, slow, signal)``."""
+    if slow < fast:
+        fast, slow = slow, fast
+    line = ema(close, segs, fast) - ema(close, segs, slow)
+    # The signal line is an EMA of the MACD line from its first valid value
+    rows = np.arange(len(line))
+    first = np.where(line.notna(), rows, len(line))
+    first = np.minimum.reduceat(first, segs.bounds[:-1]) if len(rows) else first
+    begin = np.minimum(first[segs.ids], segs.starts + np.diff(segs.bounds)[segs.ids])
+    signal_line = ema(line, segs, signal, begin=begin)
+    short = max(fast, slow, signal)
+    return _blank_short(line, segs, short), _blank_short(signal_line, segs, short)
+
+
+def bbands(
+    close: pd.Series, segs: Segments, length: int, std: float
+) -> tuple[pd.Series, pd.Series]:
+    """``(upper, lower)`` bands of ``ta.bbands(close, length, std)``."""
+    # ta.bbands uses ddof=0; ta.variance treats a length below 2 as 30
+    deviation = rolling(close, segs, length if length > 1 else 30).std(ddof=0)
+    mid = sma(close, segs, length)
+    upper = _blank_short(mid + std * deviation, segs, length)
+    lower = _blank_short(mid - std * deviation, segs, length)
+    return upper, lower
+
+
+def _non_zero_range(high: pd.Series, low: pd.Series, segs: Segments) -> pd.Series:
+    """``high - low``, plus epsilon in segments where any difference is zero."""
+    diff = high - low
+    zero = (diff == 0).to_numpy()
+    if zero.any():
+        segment_zero = np.logical_or.reduceat(zero, segs.bounds[:-1])[segs.ids]
+        diff = diff + np.where(segment_zero, sys.float_info.epsilon, 0.0)
+    return diff
+
+
+def atr(
+    high: pd.Series, low: pd.Series, close: pd.Series, segs: Segments, length: int
+) -> pd.Series:
+    """``ta.atr(high, low, close, length)``, NaN where pandas_ta returns None."""
+    prev_close = shift(close, segs)
+    ranges = [
+        _non_zero_range(high, low, segs).abs(),
+        (high - prev_close).abs(),
+        (prev_close - low).abs(),
+    ]
+    true_range = np.fmax(np.fmax(ranges[0], ranges[1]), ranges[2])
+    true_range = true_range.mask(segs.position < 1)
+    return _blank_short(rma(true_range, segs, length), segs, length)
+
+
+def donchian(
+    high: pd.Series,
+    low: pd.Series,
+    segs: Segments,
+    lower_length: int,
+    upper_length: int,
+) -> tuple[pd.Series, pd.Series]:
+    """``(upper, lower)`` channels of ``ta.donchian(high, low, ...)``."""
+    length = max(lower_length, upper_length)
+    upper = _blank_short(rolling(high, segs, upper_length).max(), segs, length)
+    lower = _blank_short(rolling(low, segs, lower_length).min(), segs, length)
+    return upper, lower
+
+
+# ---------------------------------------------------------------------------
+# Signal indicators by key name
+# ---------------------------------------------------------------------------
+#
+# Each takes the frame from ``split()``, its segments and the key's
+# parameters, and returns what the signal's per-symbol compute function
+# returns for one symbol — for all symbols at once.
+
+
+def _close(frame: pd.DataFrame) -> "pd.Series | None":
+    return _float(frame["close"]) if "close" in frame.columns else None
+
+
+def _sma(frame: pd.DataFrame, segs: Segments, period: int) -> "pd.Series | None":
+    close = _close(frame)
+    return None if close is None else sma(close, segs, int(period))
+
+
+def _rsi(frame: pd.DataFrame, segs: Segments, period: int) -> "pd.Series | None":
+    close = _close(frame)
+    return None if close is None else rsi(close, segs, int(period))
+
+
+def _ema_lines(frame: pd.DataFrame, segs: Segments, fast: int, slow: int):
+    close = _close(frame)
+    if close is None:
+        return None, None
+    return ema(close, segs, int(fast)), ema(close, segs, int(slow))
+
+
+def _macd_lines(frame: pd.DataFrame, segs: Segments, fast: int, slow: int, signal: int):
+    close = _close(frame)
+    if close is None:
+        return None, None
+    return macd(close, segs, int(fast), int(slow), int(signal))
+
+
+def _bb_bands(frame: pd.DataFrame, segs: Segments, length: int, std: float):
+    close = _close(frame)
+    if close is None:
+        return None, None
+    return bbands(close, segs, int(length), float(std))
+
+
+def _atr(frame: pd.DataFrame, segs: Segments, period: int) -> "pd.Series | None":
+    close = _close(frame)
+    if close is None:
+        return None
+    has_hl = "high" in frame.columns and "low" in frame.columns
+    high = _float(frame["high"]) if has_hl else close
+    low = _float(frame["low"]) if has_hl else close
+    return atr(high, low, close, segs, int(period))
+
+
+def _donchian_bands(
+    frame: pd.DataFrame, segs: Segments, lower_length: int, upper_length: int
+):
+    close = _close(frame)
+    high = _float(frame["high"]) if "high" in frame.columns else close
+    low = _float(frame["low"]) if "low" in frame.columns else close
+    if high is None or low is None:
+        return None, None
+    return donchian(high, low, segs, int(lower_length), int(upper_length))
+
+
+INDICATORS: dict[str, Callable[..., object]] = {
+    "sma": _sma,
+    "rsi": _rsi,
+    "ema_lines": _ema_lines,
+    "macd_lines": _macd_lines,
+    "bb_bands": _bb_bands,
+    "atr": _atr,
+    "donchian_bands": _donchian_bands,
+}
@@ -2,7 +2,7 @@
 
 import pandas as pd
 
-from ._helpers import SignalFunc
+from ._helpers import ROW, SignalFunc, _scoped
 
 
 def day_of_week(*days: int) -> SignalFunc:
@@ -16,4 +16,4 @@ def day_of_week(*days: int) -> SignalFunc:
     def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
         return data["quote_date"].dt.dayofweek.isin(day_set)
 
-    return _signal
+    return _scoped(_signal, ROW)
@@ -33,6 +33,7 @@ def rsi_below(period: int = 14, threshold: float = 30) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: _compute_rsi(p, period),
         lambda _prices, rsi: rsi < threshold,
+        key=("rsi", period),
     )
 
 
@@ -41,6 +42,7 @@ def rsi_above(period: int = 14, threshold: float = 70) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: _compute_rsi(p, period),
         lambda _prices, rsi: rsi > threshold,
+        key=("rsi", period),
     )
 
 
@@ -70,7 +72,11 @@ def macd_cross_above(
 ) -> SignalFunc:
     """True when the MACD line crosses above the signal line (bullish momentum)."""
     fast, slow, signal_period = int(fast), int(slow), int(signal_period)
-    return _crossover_signal(_macd_lines(fast, slow, signal_period), above=True)
+    return _crossover_signal(
+        _macd_lines(fast, slow, signal_period),
+        above=True,
+        key=("macd_lines", fast, slow, signal_period),
+    )
 
 
 def macd_cross_below(
@@ -78,7 +84,11 @@ def macd_cross_below(
 ) -> SignalFunc:
     """True when the MACD line crosses below the signal line (bearish momentum)."""
     fast, slow, signal_period = int(fast), int(slow), int(signal_period)
-    return _crossover_signal(_macd_lines(fast, slow, signal_period), above=False)
+    return _crossover_signal(
+        _macd_lines(fast, slow, signal_period),
+        above=False,
+        key=("macd_lines", fast, slow, signal_period),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -102,7 +112,9 @@ def stoch_below(
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind < threshold, key=("stoch", k_period, d_period)
+    )
 
 
 def stoch_above(
@@ -121,7 +133,9 @@ def stoch_above(
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind > threshold, key=("stoch", k_period, d_period)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -150,7 +164,11 @@ def stochrsi_below(
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(
+        _indicator,
+        lambda ind: ind < threshold,
+        key=("stochrsi", period, rsi_period, k_smooth, d_smooth),
+    )
 
 
 def stochrsi_above(
@@ -174,7 +192,11 @@ def stochrsi_above(
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(
+        _indicator,
+        lambda ind: ind > threshold,
+        key=("stochrsi", period, rsi_period, k_smooth, d_smooth),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -193,7 +215,7 @@ def willr_below(period: int = 14, threshold: float = -80) -> SignalFunc:
         result = ta.willr(high, low, close, length=period)
         return result
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("willr", period))
 
 
 def willr_above(period: int = 14, threshold: float = -20) -> SignalFunc:
@@ -207,7 +229,7 @@ def willr_above(period: int = 14, threshold: float = -20) -> SignalFunc:
         result = ta.willr(high, low, close, length=period)
         return result
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("willr", period))
 
 
 # ---------------------------------------------------------------------------
@@ -225,7 +247,7 @@ def cci_below(period: int = 20, threshold: float = -100) -> SignalFunc:
         high, low, close = ohlc
         return ta.cci(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("cci", period))
 
 
 def cci_above(period: int = 20, threshold: float = 100) -> SignalFunc:
@@ -238,7 +260,7 @@ def cci_above(period: int = 20, threshold: float = 100) -> SignalFunc:
         high, low, close = ohlc
         return ta.cci(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("cci", period))
 
 
 # ---------------------------------------------------------------------------
@@ -251,6 +273,7 @@ def roc_above(period: int = 10, threshold: float = 0) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.roc(p, length=period),
         lambda _prices, roc: roc > threshold,
+        key=("roc", period),
     )
 
 
@@ -259,6 +282,7 @@ def roc_below(period: int = 10, threshold: float = 0) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.roc(p, length=period),
         lambda _prices, roc: roc < threshold,
+        key=("roc", period),
     )
 
 
@@ -289,14 +313,22 @@ def ppo_cross_above(
     fast: int = 12, slow: int = 26, signal_period: int = 9
 ) -> SignalFunc:
     """True when PPO line crosses above its signal line (bullish)."""
-    return _crossover_signal(_ppo_lines(fast, slow, signal_period), above=True)
+    return _crossover_signal(
+        _ppo_lines(fast, slow, signal_period),
+        above=True,
+        key=("ppo_lines", fast, slow, signal_period),
+    )
 
 
 def ppo_cross_below(
     fast: int = 12, slow: int = 26, signal_period: int = 9
 ) -> SignalFunc:
     """True when PPO line crosses below its signal line (bearish)."""
-    return _crossover_signal(_ppo_lines(fast, slow, signal_period), above=False)
+    return _crossover_signal(
+        _ppo_lines(fast, slow, signal_period),
+        above=False,
+        key=("ppo_lines", fast, slow, signal_period),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -326,14 +358,22 @@ def tsi_cross_above(
     long: int = 25, short: int = 13, signal_period: int = 13
 ) -> SignalFunc:
     """True when TSI crosses above its signal line (bullish)."""
-    return _crossover_signal(_tsi_lines(long, short, signal_period), above=True)
+    return _crossover_signal(
+        _tsi_lines(long, short, signal_period),
+        above=True,
+        key=("tsi_lines", long, short, signal_period),
+    )
 
 
 def tsi_cross_below(
     long: int = 25, short: int = 13, signal_period: int = 13
 ) -> SignalFunc:
     """True when TSI crosses below its signal line (bearish)."""
-    return _crossover_signal(_tsi_lines(long, short, signal_period), above=False)
+    return _crossover_signal(
+        _tsi_lines(long, short, signal_period),
+        above=False,
+        key=("tsi_lines", long, short, signal_period),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -346,6 +386,7 @@ def cmo_above(period: int = 14, threshold: float = 50) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.cmo(p, length=period),
         lambda _prices, cmo: cmo > threshold,
+        key=("cmo", period),
     )
 
 
@@ -354,6 +395,7 @@ def cmo_below(period: int = 14, threshold: float = -50) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.cmo(p, length=period),
         lambda _prices, cmo: cmo < threshold,
+        key=("cmo", period),
     )
 
 
@@ -374,7 +416,9 @@ def uo_above(
         high, low, close = ohlc
         return ta.uo(high, low, close, fast=fast, medium=medium, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind > threshold, key=("uo", fast, medium, slow)
+    )
 
 
 def uo_below(
@@ -389,7 +433,9 @@ def uo_below(
         high, low, close = ohlc
         return ta.uo(high, low, close, fast=fast, medium=medium, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind < threshold, key=("uo", fast, medium, slow)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -435,7 +481,11 @@ def squeeze_on(
         return result[sq_col]
 
     # SQZ column: 0 = squeeze on (BB inside KC), 1 = no squeeze
-    return _ohlcv_signal(_indicator, lambda ind: ind == 0)
+    return _ohlcv_signal(
+        _indicator,
+        lambda ind: ind == 0,
+        key=("squeeze", bb_length, bb_std, kc_length, kc_scalar),
+    )
 
 
 def squeeze_off(
@@ -473,7 +523,11 @@ def squeeze_off(
             return None
         return result[sq_col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind == 1)
+    return _ohlcv_signal(
+        _indicator,
+        lambda ind: ind == 1,
+        key=("squeeze", bb_length, bb_std, kc_length, kc_scalar),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -491,7 +545,9 @@ def ao_above(fast: int = 5, slow: int = 34, threshold: float = 0) -> SignalFunc:
         high, low = hl
         return ta.ao(high, low, fast=fast, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind > threshold, key=("ao", fast, slow)
+    )
 
 
 def ao_below(fast: int = 5, slow: int = 34, threshold: float = 0) -> SignalFunc:
@@ -504,7 +560,9 @@ def ao_below(fast: int = 5, slow: int = 34, threshold: float = 0) -> SignalFunc:
         high, low = hl
         return ta.ao(high, low, fast=fast, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind < threshold, key=("ao", fast, slow)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -534,14 +592,22 @@ def smi_cross_above(
     fast: int = 5, slow: int = 20, signal_period: int = 5
 ) -> SignalFunc:
     """True when SMI crosses above its signal line (bullish)."""
-    return _crossover_signal(_smi_lines(fast, slow, signal_period), above=True)
+    return _crossover_signal(
+        _smi_lines(fast, slow, signal_period),
+        above=True,
+        key=("smi_lines", fast, slow, signal_period),
+    )
 
 
 def smi_cross_below(
     fast: int = 5, slow: int = 20, signal_period: int = 5
 ) -> SignalFunc:
     """True when SMI crosses below its signal line (bearish)."""
-    return _crossover_signal(_smi_lines(fast, slow, signal_period), above=False)
+    return _crossover_signal(
+        _smi_lines(fast, slow, signal_period),
+        above=False,
+        key=("smi_lines", fast, slow, signal_period),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -565,12 +631,12 @@ def _kst_lines(
 
 def kst_cross_above() -> SignalFunc:
     """True when KST crosses above its signal line (bullish)."""
-    return _crossover_signal(_kst_lines, above=True)
+    return _crossover_signal(_kst_lines, above=True, key=("kst_lines",))
 
 
 def kst_cross_below() -> SignalFunc:
     """True when KST crosses below its signal line (bearish)."""
-    return _crossover_signal(_kst_lines, above=False)
+    return _crossover_signal(_kst_lines, above=False, key=("kst_lines",))
 
 
 # ---------------------------------------------------------------------------
@@ -599,9 +665,13 @@ def _fisher_lines(
 
 def fisher_cross_above(period: int = 9) -> SignalFunc:
     """True when Fisher Transform crosses above its signal line (bullish)."""
-    return _crossover_signal(_fisher_lines(period), above=True)
+    return _crossover_signal(
+        _fisher_lines(period), above=True, key=("fisher_lines", period)
+    )
 
 
 def fisher_cross_below(period: int = 9) -> SignalFunc:
     """True when Fisher Transform crosses below its signal line (bearish)."""
-    return _crossover_signal(_fisher_lines(period), above=False)
+    return _crossover_signal(
+        _fisher_lines(period), above=False, key=("fisher_lines", period)
+    )
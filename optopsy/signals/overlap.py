@@ -17,6 +17,7 @@ def sma_below(period: int = 20) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.sma(p, length=period),
         lambda prices, sma: prices < sma,
+        key=("sma", period),
     )
 
 
@@ -25,6 +26,7 @@ def sma_above(period: int = 20) -> SignalFunc:
     return _per_symbol_signal(
         lambda p: ta.sma(p, length=period),
         lambda prices, sma: prices > sma,
+        key=("sma", period),
     )
 
 
@@ -51,13 +53,17 @@ def _ema_lines(
 def ema_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when the fast EMA crosses above the slow EMA (bullish golden cross)."""
     fast, slow = int(fast), int(slow)
-    return _crossover_signal(_ema_lines(fast, slow), above=True)
+    return _crossover_signal(
+        _ema_lines(fast, slow), above=True, key=("ema_lines", fast, slow)
+    )
 
 
 def ema_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when the fast EMA crosses below the slow EMA (bearish death cross)."""
     fast, slow = int(fast), int(slow)
-    return _crossover_signal(_ema_lines(fast, slow), above=False)
+    return _crossover_signal(
+        _ema_lines(fast, slow), above=False, key=("ema_lines", fast, slow)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -80,12 +86,20 @@ def _dema_lines(
 
 def dema_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast DEMA crosses above slow DEMA (bullish)."""
-    return _crossover_signal(_dema_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _dema_lines(int(fast), int(slow)),
+        above=True,
+        key=("dema_lines", int(fast), int(slow)),
+    )
 
 
 def dema_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast DEMA crosses below slow DEMA (bearish)."""
-    return _crossover_signal(_dema_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _dema_lines(int(fast), int(slow)),
+        above=False,
+        key=("dema_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -108,12 +122,20 @@ def _tema_lines(
 
 def tema_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast TEMA crosses above slow TEMA (bullish)."""
-    return _crossover_signal(_tema_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _tema_lines(int(fast), int(slow)),
+        above=True,
+        key=("tema_lines", int(fast), int(slow)),
+    )
 
 
 def tema_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast TEMA crosses below slow TEMA (bearish)."""
-    return _crossover_signal(_tema_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _tema_lines(int(fast), int(slow)),
+        above=False,
+        key=("tema_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -136,12 +158,20 @@ def _hma_lines(
 
 def hma_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast HMA crosses above slow HMA (bullish)."""
-    return _crossover_signal(_hma_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _hma_lines(int(fast), int(slow)),
+        above=True,
+        key=("hma_lines", int(fast), int(slow)),
+    )
 
 
 def hma_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast HMA crosses below slow HMA (bearish)."""
-    return _crossover_signal(_hma_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _hma_lines(int(fast), int(slow)),
+        above=False,
+        key=("hma_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -164,12 +194,20 @@ def _kama_lines(
 
 def kama_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast KAMA crosses above slow KAMA (bullish)."""
-    return _crossover_signal(_kama_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _kama_lines(int(fast), int(slow)),
+        above=True,
+        key=("kama_lines", int(fast), int(slow)),
+    )
 
 
 def kama_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast KAMA crosses below slow KAMA (bearish)."""
-    return _crossover_signal(_kama_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _kama_lines(int(fast), int(slow)),
+        above=False,
+        key=("kama_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -192,12 +230,20 @@ def _wma_lines(
 
 def wma_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast WMA crosses above slow WMA (bullish)."""
-    return _crossover_signal(_wma_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _wma_lines(int(fast), int(slow)),
+        above=True,
+        key=("wma_lines", int(fast), int(slow)),
+    )
 
 
 def wma_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast WMA crosses below slow WMA (bearish)."""
-    return _crossover_signal(_wma_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _wma_lines(int(fast), int(slow)),
+        above=False,
+        key=("wma_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -220,12 +266,20 @@ def _zlma_lines(
 
 def zlma_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast ZLMA crosses above slow ZLMA (bullish)."""
-    return _crossover_signal(_zlma_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _zlma_lines(int(fast), int(slow)),
+        above=True,
+        key=("zlma_lines", int(fast), int(slow)),
+    )
 
 
 def zlma_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast ZLMA crosses below slow ZLMA (bearish)."""
-    return _crossover_signal(_zlma_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _zlma_lines(int(fast), int(slow)),
+        above=False,
+        key=("zlma_lines", int(fast), int(slow)),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -248,9 +302,17 @@ def _alma_lines(
 
 def alma_cross_above(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast ALMA crosses above slow ALMA (bullish)."""
-    return _crossover_signal(_alma_lines(int(fast), int(slow)), above=True)
+    return _crossover_signal(
+        _alma_lines(int(fast), int(slow)),
+        above=True,
+        key=("alma_lines", int(fast), int(slow)),
+    )
 
 
 def alma_cross_below(fast: int = 10, slow: int = 50) -> SignalFunc:
     """True when fast ALMA crosses below slow ALMA (bearish)."""
-    return _crossover_signal(_alma_lines(int(fast), int(slow)), above=False)
+    return _crossover_signal(
+        _alma_lines(int(fast), int(slow)),
+        above=False,
+        key=("alma_lines", int(fast), int(slow)),
+    )
@@ -3,6 +3,8 @@
 import pandas as pd
 
 from ._helpers import (
+    ROW,
+    SYMBOL,
     SignalFunc,
     _crossover_signal,
     _get_close,
@@ -11,6 +13,7 @@ from ._helpers import (
     _get_open,
     _groupby_symbol,
     _per_symbol_signal,
+    _scoped,
 )
 
 # ---------------------------------------------------------------------------
@@ -21,18 +24,24 @@ from ._helpers import (
 def price_above(level: float) -> SignalFunc:
     """True every bar where the close price is above *level*."""
     level = float(level)
-    return _per_symbol_signal(
-        lambda p: pd.Series(level, index=p.index),
-        lambda prices, lvl: prices > lvl,
+    return _scoped(
+        _per_symbol_signal(
+            lambda p: pd.Series(level, index=p.index),
+            lambda prices, lvl: prices > lvl,
+        ),
+        ROW,
     )
 
 
 def price_below(level: float) -> SignalFunc:
     """True every bar where the close price is below *level*."""
     level = float(level)
-    return _per_symbol_signal(
-        lambda p: pd.Series(level, index=p.index),
-        lambda prices, lvl: prices < lvl,
+    return _scoped(
+        _per_symbol_signal(
+            lambda p: pd.Series(level, index=p.index),
+            lambda prices, lvl: prices < lvl,
+        ),
+        ROW,
     )
 
 
@@ -79,7 +88,7 @@ def gap_up(pct: float = 0.5) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def gap_down(pct: float = 0.5) -> SignalFunc:
@@ -97,7 +106,7 @@ def gap_down(pct: float = 0.5) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -124,7 +133,7 @@ def high_of_n_days(period: int = 252) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def low_of_n_days(period: int = 252) -> SignalFunc:
@@ -146,7 +155,7 @@ def low_of_n_days(period: int = 252) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -171,7 +180,7 @@ def daily_return_above(pct: float = 1.0) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def daily_return_below(pct: float = -1.0) -> SignalFunc:
@@ -192,7 +201,7 @@ def daily_return_below(pct: float = -1.0) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -220,7 +229,7 @@ def drawdown_from_high(period: int = 20, pct: float = 5.0) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def rally_from_low(period: int = 20, pct: float = 5.0) -> SignalFunc:
@@ -243,7 +252,7 @@ def rally_from_low(period: int = 20, pct: float = 5.0) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 # ---------------------------------------------------------------------------
@@ -271,7 +280,7 @@ def consecutive_up(days: int = 3) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def consecutive_down(days: int = 3) -> SignalFunc:
@@ -294,4 +303,4 @@ def consecutive_down(days: int = 3) -> SignalFunc:
 
         return _groupby_symbol(data, _compute_group)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
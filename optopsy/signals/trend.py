@@ -37,7 +37,7 @@ def adx_above(period: int = 14, threshold: float = 25) -> SignalFunc:
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("adx", period))
 
 
 def adx_below(period: int = 14, threshold: float = 20) -> SignalFunc:
@@ -59,7 +59,7 @@ def adx_below(period: int = 14, threshold: float = 20) -> SignalFunc:
             return None
         return result[col]
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("adx", period))
 
 
 # ---------------------------------------------------------------------------
@@ -93,12 +93,16 @@ def _aroon_lines(
 
 def aroon_cross_above(period: int = 25) -> SignalFunc:
     """True when Aroon Up crosses above Aroon Down (bullish trend)."""
-    return _ohlcv_crossover_signal(_aroon_lines(period), above=True)
+    return _ohlcv_crossover_signal(
+        _aroon_lines(period), above=True, key=("aroon_lines", period)
+    )
 
 
 def aroon_cross_below(period: int = 25) -> SignalFunc:
     """True when Aroon Up crosses below Aroon Down (bearish trend)."""
-    return _ohlcv_crossover_signal(_aroon_lines(period), above=False)
+    return _ohlcv_crossover_signal(
+        _aroon_lines(period), above=False, key=("aroon_lines", period)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -126,12 +130,20 @@ def _supertrend_direction(period: int, multiplier: float):
 
 def supertrend_buy(period: int = 7, multiplier: float = 3.0) -> SignalFunc:
     """True when Supertrend flips to bullish (direction changes to 1)."""
-    return _direction_signal(_supertrend_direction(period, multiplier), buy=True)
+    return _direction_signal(
+        _supertrend_direction(period, multiplier),
+        buy=True,
+        key=("supertrend_direction", period, multiplier),
+    )
 
 
 def supertrend_sell(period: int = 7, multiplier: float = 3.0) -> SignalFunc:
     """True when Supertrend flips to bearish (direction changes to -1)."""
-    return _direction_signal(_supertrend_direction(period, multiplier), buy=False)
+    return _direction_signal(
+        _supertrend_direction(period, multiplier),
+        buy=False,
+        key=("supertrend_direction", period, multiplier),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -171,12 +183,20 @@ def _psar_direction(af0: float, af: float, max_af: float):
 
 def psar_buy(af0: float = 0.02, af: float = 0.02, max_af: float = 0.2) -> SignalFunc:
     """True when PSAR flips to bullish (long SAR appears)."""
-    return _direction_signal(_psar_direction(af0, af, max_af), buy=True)
+    return _direction_signal(
+        _psar_direction(af0, af, max_af),
+        buy=True,
+        key=("psar_direction", af0, af, max_af),
+    )
 
 
 def psar_sell(af0: float = 0.02, af: float = 0.02, max_af: float = 0.2) -> SignalFunc:
     """True when PSAR flips to bearish (short SAR appears)."""
-    return _direction_signal(_psar_direction(af0, af, max_af), buy=False)
+    return _direction_signal(
+        _psar_direction(af0, af, max_af),
+        buy=False,
+        key=("psar_direction", af0, af, max_af),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -194,7 +214,7 @@ def chop_above(period: int = 14, threshold: float = 61.8) -> SignalFunc:
         high, low, close = ohlc
         return ta.chop(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("chop", period))
 
 
 def chop_below(period: int = 14, threshold: float = 38.2) -> SignalFunc:
@@ -207,7 +227,7 @@ def chop_below(period: int = 14, threshold: float = 38.2) -> SignalFunc:
         high, low, close = ohlc
         return ta.chop(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("chop", period))
 
 
 # ---------------------------------------------------------------------------
@@ -224,7 +244,7 @@ def vhf_above(period: int = 28, threshold: float = 0.4) -> SignalFunc:
             return None
         return ta.vhf(close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("vhf", period))
 
 
 def vhf_below(period: int = 28, threshold: float = 0.4) -> SignalFunc:
@@ -236,4 +256,4 @@ def vhf_below(period: int = 28, threshold: float = 0.4) -> SignalFunc:
             return None
         return ta.vhf(close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("vhf", period))
@@ -6,14 +6,17 @@ import pandas as pd
 import pandas_ta_classic as ta
 
 from ._helpers import (
+    SYMBOL,
     SignalFunc,
     _band_signal,
     _get_close,
     _get_hl,
     _get_ohlc,
-    _groupby_symbol,
     _ohlcv_signal,
+    _over_symbols,
+    _scoped,
 )
+from ._vectorized import Segments
 
 # ---------------------------------------------------------------------------
 # ATR (Average True Range) volatility regime
@@ -40,24 +43,19 @@ def _atr_signal(period: int, multiplier: float, above: bool) -> SignalFunc:
     period = int(period)
     cmp = operator.gt if above else operator.lt
 
-    def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
-        has_ohlcv = "high" in data.columns and "low" in data.columns
-
-        def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            prices = _get_close(group)
-            if prices is None:
-                return pd.Series(False, index=group.index)
-            high = group["high"] if has_ohlcv else None
-            low = group["low"] if has_ohlcv else None
-            atr = _compute_atr(prices, period, high=high, low=low)
-            median_atr = atr.median()
-            if pd.isna(median_atr):
-                return pd.Series(False, index=group.index)
-            return cmp(atr, multiplier * median_atr).fillna(False)
+    def _regime(
+        frame: pd.DataFrame, segs: Segments, atr: "pd.Series | None"
+    ) -> "pd.Series[bool]":
+        if atr is None:
+            return pd.Series(False, index=frame.index)
+        # NaN when a symbol has no ATR at all, so it never fires
+        median_atr = atr.groupby(segs.ids).transform("median")
+        return cmp(atr, multiplier * median_atr).fillna(False)
 
-        return _groupby_symbol(data, _compute_group)
+    def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
+        return _over_symbols(data, ("atr", period), _regime)
 
-    return _signal
+    return _scoped(_signal, SYMBOL)
 
 
 def atr_above(period: int = 14, multiplier: float = 1.0) -> SignalFunc:
@@ -75,32 +73,27 @@ def atr_below(period: int = 14, multiplier: float = 1.0) -> SignalFunc:
 # ---------------------------------------------------------------------------
 
 
-def _bb_signal(length: int, std: float, above: bool) -> SignalFunc:
-    """Shared Bollinger Band signal logic."""
-    length, std = int(length), float(std)
-    if above:
-        band_col = f"BBU_{length}_{std}"
-        fill_val = float("inf")
-        cmp = operator.gt
-    else:
-        band_col = f"BBL_{length}_{std}"
-        fill_val = float("-inf")
-        cmp = operator.lt
+def _bb_bands(length: int, std: float):
+    upper_col, lower_col = f"BBU_{length}_{std}", f"BBL_{length}_{std}"
 
-    def _signal(data: pd.DataFrame) -> "pd.Series[bool]":
-        def _compute_group(group: pd.DataFrame) -> "pd.Series[bool]":
-            prices = _get_close(group)
-            if prices is None:
-                return pd.Series(False, index=group.index)
-            bb = ta.bbands(prices, length=length, std=std)
-            if bb is None:
-                return pd.Series(False, index=group.index)
-            band = bb[band_col].fillna(fill_val)
-            return cmp(prices, band).fillna(False)
+    def _compute(group: pd.DataFrame) -> tuple["pd.Series | None", "pd.Series | None"]:
+        prices = _get_close(group)
+        if prices is None:
+            return None, None
+        result = ta.bbands(prices, length=length, std=std)
+        if result is None:
+            return None, None
+        return result[upper_col], result[lower_col]
+
+    return _compute
 
-        return _groupby_symbol(data, _compute_group)
 
-    return _signal
+def _bb_signal(length: int, std: float, above: bool) -> SignalFunc:
+    """Shared Bollinger Band signal logic."""
+    length, std = int(length), float(std)
+    return _band_signal(
+        _bb_bands(length, std), above=above, key=("bb_bands", length, std)
+    )
 
 
 def bb_above_upper(length: int = 20, std: float = 2.0) -> SignalFunc:
@@ -140,12 +133,16 @@ def _kc_bands(length: int, scalar: float):
 
 def kc_above_upper(length: int = 20, scalar: float = 1.5) -> SignalFunc:
     """True when price is above the upper Keltner Channel."""
-    return _band_signal(_kc_bands(length, scalar), above=True)
+    return _band_signal(
+        _kc_bands(length, scalar), above=True, key=("kc_bands", length, scalar)
+    )
 
 
 def kc_below_lower(length: int = 20, scalar: float = 1.5) -> SignalFunc:
     """True when price is below the lower Keltner Channel."""
-    return _band_signal(_kc_bands(length, scalar), above=False)
+    return _band_signal(
+        _kc_bands(length, scalar), above=False, key=("kc_bands", length, scalar)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -177,12 +174,20 @@ def _donchian_bands(lower_length: int, upper_length: int):
 
 def donchian_above_upper(lower_length: int = 20, upper_length: int = 20) -> SignalFunc:
     """True when price is above the upper Donchian Channel (breakout)."""
-    return _band_signal(_donchian_bands(lower_length, upper_length), above=True)
+    return _band_signal(
+        _donchian_bands(lower_length, upper_length),
+        above=True,
+        key=("donchian_bands", lower_length, upper_length),
+    )
 
 
 def donchian_below_lower(lower_length: int = 20, upper_length: int = 20) -> SignalFunc:
     """True when price is below the lower Donchian Channel (breakdown)."""
-    return _band_signal(_donchian_bands(lower_length, upper_length), above=False)
+    return _band_signal(
+        _donchian_bands(lower_length, upper_length),
+        above=False,
+        key=("donchian_bands", lower_length, upper_length),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -200,7 +205,7 @@ def natr_above(period: int = 14, threshold: float = 2.0) -> SignalFunc:
         high, low, close = ohlc
         return ta.natr(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("natr", period))
 
 
 def natr_below(period: int = 14, threshold: float = 1.0) -> SignalFunc:
@@ -213,7 +218,7 @@ def natr_below(period: int = 14, threshold: float = 1.0) -> SignalFunc:
         high, low, close = ohlc
         return ta.natr(high, low, close, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("natr", period))
 
 
 # ---------------------------------------------------------------------------
@@ -231,7 +236,9 @@ def massi_above(fast: int = 9, slow: int = 25, threshold: float = 27) -> SignalF
         high, low = hl
         return ta.massi(high, low, fast=fast, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind > threshold, key=("massi", fast, slow)
+    )
 
 
 def massi_below(fast: int = 9, slow: int = 25, threshold: float = 26.5) -> SignalFunc:
@@ -244,4 +251,6 @@ def massi_below(fast: int = 9, slow: int = 25, threshold: float = 26.5) -> Signa
         high, low = hl
         return ta.massi(high, low, fast=fast, slow=slow)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(
+        _indicator, lambda ind: ind < threshold, key=("massi", fast, slow)
+    )
@@ -29,7 +29,7 @@ def mfi_above(period: int = 14, threshold: float = 80) -> SignalFunc:
             return None
         return ta.mfi(high, low, close, volume, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("mfi", period))
 
 
 def mfi_below(period: int = 14, threshold: float = 20) -> SignalFunc:
@@ -45,7 +45,7 @@ def mfi_below(period: int = 14, threshold: float = 20) -> SignalFunc:
             return None
         return ta.mfi(high, low, close, volume, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("mfi", period))
 
 
 # ---------------------------------------------------------------------------
@@ -81,14 +81,18 @@ def obv_cross_above_sma(sma_period: int = 20) -> SignalFunc:
 
     from ._helpers import _ohlcv_crossover_signal
 
-    return _ohlcv_crossover_signal(_obv_sma_lines(sma_period), above=True)
+    return _ohlcv_crossover_signal(
+        _obv_sma_lines(sma_period), above=True, key=("obv_sma_lines", sma_period)
+    )
 
 
 def obv_cross_below_sma(sma_period: int = 20) -> SignalFunc:
     """True when OBV crosses below its SMA (bearish volume trend)."""
     from ._helpers import _ohlcv_crossover_signal
 
-    return _ohlcv_crossover_signal(_obv_sma_lines(sma_period), above=False)
+    return _ohlcv_crossover_signal(
+        _obv_sma_lines(sma_period), above=False, key=("obv_sma_lines", sma_period)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -109,7 +113,7 @@ def cmf_above(period: int = 20, threshold: float = 0.05) -> SignalFunc:
             return None
         return ta.cmf(high, low, close, volume, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind > threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind > threshold, key=("cmf", period))
 
 
 def cmf_below(period: int = 20, threshold: float = -0.05) -> SignalFunc:
@@ -125,7 +129,7 @@ def cmf_below(period: int = 20, threshold: float = -0.05) -> SignalFunc:
             return None
         return ta.cmf(high, low, close, volume, length=period)
 
-    return _ohlcv_signal(_indicator, lambda ind: ind < threshold)
+    return _ohlcv_signal(_indicator, lambda ind: ind < threshold, key=("cmf", period))
 
 
 # ---------------------------------------------------------------------------
@@ -161,11 +165,15 @@ def ad_cross_above_sma(sma_period: int = 20) -> SignalFunc:
     """True when A/D line crosses above its SMA (bullish accumulation)."""
     from ._helpers import _ohlcv_crossover_signal
 
-    return _ohlcv_crossover_signal(_ad_sma_lines(sma_period), above=True)
+    return _ohlcv_crossover_signal(
+        _ad_sma_lines(sma_period), above=True, key=("ad_sma_lines", sma_period)
+    )
 
 
 def ad_cross_below_sma(sma_period: int = 20) -> SignalFunc:
     """True when A/D line crosses below its SMA (bearish distribution)."""
     from ._helpers import _ohlcv_crossover_signal
 
-    return _ohlcv_crossover_signal(_ad_sma_lines(sma_period), above=False)
+    return _ohlcv_crossover_signal(
+        _ad_sma_lines(sma_period), above=False, key=("ad_sma_lines", sma_period)
+    )
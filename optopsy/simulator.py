@@ -17,7 +17,9 @@ Example::
 
 from __future__ import annotations
 
+import heapq
 import logging
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from functools import reduce
 from typing import Any, Callable, Literal, Union
@@ -25,6 +27,9 @@ from typing import Any, Callable, Literal, Union
 import numpy as np
 import pandas as pd
 
+from .parallel import _executor_scope, _run_tasks
+from .prepared import ChainLike
+
 _log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -272,8 +277,43 @@ def _normalise_calendar(raw: pd.DataFrame) -> pd.DataFrame:
 # Built-in selectors
 # ---------------------------------------------------------------------------
 
-# Each selector receives a DataFrame of candidate trades for a single entry
-# date (in the raw/pre-normalised schema) and returns a single-row Series.
+# Built-in selectors are scores: each function receives candidate trades (in
+# the raw/pre-normalised schema) and returns a Series where the lowest value
+# marks the preferred trade.  ``simulate()`` applies them to every candidate
+# at once via :class:`ScoreSelector`; the ``_select_*`` wrappers apply them to
+# the candidates of a single entry date and return a single-row Series.
+
+
+@dataclass(frozen=True)
+class ScoreSelector:
+    """Vectorized trade selector for :func:`simulate`.
+
+    Scores every candidate trade in one call and picks, per symbol and entry
+    date, the candidate with the lowest score (highest with
+    ``highest=True``).  Ties go to the first candidate; candidates without
+    a score are only picked when no candidate of their date has one.
+
+    Unlike a per-date callable selector, which :func:`simulate` calls once
+    per entry date, the score is computed across all candidates at once.
+
+    Attributes:
+        score: Column of the raw strategy output to rank by, or a callable
+            taking all candidate trades and returning a Series of scores
+            aligned with them.
+        highest: Pick the highest score instead of the lowest.
+
+    Example::
+
+        # Widest short strike distance from the underlying, per entry date
+        selector = op.ScoreSelector(
+            lambda t: (t["strike"] - t["underlying_price_entry"]).abs(),
+            highest=True,
+        )
+        result = op.simulate(data, op.short_puts, selector=selector)
+    """
+
+    score: Union[str, Callable[[pd.DataFrame], pd.Series]]
+    highest: bool = False
 
 
 def _select_one(candidates: pd.DataFrame, idx: Any) -> pd.Series:
@@ -283,13 +323,11 @@ def _select_one(candidates: pd.DataFrame, idx: Any) -> pd.Series:
     return result
 
 
-def _select_nearest(candidates: pd.DataFrame) -> pd.Series:
-    """Select the trade closest to ATM (delta closest to 0.50)."""
+def _nearest_score(candidates: pd.DataFrame) -> pd.Series:
+    """Distance from ATM (delta from 0.50, else strike from underlying)."""
     for delta_col in ("delta_entry", "delta_entry_leg1"):
         if delta_col in candidates.columns:
-            return _select_one(
-                candidates, (candidates[delta_col].abs() - 0.50).abs().idxmin()
-            )
+            return (candidates[delta_col].abs() - 0.50).abs()
 
     # Fallback: use strike - underlying_price distance
     strike_col = "strike" if "strike" in candidates.columns else None
@@ -304,32 +342,51 @@ def _select_nearest(candidates: pd.DataFrame) -> pd.Series:
             underlying_col = None
 
     if strike_col is not None and underlying_col is not None:
-        distance = (candidates[strike_col] - candidates[underlying_col]).abs()
-        return _select_one(candidates, distance.idxmin())
+        return (candidates[strike_col] - candidates[underlying_col]).abs()
 
-    return candidates.iloc[0]
+    return _first_score(candidates)
 
 
-def _select_highest_premium(candidates: pd.DataFrame) -> pd.Series:
-    """Select the trade with the highest credit (most negative entry cost).
+def _highest_premium_score(candidates: pd.DataFrame) -> pd.Series:
+    """Negated premium: the highest credit (most negative entry cost) scores lowest.
 
     For multi-leg strategies, ``total_entry_cost`` is already signed (negative
-    = credit), so ``idxmin`` picks the largest credit.  For single-leg
-    strategies, ``entry`` is an unsigned option price, so ``idxmax`` picks the
-    highest premium.
+    = credit), so the lowest cost is the largest credit.  For single-leg
+    strategies, ``entry`` is an unsigned option price, so it is negated to
+    rank the highest premium first.
     """
     cost_col = _find_cost_col(candidates)
     if cost_col == "entry":
         # Unsigned prices: highest premium = max value
-        return _select_one(candidates, candidates[cost_col].idxmax())
+        return -candidates[cost_col]
     # Signed costs: highest credit = most negative = min value
-    return _select_one(candidates, candidates[cost_col].idxmin())
+    return candidates[cost_col]
+
+
+def _lowest_premium_score(candidates: pd.DataFrame) -> pd.Series:
+    """Absolute entry cost: the cheapest debit scores lowest."""
+    cost_col = _find_cost_col(candidates)
+    return candidates[cost_col].abs()
+
+
+def _first_score(candidates: pd.DataFrame) -> pd.Series:
+    """Constant score, so the first candidate wins (deterministic, for testing)."""
+    return pd.Series(0, index=candidates.index)
+
+
+def _select_nearest(candidates: pd.DataFrame) -> pd.Series:
+    """Select the trade closest to ATM (delta closest to 0.50)."""
+    return _select_one(candidates, _nearest_score(candidates).idxmin())
+
+
+def _select_highest_premium(candidates: pd.DataFrame) -> pd.Series:
+    """Select the trade with the highest credit (most negative entry cost)."""
+    return _select_one(candidates, _highest_premium_score(candidates).idxmin())
 
 
 def _select_lowest_premium(candidates: pd.DataFrame) -> pd.Series:
     """Select the trade with the lowest debit (cheapest absolute entry cost)."""
-    cost_col = _find_cost_col(candidates)
-    return _select_one(candidates, candidates[cost_col].abs().idxmin())
+    return _select_one(candidates, _lowest_premium_score(candidates).idxmin())
 
 
 def _select_first(candidates: pd.DataFrame) -> pd.Series:
@@ -337,14 +394,50 @@ def _select_first(candidates: pd.DataFrame) -> pd.Series:
     return candidates.iloc[0]
 
 
-_BUILTIN_SELECTORS: dict[str, Callable[..., pd.Series]] = {
-    "nearest": _select_nearest,
-    "highest_premium": _select_highest_premium,
-    "lowest_premium": _select_lowest_premium,
-    "first": _select_first,
+_BUILTIN_SELECTORS: dict[str, ScoreSelector] = {
+    "nearest": ScoreSelector(_nearest_score),
+    "highest_premium": ScoreSelector(_highest_premium_score),
+    "lowest_premium": ScoreSelector(_lowest_premium_score),
+    "first": ScoreSelector(_first_score),
 }
 
 
+def _select_by_score(
+    raw: pd.DataFrame, group_cols: list[str], selector: ScoreSelector
+) -> pd.DataFrame:
+    """Pick one trade per group of *group_cols* with a single sort.
+
+    Rows come back in group-key order with their original index labels,
+    matching a ``groupby`` over the groups with a per-group selector.
+    """
+    if isinstance(selector.score, str):
+        if selector.score not in raw.columns:
+            raise ValueError(
+                f"Score column '{selector.score}' not found in strategy output. "
+                f"Available columns: {list(raw.columns)}"
+            )
+        score = raw[selector.score]
+    else:
+        score = selector.score(raw)
+    if len(score) != len(raw):
+        raise ValueError(
+            f"ScoreSelector score must have one value per candidate trade "
+            f"({len(raw)}), got {len(score)}"
+        )
+
+    ranked = raw[group_cols].assign(_score=np.asarray(score))
+    # groupby drops rows with missing keys; so does selection
+    ranked = ranked.dropna(subset=group_cols)
+    ranked = ranked.sort_values(
+        group_cols + ["_score"],
+        ascending=[True] * len(group_cols) + [not selector.highest],
+        kind="stable",
+        na_position="last",
+    )
+    picked = ranked.index[~ranked.duplicated(subset=group_cols, keep="first")]
+    return raw.loc[picked]
+
+
 def _find_cost_col(df: pd.DataFrame) -> str:
     """Find the entry cost column in the dataframe."""
     if "total_entry_cost" in df.columns:
@@ -513,16 +606,26 @@ def _compute_summary(trade_log: pd.DataFrame, capital: float) -> dict[str, Any]:
 def _filter_trades(
     trades: pd.DataFrame,
     max_positions: int,
+    max_positions_per_symbol: int | None = None,
+    max_open_dollar_cost: float | None = None,
+    lot_size: int = 1,
 ) -> pd.DataFrame:
     """Filter trades based on position limits and overlap rules.
 
-    Light O(n) scan over trades sorted by entry_date.  For each trade:
+    Event-driven scan over trades sorted by entry_date.  Open positions sit
+    in a min-heap keyed by exit date; before each candidate, positions that
+    exited on or before its entry date are popped.  A trade is kept when:
+
+    - fewer than *max_positions* positions are open
+    - no open position shares its expiration (only relevant when
+      ``max_positions > 1``)
+    - fewer than *max_positions_per_symbol* positions on its underlying
+      are open, if set
+    - its dollar cost (``abs(entry_cost) * lot_size``) plus that of the
+      open positions stays within *max_open_dollar_cost*, if set
 
-    - ``max_positions=1``: keep trade only if its entry_date >= the previous
-      kept trade's exit_date (greedy non-overlap).
-    - ``max_positions > 1``: track open intervals.  Keep trade if fewer than
-      *max_positions* are open **and** no open position shares the same
-      expiration.
+    Each candidate costs O(log max_positions), so large candidate sets with
+    many concurrent positions filter in roughly linear time.
 
     Returns the filtered DataFrame of trades that will execute.
     """
@@ -530,43 +633,67 @@ def _filter_trades(
         return trades
 
     n = len(trades)
-    entry_dates = trades["entry_date"].values
-    exit_dates = trades["exit_date"].values
-    expirations = trades["expiration"].values
+    # Plain Python ints keep the per-trade loop free of numpy scalar overhead
+    entry_dates = trades["entry_date"].to_numpy("datetime64[ns]").view("i8").tolist()
+    exit_dates = trades["exit_date"].to_numpy("datetime64[ns]").view("i8").tolist()
+    exp_values = trades["expiration"].to_numpy("datetime64[ns]")
+    # NaT never equals another expiration, so it never blocks a trade
+    expirations = [
+        None if nat else exp
+        for exp, nat in zip(exp_values.view("i8").tolist(), np.isnat(exp_values))
+    ]
+
+    if max_positions_per_symbol is not None and "underlying_symbol" in trades:
+        symbols = pd.factorize(trades["underlying_symbol"])[0].tolist()
+    else:
+        symbols = [0] * n
+        max_positions_per_symbol = None
+    if max_open_dollar_cost is not None:
+        costs = (trades["entry_cost"].abs() * lot_size).tolist()
+    else:
+        costs = [0.0] * n
 
     keep = np.zeros(n, dtype=bool)
+    # (exit_date, trade number) -- the trade number breaks exit-date ties
+    open_heap: list[tuple[int, int]] = []
+    open_exps: set[int] = set()
+    open_per_symbol: dict[int, int] = {}
+    open_cost = 0.0
+
+    for i in range(n):
+        entry = entry_dates[i]
+        # Close positions whose exit is not after this entry
+        while open_heap and open_heap[0][0] <= entry:
+            j = heapq.heappop(open_heap)[1]
+            open_exps.discard(expirations[j])
+            open_per_symbol[symbols[j]] -= 1
+            open_cost -= costs[j]
+        if not open_heap:
+            open_cost = 0.0  # drop accumulated float error
+
+        if len(open_heap) >= max_positions:
+            continue
+        exp = expirations[i]
+        if exp is not None and exp in open_exps:
+            continue
+        symbol = symbols[i]
+        if (
+            max_positions_per_symbol is not None
+            and open_per_symbol.get(symbol, 0) >= max_positions_per_symbol
+        ):
+            continue
+        if (
+            max_open_dollar_cost is not None
+            and open_cost + costs[i] > max_open_dollar_cost
+        ):
+            continue
 
-    if max_positions == 1:
-        # Fast path: greedy non-overlap
-        prev_exit = None
-        for i in range(n):
-            if prev_exit is None or entry_dates[i] >= prev_exit:
-                keep[i] = True
-                prev_exit = exit_dates[i]
-    else:
-        # Track open positions using pre-allocated numpy arrays to avoid
-        # repeated Python list creation.  In-place compaction keeps only
-        # positions whose exit_date is still in the future.
-        _open_exits = np.empty(max_positions, dtype=exit_dates.dtype)
-        _open_exps = np.empty(max_positions, dtype=expirations.dtype)
-        n_open = 0
-        for i in range(n):
-            # Compact: remove expired positions in-place
-            write = 0
-            for j in range(n_open):
-                if _open_exits[j] > entry_dates[i]:
-                    _open_exits[write] = _open_exits[j]
-                    _open_exps[write] = _open_exps[j]
-                    write += 1
-            n_open = write
-
-            if n_open < max_positions:
-                # Check no duplicate expiration
-                if expirations[i] not in _open_exps[:n_open]:
-                    keep[i] = True
-                    _open_exits[n_open] = exit_dates[i]
-                    _open_exps[n_open] = expirations[i]
-                    n_open += 1
+        keep[i] = True
+        heapq.heappush(open_heap, (exit_dates[i], i))
+        if exp is not None:
+            open_exps.add(exp)
+        open_per_symbol[symbol] = open_per_symbol.get(symbol, 0) + 1
+        open_cost += costs[i]
 
     return trades.loc[keep].reset_index(drop=True)
 
@@ -626,7 +753,7 @@ def _build_trade_log(
 
 
 def simulate(
-    data: pd.DataFrame,
+    data: ChainLike,
     strategy: Callable[..., pd.DataFrame],
     capital: float = 100_000.0,
     quantity: int = 1,
@@ -634,14 +761,20 @@ def simulate(
     multiplier: int = 100,
     selector: Union[
         Literal["nearest", "highest_premium", "lowest_premium", "first"],
+        ScoreSelector,
         Callable[[pd.DataFrame], pd.Series],
     ] = "nearest",
+    *,
+    max_positions_per_symbol: int | None = None,
+    max_open_dollar_cost: float | None = None,
     **strategy_kwargs: Any,
 ) -> SimulationResult:
     """Run a chronological simulation of an options strategy.
 
     Args:
-        data: Option chain DataFrame (same format as strategy functions expect).
+        data: Option chain DataFrame (same format as strategy functions
+            expect), a chain returned by :func:`~optopsy.prepared.prepare`,
+            or a ``ChunkedChain`` (raw trades are gathered chunk by chunk).
         strategy: Any optopsy strategy function (e.g. ``op.long_calls``).
         capital: Starting capital in dollars.
         quantity: Number of contracts per trade.
@@ -649,7 +782,19 @@ def simulate(
         multiplier: Contract multiplier (100 for standard equity options).
         selector: How to pick one trade when multiple candidates exist for a
             date.  One of ``"nearest"``, ``"highest_premium"``,
-            ``"lowest_premium"``, ``"first"``, or a custom callable.
+            ``"lowest_premium"``, ``"first"``, a :class:`ScoreSelector`
+            (scored across all candidates at once), or a custom callable
+            receiving one entry date's candidates and returning the chosen
+            row (called once per symbol and entry date -- slower).
+        max_positions_per_symbol: Keyword-only.  Maximum concurrent open
+            positions per underlying symbol.  ``None`` applies only
+            ``max_positions``.
+        max_open_dollar_cost: Keyword-only.  Maximum combined
+            ``dollar_cost`` (``abs(entry_cost) * quantity * multiplier``) of
+            open positions.  A trade that would push the total above it is
+            skipped.  This is the premium paid for debit trades but the
+            premium *received* for credit trades, not their margin or
+            maximum loss.
         **strategy_kwargs: Passed through to the strategy function.
 
     Returns:
@@ -667,6 +812,8 @@ def simulate(
             quantity=quantity,
             max_positions=max_positions,
             multiplier=multiplier,
+            max_positions_per_symbol=max_positions_per_symbol,
+            max_open_dollar_cost=max_open_dollar_cost,
         )
     except ValidationError as e:
         raise ValueError(_format_validation_error(e)) from e
@@ -675,6 +822,8 @@ def simulate(
     quantity = validated.quantity
     max_positions = validated.max_positions
     multiplier = validated.multiplier
+    max_positions_per_symbol = validated.max_positions_per_symbol
+    max_open_dollar_cost = validated.max_open_dollar_cost
 
     # Resolve selector
     if isinstance(selector, str):
@@ -683,9 +832,7 @@ def simulate(
                 f"Unknown selector '{selector}'. "
                 f"Choose from: {list(_BUILTIN_SELECTORS.keys())}"
             )
-        select_fn = _BUILTIN_SELECTORS[selector]
-    else:
-        select_fn = selector
+        selector = _BUILTIN_SELECTORS[selector]
 
     # Generate raw trades — return empty result for empty input
     if data.empty:
@@ -715,9 +862,12 @@ def simulate(
     else:
         group_cols = [group_col]
 
-    selected_raw = pd.DataFrame(
-        [select_fn(group) for _, group in raw.groupby(group_cols)]
-    )
+    if isinstance(selector, ScoreSelector):
+        selected_raw = _select_by_score(raw, group_cols, selector)
+    else:
+        selected_raw = pd.DataFrame(
+            [selector(group) for _, group in raw.groupby(group_cols)]
+        )
 
     # Detect short single-leg strategies so normalisation can negate prices
     strategy_name = getattr(strategy, "__name__", "")
@@ -731,7 +881,13 @@ def simulate(
     trades = trades.sort_values("entry_date").reset_index(drop=True)
 
     # Filter trades by position limits and overlap rules
-    filtered = _filter_trades(trades, max_positions)
+    filtered = _filter_trades(
+        trades,
+        max_positions,
+        max_positions_per_symbol=max_positions_per_symbol,
+        max_open_dollar_cost=max_open_dollar_cost,
+        lot_size=quantity * multiplier,
+    )
 
     # Build trade log with vectorized P&L computation
     trade_log = _build_trade_log(filtered, capital, quantity, multiplier)
@@ -762,11 +918,16 @@ _PORTFOLIO_RESERVED_KEYS = frozenset({"data", "strategy", "weight", "name"})
 def simulate_portfolio(
     legs: list[dict],
     capital: float = 100_000.0,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
 ) -> PortfolioResult:
     """Run a weighted portfolio simulation across multiple strategy legs.
 
     Each leg runs independently via :func:`simulate` with its share of capital.
     Results are combined into a single portfolio equity curve and trade log.
+    Legs can run in parallel worker processes; each distinct dataset is
+    shipped to the workers once through shared memory and results are
+    combined in leg order, so output is identical to a sequential run.
 
     Args:
         legs: List of leg dicts.  Each must contain ``data`` (DataFrame),
@@ -774,6 +935,11 @@ def simulate_portfolio(
             ``name`` (str) labels the leg (defaults to strategy function name).
             All other keys are forwarded to :func:`simulate` and the strategy.
         capital: Total starting capital in dollars.
+        n_jobs: Number of worker processes for running legs (``-1`` for all
+            cores).  ``None`` or ``1`` runs legs sequentially.
+        executor: Optional :class:`concurrent.futures.Executor` to run legs
+            on instead of creating a process pool.  Strategy callables must
+            be picklable (module-level functions) for process executors.
 
     Returns:
         A :class:`PortfolioResult` with combined and per-leg results.
@@ -812,13 +978,12 @@ def simulate_portfolio(
     # Normalize weights so allocated capital sums exactly to `capital`
     norm_factor = 1.0 / total_weight if total_weight != 1.0 else 1.0
 
-    # Run each leg
-    leg_results: dict[str, SimulationResult] = {}
+    # Resolve leg names and capital, then run each leg
     leg_capitals: dict[str, float] = {}
     seen_names: set[str] = set()
+    tasks = []
 
     for i, leg in enumerate(legs):
-        data = leg["data"]
         strategy = leg["strategy"]
         weight = leg["weight"] * norm_factor
         base_name = leg.get("name") or getattr(strategy, "__name__", f"leg{i}")
@@ -840,8 +1005,14 @@ def simulate_portfolio(
             k: v for k, v in leg.items() if k not in _PORTFOLIO_RESERVED_KEYS
         }
         sim_kwargs["capital"] = leg_capital
+        sim_kwargs["strategy"] = strategy
+
+        tasks.append((simulate, leg["data"], sim_kwargs))
 
-        leg_results[name] = simulate(data, strategy, **sim_kwargs)
+    with _executor_scope(n_jobs, executor) as pool:
+        leg_results: dict[str, SimulationResult] = dict(
+            zip(leg_capitals, _run_tasks(tasks, pool))
+        )
 
     # Combine trade logs
     combined_log = _combine_trade_logs(leg_results, capital)
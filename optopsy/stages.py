@@ -0,0 +1,57 @@
+"""Stage memoization for parameter sweeps.
+
+A strategy run is a chain of stages -- delta selection and exit lookup per
+leg, leg evaluation, leg join and P&L -- each depending on only a subset of
+the strategy parameters.  When the same prepared chain is run over a grid
+of parameters, most grid points share most stages.  ``_StageCache`` stores
+those intermediate frames keyed by exactly the parameters each stage
+depends on, so ``sweep()`` pays for each distinct stage once.
+"""
+
+from typing import Any, Callable, Dict, Hashable
+
+import pandas as pd
+
+
+class _StageCache:
+    """Memo of intermediate pipeline frames keyed by the parameters they depend on.
+
+    Attached to a :class:`PreparedChain` by ``sweep()`` so that strategy runs
+    over a parameter grid reuse delta selection, exit lookup, leg evaluation
+    and leg joins instead of recomputing them per grid point.  Keys are
+    built by the pipeline stages themselves; frames are stored as returned
+    and must not be modified in place by callers.
+    """
+
+    def __init__(self) -> None:
+        self._frames: Dict[Hashable, pd.DataFrame] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, key: Hashable, compute: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """Return the frame cached under *key*, computing it on first use."""
+        if key in self._frames:
+            self.hits += 1
+            return self._frames[key]
+        self.misses += 1
+        frame = self._frames[key] = compute()
+        return frame
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a parameter value into a hashable stage-key component.
+
+    Dicts and lists (delta targets, commission) become sorted tuples;
+    DataFrames (entry/exit signal dates) are keyed by identity, which is
+    stable for the lifetime of a sweep since the grid keeps them alive.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, pd.DataFrame):
+        return ("frame", id(value))
+    return value
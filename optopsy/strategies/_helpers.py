@@ -17,7 +17,8 @@ import numpy as np
 import pandas as pd
 
 from ..checks import _run_checks
-from ..core import _process_calendar_strategy, _process_strategy
+from ..chunked import ChunkedChain
+from ..core import _prepare_inputs, _process_calendar_strategy, _process_strategy
 from ..definitions import (
     calendar_spread_external_cols,
     calendar_spread_internal_cols,
@@ -32,6 +33,7 @@ from ..definitions import (
 )
 from ..evaluation import _evaluate_all_options
 from ..output import _format_output
+from ..prepared import ChainLike, _restore_dtypes
 from ..pricing import _calculate_commission, _calculate_fill_price
 from ..rules import (
     _rule_butterfly_strikes,
@@ -40,7 +42,6 @@ from ..rules import (
     _rule_iron_condor_strikes,
     _rule_non_overlapping_strike,
 )
-from ..timestamps import normalize_dates
 from ..types import CalendarStrategyParamsDict, StrategyParamsDict
 
 
@@ -63,7 +64,7 @@ _DEFAULT_ITM_WING_DELTA = {"target": 0.40, "min": 0.30, "max": 0.50}
 
 
 def _singles(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process single-leg option strategies (calls or puts)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_DELTA)
@@ -76,7 +77,7 @@ def _singles(
 
 
 def _straddles(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process straddle strategies (call and put at same strike)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_ATM_DELTA)
@@ -97,7 +98,7 @@ def _straddles(
 
 
 def _strangles(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process strangle strategies (call and put at different strikes)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_DELTA)
@@ -113,7 +114,7 @@ def _strangles(
 
 
 def _spread(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process vertical spread strategies (call or put spreads at different strikes)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_ATM_DELTA)
@@ -129,7 +130,7 @@ def _spread(
 
 
 def _butterfly(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process butterfly strategies (3 legs at different strikes)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_ITM_WING_DELTA)
@@ -146,7 +147,7 @@ def _butterfly(
 
 
 def _iron_condor(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process iron condor strategies (4 legs at different strikes)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_OTM_DELTA)
@@ -164,7 +165,7 @@ def _iron_condor(
 
 
 def _iron_butterfly(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process iron butterfly strategies (4 legs, middle legs share strike)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_OTM_DELTA)
@@ -182,7 +183,7 @@ def _iron_butterfly(
 
 
 def _covered_call(
-    data: pd.DataFrame,
+    data: ChainLike,
     leg_def: List[Tuple],
     stock_data: Optional[pd.DataFrame] = None,
     **kwargs: Unpack[StrategyParamsDict],
@@ -374,8 +375,17 @@ def _apply_option_slippage(
     return result
 
 
+def _reject_chunked(data: ChainLike) -> None:
+    """Raise if *data* is chunked; stock-backed strategies need the whole chain."""
+    if isinstance(data, ChunkedChain):
+        raise ValueError(
+            "Strategies with stock_data cannot run on a chunked chain; "
+            "pass an in-memory or prepared chain instead"
+        )
+
+
 def _covered_with_stock(
-    data: pd.DataFrame,
+    data: ChainLike,
     leg_def: List[Tuple],
     stock_data: pd.DataFrame,
     **kwargs: Unpack[StrategyParamsDict],
@@ -401,19 +411,15 @@ def _covered_with_stock(
         kwargs["leg1_delta"] = kwargs["leg2_delta"]
     else:
         kwargs.setdefault("leg1_delta", _DEFAULT_DELTA)
-    params = _run_checks(dict(kwargs), data)
+    _reject_chunked(data)
+    chain = data
+    params, data, partition = _prepare_inputs(data, dict(kwargs), _run_checks)
 
     # --- evaluate the option leg ---
-    data = data.copy()
-    data["quote_date"] = normalize_dates(data["quote_date"])
-    data["expiration"] = normalize_dates(data["expiration"])
-    data["option_type"] = data["option_type"].str.lower()
-
     delta_target = params["leg1_delta"]
-    leg_data = option_filter(data)
 
     evaluated = _evaluate_all_options(
-        leg_data,
+        partition(option_filter),
         dte_interval=params["dte_interval"],
         max_entry_dte=params["max_entry_dte"],
         exit_dte=params["exit_dte"],
@@ -507,11 +513,14 @@ def _covered_with_stock(
     if "delta_range" in result.columns:
         output["delta_range_leg2"] = result["delta_range"].values
 
-    return _format_output(output, params, double_strike_internal_cols, external_cols)
+    return _restore_dtypes(
+        chain,
+        _format_output(output, params, double_strike_internal_cols, external_cols),
+    )
 
 
 def _collar(
-    data: pd.DataFrame,
+    data: ChainLike,
     leg_def: List[Tuple],
     stock_data: Optional[pd.DataFrame] = None,
     **kwargs: Unpack[StrategyParamsDict],
@@ -549,7 +558,7 @@ def _collar(
 
 
 def _collar_with_stock(
-    data: pd.DataFrame,
+    data: ChainLike,
     leg_def: List[Tuple],
     stock_data: pd.DataFrame,
     **kwargs: Unpack[StrategyParamsDict],
@@ -571,14 +580,11 @@ def _collar_with_stock(
     kwargs.pop("leg1_delta", None)  # stock leg delta — not used here
     kwargs["leg1_delta"] = opt1_delta if opt1_delta is not None else _DEFAULT_DELTA
     kwargs["leg2_delta"] = opt2_delta if opt2_delta is not None else _DEFAULT_DELTA
-    params = _run_checks(dict(kwargs), data)
+    _reject_chunked(data)
+    chain = data
+    params, data, partition = _prepare_inputs(data, dict(kwargs), _run_checks)
 
     # --- evaluate the option legs via 2-leg spread pipeline ---
-    data = data.copy()
-    data["quote_date"] = normalize_dates(data["quote_date"])
-    data["expiration"] = normalize_dates(data["expiration"])
-    data["option_type"] = data["option_type"].str.lower()
-
     # Evaluate each option leg separately
     leg_results = []
     for i, option_leg in enumerate(option_leg_defs):
@@ -586,9 +592,8 @@ def _collar_with_stock(
         delta_key = f"leg{i + 1}_delta"
         delta_target = params[delta_key]
 
-        leg_data = option_filter(data)
         evaluated = _evaluate_all_options(
-            leg_data,
+            partition(option_filter),
             dte_interval=params["dte_interval"],
             max_entry_dte=params["max_entry_dte"],
             exit_dte=params["exit_dte"],
@@ -723,11 +728,14 @@ def _collar_with_stock(
     if "delta_range_opt2" in result.columns:
         output["delta_range_leg3"] = result["delta_range_opt2"].values
 
-    return _format_output(output, params, triple_strike_internal_cols, external_cols)
+    return _restore_dtypes(
+        chain,
+        _format_output(output, params, triple_strike_internal_cols, external_cols),
+    )
 
 
 def _condor(
-    data: pd.DataFrame, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, leg_def: List[Tuple], **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """Process condor strategies (4 legs at different strikes, same option type)."""
     kwargs.setdefault("leg1_delta", _DEFAULT_OTM_DELTA)
@@ -745,7 +753,7 @@ def _condor(
 
 
 def _calendar_spread(
-    data: pd.DataFrame,
+    data: ChainLike,
     leg_def: List[Tuple],
     same_strike: bool = True,
     **kwargs: Unpack[CalendarStrategyParamsDict],
@@ -5,12 +5,13 @@ from typing import Unpack
 import pandas as pd
 
 from ..evaluation import _calls, _puts
+from ..prepared import ChainLike
 from ..types import StrategyParamsDict
 from ._helpers import Side, _condor
 
 
 def long_call_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long call condor strategy statistics.
@@ -45,7 +46,7 @@ def long_call_condor(
 
 
 def short_call_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short call condor strategy statistics.
@@ -79,7 +80,7 @@ def short_call_condor(
 
 
 def long_put_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long put condor strategy statistics.
@@ -114,7 +115,7 @@ def long_put_condor(
 
 
 def short_put_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short put condor strategy statistics.
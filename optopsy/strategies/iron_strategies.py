@@ -5,13 +5,12 @@ from typing import Unpack
 import pandas as pd
 
 from ..evaluation import _calls, _puts
+from ..prepared import ChainLike
 from ..types import StrategyParamsDict
 from ._helpers import Side, _iron_butterfly, _iron_condor
 
 
-def iron_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
-) -> pd.DataFrame:
+def iron_condor(data: ChainLike, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
     """
     Generate iron condor strategy statistics.
 
@@ -44,7 +43,7 @@ def iron_condor(
 
 
 def reverse_iron_condor(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate reverse iron condor strategy statistics.
@@ -78,7 +77,7 @@ def reverse_iron_condor(
 
 
 def iron_butterfly(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate iron butterfly strategy statistics.
@@ -113,7 +112,7 @@ def iron_butterfly(
 
 
 def reverse_iron_butterfly(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate reverse iron butterfly strategy statistics.
@@ -5,13 +5,12 @@ from typing import Unpack
 import pandas as pd
 
 from ..evaluation import _calls, _puts
+from ..prepared import ChainLike
 from ..types import StrategyParamsDict
 from ._helpers import Side, _singles
 
 
-def long_calls(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
-) -> pd.DataFrame:
+def long_calls(data: ChainLike, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
     """
     Generate long call strategy statistics.
 
@@ -25,7 +24,7 @@ def long_calls(
     return _singles(data, [(Side.long, _calls)], **kwargs)
 
 
-def long_puts(data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
+def long_puts(data: ChainLike, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
     """
     Generate long put strategy statistics.
 
@@ -39,9 +38,7 @@ def long_puts(data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]) -> pd.Da
     return _singles(data, [(Side.long, _puts)], **kwargs)
 
 
-def short_calls(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
-) -> pd.DataFrame:
+def short_calls(data: ChainLike, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
     """
     Generate short call strategy statistics.
 
@@ -55,9 +52,7 @@ def short_calls(
     return _singles(data, [(Side.short, _calls)], **kwargs)
 
 
-def short_puts(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
-) -> pd.DataFrame:
+def short_puts(data: ChainLike, **kwargs: Unpack[StrategyParamsDict]) -> pd.DataFrame:
     """
     Generate short put strategy statistics.
 
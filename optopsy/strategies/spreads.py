@@ -5,6 +5,7 @@ from typing import Optional, Unpack
 import pandas as pd
 
 from ..evaluation import _calls, _puts
+from ..prepared import ChainLike
 from ..types import StrategyParamsDict
 from ._helpers import (
     Side,
@@ -18,7 +19,7 @@ from .singles import short_puts
 
 
 def long_straddles(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long straddle strategy statistics (long call + long put at same strike).
@@ -34,7 +35,7 @@ def long_straddles(
 
 
 def short_straddles(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short straddle strategy statistics (short call + short put at same strike).
@@ -50,7 +51,7 @@ def short_straddles(
 
 
 def long_strangles(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long strangle strategy statistics (long call + long put at different strikes).
@@ -66,7 +67,7 @@ def long_strangles(
 
 
 def short_strangles(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short strangle strategy statistics (short call + short put at different strikes).
@@ -82,7 +83,7 @@ def short_strangles(
 
 
 def long_call_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long call spread (bull call spread) statistics.
@@ -98,7 +99,7 @@ def long_call_spread(
 
 
 def short_call_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short call spread (bear call spread) statistics.
@@ -114,7 +115,7 @@ def short_call_spread(
 
 
 def long_put_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate long put spread (bear put spread) statistics.
@@ -130,7 +131,7 @@ def long_put_spread(
 
 
 def short_put_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate short put spread (bull put spread) statistics.
@@ -146,7 +147,7 @@ def short_put_spread(
 
 
 def covered_call(
-    data: pd.DataFrame,
+    data: ChainLike,
     *,
     stock_data: Optional[pd.DataFrame] = None,
     **kwargs: Unpack[StrategyParamsDict],
@@ -186,7 +187,7 @@ def covered_call(
 
 
 def protective_put(
-    data: pd.DataFrame,
+    data: ChainLike,
     *,
     stock_data: Optional[pd.DataFrame] = None,
     **kwargs: Unpack[StrategyParamsDict],
@@ -226,7 +227,7 @@ def protective_put(
 
 
 def collar(
-    data: pd.DataFrame,
+    data: ChainLike,
     *,
     stock_data: Optional[pd.DataFrame] = None,
     **kwargs: Unpack[StrategyParamsDict],
@@ -262,7 +263,7 @@ def collar(
 
 
 def cash_secured_put(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate cash-secured put strategy statistics.
@@ -283,7 +284,7 @@ def cash_secured_put(
 
 
 def call_back_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate call back spread (call ratio backspread) statistics.
@@ -306,7 +307,7 @@ def call_back_spread(
 
 
 def put_back_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate put back spread (put ratio backspread) statistics.
@@ -329,7 +330,7 @@ def put_back_spread(
 
 
 def call_front_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate call front spread (call ratio spread) statistics.
@@ -352,7 +353,7 @@ def call_front_spread(
 
 
 def put_front_spread(
-    data: pd.DataFrame, **kwargs: Unpack[StrategyParamsDict]
+    data: ChainLike, **kwargs: Unpack[StrategyParamsDict]
 ) -> pd.DataFrame:
     """
     Generate put front spread (put ratio spread) statistics.
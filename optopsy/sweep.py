@@ -0,0 +1,142 @@
+"""Parameter sweeps that share pipeline work across grid points.
+
+Running a strategy over a grid of parameters by calling it once per grid
+point repeats the same delta selection, exit lookup and leg joins for
+every point that shares those inputs.  ``sweep()`` prepares the chain once
+and attaches a stage memo (see ``stages``) so each distinct stage is
+computed once per sweep:
+
+- delta selection per leg depends only on the leg's option type,
+  ``min_bid_ask`` and delta target, so varying ``max_entry_dte``,
+  ``exit_dte`` or ``dte_interval`` reuses it
+- exit lookups go through each partition's contract index, built once
+- leg joins and P&L are reused when only early-exit or output parameters
+  (``stop_loss``, ``take_profit``, ``max_hold_days``, ``raw``, ...) vary
+
+Example::
+
+    import optopsy as op
+
+    results = op.sweep(
+        data,
+        op.short_puts,
+        grid={"max_entry_dte": [30, 45, 60], "exit_dte": [0, 7, 14, 21]},
+        raw=True,
+    )
+"""
+
+import itertools
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .parallel import _executor_scope, _run_tasks, _worker_count
+from .prepared import ChainLike, PreparedChain, prepare
+from .stages import _StageCache
+
+
+def _sweep_chain(data: ChainLike) -> PreparedChain:
+    """Prepare *data* and attach a fresh stage memo for one sweep."""
+    return replace(prepare(data), stages=_StageCache())
+
+
+def _sweep_block(
+    data: ChainLike,
+    strategy: Callable[..., pd.DataFrame],
+    names: List[str],
+    points: List[Tuple[Any, ...]],
+    fixed: Dict[str, Any],
+) -> List[pd.DataFrame]:
+    """Run a contiguous block of grid points against one stage memo."""
+    chain = _sweep_chain(data)
+    frames = []
+    for point in points:
+        params = dict(zip(names, point))
+        result = strategy(chain, **fixed, **params)
+        for pos, (name, value) in enumerate(params.items()):
+            result.insert(pos, name, [value] * len(result))
+        frames.append(result)
+    return frames
+
+
+def sweep(
+    data: ChainLike,
+    strategy: Callable[..., pd.DataFrame],
+    grid: Dict[str, Iterable[Any]],
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Run a strategy over every combination of a parameter grid.
+
+    Results are identical to calling ``strategy(data, **kwargs, **point)``
+    for each grid point, but intermediate pipeline stages are shared
+    between points, so a large grid costs a small multiple of a single run.
+
+    With ``n_jobs`` or ``executor`` the grid is split into contiguous blocks
+    (one per worker) that run in parallel, each sharing stages internally.
+    The prepared chain is shipped to workers once through shared memory and
+    blocks are merged in grid order, so output does not depend on timing.
+
+    Args:
+        data: Option chain DataFrame or a ``PreparedChain`` from ``prepare()``.
+        strategy: Any strategy function, e.g. ``op.short_puts``.
+        grid: Mapping of strategy parameter name to the values to try.
+            Points are the cartesian product of the values, in key order.
+        n_jobs: Number of worker processes (``-1`` for all cores).  ``None``
+            or ``1`` runs the whole grid in this process.
+        executor: Optional :class:`concurrent.futures.Executor` to run
+            blocks on instead of creating a process pool.  ``strategy`` must
+            be picklable (any module-level function) for process executors.
+        **kwargs: Parameters held fixed across all grid points.
+
+    Returns:
+        One DataFrame with the strategy's output for every grid point,
+        preceded by one column per grid parameter identifying the point.
+        Points that produce no trades contribute no rows.
+
+    Raises:
+        ValueError: If the grid is empty, a parameter has no values, or a
+            parameter appears both in the grid and in ``kwargs``.
+    """
+    if not grid:
+        raise ValueError("grid must contain at least one parameter")
+
+    names = list(grid)
+    overlap = sorted(set(names) & set(kwargs))
+    if overlap:
+        raise ValueError(
+            f"Parameters given both in grid and as fixed arguments: {overlap}"
+        )
+
+    values = [list(grid[name]) for name in names]
+    empty = [name for name, vals in zip(names, values) if not vals]
+    if empty:
+        raise ValueError(f"Grid parameters have no values: {empty}")
+
+    chain = prepare(data)
+    points = list(itertools.product(*values))
+
+    with _executor_scope(n_jobs, executor) as pool:
+        n_blocks = 1 if pool is None else _worker_count(n_jobs, pool, len(points))
+        size = -(-len(points) // n_blocks)
+        tasks = [
+            (
+                _sweep_block,
+                chain,
+                {
+                    "strategy": strategy,
+                    "names": names,
+                    "points": points[start : start + size],
+                    "fixed": kwargs,
+                },
+            )
+            for start in range(0, len(points), size)
+        ]
+        blocks = _run_tasks(tasks, pool)
+
+    frames = [frame for block in blocks for frame in block]
+    non_empty = [frame for frame in frames if not frame.empty]
+    return pd.concat(non_empty or frames[:1], ignore_index=True)
@@ -293,6 +293,8 @@ class SimulatorParams(BaseModel):
     quantity: int = Field(gt=0, strict=True)
     max_positions: int = Field(gt=0, strict=True)
     multiplier: int = Field(gt=0, strict=True)
+    max_positions_per_symbol: Optional[int] = Field(default=None, gt=0, strict=True)
+    max_open_dollar_cost: Optional[Union[int, float]] = Field(default=None, gt=0)
 
     @field_validator("capital", mode="before")
     @classmethod
@@ -303,3 +305,14 @@ class SimulatorParams(BaseModel):
                 "Invalid setting for capital, must be a positive int or float"
             )
         return v
+
+    @field_validator("max_open_dollar_cost", mode="before")
+    @classmethod
+    def validate_max_open_dollar_cost(cls, v):
+        # Reject booleans and non-numeric types for max_open_dollar_cost
+        if v is not None and (isinstance(v, bool) or not isinstance(v, (int, float))):
+            raise ValueError(
+                "Invalid setting for max_open_dollar_cost, "
+                "must be a positive int or float"
+            )
+        return v
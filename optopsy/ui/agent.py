@@ -28,6 +28,8 @@ import pandas as pd
 
 litellm.suppress_debug_info = True
 
+from optopsy.data.fingerprint import _stamp, fingerprint
+
 from .tools import execute_tool, get_tool_schemas
 
 SYSTEM_PROMPT = """\
@@ -523,9 +525,31 @@ class OptopsyAgent:
         # Session-scoped strategy run registry — keyed by result key string,
         # values are lightweight scalar summaries (no DataFrames).
         self.results: dict[str, dict] = {}
-        # Content hash of the active dataset — computed once per dataset load
-        # and passed to execute_tool so handlers can build cache keys.
+        # Fingerprint of the active dataset (see optopsy.data.fingerprint) —
+        # passed to execute_tool so handlers can build cache keys.
         self._dataset_fingerprint: str | None = None
+        # Schema of the dataset when it was fingerprinted (see _set_dataset)
+        self._dataset_stamp: tuple | None = None
+
+    def _set_dataset(self, dataset: pd.DataFrame | None) -> None:
+        """Make *dataset* the active dataset, fingerprinting it once.
+
+        Loaded data carries its provenance; any other frame is content-
+        hashed, which is O(rows).  Tools replace the active dataset rather
+        than edit it in place, so it is only hashed again when a tool
+        returns a different frame, or the same frame with a new shape,
+        columns or dtypes.
+        """
+        if dataset is None:
+            self._dataset_fingerprint = self._dataset_stamp = None
+        elif (
+            dataset is not self.dataset
+            or self._dataset_fingerprint is None
+            or _stamp(dataset) != self._dataset_stamp
+        ):
+            self._dataset_fingerprint = fingerprint(dataset)
+            self._dataset_stamp = _stamp(dataset)
+        self.dataset = dataset
 
     async def chat(
         self,
@@ -731,16 +755,7 @@ class OptopsyAgent:
                         uploaded_files=self.uploaded_files,
                     ),
                 )
-                # Update dataset and recompute fingerprint.  Always
-                # recompute when a dataset is returned so that in-place
-                # mutations are reflected in the fingerprint.
-                self.dataset = result.dataset
-                if self.dataset is not None:
-                    self._dataset_fingerprint = str(
-                        pd.util.hash_pandas_object(self.dataset, index=False).sum()
-                    )
-                else:
-                    self._dataset_fingerprint = None
+                self._set_dataset(result.dataset)
                 if result.signals is not None:
                     self.signals = result.signals
                 if result.datasets is not None:
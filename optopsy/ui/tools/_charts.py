@@ -5,6 +5,8 @@ from typing import Any
 
 import pandas as pd
 
+from optopsy.signals._cache import evaluation
+
 from ..providers.result_store import ResultStore
 from ._executor import _register, _require_dataset, _resolve_dataset
 from ._helpers import (
@@ -467,7 +469,11 @@ def _handle_create_chart(arguments, dataset, signals, datasets, results, _result
     # Dispatch to the appropriate builder
     has_indicators = arguments.get("indicators")
     if chart_type in ("candlestick", "line") and has_indicators:
-        result = _build_indicators(fig, go, make_subplots, df, arguments, x, y, color)
+        # One scope per chart: traces over the same close share indicators
+        with evaluation():
+            result = _build_indicators(
+                fig, go, make_subplots, df, arguments, x, y, color
+            )
         build_err, extra = result
         if build_err:
             return _result(build_err)
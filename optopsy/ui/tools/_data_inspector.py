@@ -7,6 +7,7 @@ import os
 import pandas as pd
 
 import optopsy as op
+from optopsy.data.fingerprint import remember
 from optopsy.datafeeds import default_kwargs
 from optopsy.strategies._helpers import (
     _DEFAULT_ATM_DELTA,
@@ -26,6 +27,14 @@ _log = logging.getLogger(__name__)
 _CSV_KWARG_KEYS = tuple(default_kwargs.keys())
 
 
+def _file_version(path: str) -> tuple | None:
+    """``(absolute path, mtime, size)`` of a single file, else ``None``."""
+    if not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
 @_register("load_csv_data")
 def _handle_load_csv_data(arguments, dataset, signals, datasets, results, _result):
     file_path = arguments.get("file_path")
@@ -58,12 +67,17 @@ def _handle_load_csv_data(arguments, dataset, signals, datasets, results, _resul
             csv_kwargs[key] = val
 
     try:
+        version = _file_version(file_path)
         df = op.csv_data(file_path, **csv_kwargs)
     except Exception as e:
         _log.error("load_csv_data failed for %s: %s", file_path, e)
         return _result(
             f"Failed to load CSV '{label}': check column mapping and file format."
         )
+    # Identify the data by file and mapping so it is never hashed, unless
+    # the file changed while it was read.
+    if version is not None and version == _file_version(file_path):
+        remember(df, csv=version, columns=csv_kwargs)
     updated_datasets = {**datasets, label: df}
 
     summary = _df_summary(df, label)
@@ -28,8 +28,7 @@ from optopsy.data._yf_helpers import (  # noqa: F401
     _yf_cache,
     _yf_fetch_and_cache,
 )
-from optopsy.metrics import profit_factor as _profit_factor
-from optopsy.metrics import win_rate as _win_rate
+from optopsy.data.providers.result_store import result_stats
 from optopsy.signals import signal_dates
 from optopsy.timestamps import normalize_dates
 
@@ -397,6 +396,61 @@ def _run_one_strategy(
 # ---------------------------------------------------------------------------
 
 
+def _cache_lookup(
+    store: ResultStore,
+    name: str,
+    params: dict,
+    dataset_fingerprint: str | None,
+) -> tuple[pd.DataFrame | None, str | None]:
+    """Return ``(cached_df, cache_key)``; ``cached_df`` is ``None`` on a miss."""
+    if not dataset_fingerprint:
+        _log.debug("_cached_run(%s): no dataset fingerprint, skipping cache", name)
+        return None, None
+
+    cache_key = store.make_key(name, params, dataset_fingerprint)
+    if store.has(cache_key):
+        _log.debug("_cached_run(%s): cache hit (%s)", name, cache_key[:12])
+        return store.read(cache_key), cache_key
+    return None, cache_key
+
+
+def _cached_stats(
+    store: ResultStore,
+    name: str,
+    params: dict,
+    dataset_fingerprint: str | None,
+) -> tuple[dict | None, str | None]:
+    """Return ``(stats, cache_key)`` of a stored result without reading it.
+
+    ``stats`` are the ``result_stats()`` recorded in the result's summary,
+    or ``None`` on a miss or for results stored without a summary.
+    """
+    if not dataset_fingerprint:
+        return None, None
+    cache_key = store.make_key(name, params, dataset_fingerprint)
+    if store.has(cache_key):
+        stats = store.get_summary(cache_key).get("stats")
+        if stats is not None:
+            _log.debug("_cached_stats(%s): summary hit (%s)", name, cache_key[:12])
+            return stats, cache_key
+    return None, cache_key
+
+
+def _cache_write(
+    store: ResultStore,
+    name: str,
+    cache_key: str | None,
+    df: pd.DataFrame | None,
+    metadata: dict,
+) -> None:
+    """Persist a freshly computed result; failures are logged, not raised."""
+    if cache_key and df is not None and not df.empty:
+        try:
+            store.write(cache_key, df, metadata)
+        except Exception:
+            _log.debug("_cached_run(%s): cache write failed", name, exc_info=True)
+
+
 def _cached_run(
     store: ResultStore,
     name: str,
@@ -409,26 +463,15 @@ def _cached_run(
 
     Returns ``(result_df, cache_key, error_str)``.
     """
-    if not dataset_fingerprint:
-        _log.debug("_cached_run(%s): no dataset fingerprint, skipping cache", name)
-        cache_key = None
-    else:
-        cache_key = store.make_key(name, params, dataset_fingerprint)
-
-    if cache_key and store.has(cache_key):
-        _log.debug("_cached_run(%s): cache hit (%s)", name, cache_key[:12])
-        return store.read(cache_key), cache_key, ""
+    cached, cache_key = _cache_lookup(store, name, params, dataset_fingerprint)
+    if cached is not None:
+        return cached, cache_key, ""
 
     df, err = execute_fn()
     if err:
         return None, cache_key, err
 
-    if cache_key and df is not None and not df.empty:
-        try:
-            store.write(cache_key, df, metadata)
-        except Exception:
-            _log.debug("_cached_run(%s): cache write failed", name, exc_info=True)
-
+    _cache_write(store, name, cache_key, df, metadata)
     return df, cache_key, ""
 
 
@@ -575,17 +618,21 @@ def _session_result_key(cache_key: str | None, display_key: str) -> str:
 
 def _make_result_summary(
     strategy_name: str,
-    result_df: pd.DataFrame,
+    result_df: pd.DataFrame | None,
     arguments: dict,
     *,
     display_key: str = "",
     dataset_fingerprint: str | None = None,
+    stats: dict | None = None,
 ) -> dict:
     """Build a lightweight scalar summary stored in the results registry.
 
     Stores only scalar stats — never full DataFrames — so memory usage stays
     proportional to the number of runs rather than data volume.  Handles both
     raw-mode (``pct_change`` column) and aggregated-mode (``mean`` column).
+    *stats* are the ``result_stats()`` of the result when already known
+    (e.g. from its ``ResultStore`` summary), in which case *result_df* is
+    not needed.
 
     Uses :class:`StrategyResultSummary` to validate and type the output.
     """
@@ -598,73 +645,7 @@ def _make_result_summary(
         "display_key": display_key,
         "dataset_fingerprint": dataset_fingerprint,
     }
-    if "pct_change" in result_df.columns:
-        pct = result_df["pct_change"].dropna()
-        base.update(
-            {
-                "count": len(pct),
-                "mean_return": round(float(pct.mean()), 4),
-                "std": round(float(pct.std()), 4),
-                "win_rate": round(_win_rate(pct), 4),
-                "profit_factor": round(_profit_factor(pct), 4),
-            }
-        )
-    elif "mean" in result_df.columns:
-        if "count" in result_df.columns:
-            total = int(result_df["count"].sum())
-            wt_mean = float((result_df["mean"] * result_df["count"]).sum() / total)
-        else:
-            total = len(result_df)
-            wt_mean = float(result_df["mean"].mean())
-        # Compute aggregated profit_factor by combining gross wins and
-        # losses across all groups, then dividing.  This avoids the
-        # pitfall of weighted-averaging per-group profit factors where
-        # inf values (groups with no losses) would dominate or need
-        # filtering — which would make the aggregate not equal the true
-        # all-trades combined ratio.
-        agg_pf = None
-        if "mean" in result_df.columns and "count" in result_df.columns:
-            group_pnl = result_df["mean"] * result_df["count"]
-            total_wins = float(group_pnl[group_pnl > 0].sum())
-            total_losses = float(group_pnl[group_pnl < 0].sum())
-            if total_losses != 0:
-                agg_pf = round(abs(total_wins) / abs(total_losses), 4)
-            elif total_wins > 0:
-                agg_pf = float("inf")
-            else:
-                agg_pf = 0.0
-        base.update(
-            {
-                "count": total,
-                "mean_return": round(wt_mean, 4),
-                "std": (
-                    round(float(result_df["std"].mean()), 4)
-                    if "std" in result_df.columns
-                    else None
-                ),
-                "win_rate": (
-                    round(
-                        float(
-                            (result_df["win_rate"] * result_df["count"]).sum() / total
-                        ),
-                        4,
-                    )
-                    if "win_rate" in result_df.columns and "count" in result_df.columns
-                    else round(float((result_df["mean"] > 0).mean()), 4)
-                ),
-                "profit_factor": agg_pf,
-            }
-        )
-    else:
-        base.update(
-            {
-                "count": len(result_df),
-                "mean_return": None,
-                "std": None,
-                "win_rate": None,
-                "profit_factor": None,
-            }
-        )
+    base.update(stats if stats is not None else result_stats(result_df))
     return StrategyResultSummary(**base).model_dump()
 
 
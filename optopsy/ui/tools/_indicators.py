@@ -3,15 +3,20 @@
 Each builder function takes indicator parameters and source data, and adds
 traces to a Plotly figure at the specified row.  This keeps the chart tool
 handler thin and makes individual indicators independently testable.
+Indicators are memoized in the same cache as signal indicators
+(``optopsy.signals._cache``): traces drawn over the same close series
+within one ``evaluation()`` scope share them.
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 import pandas_ta_classic as ta
 
+from optopsy.signals._cache import bind, cached_indicator
+
 # ---------------------------------------------------------------------------
 # Indicator classification
 # ---------------------------------------------------------------------------
@@ -68,6 +73,16 @@ def validate_indicator_columns(
     return None
 
 
+def _close_indicator(
+    name: str, params: tuple, close: pd.Series | None, compute: Callable[[], Any]
+) -> Any:
+    """Return ``compute()``, memoized for the indicator *name* of *close*."""
+    if close is None:
+        return compute()
+    source = bind(close, close.to_frame("close"), to_frame="close")
+    return cached_indicator(name, params, source, compute)
+
+
 # ---------------------------------------------------------------------------
 # Overlay indicator builders (added to the price panel, row=1)
 # ---------------------------------------------------------------------------
@@ -81,7 +96,12 @@ def add_sma_trace(
     fig.add_trace(
         go.Scatter(
             x=dates,
-            y=ta.sma(close, length=period),  # type: ignore[arg-type]
+            y=_close_indicator(
+                "sma",
+                (period,),
+                close,
+                lambda: ta.sma(close, length=period),  # type: ignore[arg-type]
+            ),
             mode="lines",
             name=f"SMA({period})",
         ),
@@ -98,7 +118,12 @@ def add_ema_trace(
     fig.add_trace(
         go.Scatter(
             x=dates,
-            y=ta.ema(close, length=period),  # type: ignore[arg-type]
+            y=_close_indicator(
+                "ema",
+                (period,),
+                close,
+                lambda: ta.ema(close, length=period),  # type: ignore[arg-type]
+            ),
             mode="lines",
             name=f"EMA({period})",
         ),
@@ -117,7 +142,12 @@ def add_bbands_traces(
     """Add upper, lower, and middle Bollinger Band traces to the price panel."""
     period = ind.get("period", 20)
     std = ind.get("std", 2.0)
-    bb = ta.bbands(close, length=period, std=std)  # type: ignore[arg-type]
+    bb = _close_indicator(
+        "bbands",
+        (period, std),
+        close,
+        lambda: ta.bbands(close, length=period, std=std),  # type: ignore[arg-type]
+    )
     if bb is None or bb.empty:
         return
     # pandas_ta_classic column names use format: BBL_{length}_{std} (e.g. BBL_20_2.0)
@@ -200,7 +230,12 @@ def add_rsi_traces(
     fig.add_trace(
         go.Scatter(
             x=dates,
-            y=ta.rsi(close, length=period),  # type: ignore[arg-type]
+            y=_close_indicator(
+                "rsi",
+                (period,),
+                close,
+                lambda: ta.rsi(close, length=period),  # type: ignore[arg-type]
+            ),
             mode="lines",
             name=f"RSI({period})",
         ),
@@ -224,7 +259,12 @@ def add_macd_traces(
     fast = ind.get("fast", 12)
     slow = ind.get("slow", 26)
     signal_period = ind.get("signal", 9)
-    macd_df = ta.macd(close, fast=fast, slow=slow, signal=signal_period)  # type: ignore[arg-type]
+    macd_df = _close_indicator(
+        "macd",
+        (fast, slow, signal_period),
+        close,
+        lambda: ta.macd(close, fast=fast, slow=slow, signal=signal_period),  # type: ignore[arg-type]
+    )
     if macd_df is not None and not macd_df.empty:
         macd_col = f"MACD_{fast}_{slow}_{signal_period}"
         signal_col = f"MACDs_{fast}_{slow}_{signal_period}"
@@ -537,6 +537,13 @@ class ScanStrategiesArgs(BaseModel):
             "Combinations exceeding this limit are skipped."
         ),
     )
+    n_jobs: int | None = Field(
+        None,
+        description=(
+            "Number of worker processes to run combinations on in parallel "
+            "(-1 = all cores). Omit to run sequentially."
+        ),
+    )
 
     @field_validator("strategy_names", mode="before")
     @classmethod
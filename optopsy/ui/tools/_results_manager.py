@@ -397,6 +397,21 @@ def _handle_list_results(arguments, dataset, signals, datasets, results, _result
     return _result(llm_summary, user_display=user_display)
 
 
+# query_results filter ops evaluated by pyarrow on numeric columns
+_PUSHDOWN_OPS = {"gt": ">", "lt": "<", "eq": "==", "gte": ">=", "lte": "<="}
+
+
+def _cast_filter_value(dtype, value):
+    """Cast a filter value to *dtype*, else to float; None if neither works."""
+    try:
+        return dtype.type(value)
+    except (ValueError, TypeError):
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
+
+
 @_register("query_results")
 def _handle_query_results(arguments, dataset, signals, datasets, results, _result):
     result_key = arguments.get("result_key")
@@ -411,11 +426,25 @@ def _handle_query_results(arguments, dataset, signals, datasets, results, _resul
                 return _result(
                     "No results available. Run a strategy or simulation first."
                 )
+            # Stats come from the stored summaries, not the parquet files
+            summaries = store.list_summaries()
             lines = ["Available cached results (global store):"]
             for key, meta in all_entries.items():
                 display = meta.get("display_key", key[:12])
                 rtype = meta.get("type", "?")
-                lines.append(f"  {display} ({rtype})")
+                parts = [f"  {display} ({rtype})"]
+                summary = summaries.get(key, {})
+                if "rows" in summary:
+                    parts.append(f"rows={summary['rows']}")
+                stats = summary.get("stats", {})
+                if stats.get("mean_return") is not None:
+                    parts.append(f"mean={stats['mean_return']:.4f}")
+                if stats.get("win_rate") is not None:
+                    parts.append(f"wr={stats['win_rate']:.2%}")
+                if "date_span" in summary:
+                    first, last = (d[:10] for d in summary["date_span"])
+                    parts.append(f"{first} to {last}")
+                lines.append(" | ".join(parts))
             return _result("\n".join(lines))
 
         lines = [f"Session has {len(results)} result(s):"]
@@ -464,20 +493,22 @@ def _handle_query_results(arguments, dataset, signals, datasets, results, _resul
             f"Available: {available or 'none — run a strategy first'}"
         )
 
-    df = store.read(cache_key)
-    if df is None or df.empty:
+    # Validate against the stored dtypes so only the needed columns, and
+    # for numeric filters only the matching rows, are read.
+    dtypes = store.dtypes(cache_key)
+    if not dtypes:
         return _result(f"No data found for '{result_key}' (cache key: {cache_key}).")
+    available = list(dtypes)
 
     # Apply column selection
     columns = arguments.get("columns")
     if columns:
-        valid_cols = [c for c in columns if c in df.columns]
+        valid_cols = [c for c in columns if c in dtypes]
         if not valid_cols:
             return _result(
-                f"None of the requested columns {columns} exist. "
-                f"Available: {list(df.columns)}"
+                f"None of the requested columns {columns} exist. Available: {available}"
             )
-        df = df[valid_cols]
+        available = valid_cols
 
     # Apply filter
     filter_col = arguments.get("filter_column")
@@ -496,27 +527,43 @@ def _handle_query_results(arguments, dataset, signals, datasets, results, _resul
             f"Incomplete filter: missing {', '.join(missing)}. "
             "All three (filter_column, filter_op, filter_value) are required."
         )
-    if filter_col and filter_op and filter_val is not None:
-        if filter_col not in df.columns:
+    has_filter = bool(filter_col and filter_op and filter_val is not None)
+    pushed = None
+    if has_filter:
+        if filter_col not in available:
             return _result(
-                f"Filter column '{filter_col}' not found. Available: {list(df.columns)}"
+                f"Filter column '{filter_col}' not found. Available: {available}"
             )
+        dtype = pd.api.types.pandas_dtype(dtypes[filter_col])
+        if filter_op in _PUSHDOWN_OPS and dtype.kind in "iuf":
+            val = _cast_filter_value(dtype, filter_val)
+            if val is None:
+                return _result(
+                    f"Invalid filter_value '{filter_val}' for column "
+                    f"'{filter_col}' (dtype {dtype})."
+                )
+            pushed = [(filter_col, _PUSHDOWN_OPS[filter_op], val)]
+
+    sort_by = arguments.get("sort_by")
+    if sort_by and sort_by not in available:
+        return _result(f"Sort column '{sort_by}' not found. Available: {available}")
+
+    df = store.read(cache_key, columns=available if columns else None, filters=pushed)
+    if df is None or (df.empty and pushed is None):
+        return _result(f"No data found for '{result_key}' (cache key: {cache_key}).")
+
+    if has_filter and pushed is None:
         col = df[filter_col]
         try:
             if filter_op == "contains":
                 mask = col.astype(str).str.contains(filter_val, case=False, na=False)
             else:
-                # Cast filter_value to column dtype for numeric comparisons
-                try:
-                    val = col.dtype.type(filter_val)
-                except (ValueError, TypeError):
-                    try:
-                        val = float(filter_val)
-                    except (ValueError, TypeError):
-                        return _result(
-                            f"Invalid filter_value '{filter_val}' for column "
-                            f"'{filter_col}' (dtype {col.dtype})."
-                        )
+                val = _cast_filter_value(col.dtype, filter_val)
+                if val is None:
+                    return _result(
+                        f"Invalid filter_value '{filter_val}' for column "
+                        f"'{filter_col}' (dtype {col.dtype})."
+                    )
                 ops = {
                     "gt": col > val,
                     "lt": col < val,
@@ -532,15 +579,9 @@ def _handle_query_results(arguments, dataset, signals, datasets, results, _resul
             return _result(f"Filter error: {e}")
 
     # Apply sort
-    sort_by = arguments.get("sort_by")
     ascending = arguments.get("ascending", False)
     if sort_by:
-        if sort_by in df.columns:
-            df = df.sort_values(sort_by, ascending=ascending, na_position="last")
-        else:
-            return _result(
-                f"Sort column '{sort_by}' not found. Available: {list(df.columns)}"
-            )
+        df = df.sort_values(sort_by, ascending=ascending, na_position="last")
 
     # Apply head
     head = arguments.get("head")
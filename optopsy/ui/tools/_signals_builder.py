@@ -1,6 +1,8 @@
 """Signal tool handlers: build_signal, preview_signal, list_signals, fetch_stock_data."""
 
+import json
 import logging
+from collections import OrderedDict
 from datetime import date
 from typing import Any
 
@@ -56,6 +58,25 @@ def _remap_cross_symbol_dates(
     return pd.concat(frames, ignore_index=True)
 
 
+# Compiled build_signal plans, keyed by their expression tree's JSON
+_MAX_PLANS = 64
+_plans: "OrderedDict[str, _signals.Signal]" = OrderedDict()
+
+
+def _compiled_signal(tree: dict[str, Any]) -> "_signals.Signal":
+    """Return the Signal for *tree*, reusing a plan compiled earlier."""
+    key = json.dumps(tree, sort_keys=True, default=str)
+    plan = _plans.get(key)
+    if plan is not None:
+        _plans.move_to_end(key)
+        return plan
+    plan = _signals.Signal.from_dict(tree, factories=SIGNAL_REGISTRY)
+    _plans[key] = plan
+    while len(_plans) > _MAX_PLANS:
+        _plans.popitem(last=False)
+    return plan
+
+
 @_register("build_signal")
 def _handle_build_signal(arguments, dataset, signals, datasets, results, _result):
     slot = arguments.get("slot", "").strip()
@@ -166,8 +187,8 @@ def _handle_build_signal(arguments, dataset, signals, datasets, results, _result
     if signal_data is None:
         signal_data = _date_only_fallback(dataset)
 
-    # Build individual signal functions
-    built_signals = []
+    # Describe the signal as an expression tree
+    leaves = []
     descriptions = []
     for spec in signal_specs:
         name = spec.get("name")
@@ -176,30 +197,27 @@ def _handle_build_signal(arguments, dataset, signals, datasets, results, _result
                 f"Unknown signal '{name}'. Available: {', '.join(SIGNAL_NAMES)}"
             )
         params = spec.get("params") or {}
-        sig = SIGNAL_REGISTRY[name](**params)
+        leaf: dict[str, Any] = {"signal": name, "params": params}
         try:
             sig_days = int(spec.get("days", 0))
         except (TypeError, ValueError):
             sig_days = 0
         if sig_days > 1:
-            sig = _signals.sustained(sig, sig_days)
+            leaf = {"sustained": leaf, "days": sig_days}
             descriptions.append(f"{name}(sustained {sig_days}d)")
         else:
             param_str = ", ".join(f"{k}={v}" for k, v in params.items())
             descriptions.append(f"{name}({param_str})" if param_str else name)
-        built_signals.append(sig)
+        leaves.append(leaf)
 
-    # Combine signals
     combine = arguments.get("combine", "and")
-    if len(built_signals) == 1:
-        combined = built_signals[0]
-    elif combine == "or":
-        combined = _signals.or_signals(*built_signals)
+    if len(leaves) == 1:
+        tree = leaves[0]
     else:
-        combined = _signals.and_signals(*built_signals)
+        tree = {"or" if combine == "or" else "and": leaves}
 
     # Compute valid dates, intersected with actual options dates.
-    raw_signal_dates = signal_dates(signal_data, combined)
+    raw_signal_dates = signal_dates(signal_data, _compiled_signal(tree))
 
     # Cross-symbol: remap signal symbol to options dataset symbol(s).
     # Only applies when we actually fetched data for signal_symbol (i.e.
@@ -4,11 +4,17 @@ import itertools as _itertools
 
 import pandas as pd
 
+from optopsy.parallel import _executor_scope, _run_tasks
+from optopsy.sweep import _sweep_chain
+
 from ..providers.result_store import ResultStore
 from ._executor import _register, _require_dataset
 from ._helpers import (
     _build_strat_kwargs,
+    _cache_lookup,
+    _cache_write,
     _cached_run,
+    _cached_stats,
     _df_to_markdown,
     _make_display_key,
     _make_result_summary,
@@ -125,6 +131,8 @@ def _handle_scan_strategies(arguments, dataset, signals, datasets, results, _res
     errors = []
     scan_results = dict(results)
 
+    # Resolve cache hits first; only misses are executed.
+    combos = []
     for strat, max_dte, exit_dte in combos_to_run:
         if strat in CALENDAR_STRATEGIES:
             errors.append(
@@ -138,66 +146,97 @@ def _handle_scan_strategies(arguments, dataset, signals, datasets, results, _res
             "exit_dte": exit_dte,
             "slippage": slippage,
         }
+        # Hits are ranked from their stored summaries without reading them
+        stats, cache_key = _cached_stats(store, strat, combo_args, ds_fp)
+        cached = None
+        if stats is None:
+            cached, cache_key = _cache_lookup(store, strat, combo_args, ds_fp)
+        combos.append((strat, max_dte, exit_dte, combo_args, cached, cache_key, stats))
 
-        combo_display_key = _make_display_key(strat, combo_args)
-        result_df, cache_key, combo_err = _cached_run(
-            store,
-            strat,
-            combo_args,
-            ds_fp,
-            execute_fn=lambda s=strat, a=combo_args, ds=active_ds: _run_one_strategy(
-                s, ds, a
-            ),
-            metadata={
-                "type": "strategy",
-                "strategy": strat,
-                "display_key": combo_display_key,
-                "params": combo_args,
-            },
-        )
+    # Misses run against one prepared chain with a stage memo, so combos with
+    # common legs reuse delta selection, exit lookup and leg joins.  With
+    # n_jobs > 1 they fan out over a process pool that receives the chain
+    # once via shared memory; results come back in submission order.
+    pending = [c for c in combos if c[4] is None and c[6] is None]
+    outcomes: dict[int, pd.DataFrame | Exception] = {}
+    if pending:
+        try:
+            chain = _sweep_chain(active_ds)
+        except ValueError:
+            # Invalid schema: let each run report the error itself
+            chain = active_ds
+        tasks = [(STRATEGIES[c[0]][0], chain, c[3]) for c in pending]
+        try:
+            with _executor_scope(arguments.get("n_jobs")) as executor:
+                ran = _run_tasks(tasks, executor, return_exceptions=True)
+        except ValueError as e:
+            return _result(f"scan_strategies: {e}")
+        outcomes = {id(c): out for c, out in zip(pending, ran)}
 
-        if combo_err:
-            errors.append(f"{strat}(dte={max_dte},exit={exit_dte}): {combo_err}")
-            continue
+    # Index rows of the new results are committed in one transaction
+    with store.batch():
+        for combo in combos:
+            strat, max_dte, exit_dte, combo_args, result_df, cache_key, stats = combo
+            combo_display_key = _make_display_key(strat, combo_args)
 
-        if result_df is None or result_df.empty:
+            if result_df is None and stats is None:
+                outcome = outcomes[id(combo)]
+                if isinstance(outcome, Exception):
+                    errors.append(f"{strat}(dte={max_dte},exit={exit_dte}): {outcome}")
+                    continue
+                result_df = outcome
+                _cache_write(
+                    store,
+                    strat,
+                    cache_key,
+                    result_df,
+                    metadata={
+                        "type": "strategy",
+                        "strategy": strat,
+                        "display_key": combo_display_key,
+                        "params": combo_args,
+                    },
+                )
+
+            if stats is None and result_df.empty:
+                rows.append(
+                    {
+                        "strategy": strat,
+                        "max_entry_dte": max_dte,
+                        "exit_dte": exit_dte,
+                        "count": 0,
+                        "mean_return": float("nan"),
+                        "std": float("nan"),
+                        "win_rate": float("nan"),
+                        "profit_factor": float("nan"),
+                    }
+                )
+                continue
+
+            summary = _make_result_summary(
+                strat,
+                result_df,
+                combo_args,
+                display_key=combo_display_key,
+                dataset_fingerprint=ds_fp,
+                stats=stats,
+            )
             rows.append(
                 {
                     "strategy": strat,
                     "max_entry_dte": max_dte,
                     "exit_dte": exit_dte,
-                    "count": 0,
-                    "mean_return": float("nan"),
-                    "std": float("nan"),
-                    "win_rate": float("nan"),
-                    "profit_factor": float("nan"),
+                    "count": summary["count"],
+                    "mean_return": summary["mean_return"],
+                    "std": summary["std"],
+                    "win_rate": summary["win_rate"],
+                    "profit_factor": summary["profit_factor"],
                 }
             )
-            continue
-
-        summary = _make_result_summary(
-            strat,
-            result_df,
-            combo_args,
-            display_key=combo_display_key,
-            dataset_fingerprint=ds_fp,
-        )
-        rows.append(
-            {
-                "strategy": strat,
-                "max_entry_dte": max_dte,
-                "exit_dte": exit_dte,
-                "count": summary["count"],
-                "mean_return": summary["mean_return"],
-                "std": summary["std"],
-                "win_rate": summary["win_rate"],
-                "profit_factor": summary["profit_factor"],
-            }
-        )
-        key = _session_result_key(cache_key, combo_display_key)
-        scan_results[key] = _with_cache_key(
-            {**summary, "source": "scan_strategies"}, cache_key
-        )
+            key = _session_result_key(cache_key, combo_display_key)
+            scan_results[key] = _with_cache_key(
+                {**summary, "source": "scan_strategies"}, cache_key
+            )
 
     if not rows and not errors:
         return _result("scan_strategies: no combinations produced results.")
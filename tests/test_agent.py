@@ -509,6 +509,22 @@ class TestAgentChat:
 
         asyncio.run(_run())
 
+    def test_unchanged_dataset_fingerprinted_once(self):
+        import pandas as pd
+
+        agent = OptopsyAgent(model="test/model")
+        df = pd.DataFrame({"a": [1, 2]})
+        with patch("optopsy.ui.agent.fingerprint", return_value="fp") as fp:
+            agent._set_dataset(df)
+            agent._set_dataset(df)
+            assert fp.call_count == 1
+            df["b"] = 0
+            agent._set_dataset(df)
+            agent._set_dataset(df.copy())
+            assert fp.call_count == 3
+        agent._set_dataset(None)
+        assert agent.dataset is None and agent._dataset_fingerprint is None
+
     def test_rate_limit_retry_succeeds_on_second_attempt(self):
         """RateLimitError on first attempt, success on second."""
 
@@ -0,0 +1,145 @@
+"""Tests for mergeable grouped-statistics aggregates (optopsy.aggregates)."""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from optopsy.aggregates import (
+    _SKETCH_K,
+    _finalize_aggregates,
+    _merge_aggregates,
+    _partial_aggregates,
+    _QuantileSketch,
+)
+from optopsy.output import _group_by_intervals
+
+
+@pytest.fixture
+def trades():
+    rng = np.random.default_rng(3)
+    n = 3000
+    frame = pd.DataFrame(
+        {
+            "dte_range": pd.Categorical(rng.choice(["(0, 7]", "(7, 14]"], n)),
+            "delta_range": pd.Categorical(rng.choice(["(0.2, 0.3]", "(0.3, 0.4]"], n)),
+            "pct_change": rng.normal(0.02, 0.3, n),
+        }
+    )
+    frame.loc[::11, "pct_change"] = np.nan
+    return frame
+
+
+COLS = ["dte_range", "delta_range"]
+
+
+class TestGroupByIntervals:
+    def test_matches_describe(self, trades):
+        result = _group_by_intervals(trades, COLS, drop_na=False)
+        expected = trades.groupby(COLS, observed=True)["pct_change"].describe()
+        pd.testing.assert_frame_equal(result[expected.columns], expected)
+
+    def test_exact_quartiles_beyond_sketch_capacity(self):
+        rng = np.random.default_rng(5)
+        n = 4 * _SKETCH_K
+        frame = pd.DataFrame(
+            {
+                "bucket": pd.Categorical(rng.choice(["a", "b"], n)),
+                "pct_change": rng.normal(0.0, 1.0, n),
+            }
+        )
+        result = _group_by_intervals(frame, ["bucket"], drop_na=False)
+        expected = frame.groupby("bucket", observed=True)["pct_change"].describe()
+        pd.testing.assert_frame_equal(result[expected.columns], expected)
+
+    def test_win_rate_and_profit_factor(self, trades):
+        result = _group_by_intervals(trades, COLS, drop_na=False)
+        for key, group in trades.groupby(COLS, observed=True)["pct_change"]:
+            valid = group.dropna()
+            wins = valid[valid > 0]
+            losses = valid[valid < 0]
+            assert result.loc[key, "win_rate"] == pytest.approx(len(wins) / len(valid))
+            assert result.loc[key, "profit_factor"] == pytest.approx(
+                abs(wins.sum() / losses.sum())
+            )
+
+    def test_all_nan_group(self):
+        frame = pd.DataFrame(
+            {"bucket": pd.Categorical(["a", "a", "b"]), "pct_change": [0.1, 0.3, None]}
+        )
+        result = _group_by_intervals(frame, ["bucket"], drop_na=False)
+        assert result.loc["b", "count"] == 0
+        assert np.isnan(result.loc["b", "mean"])
+        assert np.isnan(result.loc["b", "win_rate"])
+        assert result.loc["b", "profit_factor"] == 0.0
+        assert result.loc["a", "profit_factor"] == np.inf
+
+
+class TestMerge:
+    def test_merged_parts_match_whole(self, trades):
+        shuffled = trades.sample(frac=1, random_state=0)
+        parts = [
+            _partial_aggregates(shuffled.iloc[start : start + 600], COLS)
+            for start in range(0, len(shuffled), 600)
+        ]
+        merged = _finalize_aggregates(_merge_aggregates(parts))
+        whole = _finalize_aggregates(_partial_aggregates(trades, COLS))
+        pd.testing.assert_frame_equal(merged, whole)
+
+    def test_merge_with_disjoint_groups(self, trades):
+        first = trades[trades["dte_range"] == "(0, 7]"]
+        second = trades[trades["dte_range"] == "(7, 14]"]
+        merged = _merge_aggregates(
+            [_partial_aggregates(first, COLS), _partial_aggregates(second, COLS)]
+        )
+        whole = _partial_aggregates(trades, COLS)
+        pd.testing.assert_frame_equal(
+            _finalize_aggregates(merged), _finalize_aggregates(whole)
+        )
+
+    def test_partials_pickle(self, trades):
+        partials = _partial_aggregates(trades, COLS)
+        restored = pickle.loads(pickle.dumps(partials))
+        pd.testing.assert_frame_equal(
+            _finalize_aggregates(restored), _finalize_aggregates(partials)
+        )
+
+
+class TestQuantileSketch:
+    def test_from_values_is_exact(self):
+        values = np.random.default_rng(4).normal(size=5000)
+        sketch = _QuantileSketch.from_values(values, k=256)
+        assert sketch.exact
+        np.testing.assert_allclose(
+            sketch.quantiles([0.25, 0.5, 0.75]), np.quantile(values, [0.25, 0.5, 0.75])
+        )
+
+    def test_exact_below_capacity(self):
+        values = np.random.default_rng(1).normal(size=500)
+        sketch = _QuantileSketch.from_values(values, k=1000)
+        assert sketch.exact
+        np.testing.assert_allclose(
+            sketch.quantiles([0.25, 0.5, 0.75]), np.quantile(values, [0.25, 0.5, 0.75])
+        )
+
+    def test_bounded_rank_error_when_compacted(self):
+        values = np.random.default_rng(2).uniform(size=200_000)
+        sketches = [
+            _QuantileSketch.from_values(chunk, k=256)
+            for chunk in np.array_split(values, 20)
+        ]
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged = merged.merge(sketch)
+        assert not merged.exact
+        assert merged.count == len(values)
+        assert sum(len(level) for level in merged.levels) < 2000
+        # Uniform(0, 1): a value's rank is the value itself
+        estimates = merged.quantiles([0.25, 0.5, 0.75])
+        np.testing.assert_allclose(estimates, [0.25, 0.5, 0.75], atol=0.02)
+
+    def test_empty(self):
+        sketch = _QuantileSketch.from_values([np.nan])
+        assert sketch.count == 0
+        assert np.isnan(sketch.quantiles([0.5])).all()
@@ -0,0 +1,126 @@
+"""Tests for the benchmark harness (synthetic data, runner and comparison)."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.cases import CASES, select_cases
+from benchmarks.runner import compare, main
+from benchmarks.synthetic import ChainSpec, generate_chain, generate_stocks
+
+SPEC = ChainSpec(symbols=("SPX", "QQQ"), years=1, strikes_per_expiration=10, seed=3)
+
+
+class TestSyntheticChain:
+    def test_deterministic(self):
+        pd.testing.assert_frame_equal(generate_chain(SPEC), generate_chain(SPEC))
+        pd.testing.assert_frame_equal(generate_stocks(SPEC), generate_stocks(SPEC))
+
+    def test_seed_changes_data(self):
+        other = ChainSpec(**{**SPEC.__dict__, "seed": 4})
+        assert not generate_chain(SPEC)["bid"].equals(generate_chain(other)["bid"])
+
+    def test_shape(self):
+        chain = generate_chain(SPEC)
+        per_date = chain.groupby(["underlying_symbol", "quote_date"])
+        assert (per_date["expiration"].nunique() == SPEC.expirations_per_date).all()
+        assert set(chain["option_type"]) == {"c", "p"}
+        assert (chain["ask"] > chain["bid"]).all()
+        assert chain["delta"].between(-1, 1).all()
+        for col in ("gamma", "theta", "vega", "implied_volatility", "volume"):
+            assert col in chain.columns
+
+    def test_contracts_persist_to_expiration(self):
+        chain = generate_chain(SPEC)
+        spx = chain[chain["underlying_symbol"] == "SPX"]
+        # Strike ladders are fixed per expiration, so each contract is quoted
+        # on every date from its listing until expiration
+        days = spx.groupby(["expiration", "strike", "option_type"])["quote_date"]
+        first, last, count = days.min(), days.max(), days.count()
+        bdays = [
+            len(pd.bdate_range(a, b)) for a, b in zip(first.to_numpy(), last.to_numpy())
+        ]
+        assert (count.to_numpy() == bdays).all()
+
+    def test_stocks_match_chain_underlying(self):
+        chain = generate_chain(SPEC)
+        stocks = generate_stocks(SPEC)
+        underlying = chain.groupby(["underlying_symbol", "quote_date"])[
+            "underlying_price"
+        ].first()
+        closes = stocks.set_index(["underlying_symbol", "quote_date"])["close"]
+        pd.testing.assert_series_equal(
+            underlying, closes.loc[underlying.index], check_names=False
+        )
+
+
+class TestCompare:
+    @staticmethod
+    def _doc(median_s, peak_mb):
+        return {
+            "meta": {"size": "small"},
+            "results": {"case": {"median_s": median_s, "peak_mb": peak_mb}},
+        }
+
+    @pytest.mark.parametrize(
+        "baseline, current, regressed",
+        [
+            ((0.10, 10.0), (0.10, 10.0), False),
+            ((0.10, 10.0), (0.13, 10.0), True),
+            ((0.10, 10.0), (0.10, 13.0), True),
+            # Large ratio but below the absolute noise margin
+            ((0.001, 10.0), (0.004, 10.0), False),
+        ],
+    )
+    def test_regression_flag(self, baseline, current, regressed):
+        (row,) = compare(self._doc(*current), self._doc(*baseline), tolerance=0.2)
+        assert row["regressed"] is regressed
+
+    def test_cases_missing_from_baseline_skipped(self):
+        baseline = {"meta": {}, "results": {}}
+        assert compare(self._doc(0.1, 1.0), baseline) == []
+
+
+class TestRunner:
+    def test_case_names_unique(self):
+        names = [case.name for case in CASES]
+        assert len(names) == len(set(names))
+
+    def test_select_cases(self):
+        assert {c.name for c in select_cases(["signals."])} == {
+            "signals.rsi_below",
+            "signals.composed",
+            "signals.entry_dates",
+            "signals.single_symbol_large",
+        }
+
+    def test_run_and_compare_against_baseline(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        assert (
+            main(
+                ["signals.rsi_below", "--repeat", "1", "--save-baseline", str(baseline)]
+            )
+            == 0
+        )
+        document = json.loads(baseline.read_text())
+        result = document["results"]["signals.rsi_below"]
+        assert set(result) == {"median_s", "min_s", "peak_mb", "rows"}
+        assert document["meta"]["size"] == "small"
+
+        # Comparing against itself never regresses
+        assert (
+            main(
+                [
+                    "signals.rsi_below",
+                    "--repeat",
+                    "1",
+                    "--baseline",
+                    str(baseline),
+                    "--tolerance",
+                    "100",
+                ]
+            )
+            == 0
+        )
+        assert "signals.rsi_below" in capsys.readouterr().out
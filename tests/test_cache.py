@@ -1,11 +1,14 @@
 from datetime import date, timedelta
 
+import numpy as np
 import pandas as pd
 import pytest
 
 pytest.importorskip("requests", reason="UI extras not installed")
 pytest.importorskip("pyarrow", reason="UI extras not installed")
 
+from optopsy.data.providers.cache import coverage_gaps
+from optopsy.data.providers.store import date_intervals, merge_intervals
 from optopsy.ui.providers.cache import ParquetCache, compute_date_gaps
 
 # -- ParquetCache --
@@ -53,6 +56,399 @@ class TestParquetCacheReadWrite:
         assert not (tmp_path / "newcategory").exists()
 
 
+class TestParquetCachePartitions:
+    @pytest.fixture
+    def chain(self):
+        expirations = pd.to_datetime(
+            ["2020-01-17", "2020-01-17", "2020-02-21", "2020-02-21", "2021-03-19"]
+        )
+        return pd.DataFrame(
+            {
+                "option_type": ["call", "put", "call", "put", "call"],
+                "expiration": expirations,
+                "quote_date": expirations - pd.Timedelta(days=10),
+                "strike": [100.0, 100.0, 105.0, 105.0, 110.0],
+                "bid": [1.0, 2.0, 3.0, 4.0, 5.0],
+            }
+        )
+
+    def test_writes_year_month_partitions(self, cache, chain, tmp_path):
+        cache.write("options", "SPY", chain)
+        root = tmp_path / "options" / "SPY.parquet"
+        assert root.is_dir()
+        parts = sorted(
+            str(p.relative_to(root)) for p in root.rglob("*.parquet") if p.is_file()
+        )
+        assert parts == [
+            "year=2020/month=01/part-0.parquet",
+            "year=2020/month=02/part-0.parquet",
+            "year=2021/month=03/part-0.parquet",
+        ]
+
+    def test_read_round_trips_without_partition_fields(self, cache, chain):
+        cache.write("options", "SPY", chain)
+        result = cache.read("options", "SPY")
+        assert list(result.columns) == list(chain.columns)
+        pd.testing.assert_frame_equal(
+            result.sort_values("bid", ignore_index=True), chain
+        )
+
+    def test_read_filtered_dates_and_type(self, cache, chain):
+        cache.write("options", "SPY", chain)
+        result = cache.read_filtered(
+            "options",
+            "SPY",
+            filters=[
+                ("expiration", ">=", "2020-02-01"),
+                ("expiration", "<=", pd.Timestamp("2020-12-31")),
+                ("option_type", "in", ["call"]),
+            ],
+        )
+        assert result["bid"].tolist() == [3.0]
+
+    def test_read_filtered_prunes_partitions(self, cache, chain, tmp_path):
+        cache.write("options", "SPY", chain)
+        # Break a partition the filter excludes: it must never be opened
+        other = tmp_path / "options" / "SPY.parquet" / "year=2021" / "month=03"
+        (other / "part-0.parquet").write_text("not parquet")
+        result = cache.read_filtered(
+            "options", "SPY", filters=[("expiration", "<", date(2020, 3, 1))]
+        )
+        assert len(result) == 4
+
+    def test_read_filtered_columns(self, cache, chain):
+        cache.write("options", "SPY", chain)
+        result = cache.read_filtered(
+            "options", "SPY", columns=["strike", "expiration", "missing"]
+        )
+        assert list(result.columns) == ["expiration", "strike"]
+
+    def test_read_range_and_column(self, cache, chain):
+        cache.write("options", "SPY", chain)
+        result = cache.read_range(
+            "options", "SPY", "expiration", "2020-01-01", "2020-02-21"
+        )
+        assert len(result) == 2
+        assert len(cache.read_column("options", "SPY", "strike")) == 5
+        assert cache.read_column("options", "SPY", "missing") is None
+
+    def test_rows_without_partition_date(self, cache, chain):
+        chain.loc[0, "expiration"] = pd.NaT
+        cache.write("options", "SPY", chain)
+        assert len(cache.read("options", "SPY")) == 5
+        result = cache.read_filtered(
+            "options", "SPY", filters=[("expiration", ">=", "2020-01-01")]
+        )
+        assert len(result) == 4
+
+    def test_unsupported_operator_raises(self, cache, chain):
+        cache.write("options", "SPY", chain)
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            cache.read_filtered("options", "SPY", filters=[("strike", "~", 1)])
+
+    def test_legacy_single_file(self, cache, chain, tmp_path):
+        path = tmp_path / "options" / "SPY.parquet"
+        path.parent.mkdir()
+        chain.to_parquet(path, index=False)
+        result = cache.read_filtered(
+            "options", "SPY", filters=[("option_type", "==", "put")]
+        )
+        assert result["bid"].tolist() == [2.0, 4.0]
+        assert cache.size()["options/SPY.parquet"] == path.stat().st_size
+
+        cache.write("options", "SPY", chain)
+        assert path.is_dir()
+        assert len(cache.read("options", "SPY")) == 5
+
+    def test_write_replaces_dataset(self, cache, chain, tmp_path):
+        cache.write("options", "SPY", chain)
+        cache.write("options", "SPY", chain.iloc[:2])
+        assert len(cache.read("options", "SPY")) == 2
+        leftovers = [
+            p
+            for p in (tmp_path / "options").iterdir()
+            if p.name not in ("SPY.parquet", ".SPY.parquet.lock")
+        ]
+        assert leftovers == []
+
+    def test_reads_retired_copy_mid_swap(self, cache, chain, tmp_path):
+        cache.write("options", "SPY", chain)
+        path = tmp_path / "options" / "SPY.parquet"
+        # State between the two renames of a replace
+        path.rename(tmp_path / "options" / ".SPY.parquet.retired")
+        assert len(cache.read("options", "SPY")) == 5
+        assert cache.dataset_version("options", "SPY") is not None
+
+    def test_recovers_interrupted_swap(self, cache, chain, tmp_path):
+        cache.write("options", "SPY", chain)
+        path = tmp_path / "options" / "SPY.parquet"
+        path.rename(tmp_path / "options" / ".SPY.parquet.retired")
+        cache.append("options", "SPY", chain.iloc[:1].assign(bid=9.0))
+        assert len(cache.read("options", "SPY")) == 6
+        assert not (tmp_path / "options" / ".SPY.parquet.retired").exists()
+
+    def test_stocks_partition_by_date(self, cache, tmp_path):
+        bars = pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2020-01-02", "2020-02-03"]),
+                "close": [1.0, 2.0],
+            }
+        )
+        cache.write("yf_stocks", "SPY", bars)
+        root = tmp_path / "yf_stocks" / "SPY.parquet"
+        assert (root / "year=2020" / "month=02").is_dir()
+        result = cache.read_filtered(
+            "yf_stocks", "SPY", filters=[("date", ">", "2020-01-31")]
+        )
+        assert result["close"].tolist() == [2.0]
+
+
+class TestDataStoreReadFiltered:
+    def test_default_filters_in_pandas(self, sample_df):
+        from optopsy.data.providers.store import DataStore
+
+        class MemoryStore(DataStore):
+            read = staticmethod(lambda category, symbol: sample_df)
+            write = merge_and_save = clear = size = total_size_bytes = None
+
+        store = MemoryStore()
+        result = store.read_filtered(
+            "options", "AAPL", columns=["price"], filters=[("price", ">", 150.0)]
+        )
+        assert result["price"].tolist() == [151.0]
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            store.read_filtered("options", "AAPL", filters=[("price", "like", 1)])
+
+
+def _append_rows(cache_dir, worker, n_appends):
+    """Append *n_appends* single-row segments from a separate process."""
+    cache = ParquetCache(cache_dir=cache_dir)
+    for i in range(n_appends):
+        row = pd.DataFrame(
+            {
+                "expiration": pd.to_datetime(["2020-01-17"]),
+                "strike": [float(worker * 1000 + i)],
+                "bid": [1.0],
+            }
+        )
+        cache.append("options", "SPY", row, dedup_cols=["expiration", "strike"])
+
+
+class TestParquetCacheSegments:
+    @pytest.fixture
+    def quotes(self):
+        return pd.DataFrame(
+            {
+                "expiration": pd.to_datetime(["2020-01-17", "2020-02-21"]),
+                "strike": [100.0, 100.0],
+                "bid": [1.0, 2.0],
+            }
+        )
+
+    def _manifest(self, tmp_path, symbol="SPY"):
+        import json
+
+        with open(tmp_path / "options" / f"{symbol}.parquet" / "_manifest.json") as f:
+            return json.load(f)
+
+    def test_append_writes_new_segment_only(self, cache, quotes, tmp_path):
+        cache.append("options", "SPY", quotes, dedup_cols=["expiration", "strike"])
+        first = tmp_path / "options" / "SPY.parquet" / "year=2020" / "month=01"
+        mtime = (first / "part-0.parquet").stat().st_mtime_ns
+        cache.append(
+            "options", "SPY", quotes.assign(strike=105.0), ["expiration", "strike"]
+        )
+        assert (first / "part-0.parquet").stat().st_mtime_ns == mtime
+        assert (first / "part-1.parquet").exists()
+        manifest = self._manifest(tmp_path)
+        assert [seg["id"] for seg in manifest["segments"]] == [0, 1]
+        assert manifest["dedup_cols"] == ["expiration", "strike"]
+        assert len(cache.read("options", "SPY")) == 4
+
+    def test_newest_segment_wins(self, cache, quotes):
+        keys = ["expiration", "strike"]
+        cache.append("options", "SPY", quotes, keys)
+        cache.append("options", "SPY", quotes.assign(bid=[10.0, 20.0]), keys)
+        result = cache.read("options", "SPY")
+        assert result["bid"].tolist() == [10.0, 20.0]
+
+    def test_non_key_filter_applies_after_dedup(self, cache, quotes):
+        keys = ["expiration", "strike"]
+        cache.append("options", "SPY", quotes, keys)
+        cache.append("options", "SPY", quotes.assign(bid=[10.0, 20.0]), keys)
+        # The stale bid=1.0 row must not resurface through the filter
+        result = cache.read_filtered(
+            "options", "SPY", columns=["bid"], filters=[("bid", "<", 5.0)]
+        )
+        assert result.empty
+        assert list(result.columns) == ["bid"]
+
+    def test_full_row_dedup_with_column_selection(self, cache, quotes):
+        cache.append("options", "SPY", quotes)
+        cache.append("options", "SPY", pd.concat([quotes, quotes.assign(bid=3.0)]))
+        result = cache.read_filtered("options", "SPY", columns=["expiration"])
+        assert len(result) == 4
+
+    def test_compact_merges_segments(self, cache, quotes, tmp_path):
+        keys = ["expiration", "strike"]
+        cache.append("options", "SPY", quotes, keys)
+        cache.append("options", "SPY", quotes.assign(bid=[10.0, 20.0]), keys)
+        cache.compact("options", "SPY")
+        manifest = self._manifest(tmp_path)
+        assert len(manifest["segments"]) == 1
+        files = sorted(
+            p.name for p in (tmp_path / "options" / "SPY.parquet").rglob("*.parquet")
+        )
+        assert files == ["part-0.parquet", "part-0.parquet"]
+        assert cache.read("options", "SPY")["bid"].tolist() == [10.0, 20.0]
+
+    def test_compacts_at_segment_limit(self, cache, quotes, tmp_path, monkeypatch):
+        from optopsy.data.providers import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_MAX_SEGMENTS", 3)
+        for bid in (1.0, 2.0, 3.0):
+            cache.append("options", "SPY", quotes.assign(bid=bid), ["expiration"])
+        assert len(self._manifest(tmp_path)["segments"]) == 1
+        assert cache.read("options", "SPY")["bid"].tolist() == [3.0, 3.0]
+
+    def test_unlisted_files_are_ignored(self, cache, quotes, tmp_path):
+        cache.append("options", "SPY", quotes)
+        # A crash after writing segment files but before the manifest swap
+        orphan = tmp_path / "options" / "SPY.parquet" / "year=2020" / "month=01"
+        quotes.assign(bid=99.0).to_parquet(orphan / "part-1.parquet", index=False)
+        assert cache.read("options", "SPY")["bid"].tolist() == [1.0, 2.0]
+
+    def test_append_to_legacy_file(self, cache, quotes, tmp_path):
+        path = tmp_path / "options" / "SPY.parquet"
+        path.parent.mkdir()
+        quotes.to_parquet(path, index=False)
+        cache.append("options", "SPY", quotes.assign(bid=[5.0, 6.0]), ["expiration"])
+        assert path.is_dir()
+        assert cache.read("options", "SPY")["bid"].tolist() == [5.0, 6.0]
+
+    def test_concurrent_processes_keep_every_segment(self, tmp_path):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(_append_rows, str(tmp_path), worker, 10)
+                for worker in range(2)
+            ]
+            for future in futures:
+                future.result()
+        result = ParquetCache(cache_dir=str(tmp_path)).read("options", "SPY")
+        assert len(result) == 20
+
+    def test_append_empty_is_noop(self, cache, quotes):
+        cache.append("options", "SPY", quotes.iloc[:0])
+        assert cache.read("options", "SPY") is None
+
+
+class TestHotCache:
+    @pytest.fixture
+    def hot(self, tmp_path):
+        from optopsy.data.providers.hot_cache import ArrowHotCache
+
+        return ArrowHotCache(str(tmp_path / "hot"), max_bytes=2**20)
+
+    @pytest.fixture
+    def quotes(self):
+        return pd.DataFrame(
+            {
+                "expiration": pd.to_datetime(["2020-01-17", "2020-02-21"]),
+                "option_type": ["call", "put"],
+                "bid": [1.0, 2.0],
+            }
+        )
+
+    def test_read_fills_and_uses_hot_copy(self, tmp_path, hot, quotes):
+        cache = ParquetCache(cache_dir=str(tmp_path / "cache"), hot_cache=hot)
+        cache.write("options", "SPY", quotes)
+        first = cache.read("options", "SPY")
+        copies = list((tmp_path / "hot" / "options").glob("SPY-*.arrow"))
+        assert len(copies) == 1
+
+        # Served from the hot copy: the parquet files are never opened
+        for part in (tmp_path / "cache").rglob("part-*.parquet"):
+            part.write_text("not parquet")
+        pd.testing.assert_frame_equal(cache.read("options", "SPY"), first)
+        result = cache.read_filtered(
+            "options", "SPY", columns=["bid"], filters=[("option_type", "==", "put")]
+        )
+        assert result["bid"].tolist() == [2.0]
+
+    def test_append_invalidates(self, tmp_path, hot, quotes):
+        cache = ParquetCache(cache_dir=str(tmp_path / "cache"), hot_cache=hot)
+        cache.write("options", "SPY", quotes)
+        cache.read("options", "SPY")
+        cache.append("options", "SPY", quotes.assign(bid=[5.0, 6.0]), ["expiration"])
+        assert cache.read("options", "SPY")["bid"].tolist() == [5.0, 6.0]
+        # The stale copy was replaced, not kept beside the new one
+        assert len(list((tmp_path / "hot" / "options").glob("SPY-*.arrow"))) == 1
+
+    def test_same_shape_write_invalidates(self, tmp_path, hot, quotes):
+        cache = ParquetCache(cache_dir=str(tmp_path / "cache"), hot_cache=hot)
+        cache.write("options", "SPY", quotes)
+        cache.read("options", "SPY")
+        # Same rows, columns and dates: only the values differ
+        cache.write("options", "SPY", quotes.assign(bid=[10.0, 20.0]))
+        assert hot.size_bytes() == 0
+        assert cache.read("options", "SPY")["bid"].tolist() == [10.0, 20.0]
+
+    def test_clear_discards_hot_copy(self, tmp_path, hot, quotes):
+        cache = ParquetCache(cache_dir=str(tmp_path / "cache"), hot_cache=hot)
+        cache.write("options", "SPY", quotes)
+        cache.read("options", "SPY")
+        cache.clear(symbol="SPY")
+        assert hot.size_bytes() == 0
+        assert cache.read("options", "SPY") is None
+
+    def test_lru_eviction(self, tmp_path, quotes):
+        import os
+        import time
+
+        import pyarrow as pa
+
+        from optopsy.data.providers.hot_cache import ArrowHotCache
+
+        table = pa.Table.from_pandas(quotes)
+        probe = ArrowHotCache(str(tmp_path / "probe"), max_bytes=2**20)
+        probe.put("options", "X", "f", table)
+        one = probe.size_bytes()
+
+        hot = ArrowHotCache(str(tmp_path / "hot"), max_bytes=2 * one)
+        hot.put("options", "A", "f", table)
+        hot.put("options", "B", "f", table)
+        # Make A the most recently read
+        past = time.time() - 60
+        os.utime(tmp_path / "hot" / "options" / "B-f.arrow", (past, past))
+        assert hot.get("options", "A", "f") is not None
+        hot.put("options", "C", "f", table)
+        assert hot.get("options", "B", "f") is None
+        assert hot.get("options", "A", "f") is not None
+        assert hot.get("options", "C", "f") is not None
+
+    def test_oversized_table_not_stored(self, tmp_path, quotes):
+        import pyarrow as pa
+
+        from optopsy.data.providers.hot_cache import ArrowHotCache
+
+        hot = ArrowHotCache(str(tmp_path / "hot"), max_bytes=1)
+        hot.put("options", "SPY", "f", pa.Table.from_pandas(quotes))
+        assert hot.get("options", "SPY", "f") is None
+
+    def test_get_store_enables_tier(self, monkeypatch):
+        from optopsy.data.providers import cache as cache_module
+
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        monkeypatch.setenv("OPTOPSY_HOT_CACHE_MB", "64")
+        store = cache_module.get_store()
+        assert store._hot_cache is not None
+
+
 class TestParquetCacheMergeAndSave:
     def test_merge_no_existing(self, cache):
         df = pd.DataFrame({"a": [1, 2]})
@@ -301,3 +697,139 @@ class TestComputeDateGaps:
         # Before and after gaps must still be detected
         assert ("2023-12-01", "2023-12-31") in gaps
         assert ("2024-02-03", "2024-03-01") in gaps
+
+    def test_matches_pairwise_scan(self):
+        """Gaps equal a scan of every pair of consecutive cached dates."""
+        rng = np.random.default_rng(7)
+        days = pd.date_range("2023-01-01", "2024-12-31")
+        for _ in range(20):
+            picked = days[np.sort(rng.choice(len(days), size=120, replace=False))]
+            start = date(2022, 12, 1) + timedelta(days=int(rng.integers(0, 500)))
+            end = start + timedelta(days=int(rng.integers(0, 400)))
+            cached = _make_cached_df(picked.repeat(3))
+            assert compute_date_gaps(cached, start, end) == _pairwise_gaps(
+                sorted(set(picked.date)), start, end
+            )
+
+
+def _pairwise_gaps(unique_dates, start_dt, end_dt):
+    """Reference gaps for sorted *unique_dates* and a bounded request."""
+    gaps = []
+    if start_dt < unique_dates[0]:
+        gaps.append((str(start_dt), str(unique_dates[0] - timedelta(days=1))))
+    overlap_start = max(start_dt, unique_dates[0])
+    overlap_end = min(end_dt, unique_dates[-1])
+    if overlap_start <= overlap_end:
+        for prev, curr in zip(unique_dates, unique_dates[1:]):
+            hole_start = max(prev + timedelta(days=1), overlap_start)
+            hole_end = min(curr - timedelta(days=1), overlap_end)
+            if (curr - prev).days > 5 and hole_start <= hole_end:
+                gaps.append((str(hole_start), str(hole_end)))
+    if end_dt > unique_dates[-1]:
+        gaps.append((str(unique_dates[-1] + timedelta(days=1)), str(end_dt)))
+    return gaps
+
+
+class TestCoverageIndex:
+    @pytest.fixture
+    def quotes(self):
+        dates = pd.bdate_range("2024-01-01", "2024-03-29")
+        dates = dates[(dates < "2024-02-05") | (dates > "2024-02-16")]
+        return pd.DataFrame(
+            {
+                "quote_date": dates.repeat(2),
+                "expiration": pd.Timestamp("2024-06-21"),
+                "strike": [100.0, 105.0] * len(dates),
+            }
+        )
+
+    def test_date_intervals(self):
+        dates = pd.Series(
+            pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-08"])
+        )
+        assert date_intervals(dates) == [
+            (date(2024, 1, 1), date(2024, 1, 3)),
+            (date(2024, 1, 8), date(2024, 1, 8)),
+        ]
+        assert date_intervals(pd.Series(pd.to_datetime([None]))) == []
+
+    def test_merge_intervals(self):
+        runs = [(date(2024, 1, 1), date(2024, 1, 3))]
+        assert merge_intervals(runs, [(date(2024, 1, 4), date(2024, 1, 5))]) == [
+            (date(2024, 1, 1), date(2024, 1, 5))
+        ]
+        assert merge_intervals(runs, [(date(2024, 1, 6), date(2024, 1, 6))]) == [
+            (date(2024, 1, 1), date(2024, 1, 3)),
+            (date(2024, 1, 6), date(2024, 1, 6)),
+        ]
+
+    def test_write_indexes_coverage(self, cache, quotes):
+        cache.write("options", "SPY", quotes)
+        coverage = cache.coverage("options", "SPY")
+        assert coverage == date_intervals(quotes["quote_date"])
+        # One run per week, the missing fortnight splitting them
+        assert len(coverage) == 11
+        # Unindexed columns are read instead
+        assert cache.coverage("options", "SPY", "expiration") == [
+            (date(2024, 6, 21), date(2024, 6, 21))
+        ]
+
+    def test_coverage_does_not_read_rows(self, cache, quotes, monkeypatch):
+        from optopsy.data.providers import cache as cache_module
+
+        cache.write("options", "SPY", quotes)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("coverage read the dataset")
+
+        monkeypatch.setattr(cache_module, "read_dataset", _fail)
+        assert cache.coverage("options", "SPY") == date_intervals(quotes["quote_date"])
+
+    def test_append_merges_coverage(self, cache, quotes):
+        keys = ["quote_date", "strike"]
+        gap = quotes["quote_date"].between("2024-02-01", "2024-02-29")
+        cache.append("options", "SPY", quotes[~gap], keys)
+        cache.append("options", "SPY", quotes[gap], keys)
+        cache.append("options", "SPY", quotes.assign(strike=110.0), keys)
+        assert cache.coverage("options", "SPY") == date_intervals(quotes["quote_date"])
+
+    def test_missing_symbol(self, cache):
+        assert cache.coverage("options", "SPY") is None
+
+    def test_manifest_without_index_reads_column(self, cache, quotes, tmp_path):
+        import json
+
+        cache.append("options", "SPY", quotes, ["quote_date", "strike"])
+        manifest_path = tmp_path / "options" / "SPY.parquet" / "_manifest.json"
+        manifest = json.loads(manifest_path.read_text())
+        del manifest["coverage"]
+        manifest_path.write_text(json.dumps(manifest))
+
+        expected = date_intervals(quotes["quote_date"])
+        assert cache.coverage("options", "SPY") == expected
+        # Appends cannot extend an index they never saw; compaction rebuilds it
+        cache.append("options", "SPY", quotes.assign(strike=110.0))
+        assert "coverage" not in json.loads(manifest_path.read_text())
+        cache.compact("options", "SPY")
+        assert json.loads(manifest_path.read_text())["coverage"]["quote_date"]
+        assert cache.coverage("options", "SPY") == expected
+
+    def test_coverage_gaps_match_compute_date_gaps(self, cache, quotes):
+        cache.write("options", "SPY", quotes)
+        coverage = cache.coverage("options", "SPY")
+        for start, end in [
+            (date(2023, 12, 1), date(2024, 5, 1)),
+            (date(2024, 2, 1), date(2024, 2, 20)),
+            (date(2024, 1, 10), None),
+            (None, None),
+        ]:
+            assert coverage_gaps(coverage, start, end) == compute_date_gaps(
+                quotes, start, end
+            )
+        assert ("2024-02-03", "2024-02-18") in coverage_gaps(
+            coverage, date(2024, 1, 1), date(2024, 3, 29)
+        )
+
+    def test_coverage_gaps_without_cache(self):
+        assert coverage_gaps(None, date(2024, 1, 1), None) == [("2024-01-01", None)]
+        assert coverage_gaps([], None, None) == [(None, None)]
@@ -0,0 +1,175 @@
+"""Tests for out-of-core strategy runs over expiration-aligned chunks."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import optopsy as op
+from optopsy.chunked import _plan_chunks
+
+
+@pytest.fixture(scope="module")
+def long_chain():
+    """Daily quotes for several weekly expirations and a strike ladder."""
+    rng = np.random.default_rng(7)
+    rows = []
+    for quote_date in pd.bdate_range("2023-01-02", periods=60):
+        underlying = 100 + rng.normal(0, 2)
+        for expiration in pd.date_range("2023-01-20", periods=8, freq="W-FRI"):
+            if expiration < quote_date:
+                continue
+            for strike in range(90, 111, 2):
+                for option_type in ("c", "p"):
+                    moneyness = (underlying - strike) / 20
+                    delta = 0.5 + moneyness if option_type == "c" else moneyness - 0.5
+                    mid = max(0.1, abs(underlying - strike) / 4 + rng.uniform(0.5, 2))
+                    rows.append(
+                        (
+                            "SPX",
+                            underlying,
+                            option_type,
+                            expiration,
+                            quote_date,
+                            float(strike),
+                            mid - 0.05,
+                            mid + 0.05,
+                            float(np.clip(delta, -0.99, 0.99)),
+                        )
+                    )
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "underlying_symbol",
+            "underlying_price",
+            "option_type",
+            "expiration",
+            "quote_date",
+            "strike",
+            "bid",
+            "ask",
+            "delta",
+        ],
+    )
+
+
+def _sorted(frame):
+    return frame.sort_values(list(frame.columns[:6])).reset_index(drop=True)
+
+
+class TestPlanChunks:
+    def test_never_splits_an_expiration(self, long_chain):
+        expirations = long_chain["expiration"]
+        ranges = _plan_chunks(expirations, 500)
+        assert len(ranges) > 1
+        for start, stop in ranges:
+            assert start < stop
+        # Ranges tile every expiration exactly once
+        covered = sum(
+            ((expirations >= start) & (expirations < stop)).sum()
+            for start, stop in ranges
+        )
+        assert covered == len(long_chain)
+
+    def test_oversized_expiration_gets_own_chunk(self, long_chain):
+        ranges = _plan_chunks(long_chain["expiration"], 1)
+        assert len(ranges) == long_chain["expiration"].nunique()
+
+    @pytest.mark.parametrize("chunk_rows", [0, -5, 1.5, True])
+    def test_invalid_chunk_rows(self, long_chain, chunk_rows):
+        with pytest.raises(ValueError, match="chunk_rows"):
+            op.chunk_chain(long_chain, chunk_rows)
+
+
+class TestChunkedStrategies:
+    @pytest.mark.parametrize(
+        "strategy, kwargs",
+        [
+            (op.long_calls, {}),
+            (op.short_puts, {"exit_dte": 3}),
+            (op.long_call_spread, {}),
+            (op.long_call_spread, {"stop_loss": -0.3, "take_profit": 0.3}),
+            (op.iron_condor, {}),
+        ],
+    )
+    def test_raw_matches_full_run(self, long_chain, strategy, kwargs):
+        expected = strategy(long_chain, raw=True, **kwargs)
+        result = strategy(op.chunk_chain(long_chain, 2000), raw=True, **kwargs)
+        assert not expected.empty
+        pd.testing.assert_frame_equal(_sorted(result), _sorted(expected))
+
+    @pytest.mark.parametrize("strategy", [op.long_calls, op.long_call_spread])
+    def test_aggregated_matches_full_run(self, long_chain, strategy):
+        expected = strategy(long_chain)
+        result = strategy(op.chunk_chain(long_chain, 2000))
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_no_trades(self, long_chain):
+        chain = op.chunk_chain(long_chain, 2000)
+        expected = op.long_calls(long_chain, max_entry_dte=1, exit_dte=0)
+        result = op.long_calls(chain, max_entry_dte=1, exit_dte=0)
+        assert result.empty
+        assert list(result.columns) == list(expected.columns)
+
+    def test_empty_chain_raises(self, long_chain):
+        with pytest.raises(ValueError, match="no data"):
+            op.long_calls(op.chunk_chain(long_chain.iloc[:0], 100))
+
+    def test_calendar_rejected(self, long_chain):
+        with pytest.raises(ValueError, match="chunked chain"):
+            op.long_call_calendar(op.chunk_chain(long_chain, 2000))
+
+    def test_simulate_matches_full_run(self, long_chain):
+        expected = op.simulate(long_chain, op.short_puts, exit_dte=3)
+        result = op.simulate(
+            op.chunk_chain(long_chain, 2000), op.short_puts, exit_dte=3
+        )
+        assert not expected.trade_log.empty
+        pd.testing.assert_frame_equal(result.trade_log, expected.trade_log)
+        pd.testing.assert_series_equal(result.equity_curve, expected.equity_curve)
+
+    def test_simulate_empty_chain(self, long_chain):
+        result = op.simulate(op.chunk_chain(long_chain.iloc[:0], 100), op.long_calls)
+        assert result.trade_log.empty
+
+    def test_stock_data_rejected(self, long_chain):
+        stock = (
+            long_chain.groupby("quote_date", as_index=False)["underlying_price"]
+            .first()
+            .assign(symbol="SPX", close=lambda df: df["underlying_price"])
+        )
+        with pytest.raises(ValueError, match="chunked chain"):
+            op.covered_call(op.chunk_chain(long_chain, 2000), stock_data=stock)
+        with pytest.raises(ValueError, match="chunked chain"):
+            op.collar(op.chunk_chain(long_chain, 2000), stock_data=stock)
+
+    def test_prepare_rejected(self, long_chain):
+        with pytest.raises(ValueError, match="chunked chain"):
+            op.prepare(op.chunk_chain(long_chain, 2000))
+
+
+class TestCachedChunks:
+    def test_matches_in_memory_run(self, long_chain, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers import cache
+
+        store = cache.ParquetCache(cache_dir=str(tmp_path))
+        cached = long_chain.assign(
+            option_type=long_chain["option_type"].map({"c": "call", "p": "put"})
+        )
+        store.write("options", "SPX", cached)
+        monkeypatch.setattr(cache, "get_store", lambda: store)
+
+        chain = op.load_cached_options_chunked("SPX", chunk_rows=2000)
+        assert len(chain) > 1
+        expected = op.long_call_spread(op.load_cached_options("SPX"), raw=True)
+        result = op.long_call_spread(chain, raw=True)
+        pd.testing.assert_frame_equal(_sorted(result), _sorted(expected))
+
+    def test_missing_symbol(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers import cache
+
+        store = cache.ParquetCache(cache_dir=str(tmp_path))
+        monkeypatch.setattr(cache, "get_store", lambda: store)
+        with pytest.raises(FileNotFoundError):
+            op.load_cached_options_chunked("NOPE")
@@ -0,0 +1,145 @@
+"""Tests for the compact chain schema (optopsy.compact)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import optopsy as op
+from benchmarks.synthetic import ChainSpec, generate_chain
+from optopsy.compact import _expand_compact
+
+
+@pytest.fixture(scope="module")
+def chain():
+    """Synthetic chain quoted like real end-of-day data (cents, 4-5 digit Greeks)."""
+    raw = generate_chain(ChainSpec(strikes_per_expiration=10, expirations_per_date=4))
+    return raw.assign(
+        underlying_price=raw["underlying_price"].round(2),
+        delta=raw["delta"].round(4),
+        gamma=raw["gamma"].round(5),
+        theta=raw["theta"].round(4),
+        vega=raw["vega"].round(4),
+        implied_volatility=raw["implied_volatility"].round(4),
+    )
+
+
+@pytest.fixture(scope="module")
+def compact(chain):
+    return op.compact_chain(chain)
+
+
+class TestCompactChain:
+    def test_dtypes(self, compact):
+        assert isinstance(compact["underlying_symbol"].dtype, pd.CategoricalDtype)
+        assert isinstance(compact["option_type"].dtype, pd.CategoricalDtype)
+        for col in ("strike", "bid", "ask", "underlying_price"):
+            assert compact[col].dtype == np.int32
+        for col in ("delta", "gamma", "theta", "vega", "implied_volatility"):
+            assert compact[col].dtype == np.float32
+        for col in ("volume", "open_interest", "expiration", "quote_date"):
+            assert compact[col].dtype == np.int32
+
+    def test_round_trip(self, chain, compact):
+        pd.testing.assert_frame_equal(_expand_compact(compact), chain)
+
+    def test_does_not_modify_input(self, chain):
+        before = chain.dtypes.copy()
+        op.compact_chain(chain)
+        pd.testing.assert_series_equal(chain.dtypes, before)
+
+    def test_smaller(self, chain, compact):
+        full = chain.memory_usage(deep=True).sum()
+        assert compact.memory_usage(deep=True).sum() < full / 2
+
+    def test_sub_cent_prices_kept(self, data):
+        chain = data.assign(bid=data["bid"] + 0.001)
+        compact = op.compact_chain(chain)
+        assert compact["bid"].dtype == np.float64
+        assert compact["ask"].dtype == np.int32
+        pd.testing.assert_frame_equal(_expand_compact(compact), chain)
+
+    def test_missing_values_kept(self, data_with_delta):
+        chain = data_with_delta.copy()
+        chain.loc[0, "strike"] = np.nan
+        chain.loc[0, "delta"] = np.nan
+        chain.loc[1, "delta"] = 0.123456789
+        compact = op.compact_chain(chain)
+        assert compact["strike"].dtype == np.float64
+        assert compact["delta"].dtype == np.float64
+        pd.testing.assert_frame_equal(_expand_compact(compact), chain)
+
+    def test_intraday_timestamps_kept(self, data):
+        chain = data.assign(quote_date=data["quote_date"] + pd.Timedelta(hours=16))
+        compact = op.compact_chain(chain)
+        assert compact["quote_date"].dtype == chain["quote_date"].dtype
+        assert compact["expiration"].dtype == np.int32
+
+    def test_expand_standard_chain_is_noop(self, chain):
+        assert _expand_compact(chain) is chain
+
+    def test_expand_only_marked_columns(self, data):
+        compact = op.compact_chain(data.assign(bid=data["bid"] + 0.001))
+        assert "bid" not in compact.attrs["optopsy_compact"]
+        expanded = _expand_compact(compact.assign(bid=compact["bid"].astype(np.int32)))
+        assert expanded["bid"].dtype == np.int32
+        assert "optopsy_compact" not in expanded.attrs
+
+    def test_int32_strikes_not_rescaled(self, data):
+        # Whole-dollar strikes stored as int32 are not cents
+        chain = data.assign(strike=data["strike"].astype(np.int32))
+        assert _expand_compact(chain) is chain
+        with pytest.raises(ValueError, match="int32 of strike"):
+            op.long_calls(chain)
+
+    def test_csv_data_option(self, tmp_path, data):
+        path = tmp_path / "chain.csv"
+        data.to_csv(path, index=False)
+        kwargs = dict(
+            underlying_symbol=0,
+            option_type=1,
+            expiration=2,
+            quote_date=3,
+            strike=4,
+            bid=5,
+            ask=6,
+        )
+        compact = op.csv_data(str(path), compact=True, **kwargs)
+        assert compact["strike"].dtype == np.int32
+        pd.testing.assert_frame_equal(
+            _expand_compact(compact), op.csv_data(str(path), **kwargs)
+        )
+
+
+class TestIdenticalResults:
+    @pytest.mark.parametrize(
+        "strategy,kwargs",
+        [
+            (op.long_calls, {}),
+            (op.short_puts, {"raw": True}),
+            (op.long_straddles, {}),
+            (op.short_put_spread, {}),
+            (op.iron_condor, {"raw": True}),
+            (op.long_call_butterfly, {}),
+            (op.long_call_calendar, {}),
+            (op.short_puts, {"stop_loss": -1.0, "take_profit": 0.5, "raw": True}),
+            (
+                op.short_puts,
+                {"leg1_delta": op.TargetRange(target=0.3, min=0.2, max=0.4)},
+            ),
+        ],
+    )
+    def test_strategy(self, chain, compact, strategy, kwargs):
+        pd.testing.assert_frame_equal(
+            strategy(compact, **kwargs), strategy(chain, **kwargs)
+        )
+
+    def test_simulate(self, chain, compact):
+        kwargs = dict(max_positions=3, max_entry_dte=45, exit_dte=7)
+        result = op.simulate(compact, op.short_puts, **kwargs)
+        expected = op.simulate(chain, op.short_puts, **kwargs)
+        pd.testing.assert_frame_equal(result.trade_log, expected.trade_log)
+
+    def test_prepare(self, chain, compact):
+        result = op.iron_condor(op.prepare(compact), raw=True)
+        expected = op.iron_condor(op.prepare(chain), raw=True)
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,156 @@
+"""Tests for the sorted contract index (optopsy.contracts)."""
+
+import gc
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import optopsy as op
+from optopsy.contracts import (
+    _INDEX_CACHE,
+    CONTRACT_COLS,
+    _contract_index,
+    _pin_index,
+)
+
+
+@pytest.fixture
+def chain():
+    """Two contracts, one quoted on three dates with a duplicated middle row."""
+    d = pd.to_datetime
+    rows = [
+        ("SPX", "call", d("2024-02-16"), 100.0, d("2024-01-05"), 1.0),
+        ("SPX", "call", d("2024-02-16"), 100.0, d("2024-01-03"), 2.0),
+        ("SPX", "put", d("2024-02-16"), 100.0, d("2024-01-03"), 3.0),
+        ("SPX", "call", d("2024-02-16"), 100.0, d("2024-01-04"), 4.0),
+        ("SPX", "call", d("2024-02-16"), 100.0, d("2024-01-04"), 5.0),
+        ("SPX", "put", d("2024-02-16"), 100.0, d("2024-01-05"), 6.0),
+    ]
+    return pd.DataFrame(rows, columns=CONTRACT_COLS + ["quote_date", "bid"])
+
+
+def _ids(index, option_types):
+    n = len(option_types)
+    return index.contract_ids(
+        [
+            pd.Series(["SPX"] * n),
+            pd.Series(option_types),
+            pd.Series(pd.to_datetime(["2024-02-16"] * n)),
+            pd.Series([100.0] * n),
+        ]
+    )
+
+
+class TestContractIndex:
+    def test_unknown_contract(self, chain):
+        index = _contract_index(chain)
+        ids = index.contract_ids(
+            [
+                pd.Series(["QQQ"]),
+                pd.Series(["call"]),
+                pd.Series(pd.to_datetime(["2024-02-16"])),
+                pd.Series([100.0]),
+            ]
+        )
+        assert ids.tolist() == [-1]
+
+    def test_locate_returns_first_duplicate(self, chain):
+        index = _contract_index(chain)
+        dates = pd.Series(pd.to_datetime(["2024-01-04", "2024-01-04", "2024-01-10"]))
+        positions = index.locate(_ids(index, ["call", "put", "call"]), dates)
+        assert positions.tolist() == [3, -1, -1]
+
+    def test_locate_all_keeps_duplicates(self, chain):
+        index = _contract_index(chain)
+        dates = pd.Series(pd.to_datetime(["2024-01-03", "2024-01-04"]))
+        rows, positions = index.locate_all(_ids(index, ["put", "call"]), dates)
+        assert rows.tolist() == [0, 1, 1]
+        assert positions.tolist() == [2, 3, 4]
+
+    def test_locate_latest_with_floor(self, chain):
+        index = _contract_index(chain)
+        ids = _ids(index, ["call", "call", "put"])
+        latest = pd.Series(pd.to_datetime(["2024-01-04", "2024-01-02", "2024-01-04"]))
+        earliest = pd.Series(pd.to_datetime(["2024-01-01", "2024-01-01", "2024-01-04"]))
+        assert index.locate_latest(ids, latest, earliest).tolist() == [3, -1, -1]
+        assert index.locate_latest(ids, latest).tolist() == [3, -1, 2]
+
+    def test_between_excludes_entry_and_last_date(self, chain):
+        index = _contract_index(chain)
+        after = pd.Series(pd.to_datetime(["2024-01-03", "2024-01-01"]))
+        rows, positions = index.between(_ids(index, ["call", "put"]), after)
+        # call: both 01-04 rows (01-05 is its last date); put: only 01-03
+        assert rows.tolist() == [0, 0, 1]
+        assert positions.tolist() == [3, 4, 2]
+
+    def test_between_batches_cap_rows_per_batch(self, chain):
+        index = _contract_index(chain)
+        ids = _ids(index, ["call", "put", "call"])
+        after = pd.Series(pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-01"]))
+        batches = list(index.between_batches(ids, after, max_rows=2))
+        # Windows of 2, 1 and 3 rows; the 3-row window is never split
+        assert [rows.tolist() for rows, _ in batches] == [[0, 0], [1], [2, 2, 2]]
+        rows, positions = index.between(ids, after)
+        assert np.concatenate([p for _, p in batches]).tolist() == positions.tolist()
+
+    def test_empty_chain(self, chain):
+        index = _contract_index(chain.iloc[:0])
+        ids = np.array([-1])
+        dates = pd.Series(pd.to_datetime(["2024-01-04"]))
+        assert index.locate(ids, dates).tolist() == [-1]
+        assert index.locate_latest(ids, dates).tolist() == [-1]
+        assert len(index.between(ids, dates)[0]) == 0
+        assert list(index.between_batches(ids, dates, max_rows=10)) == []
+
+    def test_cached_for_pinned_frames(self, chain):
+        frame = _pin_index(chain.copy())
+        assert _contract_index(frame) is _contract_index(frame)
+        assert _contract_index(frame.copy()) is not _contract_index(frame)
+
+    def test_other_frames_indexed_per_call(self, chain):
+        frame = chain.copy()
+        before = _contract_index(frame)
+        frame.loc[0, "strike"] = 105.0
+        after = _contract_index(frame)
+        assert after is not before
+        assert len(after.contracts) == len(before.contracts) + 1
+
+    def test_cache_hit_never_hashes(self, chain, monkeypatch):
+        frame = _pin_index(chain.copy())
+        index = _contract_index(frame)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("hashed the chain")
+
+        monkeypatch.setattr(pd.util, "hash_pandas_object", fail)
+        monkeypatch.setattr(pd, "factorize", fail)
+        assert _contract_index(frame) is index
+
+    def test_prepared_chain_indexed_once(self, chain):
+        prepared = op.prepare(
+            chain.assign(
+                ask=chain["bid"] + 0.1,
+                underlying_price=100.0,
+                delta=0.5,
+            )
+        )
+        assert _contract_index(prepared.data) is _contract_index(prepared.data)
+        assert _contract_index(prepared.calls) is _contract_index(prepared.calls)
+
+    def test_last_dates_without_warnings(self, chain):
+        index = _contract_index(chain)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = index.last_dates(np.array([-1]))
+        assert np.isnat(result).all()
+
+    def test_cache_released_with_frame(self, chain):
+        frame = _pin_index(chain.copy())
+        _contract_index(frame)
+        key = id(frame)
+        assert key in _INDEX_CACHE
+        del frame
+        gc.collect()
+        assert key not in _INDEX_CACHE
@@ -1,4 +1,5 @@
 import os
+import shutil
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -37,6 +38,19 @@ def filepath_empty():
     return os.path.join(_TEST_DATA_DIR, "empty.csv")
 
 
+_CSV_KWARGS = dict(
+    underlying_symbol=0,
+    underlying_price=1,
+    option_type=2,
+    expiration=3,
+    quote_date=4,
+    strike=5,
+    bid=6,
+    ask=7,
+    delta=8,
+)
+
+
 def test_import_csv_file():
     data = op.datafeeds.csv_data(
         filepath(),
@@ -304,6 +318,133 @@ def test_empty_csv_raises():
         )
 
 
+def test_date_format():
+    """An explicit date format parses the same dates as inference."""
+    kwargs = dict(_CSV_KWARGS, start_date=datetime(1990, 1, 20))
+    inferred = op.datafeeds.csv_data(filepath(), **kwargs)
+    explicit = op.datafeeds.csv_data(filepath(), date_format="%m/%d/%Y", **kwargs)
+    pd.testing.assert_frame_equal(explicit, inferred)
+
+
+# =============================================================================
+# Multi-file CSV Tests
+# =============================================================================
+
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    """data.csv split into one file per row under tmp_path/chains."""
+    directory = tmp_path / "chains"
+    directory.mkdir()
+    raw = pd.read_csv(filepath())
+    for i in range(len(raw)):
+        raw.iloc[[i]].to_csv(directory / f"day_{i:03d}.csv", index=False)
+    (directory / "notes.txt").write_text("not a chain")
+    return directory
+
+
+class TestMultiFileCsv:
+    def test_directory_matches_single_file(self, csv_dir):
+        pytest.importorskip("pyarrow")
+        expected = op.csv_data(filepath(), **_CSV_KWARGS)
+        result = op.csv_data(str(csv_dir), **_CSV_KWARGS)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_glob_with_date_format_and_range(self, csv_dir):
+        pytest.importorskip("pyarrow")
+        kwargs = dict(_CSV_KWARGS, start_date=datetime(1990, 1, 20))
+        expected = op.csv_data(filepath(), **kwargs)
+        result = op.csv_data(
+            str(csv_dir / "day_*.csv"), date_format="%m/%d/%Y", workers=2, **kwargs
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_reports_progress(self, csv_dir):
+        pytest.importorskip("pyarrow")
+        reports = []
+        op.csv_data(str(csv_dir), progress=reports.append, **_CSV_KWARGS)
+        assert [r.files_done for r in reports] == list(range(1, len(reports) + 1))
+        last = reports[-1]
+        assert last.files_done == last.files_total == len(reports)
+        assert last.rows == len(pd.read_csv(filepath()))
+        assert last.bytes > 0
+        assert last.rows_per_s > 0 and last.mb_per_s > 0
+
+    def test_file_name_with_glob_characters(self, tmp_path):
+        path = tmp_path / "chain[2024].csv"
+        shutil.copy(filepath(), path)
+        expected = op.csv_data(filepath(), **_CSV_KWARGS)
+        pd.testing.assert_frame_equal(op.csv_data(str(path), **_CSV_KWARGS), expected)
+
+    def test_no_match_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="No CSV files found"):
+            op.csv_data(str(tmp_path / "*.csv"), **_CSV_KWARGS)
+
+    def test_bad_date_format_raises(self, csv_dir):
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="Error parsing CSV file"):
+            op.csv_data(str(csv_dir), date_format="%Y-%m-%d", **_CSV_KWARGS)
+
+    def test_narrow_file_raises(self, csv_dir):
+        pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="Column mapping error"):
+            op.csv_data(str(csv_dir), **dict(_CSV_KWARGS, gamma=20))
+
+
+class TestIngestCsv:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers import cache
+
+        store = cache.ParquetCache(cache_dir=str(tmp_path / "cache"))
+        monkeypatch.setattr(cache, "get_store", lambda: store)
+        return store
+
+    def test_ingest_into_cache(self, csv_dir, store):
+        rows = op.ingest_csv(
+            str(csv_dir), "SPX", date_format="%m/%d/%Y", batch_rows=3, **_CSV_KWARGS
+        )
+        expected = op.csv_data(filepath(), **_CSV_KWARGS)
+        assert rows == len(expected)
+
+        cached = store.read("options", "SPX")
+        key = ["quote_date", "expiration", "strike", "option_type"]
+        pd.testing.assert_frame_equal(
+            cached.sort_values(key, ignore_index=True)[list(expected.columns)],
+            expected.sort_values(key, ignore_index=True),
+            check_dtype=False,
+        )
+
+    def test_reingest_replaces_rows(self, csv_dir, store):
+        op.ingest_csv(str(csv_dir), "SPX", **_CSV_KWARGS)
+        op.ingest_csv(str(csv_dir), "SPX", **_CSV_KWARGS)
+        assert len(store.read("options", "SPX")) == len(pd.read_csv(filepath()))
+
+    def test_roots_sharing_a_symbol_kept_apart(self, tmp_path, store):
+        raw = pd.read_csv(filepath()).iloc[[0]]
+        raw.to_csv(tmp_path / "spx.csv", index=False)
+        raw.assign(**{raw.columns[0]: "SPXW"}).to_csv(
+            tmp_path / "spxw.csv", index=False
+        )
+        source = str(tmp_path / "*.csv")
+        assert len(op.csv_data(source, **_CSV_KWARGS)) == 2
+
+        assert op.ingest_csv(source, "SPX", **_CSV_KWARGS) == 2
+        cached = store.read("options", "SPX")
+        assert sorted(cached["underlying_symbol"]) == ["SPX", "SPXW"]
+
+    def test_counts_rows_stored(self, tmp_path, store):
+        raw = pd.read_csv(filepath()).iloc[[0, 0]]
+        raw.to_csv(tmp_path / "dup.csv", index=False)
+        assert op.ingest_csv(str(tmp_path / "dup.csv"), "SPX", **_CSV_KWARGS) == 1
+        assert len(store.read("options", "SPX")) == 1
+
+    def test_unknown_column_parameter(self, csv_dir):
+        with pytest.raises(ValueError, match="Unknown column parameters"):
+            op.ingest_csv(str(csv_dir), "SPX", stike=5)
+
+
 # =============================================================================
 # Internal Helper Tests
 # =============================================================================
@@ -494,12 +635,13 @@ class TestLoadCachedOptions:
     def test_loads_and_normalizes(self, MockCache):
         """Loading cached data returns normalized DataFrame."""
         mock_instance = MagicMock()
-        mock_instance.read.return_value = self._make_cached_df()
+        mock_instance.read_filtered.return_value = self._make_cached_df()
         MockCache.return_value = mock_instance
 
         result = load_cached_options("SPY")
 
-        mock_instance.read.assert_called_once_with("options", "SPY")
+        mock_instance.read_filtered.assert_called_once()
+        assert mock_instance.read_filtered.call_args.args == ("options", "SPY")
         assert not result.empty
         assert len(result) == 2
         # option_type normalized to single char
@@ -517,7 +659,7 @@ class TestLoadCachedOptions:
     def test_symbol_not_cached(self, MockCache):
         """Missing symbol raises FileNotFoundError."""
         mock_instance = MagicMock()
-        mock_instance.read.return_value = None
+        mock_instance.read_filtered.return_value = None
         MockCache.return_value = mock_instance
 
         with pytest.raises(
@@ -545,7 +687,7 @@ class TestLoadCachedOptions:
             }
         )
         mock_instance = MagicMock()
-        mock_instance.read.return_value = cached
+        mock_instance.read_filtered.return_value = cached
         MockCache.return_value = mock_instance
 
         result = load_cached_options(
@@ -555,16 +697,66 @@ class TestLoadCachedOptions:
         )
         assert len(result) == 1
 
+    @patch("optopsy.data.providers.cache.ParquetCache", autospec=True)
+    def test_max_dte_pushes_quote_date_floor(self, MockCache):
+        """With start_date, max_dte bounds quote_date in the reader filters."""
+        mock_instance = MagicMock()
+        mock_instance.read_filtered.return_value = self._make_cached_df()
+        MockCache.return_value = mock_instance
+
+        load_cached_options("SPY", start_date="2020-01-10", max_dte=30)
+        filters = mock_instance.read_filtered.call_args.kwargs["filters"]
+        assert ("quote_date", ">=", pd.Timestamp("2019-12-11")) in filters
+
+        for kwargs in ({"max_dte": 30}, {"start_date": "2020-01-10"}):
+            load_cached_options("SPY", **kwargs)
+            filters = mock_instance.read_filtered.call_args.kwargs["filters"] or []
+            assert not [f for f in filters if f[0] == "quote_date"]
+
     @patch("optopsy.data.providers.cache.ParquetCache", autospec=True)
     def test_empty_cache_raises(self, MockCache):
         """Empty cached DataFrame raises FileNotFoundError."""
         mock_instance = MagicMock()
-        mock_instance.read.return_value = pd.DataFrame()
+        mock_instance.read_filtered.return_value = pd.DataFrame()
         MockCache.return_value = mock_instance
 
         with pytest.raises(FileNotFoundError, match="No cached options data"):
             load_cached_options("SPY")
 
+    def test_pushdown_on_parquet_cache(self, tmp_path, monkeypatch):
+        """Column, date, type and DTE restrictions are applied on a real cache."""
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers import cache
+
+        store = cache.ParquetCache(cache_dir=str(tmp_path))
+        cached = self._make_cached_df()
+        later = cached.assign(expiration=pd.Timestamp("2020-06-19"))
+        store.write("options", "SPY", pd.concat([cached, later], ignore_index=True))
+        monkeypatch.setattr(cache, "get_store", lambda: store)
+
+        result = load_cached_options(
+            "SPY", start_date="2020-01-01", option_type="put", columns=["volume"]
+        )
+        assert list(result["option_type"]) == ["p", "p"]
+        assert "volume" in result.columns
+        assert "gamma" not in result.columns
+
+        result = load_cached_options("SPY", max_dte=30)
+        assert (result["expiration"] == pd.Timestamp("2020-01-17")).all()
+
+        result = load_cached_options("SPY", start_date="2020-01-01", max_dte=30)
+        assert len(result) == 2
+        assert load_cached_options("SPY", start_date="2020-02-15", max_dte=30).empty
+
+        result = load_cached_options("SPY", filters=[("strike", ">", 315.0)])
+        assert list(result["strike"]) == [320.0, 320.0]
+
+        empty = load_cached_options("SPY", start_date="2030-01-01")
+        assert empty.empty
+
+        with pytest.raises(ValueError, match="option_type"):
+            load_cached_options("SPY", option_type="straddle")
+
     def test_accessible_from_public_api(self):
         """load_cached_options is accessible via op.load_cached_options."""
         assert hasattr(op, "load_cached_options")
@@ -2,10 +2,18 @@
 
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 
 import optopsy as op
+from optopsy.contracts import CONTRACT_COLS
+from optopsy.exits import (
+    _find_first_threshold_crossing,
+    _first_crossing,
+    _get_intermediate_snapshots,
+    _trade_paths,
+)
 
 
 @pytest.fixture
@@ -528,3 +536,142 @@ class TestMaxHoldDaysValidation:
                 leg1_delta={"target": 0.30, "min": 0.15, "max": 0.40},
                 max_hold_days=5.0,
             )
+
+
+class TestExitKernel:
+    """The contract-index scan must agree with the merge-based scan."""
+
+    @pytest.fixture
+    def chain_and_trades(self):
+        rng = np.random.default_rng(11)
+        rows = []
+        for quote_date in pd.bdate_range("2024-01-01", periods=25):
+            for strike in (95.0, 100.0, 105.0):
+                for option_type in ("call", "put"):
+                    if rng.uniform() < 0.1:
+                        continue
+                    mid = rng.uniform(1, 5)
+                    rows.append(
+                        (
+                            "SPX",
+                            option_type,
+                            pd.Timestamp("2024-02-09"),
+                            strike,
+                            quote_date,
+                            mid - 0.05,
+                            mid + 0.05,
+                        )
+                    )
+        data = pd.DataFrame(rows, columns=CONTRACT_COLS + ["quote_date", "bid", "ask"])
+        # Duplicate quotes with different prices expand like a merge would
+        data = pd.concat([data, data.sample(15, random_state=2).assign(bid=0.5)])
+        data = data.reset_index(drop=True)
+
+        trades = (
+            data.drop_duplicates(CONTRACT_COLS + ["quote_date"])
+            .sample(40, random_state=3)
+            .rename(columns={"quote_date": "quote_date_entry"})
+            .reset_index(drop=True)
+        )
+        trades["_trade_id"] = np.arange(len(trades))
+        trades["entry"] = (trades["bid"] + trades["ask"]) / 2
+        return data, trades
+
+    @pytest.mark.parametrize(
+        "thresholds", [(-0.3, None, None), (None, 0.4, None), (-0.5, 0.5, 6)]
+    )
+    def test_single_leg_matches_merge_scan(self, chain_and_trades, thresholds):
+        data, trades = chain_and_trades
+        stop_loss, take_profit, max_hold_days = thresholds
+
+        intermediates = _get_intermediate_snapshots(
+            data, trades, CONTRACT_COLS, "quote_date_entry"
+        ).merge(
+            trades[["_trade_id", "entry", "quote_date_entry"]].rename(
+                columns={"quote_date_entry": "_entry_date"}
+            ),
+            on="_trade_id",
+        )
+        intermediates["_unrealized_pct"] = (
+            intermediates["_mid"] - intermediates["entry"]
+        ) / intermediates["entry"].abs()
+        expected = _find_first_threshold_crossing(
+            intermediates, stop_loss, take_profit, max_hold_days
+        )
+
+        ((rows, quote_dates, (mid,)),) = _trade_paths(
+            data, [([trades[c] for c in CONTRACT_COLS], trades["quote_date_entry"])]
+        )
+        entry = trades["entry"].to_numpy()[rows]
+        result = _first_crossing(
+            trades["_trade_id"].to_numpy(),
+            rows,
+            quote_dates,
+            (mid - entry) / np.abs(entry),
+            trades["quote_date_entry"],
+            stop_loss,
+            take_profit,
+            max_hold_days,
+        )
+        assert not expected.empty
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_multi_leg_requires_every_leg_quoted(self, chain_and_trades):
+        data, _ = chain_and_trades
+        entry = pd.Series([pd.Timestamp("2024-01-01")])
+        legs = [
+            (
+                [
+                    pd.Series(["SPX"]),
+                    pd.Series([option_type]),
+                    pd.Series([pd.Timestamp("2024-02-09")]),
+                    pd.Series([100.0]),
+                ],
+                entry,
+            )
+            for option_type in ("call", "put")
+        ]
+        ((rows, quote_dates, mids),) = _trade_paths(data, legs)
+
+        def quoted(option_type):
+            mask = (data["option_type"] == option_type) & (data["strike"] == 100.0)
+            return data.loc[mask, "quote_date"]
+
+        both = set(quoted("call")) & set(quoted("put"))
+        last = min(quoted("call").max(), quoted("put").max())
+        expected = {d for d in both if entry[0] < d < last}
+        assert set(pd.to_datetime(quote_dates)) == expected
+        assert (np.diff(quote_dates.astype("int64")) >= 0).all()
+        assert len(mids) == 2 and len(mids[0]) == len(rows)
+
+    def test_batches_match_single_scan(self, chain_and_trades):
+        data, trades = chain_and_trades
+        legs = [([trades[c] for c in CONTRACT_COLS], trades["quote_date_entry"])]
+        ((rows, quote_dates, (mid,)),) = _trade_paths(data, legs)
+
+        batches = list(_trade_paths(data, legs, max_points=20))
+        assert len(batches) > 1
+        # A batch only exceeds the cap when one trade's path alone does
+        assert all(len(b[0]) <= 20 or len(set(b[0])) == 1 for b in batches)
+        np.testing.assert_array_equal(np.concatenate([b[0] for b in batches]), rows)
+        np.testing.assert_array_equal(
+            np.concatenate([b[1] for b in batches]), quote_dates
+        )
+        np.testing.assert_array_equal(np.concatenate([b[2][0] for b in batches]), mid)
+
+    def test_batched_scan_matches_single_batch(
+        self, multi_date_spread_data, monkeypatch
+    ):
+        def run():
+            return op.long_call_spread(
+                multi_date_spread_data,
+                leg1_delta={"target": 0.50, "min": 0.40, "max": 0.60},
+                leg2_delta={"target": 0.30, "min": 0.10, "max": 0.40},
+                stop_loss=-0.20,
+                take_profit=0.20,
+                raw=True,
+            )
+
+        expected = run()
+        monkeypatch.setattr("optopsy.exits._PATH_BATCH_POINTS", 1)
+        pd.testing.assert_frame_equal(run(), expected)
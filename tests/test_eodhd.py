@@ -0,0 +1,312 @@
+"""Tests for the EODHD bulk downloader against a local stub HTTP server."""
+
+import json
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("requests")
+
+from optopsy.data.providers import eodhd  # noqa: E402
+from optopsy.data.providers.cache import ParquetCache  # noqa: E402
+
+_FIELDS = [
+    "underlying_symbol",
+    "type",
+    "exp_date",
+    "expiration_type",
+    "tradetime",
+    "strike",
+    "bid",
+    "ask",
+    "delta",
+]
+_STRIKES = (100.0, 105.0)
+
+
+def _make_rows(days: int = 730) -> list:
+    """Two strikes per type for every weekday of the last *days* days."""
+    today = date.today()
+    rows = []
+    for offset in range(days):
+        day = today - timedelta(days=offset)
+        if day.weekday() >= 5:
+            continue
+        expiration = day + timedelta(days=30)
+        for option_type in ("call", "put"):
+            for strike in _STRIKES:
+                rows.append(
+                    [
+                        "SPY",
+                        option_type,
+                        str(expiration),
+                        "monthly",
+                        str(day),
+                        strike,
+                        "1.10",
+                        "1.20",
+                        "0.5",
+                    ]
+                )
+    return rows
+
+
+class _StubEODHD:
+    """Serves ``/options/eod`` like EODHD's compact mode from in-memory rows.
+
+    Attributes:
+        requests: Number of ``/options/eod`` requests served.
+        max_in_flight: Highest number of requests handled at once.
+        fail_from: ``tradetime_from`` values answered with 403.
+    """
+
+    def __init__(self, rows: list, latency: float = 0.01):
+        self.rows = rows
+        self.latency = latency
+        self.requests = 0
+        self.max_in_flight = 0
+        self.fail_from: set = set()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                stub._handle(self)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handle(self, handler):
+        with self._lock:
+            self.requests += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self.latency)
+            status, body = self._respond(handler.path)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        payload = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _respond(self, path):
+        url = urlparse(path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if query.get("api_token") != "test-key":
+            return 401, {}
+        if url.path == "/options/underlying-symbols":
+            return 200, {"data": ["SPY"]}
+        if url.path != "/options/eod":
+            return 404, {}
+        win_from = query["filter[tradetime_from]"]
+        win_to = query["filter[tradetime_to]"]
+        if win_from in self.fail_from:
+            return 403, {}
+
+        matching = [
+            row
+            for row in self.rows
+            if row[1] == query["filter[type]"] and win_from <= row[4] <= win_to
+        ]
+        offset = int(query.get("page[offset]", 0))
+        limit = int(query["page[limit]"])
+        body = {"meta": {"fields": _FIELDS}, "data": matching[offset : offset + limit]}
+        if offset + limit < len(matching):
+            following = {
+                k: v for k, v in query.items() if k not in ("api_token", "compact")
+            }
+            following["page[offset]"] = offset + limit
+            body["links"] = {"next": f"{self.url}/options/eod?{urlencode(following)}"}
+        return 200, body
+
+
+@pytest.fixture
+def stub():
+    server = _StubEODHD(_make_rows())
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("EODHD_API_KEY", "test-key")
+    cache = ParquetCache(cache_dir=str(tmp_path))
+    monkeypatch.setattr(eodhd, "get_store", lambda: cache)
+    return cache
+
+
+def _provider(stub, **kwargs):
+    return eodhd.EODHDProvider(base_url=stub.url, requests_per_minute=600_000, **kwargs)
+
+
+def _keys(df):
+    return set(
+        zip(
+            df["option_type"],
+            pd.to_datetime(df["quote_date"]).dt.strftime("%Y-%m-%d"),
+            df["strike"].astype(float),
+        )
+    )
+
+
+def _expected_keys(rows):
+    return {(row[1], row[4], row[5]) for row in rows}
+
+
+def _windows():
+    """Top-level download windows of a full two-year download."""
+    end = pd.Timestamp.now()
+    return eodhd.EODHDProvider._quarter_windows(end - pd.Timedelta(days=730), end)
+
+
+class TestDownload:
+    def test_downloads_every_row_concurrently(self, stub, store):
+        progress = []
+        summary, _ = _provider(stub).download_with_progress(
+            "spy", on_progress=lambda *args: progress.append(args)
+        )
+
+        cached = store.read("options", "SPY")
+        assert len(cached) == len(stub.rows)
+        assert _keys(cached) == _expected_keys(stub.rows)
+        assert f"Downloaded {len(stub.rows):,} options records" in summary
+        assert stub.max_in_flight > 1
+
+        finals = {p[1]: p for p in progress if p[3] == 100.0}
+        assert set(finals) == {"call", "put"}
+        assert finals["call"][2] + finals["put"][2] == len(stub.rows)
+
+    def test_subdivides_windows_at_offset_cap(self, stub, store, monkeypatch):
+        monkeypatch.setattr(eodhd, "_PAGE_LIMIT", 20)
+        monkeypatch.setattr(eodhd, "_MAX_OFFSET", 40)
+        _provider(stub).download_with_progress("SPY")
+
+        cached = store.read("options", "SPY")
+        assert len(cached) == len(stub.rows)
+        assert _keys(cached) == _expected_keys(stub.rows)
+
+    def test_resume_fetches_nothing_when_current(self, stub, store):
+        _provider(stub).download_with_progress("SPY")
+        served = stub.requests
+
+        summary, _ = _provider(stub).download_with_progress("SPY")
+        assert "already up to date" in summary
+        # Only the windows from the day after the last cached quote
+        assert stub.requests - served <= 2
+        assert len(store.read("options", "SPY")) == len(stub.rows)
+
+    def test_failed_window_is_skipped(self, stub, store):
+        failed_from, failed_to = _windows()[3]
+        stub.fail_from.add(failed_from)
+        statuses = []
+
+        _provider(stub).download_with_progress("SPY", on_status=statuses.append)
+
+        cached = store.read("options", "SPY")
+        expected = [r for r in stub.rows if not failed_from <= r[4] <= failed_to]
+        assert _keys(cached) == _expected_keys(expected)
+        assert any("skipping" in s for s in statuses)
+
+    def test_cache_write_failure_stops_download(self, stub, store, monkeypatch):
+        def _fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store, "append", _fail)
+        summary, _ = _provider(stub).download_with_progress("SPY")
+        assert "Download failed for SPY" in summary
+        assert "disk full" in summary
+        # Queued windows are cancelled after the first failed write
+        assert stub.requests < 2 * len(_windows())
+
+    def test_list_available_symbols_uses_base_url(self, stub, store):
+        assert _provider(stub).list_available_symbols() == ["SPY"]
+
+
+class TestDecodePage:
+    def test_matches_row_dicts(self):
+        rows = _make_rows(days=10)
+        page = eodhd._decode_page(_FIELDS, rows)
+        expected = pd.DataFrame([dict(zip(_FIELDS, row)) for row in rows]).rename(
+            columns=eodhd._COLUMN_MAP
+        )
+        for col in ("strike", "bid", "ask", "delta"):
+            expected[col] = pd.to_numeric(expected[col])
+        pd.testing.assert_frame_equal(eodhd._concat_pages([page]), expected)
+
+    def test_numeric_coercion(self):
+        page = eodhd._decode_page(
+            ["strike", "volume", "type"],
+            [[100, 5, "call"], ["102.5", None, "put"], ["n/a", 7, "call"]],
+        )
+        assert page["strike"].dtype == "float64"
+        assert list(page["strike"][:2]) == [100.0, 102.5]
+        assert pd.isna(page["strike"][2])
+        assert pd.isna(page["volume"][1])
+        assert list(page["option_type"]) == ["call", "put", "call"]
+
+    def test_integer_column_widens_only_when_needed(self):
+        first = eodhd._decode_page(["volume"], [[1], [2]])
+        second = eodhd._decode_page(["volume"], [[3]])
+        assert first["volume"].dtype == "int64"
+        assert eodhd._concat_pages([first, second])["volume"].dtype == "int64"
+        gap = eodhd._decode_page(["volume"], [[None]])
+        assert eodhd._concat_pages([first, gap])["volume"].dtype == "float64"
+
+    def test_standard_format_and_missing_columns(self):
+        compact = eodhd._decode_page(["strike", "rho"], [[100, 0.1]])
+        standard = eodhd._decode_page(
+            [], [{"attributes": {"strike": 105, "type": "put"}}]
+        )
+        df = eodhd._concat_pages([compact, standard])
+        assert list(df["strike"]) == [100.0, 105.0]
+        assert pd.isna(df["rho"][1])
+        assert pd.isna(df["option_type"][0])
+        assert df["option_type"][1] == "put"
+        assert eodhd._page_rows([compact, standard]) == 2
+
+
+class TestTokenBucket:
+    def test_limits_rate_across_threads(self):
+        bucket = eodhd._TokenBucket(rate=100, capacity=1)
+        start = time.monotonic()
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # 20 tokens at 100/s with one available up front
+        assert time.monotonic() - start >= 0.17
+
+    def test_drain_delays_next_request(self):
+        bucket = eodhd._TokenBucket(rate=1000, capacity=10)
+        bucket.drain(0.1)
+        start = time.monotonic()
+        bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError, match="rate must be positive"):
+            eodhd._TokenBucket(rate=0, capacity=1)
@@ -0,0 +1,176 @@
+"""Tests for DataFrame fingerprints (optopsy.data.fingerprint)."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from optopsy.data import fingerprint as fp_module
+from optopsy.data.fingerprint import derive, fingerprint, recorded, remember
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "quote_date": pd.date_range("2024-01-01", periods=6),
+            "option_type": ["call", "put"] * 3,
+            "strike": [100.0, 100.0, 105.0, 105.0, 110.0, 110.0],
+        }
+    )
+
+
+@pytest.fixture
+def count_hashes(monkeypatch):
+    calls = []
+    original = fp_module._content_hash
+
+    def _counting(df):
+        calls.append(len(df))
+        return original(df)
+
+    monkeypatch.setattr(fp_module, "_content_hash", _counting)
+    return calls
+
+
+class TestContentFingerprint:
+    def test_equal_content_equal_fingerprint(self, frame):
+        assert fingerprint(frame) == fingerprint(frame.copy())
+
+    def test_different_content(self, frame):
+        assert fingerprint(frame) != fingerprint(frame.assign(strike=1.0))
+        assert fingerprint(frame) != fingerprint(frame.iloc[::-1])
+        assert fingerprint(frame) != fingerprint(frame.rename(columns={"strike": "k"}))
+
+    def test_rehashed_on_every_call(self, frame, count_hashes):
+        before = fingerprint(frame)
+        assert fingerprint(frame) == before
+        frame.loc[3:, "strike"] = 0.0
+        assert fingerprint(frame) != before
+        assert count_hashes == [6, 6, 6]
+
+    def test_schema_change_invalidates(self, frame, count_hashes):
+        before = fingerprint(frame)
+        frame["bid"] = 1.0
+        assert fingerprint(frame) != before
+        assert len(count_hashes) == 2
+
+    def test_large_frame_sampled_but_numeric_edits_detected(self, monkeypatch):
+        monkeypatch.setattr(fp_module, "_FULL_HASH_ROWS", 1_000)
+        monkeypatch.setattr(fp_module, "_BLOCK_ROWS", 16)
+        rng = np.random.default_rng(0)
+        large = pd.DataFrame(
+            {
+                "strike": rng.random(50_000),
+                "quote_date": pd.Timestamp("2024-01-01")
+                + pd.to_timedelta(rng.integers(0, 500, 50_000), "D"),
+            }
+        )
+        base = fingerprint(large)
+        assert fingerprint(large.copy()) == base
+        edited = large.copy()
+        edited.iloc[25_007, 0] += 1.0
+        assert fingerprint(edited) != base
+        shifted = large.copy()
+        shifted.iloc[31_111, 1] += pd.Timedelta(days=1)
+        assert fingerprint(shifted) != base
+
+
+class TestProvenance:
+    def test_remember_skips_hashing(self, frame, count_hashes):
+        remember(frame, dataset="/cache/SPY.parquet@abc")
+        assert fingerprint(frame) == fingerprint(
+            remember(frame.copy(), dataset="/cache/SPY.parquet@abc")
+        )
+        assert count_hashes == []
+
+    def test_recorded_never_hashes(self, frame, count_hashes):
+        assert recorded(frame) is None
+        remember(frame, dataset="SPY@1")
+        assert recorded(frame) == fingerprint(frame)
+        assert count_hashes == []
+
+    def test_provenance_distinguishes_versions(self, frame):
+        a = fingerprint(remember(frame.copy(), dataset="SPY@1"))
+        b = fingerprint(remember(frame.copy(), dataset="SPY@2"))
+        assert a != b
+
+    def test_derive_extends_parent(self, frame, count_hashes):
+        remember(frame, dataset="SPY@1")
+        calls = frame[frame["option_type"] == "call"]
+        derive(frame, calls, option_type="call")
+        again = derive(frame, frame.iloc[::2], option_type="call")
+        assert fingerprint(calls) == fingerprint(again)
+        puts = derive(frame, frame.iloc[1::2], option_type="put")
+        assert fingerprint(puts) != fingerprint(calls)
+        assert count_hashes == []
+
+    def test_forgotten_when_collected(self):
+        import gc
+
+        frame = pd.DataFrame({"strike": [100.0]})
+        remember(frame, dataset="SPY@1")
+        key = id(frame)
+        del frame
+        gc.collect()
+        assert key not in fp_module._known
+
+
+class TestStoreProvenance:
+    def test_dataset_version_changes_on_append(self, tmp_path, frame):
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers.cache import ParquetCache
+
+        cache = ParquetCache(cache_dir=str(tmp_path))
+        assert cache.dataset_version("options", "SPY") is None
+        cache.append("options", "SPY", frame)
+        first = cache.dataset_version("options", "SPY")
+        assert first == cache.dataset_version("options", "SPY")
+        assert "SPY.parquet" in first
+        cache.append("options", "SPY", frame.assign(strike=200.0))
+        assert cache.dataset_version("options", "SPY") != first
+
+    def test_dataset_version_changes_on_same_shape_write(self, tmp_path, frame):
+        pytest.importorskip("pyarrow")
+        from optopsy.data.providers.cache import ParquetCache
+
+        cache = ParquetCache(cache_dir=str(tmp_path))
+        cache.write("options", "SPY", frame)
+        first = cache.dataset_version("options", "SPY")
+        cache.write("options", "SPY", frame.assign(strike=200.0))
+        assert cache.dataset_version("options", "SPY") != first
+
+    def test_eodhd_local_read_is_fingerprinted_from_provenance(
+        self, tmp_path, monkeypatch, count_hashes
+    ):
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("requests")
+        from optopsy.data.providers import eodhd
+        from optopsy.data.providers.cache import ParquetCache
+
+        cache = ParquetCache(cache_dir=str(tmp_path))
+        monkeypatch.setattr(eodhd, "get_store", lambda: cache)
+        chain = pd.DataFrame(
+            {
+                "underlying_symbol": "SPY",
+                "option_type": ["call", "put"] * 2,
+                "expiration": pd.Timestamp("2024-02-16"),
+                "quote_date": pd.to_datetime(["2024-01-02"] * 2 + ["2024-01-03"] * 2),
+                "strike": 100.0,
+                "bid": 1.0,
+                "ask": 1.2,
+                "expiration_type": "monthly",
+            }
+        )
+        cache.write("options", "SPY", chain)
+        provider = eodhd.EODHDProvider()
+
+        _, first = provider._fetch_options("SPY")
+        _, again = provider._fetch_options("SPY")
+        _, calls = provider._fetch_options("SPY", option_type="call")
+        assert fingerprint(first) == fingerprint(again)
+        assert fingerprint(calls) != fingerprint(first)
+        assert count_hashes == []
+
+        cache.append("options", "SPY", chain.assign(bid=2.0), ["strike"])
+        _, updated = provider._fetch_options("SPY")
+        assert fingerprint(updated) != fingerprint(first)
@@ -0,0 +1,219 @@
+"""Tests for parallel execution over shared-memory option chains."""
+
+import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from multiprocessing import shared_memory
+
+import pandas as pd
+import pytest
+
+import optopsy as op
+from optopsy.parallel import (
+    _ATTACHED,
+    _OWNED,
+    _decode_frame,
+    _executor_scope,
+    _resolve_workers,
+    _run_tasks,
+    _share_frame,
+)
+from optopsy.sweep import _sweep_chain
+
+
+@pytest.fixture(scope="module")
+def spawn_pool():
+    """Process pool whose workers must decode chains from shared memory."""
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="module")
+def grid_data(multi_strike_data):
+    """multi_strike_data plus extra quote dates so exit_dte grids vary."""
+    frames = [multi_strike_data]
+    exit_rows = multi_strike_data[
+        multi_strike_data["quote_date"] == datetime.datetime(2018, 1, 31)
+    ]
+    for day in (10, 17, 24):
+        frames.append(exit_rows.assign(quote_date=datetime.datetime(2018, 1, day)))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _roundtrip(frame):
+    with ExitStack() as stack:
+        handle = _share_frame(frame, stack)
+        shm = shared_memory.SharedMemory(name=handle.shm_name)
+        try:
+            return _decode_frame(handle, shm.buf)
+        finally:
+            shm.close()
+
+
+def _row_count(data, offset=0):
+    return len(data) + offset
+
+
+def _chain_state(chain, offset=0):
+    """Report what a worker sees of a prepared chain."""
+    return (
+        type(chain).__name__,
+        chain.stages is not None,
+        sorted(chain.source_dtypes),
+    )
+
+
+def _fail_on_negative(data, value):
+    if value < 0:
+        raise ValueError(f"negative: {value}")
+    return value
+
+
+class TestSharedFrame:
+    def test_roundtrip_option_chain(self, data):
+        pd.testing.assert_frame_equal(_roundtrip(data), data)
+
+    def test_roundtrip_prepared_chain(self, multi_strike_data):
+        chain = op.prepare(multi_strike_data)
+        pd.testing.assert_frame_equal(_roundtrip(chain.data), chain.data)
+
+    def test_roundtrip_extension_dtypes(self):
+        frame = pd.DataFrame(
+            {
+                "sym": pd.Series(["SPX", "QQQ", "SPX"], dtype="str"),
+                "obj": pd.Series(["a", "b", "c"], dtype=object),
+                "cat": pd.Categorical(["x", "y", "x"], ordered=True),
+                "ts": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"]),
+                "tz": pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-04"])
+                .tz_localize("US/Eastern")
+                .as_unit("ns"),
+                "nullable": pd.array([1, None, 3], dtype="Int64"),
+                "flag": [True, False, True],
+                "i32": pd.array([1, 2, 3], dtype="int32"),
+            },
+            index=[10, 20, 30],
+        )
+        pd.testing.assert_frame_equal(_roundtrip(frame), frame)
+
+    def test_roundtrip_keeps_compact_marker(self, data):
+        compact = op.compact_chain(data)
+        decoded = _roundtrip(compact)
+        assert decoded.attrs == compact.attrs
+        pd.testing.assert_frame_equal(decoded, compact)
+
+    def test_empty_frame(self, data):
+        empty = data.iloc[:0]
+        pd.testing.assert_frame_equal(_roundtrip(empty), empty)
+
+    def test_block_unlinked_on_exit(self, data):
+        with ExitStack() as stack:
+            handle = _share_frame(data, stack)
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=handle.shm_name)
+
+
+class TestRunTasks:
+    def test_sequential(self, data):
+        tasks = [(_row_count, data, {"offset": i}) for i in range(3)]
+        assert _run_tasks(tasks) == [len(data), len(data) + 1, len(data) + 2]
+
+    def test_threads_preserve_order(self, data):
+        tasks = [(_row_count, data, {"offset": i}) for i in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert _run_tasks(tasks, pool) == _run_tasks(tasks)
+        assert not _OWNED
+
+    def test_spawned_workers_decode_shared_chain(self, data, spawn_pool):
+        tasks = [(_row_count, data, {"offset": i}) for i in range(4)]
+        assert _run_tasks(tasks, spawn_pool) == _run_tasks(tasks)
+        # Nothing was attached in the parent; workers did the decoding
+        assert not _ATTACHED
+
+    def test_spawned_workers_keep_stages_and_dtypes(
+        self, multi_strike_data, spawn_pool
+    ):
+        chain = _sweep_chain(multi_strike_data)
+        tasks = [(_chain_state, chain, {"offset": i}) for i in range(4)]
+        expected = ("PreparedChain", True, ["option_type", "underlying_symbol"])
+        assert _run_tasks(tasks, spawn_pool) == [expected] * 4
+
+    def test_raises_first_error(self, data):
+        tasks = [(_fail_on_negative, data, {"value": v}) for v in (1, -1, 2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            with pytest.raises(ValueError, match="negative: -1"):
+                _run_tasks(tasks, pool)
+
+    def test_return_exceptions(self, data):
+        tasks = [(_fail_on_negative, data, {"value": v}) for v in (1, -1, 2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = _run_tasks(tasks, pool, return_exceptions=True)
+        assert results[0] == 1 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+
+class TestExecutorScope:
+    @pytest.mark.parametrize("n_jobs", [None, 1])
+    def test_sequential_without_executor(self, n_jobs):
+        with _executor_scope(n_jobs) as pool:
+            assert pool is None
+
+    def test_injected_executor_left_running(self):
+        with ThreadPoolExecutor(max_workers=1) as injected:
+            with _executor_scope(4, injected) as pool:
+                assert pool is injected
+            assert injected.submit(lambda: 1).result() == 1
+
+    def test_all_cores(self):
+        assert _resolve_workers(-1) >= 1
+
+    @pytest.mark.parametrize("n_jobs", [0, -2, 1.5, True, "2"])
+    def test_invalid_n_jobs(self, n_jobs):
+        with pytest.raises(ValueError, match="n_jobs"):
+            _resolve_workers(n_jobs)
+
+
+class TestParallelSweep:
+    def test_matches_sequential(self, grid_data, spawn_pool):
+        grid = {"max_entry_dte": [30, 60, 90], "exit_dte": [0, 7, 14]}
+        expected = op.sweep(grid_data, op.long_call_spread, grid, raw=True)
+        result = op.sweep(
+            grid_data, op.long_call_spread, grid, executor=spawn_pool, raw=True
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_n_jobs(self, grid_data):
+        grid = {"exit_dte": [0, 7, 14]}
+        expected = op.sweep(grid_data, op.short_puts, grid)
+        result = op.sweep(grid_data, op.short_puts, grid, n_jobs=2)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_invalid_n_jobs(self, grid_data):
+        with pytest.raises(ValueError, match="n_jobs"):
+            op.sweep(grid_data, op.short_puts, {"exit_dte": [0]}, n_jobs=0)
+
+
+class TestParallelPortfolio:
+    def _legs(self, multi_strike_data, data):
+        return [
+            {"data": multi_strike_data, "strategy": op.long_calls, "weight": 0.4},
+            {"data": data, "strategy": op.short_puts, "weight": 0.3},
+            {"data": multi_strike_data, "strategy": op.long_calls, "weight": 0.3},
+        ]
+
+    def test_matches_sequential(self, multi_strike_data, data, spawn_pool):
+        legs = self._legs(multi_strike_data, data)
+        expected = op.simulate_portfolio(legs)
+        result = op.simulate_portfolio(legs, executor=spawn_pool)
+        pd.testing.assert_frame_equal(result.trade_log, expected.trade_log)
+        pd.testing.assert_series_equal(result.equity_curve, expected.equity_curve)
+        assert list(result.leg_results) == list(expected.leg_results)
+        assert result.summary == expected.summary
+
+    def test_n_jobs(self, multi_strike_data, data):
+        legs = self._legs(multi_strike_data, data)
+        expected = op.simulate_portfolio(legs)
+        result = op.simulate_portfolio(legs, n_jobs=2)
+        pd.testing.assert_frame_equal(result.trade_log, expected.trade_log)
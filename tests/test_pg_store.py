@@ -0,0 +1,347 @@
+"""Tests for the PostgreSQL data store (optopsy.data.providers.pg_store).
+
+The unit tests run against mocked connections and check the SQL the store
+generates.  ``TestPostgresRoundTrip`` runs against a real database and is
+skipped unless ``DATABASE_URL`` points at PostgreSQL.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("sqlalchemy", reason="UI extras not installed")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from optopsy.data.providers import pg_store  # noqa: E402
+from optopsy.data.providers.pg_store import (  # noqa: E402
+    PostgresStore,
+    _conflict_columns,
+    _copy_rows,
+    _where,
+    options_data,
+    stocks_data,
+)
+
+
+def _sql(clause) -> str:
+    """Compile *clause* for PostgreSQL with its parameters inlined."""
+    return str(
+        clause.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+class _Recorder:
+    """Mock engine/connection pair recording executed SQL and COPY loads."""
+
+    def __init__(self):
+        self.conn = MagicMock()
+        self.engine = MagicMock()
+        self.engine.begin.side_effect = self._scope
+        self.engine.connect.side_effect = self._scope
+        self.copies = []
+
+    @contextmanager
+    def _scope(self):
+        yield self.conn
+
+    def statements(self) -> list[str]:
+        executed = []
+        for call in self.conn.execute.call_args_list:
+            stmt = call.args[0]
+            executed.append(
+                stmt.text if hasattr(stmt, "text") else _sql(stmt).replace("\n", "")
+            )
+        return executed
+
+    def copy(self, conn, table_name, df):
+        self.copies.append((table_name, df.copy()))
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = _Recorder()
+    monkeypatch.setattr(pg_store, "_copy_rows", rec.copy)
+    return rec
+
+
+@pytest.fixture
+def store(recorder):
+    instance = PostgresStore.__new__(PostgresStore)
+    instance._url = "postgresql://test"
+    instance._engine = recorder.engine
+    return instance
+
+
+@pytest.fixture
+def quotes():
+    return pd.DataFrame(
+        {
+            "underlying_symbol": ["SPX", "SPX", "SPX"],
+            "option_type": ["call", "call", "put"],
+            "expiration": pd.to_datetime(["2024-02-16"] * 3),
+            "quote_date": pd.to_datetime(["2024-01-02"] * 3),
+            "strike": [4700.0, 4700.0, 4700.0],
+            "bid": [1.0, 2.0, 3.0],
+            "not_a_column": [0, 0, 0],
+        }
+    )
+
+
+class TestWhere:
+    @pytest.mark.parametrize(
+        "op, value, expected",
+        [
+            ("==", 4700.0, "options_data.strike = 4700.0"),
+            ("!=", 4700.0, "options_data.strike != 4700.0"),
+            ("<", 4700.0, "options_data.strike < 4700.0"),
+            ("<=", 4700.0, "options_data.strike <= 4700.0"),
+            (">", 4700.0, "options_data.strike > 4700.0"),
+            (">=", 4700.0, "options_data.strike >= 4700.0"),
+            ("in", (4700.0, 4750.0), "options_data.strike IN (4700.0, 4750.0)"),
+        ],
+    )
+    def test_operators(self, op, value, expected):
+        assert _sql(_where(options_data, "strike", op, value)) == expected
+
+    def test_unknown_column_raises(self):
+        with pytest.raises(ValueError, match="not found in options_data"):
+            _where(options_data, "close", "==", 1.0)
+
+
+class TestConflictColumns:
+    def test_options_unique_index(self):
+        assert _conflict_columns(options_data) == [
+            "underlying_symbol",
+            "quote_date",
+            "expiration",
+            "strike",
+            "option_type",
+            "expiration_type",
+        ]
+
+    def test_stocks_unique_index(self):
+        assert _conflict_columns(stocks_data) == ["underlying_symbol", "date"]
+
+
+class TestReadFiltered:
+    def _read(self, store, monkeypatch, result, **kwargs):
+        captured = {}
+
+        def read_sql(stmt, conn):
+            captured["sql"] = _sql(stmt).replace("\n", "")
+            return result
+
+        monkeypatch.setattr(pg_store.pd, "read_sql", read_sql)
+        return store.read_filtered("options", "spx", **kwargs), captured["sql"]
+
+    def test_columns_and_filters_compile_to_sql(self, store, monkeypatch):
+        frame = pd.DataFrame({"strike": [4700.0], "bid": [1.0]})
+        result, sql = self._read(
+            store,
+            monkeypatch,
+            frame,
+            columns=["bid", "strike", "unknown"],
+            filters=[("option_type", "==", "call"), ("strike", "in", [4700.0])],
+        )
+        assert result is frame
+        # Columns come back in table order; unknown names are dropped
+        assert sql.startswith("SELECT options_data.strike, options_data.bid FROM")
+        assert (
+            "WHERE options_data.underlying_symbol = 'SPX' "
+            "AND options_data.option_type = 'call' "
+            "AND options_data.strike IN (4700.0)"
+        ) in sql
+
+    def test_missing_symbol_returns_none(self, store, monkeypatch):
+        result, _ = self._read(store, monkeypatch, pd.DataFrame())
+        assert result is None
+
+    def test_filtered_read_matching_nothing(self, store, recorder, monkeypatch):
+        recorder.conn.execute.return_value.first.return_value = (1,)
+        result, _ = self._read(
+            store, monkeypatch, pd.DataFrame(), filters=[("strike", ">", 1e9)]
+        )
+        assert result is not None and result.empty
+
+    def test_unsupported_operator_raises(self, store):
+        with pytest.raises(ValueError, match="Unsupported filter operator"):
+            store.read_filtered("options", "SPX", filters=[("strike", "like", 1)])
+
+    def test_unknown_category_raises(self, store):
+        with pytest.raises(ValueError, match="Unknown category"):
+            store.read_filtered("futures", "SPX")
+
+
+class TestWrites:
+    def test_write_deletes_then_copies(self, store, recorder, quotes):
+        store.write("options", "spx", quotes)
+        [delete] = recorder.statements()
+        assert delete.startswith("DELETE FROM options_data")
+        assert "underlying_symbol = 'SPX'" in delete
+        [(table, copied)] = recorder.copies
+        assert table == "options_data"
+        # Only table columns, in table order
+        assert list(copied.columns) == [
+            "underlying_symbol",
+            "option_type",
+            "expiration",
+            "quote_date",
+            "strike",
+            "bid",
+        ]
+
+    def test_append_without_dedup_copies_into_table(self, store, recorder, quotes):
+        store.append("options", "SPX", quotes)
+        assert recorder.statements() == []
+        [(table, copied)] = recorder.copies
+        assert table == "options_data"
+        assert len(copied) == 3
+
+    def test_append_full_key_upserts(self, store, recorder, quotes):
+        keys = ["quote_date", "expiration", "strike", "option_type", "expiration_type"]
+        store.append(
+            "options", "SPX", quotes.assign(expiration_type="monthly"), dedup_cols=keys
+        )
+        [(table, copied)] = recorder.copies
+        assert table == "_staging_options_data"
+        # The duplicated call keeps its last row, as newer data wins
+        assert copied["bid"].tolist() == [2.0, 3.0]
+
+        create, upsert = recorder.statements()
+        assert create.startswith("CREATE TEMP TABLE _staging_options_data")
+        assert "ON COMMIT DROP" in create
+        assert upsert.startswith("INSERT INTO options_data")
+        assert "FROM _staging_options_data" in upsert
+        assert (
+            'ON CONFLICT ("underlying_symbol", "quote_date", "expiration", '
+            '"strike", "option_type", "expiration_type") '
+            'DO UPDATE SET "bid" = EXCLUDED."bid"'
+        ) in upsert
+
+    def test_append_without_unique_key_replaces_on_dedup_cols(
+        self, store, recorder, quotes
+    ):
+        # expiration_type is absent, so no ON CONFLICT target matches an index
+        keys = ["quote_date", "expiration", "strike", "option_type"]
+        store.append("options", "SPX", quotes, dedup_cols=keys)
+        [(table, copied)] = recorder.copies
+        assert table == "_staging_options_data"
+        assert copied["bid"].tolist() == [2.0, 3.0]
+
+        create, remove, insert = recorder.statements()
+        assert create.startswith("CREATE TEMP TABLE _staging_options_data")
+        assert remove == (
+            "DELETE FROM options_data AS t USING _staging_options_data AS s "
+            'WHERE t."underlying_symbol" = s."underlying_symbol" '
+            'AND t."quote_date" = s."quote_date" '
+            'AND t."expiration" = s."expiration" '
+            'AND t."strike" = s."strike" '
+            'AND t."option_type" = s."option_type"'
+        )
+        assert insert.startswith("INSERT INTO options_data")
+        assert "ON CONFLICT" not in insert
+
+    def test_append_null_key_column_replaces(self, store, recorder, quotes):
+        keys = ["quote_date", "expiration", "strike", "option_type", "expiration_type"]
+        frame = quotes.assign(expiration_type=[None, None, "monthly"])
+        store.append("options", "SPX", frame, dedup_cols=keys)
+        _, remove, _ = recorder.statements()
+        assert 't."expiration_type" IS NOT DISTINCT FROM s."expiration_type"' in remove
+
+    def test_append_key_only_rows_do_nothing(self, store, recorder):
+        stocks = pd.DataFrame(
+            {"underlying_symbol": ["SPY"], "date": pd.to_datetime(["2024-01-02"])}
+        )
+        store.append("yf_stocks", "SPY", stocks, dedup_cols=["date"])
+        _, upsert = recorder.statements()
+        assert upsert.endswith('ON CONFLICT ("underlying_symbol", "date") DO NOTHING')
+
+    def test_append_empty_is_noop(self, store, recorder, quotes):
+        store.append("options", "SPX", quotes.iloc[:0], dedup_cols=["strike"])
+        assert recorder.copies == []
+        assert recorder.statements() == []
+
+
+class TestCopyRows:
+    def test_streams_csv_through_copy(self):
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value
+        frame = pd.DataFrame({"strike": [4700.0, 4750.0], "bid": [1.0, None]})
+        _copy_rows(conn, "options_data", frame)
+
+        sql, buf = cursor.copy_expert.call_args.args
+        assert sql == (
+            'COPY options_data ("strike", "bid") FROM STDIN WITH (FORMAT csv)'
+        )
+        assert buf.getvalue() == "4700.0,1.0\n4750.0,\n"
+        cursor.close.assert_called_once()
+
+
+_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+_OPTION_KEYS = ["quote_date", "expiration", "strike", "option_type", "expiration_type"]
+
+
+@pytest.mark.skipif(
+    not _DATABASE_URL.startswith(("postgres://", "postgresql://")),
+    reason="DATABASE_URL does not point at PostgreSQL",
+)
+class TestPostgresRoundTrip:
+    @pytest.fixture
+    def pg(self):
+        pytest.importorskip("psycopg2")
+        store = PostgresStore(_DATABASE_URL)
+        symbol = f"T{uuid.uuid4().hex[:8].upper()}"
+        yield store, symbol
+        store.clear(symbol=symbol)
+
+    def _quotes(self, symbol, bids):
+        return pd.DataFrame(
+            {
+                "underlying_symbol": symbol,
+                "option_type": ["call", "put"],
+                "expiration": pd.to_datetime(["2024-02-16"] * 2),
+                "quote_date": pd.to_datetime(["2024-01-02"] * 2),
+                "strike": [4700.0, 4700.0],
+                "bid": bids,
+                "expiration_type": "monthly",
+            }
+        )
+
+    def test_copy_and_upsert_round_trip(self, pg):
+        store, symbol = pg
+        store.write("options", symbol, self._quotes(symbol, [1.0, 2.0]))
+        newer = pd.concat(
+            [
+                self._quotes(symbol, [5.0, 6.0]).iloc[:1],
+                self._quotes(symbol, [7.0, 8.0]).iloc[:1],
+            ]
+        )
+        store.append("options", symbol, newer, dedup_cols=_OPTION_KEYS)
+
+        result = store.read_filtered("options", symbol, columns=["option_type", "bid"])
+        assert result.sort_values("option_type")["bid"].tolist() == [7.0, 2.0]
+
+        calls = store.read_filtered(
+            "options", symbol, filters=[("option_type", "==", "call")]
+        )
+        assert len(calls) == 1
+        empty = store.read_filtered("options", symbol, filters=[("strike", ">", 1e9)])
+        assert empty is not None and empty.empty
+
+    def test_append_without_expiration_type(self, pg):
+        store, symbol = pg
+        keys = ["quote_date", "expiration", "strike", "option_type"]
+        first = self._quotes(symbol, [1.0, 2.0]).drop(columns="expiration_type")
+        store.append("options", symbol, first, dedup_cols=keys)
+        newer = self._quotes(symbol, [5.0, 6.0]).drop(columns="expiration_type")
+        store.append("options", symbol, newer.iloc[:1], dedup_cols=keys)
+
+        result = store.read_filtered("options", symbol, columns=["option_type", "bid"])
+        assert result.sort_values("option_type")["bid"].tolist() == [5.0, 2.0]
@@ -0,0 +1,173 @@
+"""Tests for prepared option chains (optopsy.prepared)."""
+
+import datetime
+
+import pandas as pd
+import pytest
+
+import optopsy as op
+from optopsy.prepared import PreparedChain, prepare
+
+
+def _assert_same(result, expected):
+    """Compare a prepared-chain result with the plain-DataFrame result."""
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.fixture(scope="module")
+def multi_date_chain(multi_strike_data):
+    """multi_strike_data plus an intermediate quote date for early exits."""
+    mid = multi_strike_data[
+        multi_strike_data["quote_date"] == datetime.datetime(2018, 1, 31)
+    ].assign(quote_date=datetime.datetime(2018, 1, 15))
+    return pd.concat([multi_strike_data, mid], ignore_index=True)
+
+
+class TestPrepare:
+    def test_returns_prepared_chain(self, data):
+        chain = prepare(data)
+        assert isinstance(chain, PreparedChain)
+        assert len(chain) == len(data)
+        assert not chain.empty
+
+    def test_normalizes_and_assigns_dte(self, data):
+        chain = prepare(data)
+        assert chain.data["underlying_symbol"].dtype == "category"
+        assert chain.data["option_type"].dtype == "category"
+        assert set(chain.data["option_type"]) == {"call", "put"}
+        expected_dte = (chain.data["expiration"] - chain.data["quote_date"]).dt.days
+        assert chain.data["dte"].tolist() == expected_dte.tolist()
+
+    def test_sorted_by_contract_key(self, multi_strike_data):
+        shuffled = multi_strike_data.sample(frac=1.0, random_state=7)
+        chain = prepare(shuffled)
+        keys = ["underlying_symbol", "option_type", "expiration", "strike"]
+        keys.append("quote_date")
+        ordered = chain.data[keys].astype(
+            {"underlying_symbol": str, "option_type": str}
+        )
+        assert ordered.equals(ordered.sort_values(keys, ignore_index=True))
+
+    def test_call_put_partitions(self, data):
+        chain = prepare(data)
+        assert set(chain.calls["option_type"]) == {"call"}
+        assert set(chain.puts["option_type"]) == {"put"}
+        assert len(chain.calls) + len(chain.puts) == len(data)
+
+    def test_normalizes_intraday_timestamps(self, data):
+        shifted = data.assign(quote_date=data["quote_date"] + pd.Timedelta(hours=16))
+        chain = prepare(shifted)
+        dates = chain.data["quote_date"]
+        assert (dates == dates.dt.normalize()).all()
+
+    def test_prepare_is_idempotent(self, data):
+        chain = prepare(data)
+        assert prepare(chain) is chain
+
+    def test_input_not_modified(self, data):
+        before = data.copy()
+        prepare(data)
+        pd.testing.assert_frame_equal(data, before)
+
+    def test_chain_is_frozen(self, data):
+        chain = prepare(data)
+        with pytest.raises(AttributeError):
+            chain.data = data  # type: ignore[misc]
+
+    def test_invalid_schema_raises(self, data):
+        with pytest.raises(ValueError, match="Expected column: delta"):
+            prepare(data.drop(columns=["delta"]))
+
+    def test_exported(self):
+        assert op.prepare is prepare
+        assert op.PreparedChain is PreparedChain
+
+
+class TestPreparedStrategies:
+    @pytest.mark.parametrize(
+        "strategy",
+        [op.long_calls, op.short_puts, op.long_straddles, op.short_strangles],
+    )
+    @pytest.mark.parametrize("raw", [True, False])
+    def test_simple_strategies_match(self, data, strategy, raw):
+        expected = strategy(data, raw=raw)
+        result = strategy(prepare(data), raw=raw)
+        _assert_same(result, expected)
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            op.long_call_spread,
+            op.short_put_spread,
+            op.long_call_butterfly,
+            op.iron_condor,
+            op.iron_butterfly,
+            op.long_put_condor,
+            op.covered_call,
+            op.collar,
+            op.call_back_spread,
+        ],
+    )
+    @pytest.mark.parametrize("raw", [True, False])
+    def test_multi_leg_strategies_match(self, multi_strike_data, strategy, raw):
+        expected = strategy(multi_strike_data, raw=raw)
+        result = strategy(prepare(multi_strike_data), raw=raw)
+        _assert_same(result, expected)
+
+    def test_chain_reused_across_strategies(self, multi_strike_data):
+        chain = prepare(multi_strike_data)
+        snapshot = chain.data.copy()
+        for strategy in (op.long_calls, op.iron_condor, op.short_put_spread):
+            strategy(chain, raw=True)
+        pd.testing.assert_frame_equal(chain.data, snapshot)
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [op.long_call_calendar, op.short_put_calendar, op.long_call_diagonal],
+    )
+    def test_calendar_strategies_match(self, calendar_data, strategy):
+        expected = strategy(calendar_data, raw=True)
+        result = strategy(prepare(calendar_data), raw=True)
+        _assert_same(result, expected)
+
+    def test_covered_call_with_stock_match(
+        self, multi_strike_data, stock_data_multi_strike
+    ):
+        expected = op.covered_call(
+            multi_strike_data, stock_data=stock_data_multi_strike, raw=True
+        )
+        result = op.covered_call(
+            prepare(multi_strike_data), stock_data=stock_data_multi_strike, raw=True
+        )
+        _assert_same(result, expected)
+
+    @pytest.mark.parametrize(
+        "strategy,kwargs",
+        [
+            (op.long_calls, {"take_profit": 0.10}),
+            (op.long_puts, {"stop_loss": -0.50}),
+            (op.long_call_spread, {"max_hold_days": 10}),
+            (op.iron_condor, {"stop_loss": -0.10, "take_profit": 0.10}),
+        ],
+    )
+    def test_early_exits_match(self, multi_date_chain, strategy, kwargs):
+        expected = strategy(multi_date_chain, raw=True, **kwargs)
+        result = strategy(prepare(multi_date_chain), raw=True, **kwargs)
+        _assert_same(result, expected)
+
+    def test_invalid_params_still_validated(self, data):
+        with pytest.raises(ValueError, match="exit_dte"):
+            op.long_calls(prepare(data), max_entry_dte=10, exit_dte=20)
+
+
+class TestPreparedSimulate:
+    def test_simulate_matches(self, multi_strike_data):
+        expected = op.simulate(multi_strike_data, op.short_puts)
+        result = op.simulate(prepare(multi_strike_data), op.short_puts)
+        _assert_same(result.trade_log, expected.trade_log)
+        assert result.summary == expected.summary
+
+    def test_simulate_empty_chain(self, data):
+        result = op.simulate(prepare(data.iloc[:0]), op.long_calls)
+        assert result.trade_log.empty
+        assert result.summary["total_trades"] == 0
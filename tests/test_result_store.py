@@ -1,14 +1,24 @@
 """Tests for ResultStore and query_results tool."""
 
+import json
+import os
+import sqlite3
+import time
+
 import pandas as pd
 import pytest
 
 pyarrow = pytest.importorskip("pyarrow")  # noqa: F841
 pydantic = pytest.importorskip("pydantic")  # noqa: F841
 
+from optopsy.data.providers import result_store  # noqa: E402
 from optopsy.ui.providers.result_store import ResultStore  # noqa: E402
 from optopsy.ui.tools._executor import execute_tool  # noqa: E402
-from optopsy.ui.tools._helpers import _cached_run, _with_cache_key  # noqa: E402
+from optopsy.ui.tools._helpers import (  # noqa: E402
+    _cached_run,
+    _make_result_summary,
+    _with_cache_key,
+)
 
 # ---------------------------------------------------------------------------
 # ResultStore unit tests
@@ -131,6 +141,207 @@ class TestResultStore:
         assert df is not None
 
 
+class TestResultStoreIndex:
+    def _sized_store(self, tmp_path, sample_df, entries, **kwargs):
+        """Store whose budget holds *entries* results of ``sample_df``."""
+        probe = ResultStore(results_dir=str(tmp_path / "probe"))
+        probe.write("probe", sample_df, {})
+        size = os.path.getsize(probe._parquet_path("probe"))
+        return ResultStore(
+            results_dir=str(tmp_path / "results"),
+            max_bytes=size * entries,
+            **kwargs,
+        )
+
+    def test_lru_eviction(self, tmp_path, sample_df, monkeypatch):
+        clock = iter(range(1_000, 2_000, 100))
+        monkeypatch.setattr(result_store.time, "time", lambda: next(clock))
+        store = self._sized_store(tmp_path, sample_df, entries=2)
+        store.write("a", sample_df, {})
+        store.write("b", sample_df, {})
+        store.read("a")  # "b" is now least recently used
+        store.write("c", sample_df, {})
+        assert store.has("a") and store.has("c")
+        assert not store.has("b")
+        assert set(store.list_all()) == {"a", "c"}
+
+    def test_oversized_result_is_kept(self, tmp_path, sample_df):
+        store = ResultStore(results_dir=str(tmp_path), max_bytes=1)
+        store.write("a", sample_df, {})
+        store.write("b", sample_df, {})
+        assert not store.has("a")
+        assert store.has("b")
+
+    def test_age_eviction(self, tmp_path, sample_df, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(result_store.time, "time", lambda: now[0])
+        store = ResultStore(results_dir=str(tmp_path), max_age_days=1)
+        store.write("old", sample_df, {})
+        now[0] += 2 * 86400
+        store.write("new", sample_df, {})
+        assert not store.has("old")
+        assert set(store.list_all()) == {"new"}
+
+    def test_batch_commits_once(self, store, sample_df, monkeypatch):
+        commits = []
+        original = store._commit
+        monkeypatch.setattr(
+            store, "_commit", lambda rows: (commits.append(len(rows)), original(rows))
+        )
+        with store.batch():
+            for i in range(5):
+                store.write(f"k{i}", sample_df, {"i": i})
+            assert store.get_metadata("k0") == {}
+        assert commits == [5]
+        assert store.get_metadata("k3") == {"i": 3}
+        assert store.read("k3") is not None
+
+    def test_batch_files_stay_temporary_until_commit(self, store, sample_df):
+        with store.batch():
+            store.write("k", sample_df, {"type": "strategy"})
+            # A process dying here leaves only a temporary file behind
+            assert not store.has("k")
+            assert any(f.endswith(".parquet.tmp") for f in os.listdir(store._dir))
+        assert store.has("k")
+        assert not any(f.endswith(".tmp") for f in os.listdir(store._dir))
+
+    def test_commit_removes_abandoned_temp_files(self, store, sample_df):
+        store.write("a", sample_df, {})
+        stale = os.path.join(store._dir, "dead.parquet.tmp")
+        fresh = os.path.join(store._dir, "live.parquet.tmp")
+        for path in (stale, fresh):
+            sample_df.to_parquet(path)
+        old = time.time() - 2 * result_store._STALE_TMP_S
+        os.utime(stale, (old, old))
+        store.write("b", sample_df, {})
+        assert not os.path.exists(stale)
+        assert os.path.exists(fresh)
+
+    def test_batch_commits_on_error(self, store, sample_df):
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.write("k", sample_df, {"type": "strategy"})
+                raise RuntimeError("scan failed")
+        assert store.get_metadata("k") == {"type": "strategy"}
+
+    def test_readers_do_not_wait_for_writers(self, store, sample_df):
+        store.write("abc123", sample_df, {"type": "strategy"})
+        writer = sqlite3.connect(store._index_path(), isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            start = time.monotonic()
+            assert store.list_all() == {"abc123": {"type": "strategy"}}
+            assert store.read("abc123") is not None
+            assert time.monotonic() - start < 1.0
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+    def test_imports_legacy_json_index(self, tmp_path, sample_df):
+        results_dir = tmp_path / "results"
+        results_dir.mkdir()
+        sample_df.to_parquet(results_dir / "abc123.parquet", index=False)
+        (results_dir / "_index.json").write_text(
+            json.dumps({"abc123": {"type": "strategy"}, "gone": {"type": "strategy"}})
+        )
+        store = ResultStore(results_dir=str(results_dir))
+        assert store.list_all() == {"abc123": {"type": "strategy"}}
+        assert not (results_dir / "_index.json").exists()
+
+    def test_write_rebuilds_corrupt_index(self, store, sample_df):
+        store.write("abc123", sample_df, {"type": "strategy"})
+        with open(store._index_path(), "w") as f:
+            f.write("not valid json{{{")
+        store.write("def456", sample_df, {"type": "simulation"})
+        # Entries whose metadata was lost stay tracked for eviction
+        assert store.list_all() == {"abc123": {}, "def456": {"type": "simulation"}}
+
+    def test_max_bytes_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPTOPSY_RESULTS_MAX_MB", "1.5")
+        assert ResultStore(results_dir=str(tmp_path))._max_bytes == int(1.5 * 2**20)
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            ResultStore(results_dir=str(tmp_path), max_bytes=0)
+
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame(
+        {
+            "quote_date_entry": pd.date_range("2024-01-01", periods=5),
+            "strike": [100, 105, 110, 115, 120],
+            "pct_change": [-0.5, 0.25, None, 1.0, 0.5],
+        }
+    )
+
+
+class TestResultSummary:
+    def test_summary_recorded_on_write(self, store, raw_df):
+        store.write("raw", raw_df, {"type": "strategy"})
+        summary = store.get_summary("raw")
+        assert summary["rows"] == 5
+        assert summary["columns"]["strike"] == "int64"
+        assert summary["stats"] == {
+            "count": 4,
+            "mean_return": 0.3125,
+            "std": 0.6250,
+            "win_rate": 0.75,
+            "profit_factor": 3.5,
+        }
+        assert summary["quantiles"]["min"] == -0.5
+        assert summary["quantiles"]["max"] == 1.0
+        assert summary["date_span"] == ["2024-01-01T00:00:00", "2024-01-05T00:00:00"]
+        assert summary["row_groups"] == 1
+        assert summary["column_stats"]["strike"] == {"min": 100, "max": 120, "nulls": 0}
+        assert summary["column_stats"]["pct_change"]["nulls"] == 1
+        assert store.list_summaries() == {"raw": summary}
+
+    def test_stats_match_result_summary(self, store, sample_df, raw_df):
+        for key, df in (
+            ("agg", sample_df.rename(columns={"mean_return": "mean"})),
+            ("raw", raw_df),
+        ):
+            store.write(key, df, {})
+            expected = _make_result_summary("long_calls", df, {})
+            from_store = _make_result_summary(
+                "long_calls", None, {}, stats=store.get_summary(key)["stats"]
+            )
+            assert from_store == expected
+
+    def test_summary_missing(self, store, sample_df):
+        assert store.get_summary("nonexistent") == {}
+        store.write("abc123", sample_df, {})
+        store.clear("abc123")
+        assert store.list_summaries() == {}
+
+    def test_read_columns_and_filters(self, store, raw_df):
+        store.write("raw", raw_df, {})
+        df = store.read("raw", columns=["strike"], filters=[("pct_change", ">", 0.3)])
+        assert list(df.columns) == ["strike"]
+        assert list(df["strike"]) == [115, 120]
+
+    def test_adds_summary_column_to_existing_index(self, tmp_path, sample_df):
+        results_dir = tmp_path / "results"
+        results_dir.mkdir()
+        sample_df.to_parquet(results_dir / "old.parquet", index=False)
+        with sqlite3.connect(results_dir / "_index.sqlite") as conn:
+            conn.execute(
+                "CREATE TABLE results (key TEXT PRIMARY KEY, metadata TEXT NOT NULL, "
+                "bytes INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("INSERT INTO results VALUES ('old', '{}', 1, 0, 0)")
+        conn.close()
+        store = ResultStore(results_dir=str(results_dir))
+        assert store.get_summary("old") == {}
+        # Results stored without a summary still report their columns
+        assert store.dtypes("old") == {
+            "strategy": "str",
+            "mean_return": "float64",
+            "count": "int64",
+        }
+        store.write("new", sample_df, {})
+        assert store.get_summary("new")["rows"] == 2
+
+
 # ---------------------------------------------------------------------------
 # _cached_run helper tests
 # ---------------------------------------------------------------------------
@@ -325,6 +536,53 @@ class TestQueryResults:
         )
         assert "1 rows" in result.llm_summary
 
+    def test_list_mode_global_store_shows_summary(self, store, raw_df):
+        store.write("raw", raw_df, {"type": "strategy", "display_key": "long_calls"})
+        result = execute_tool("query_results", {}, None, results={})
+        assert "long_calls (strategy)" in result.llm_summary
+        assert "mean=0.3125" in result.llm_summary
+        assert "2024-01-01 to 2024-01-05" in result.llm_summary
+
+    def test_query_numeric_filter_pushed_down(self, stored_result, monkeypatch):
+        results, store = stored_result
+        calls = []
+        original = ResultStore.read
+
+        def _read(self, key, columns=None, filters=None):
+            calls.append((columns, filters))
+            return original(self, key, columns=columns, filters=filters)
+
+        monkeypatch.setattr(ResultStore, "read", _read)
+        result = execute_tool(
+            "query_results",
+            {
+                "result_key": "long_calls:dte=45,exit=0,otm=0.50,slip=mid",
+                "columns": ["strategy", "count"],
+                "filter_column": "count",
+                "filter_op": "gte",
+                "filter_value": "60",
+            },
+            None,
+            results=results,
+        )
+        assert "1 rows" in result.llm_summary
+        assert calls == [(["strategy", "count"], [("count", ">=", 60)])]
+
+    def test_query_contains_filter_in_memory(self, stored_result):
+        results, store = stored_result
+        result = execute_tool(
+            "query_results",
+            {
+                "result_key": "long_calls:dte=45,exit=0,otm=0.50,slip=mid",
+                "filter_column": "strategy",
+                "filter_op": "contains",
+                "filter_value": "PUTS",
+            },
+            None,
+            results=results,
+        )
+        assert "1 rows" in result.llm_summary
+
     def test_query_columns(self, stored_result):
         results, store = stored_result
         key = "long_calls:dte=45,exit=0,otm=0.50,slip=mid"
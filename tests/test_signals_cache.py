@@ -0,0 +1,177 @@
+"""Tests for the shared per-symbol indicator cache (optopsy.signals._cache)."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pandas_ta_classic as ta
+import pytest
+
+from optopsy.data import fingerprint as fp_module
+from optopsy.data.fingerprint import remember
+from optopsy.signals import (
+    _cache,
+    cmo_above,
+    cmo_below,
+    ppo_cross_above,
+    roc_above,
+    rsi_below,
+    signal,
+    signal_dates,
+    sma_above,
+    sustained,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2023-01-02", periods=300)
+    return pd.DataFrame(
+        {
+            "underlying_symbol": np.repeat(["AAA", "BBB", "CCC"], len(dates)),
+            "quote_date": np.tile(dates, 3),
+            "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 3 * len(dates)))),
+        }
+    )
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """Count calls of ``ta.<name>`` per indicator name.
+
+    Counted indicators take the per-symbol path; the whole-frame ones in
+    ``_vectorized`` never call pandas_ta.
+    """
+    calls: dict[str, int] = {}
+
+    def _count(name):
+        original = getattr(ta, name)
+
+        def _wrapper(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(ta, name, _wrapper)
+
+    for name in ("rsi", "sma", "cmo", "roc", "ppo"):
+        _count(name)
+    return calls
+
+
+def _composed():
+    return (
+        signal(cmo_below(14, 40))
+        & signal(cmo_above(14, -40))
+        & signal(sustained(roc_above(10), days=3))
+    )
+
+
+class TestComposedSignals:
+    def test_each_indicator_computed_once_per_symbol(self, prices, counted):
+        signal_dates(prices, _composed())
+        assert counted == {"cmo": 3, "roc": 3}
+
+    def test_one_groupby_pass(self, prices, monkeypatch):
+        groupbys = []
+        original = pd.DataFrame.groupby
+
+        def _groupby(self, by=None, *args, **kwargs):
+            groupbys.append(by)
+            return original(self, by, *args, **kwargs)
+
+        monkeypatch.setattr(pd.DataFrame, "groupby", _groupby)
+        signal_dates(prices, _composed())
+        assert groupbys.count("underlying_symbol") == 1
+
+    def test_matches_uncached(self, prices, monkeypatch):
+        cached = signal_dates(prices, _composed())
+        cached_again = signal_dates(prices, _composed())
+        monkeypatch.setenv("OPTOPSY_INDICATOR_CACHE_MB", "0")
+        _cache.clear()
+        uncached = signal_dates(prices, _composed())
+        pd.testing.assert_frame_equal(cached, uncached)
+        pd.testing.assert_frame_equal(cached_again, uncached)
+
+    def test_loaded_data_reused_across_calls(self, prices, counted):
+        remember(prices, dataset="prices@1")
+        signal_dates(prices, ppo_cross_above())
+        signal_dates(prices, ppo_cross_above())
+        assert counted == {"ppo": 3}
+        signal_dates(prices, ppo_cross_above(fast=5))
+        assert counted == {"ppo": 6}
+
+    def test_caller_frames_not_kept_across_calls(self, prices, counted):
+        signal_dates(prices, ppo_cross_above())
+        signal_dates(prices, ppo_cross_above())
+        assert counted == {"ppo": 6}
+        assert not _cache._indicators
+
+    def test_cache_hits_never_hash(self, prices, monkeypatch):
+        def _fail(df):
+            raise AssertionError("frame was hashed")
+
+        monkeypatch.setattr(fp_module, "_content_hash", _fail)
+        signal_dates(prices, _composed())
+        _composed()(prices)
+        signal_dates(remember(prices, dataset="prices@1"), _composed())
+        signal_dates(prices, _composed())
+
+    def test_changed_data_recomputed(self, prices, counted):
+        sig = cmo_below(14, 40)
+        before = sig(prices)
+        changed = prices.assign(close=prices["close"][::-1].to_numpy())
+        after = sig(changed)
+        assert counted == {"cmo": 6}
+        assert not before.equals(after)
+
+    def test_in_place_edit_recomputed(self, prices):
+        sig = sma_above(5)
+        sig(prices)
+        prices.loc[30:, "close"] = prices["close"].iloc[30:] * 1.5
+        pd.testing.assert_series_equal(sig(prices), sig(prices.copy()))
+
+    def test_same_content_other_index(self, prices):
+        sig = rsi_below(14, 40)
+        expected = sig(prices)
+        shifted = prices.set_axis(prices.index + 1000)
+        pd.testing.assert_series_equal(
+            sig(shifted), expected.set_axis(shifted.index), check_names=False
+        )
+
+
+class TestCacheBudget:
+    def test_evicts_beyond_budget(self, prices, monkeypatch):
+        # Roughly two symbols' worth of one float indicator
+        monkeypatch.setenv("OPTOPSY_INDICATOR_CACHE_MB", str(2 * 300 * 8 / 2**20))
+        cmo_below()(remember(prices, dataset="prices@1"))
+        assert len(_cache._indicators) == 2
+        assert _cache._indicator_bytes <= 2 * 300 * 8
+
+    def test_disabled(self, prices, monkeypatch, counted):
+        monkeypatch.setenv("OPTOPSY_INDICATOR_CACHE_MB", "0")
+        cmo_below()(prices)
+        cmo_above()(prices)
+        assert counted == {"cmo": 6}
+        assert not _cache._indicators
+
+
+class TestChartTraces:
+    def test_chart_indicators_share_cache(self, prices, counted):
+        from optopsy.ui.tools._indicators import add_rsi_traces, add_sma_trace
+
+        close = prices["close"].iloc[:300]
+        dates = prices["quote_date"].iloc[:300]
+        fig, go = MagicMock(), MagicMock()
+        with _cache.evaluation():
+            for _ in range(2):
+                add_rsi_traces(fig, go, dates, close, {"type": "rsi"}, row=2)
+                add_sma_trace(fig, go, dates, close, {"type": "sma", "period": 50})
+        assert counted == {"rsi": 1, "sma": 1}
@@ -0,0 +1,305 @@
+"""Tests for signal expression trees (optopsy.signals._expr)."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import optopsy.signals as signals
+from optopsy.signals import (
+    Signal,
+    _cache,
+    and_signals,
+    day_of_week,
+    or_signals,
+    rsi_below,
+    signal,
+    sma_above,
+    sustained,
+)
+from optopsy.signals._expr import And, Leaf, Sustained, optimize
+from optopsy.signals._helpers import FRAME, ROW, SYMBOL
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(11)
+    dates = pd.bdate_range("2023-01-02", periods=250)
+    symbols = ["AAA", "BBB", "CCC"]
+    return pd.DataFrame(
+        {
+            "underlying_symbol": np.repeat(symbols, len(dates)),
+            "quote_date": np.tile(dates, len(symbols)),
+            "close": 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 3 * len(dates)))),
+        }
+    )
+
+
+def _counting(func, calls):
+    """*func*, of unknown scope, recording the rows it is called with."""
+
+    def _signal(data):
+        calls.append(len(data))
+        return func(data)
+
+    return _signal
+
+
+def _closure_sustained(func, days):
+    """``sustained()`` as it was before expression trees, for reference."""
+
+    def _signal(data):
+        return signals._groupby_symbol(
+            data,
+            lambda g: func(g).astype(int).rolling(days).min().fillna(0).astype(bool),
+        )
+
+    return _signal
+
+
+class TestOptimize:
+    def test_duplicates_evaluated_once(self, prices):
+        calls = []
+        leaf = _counting(rsi_below(14, 45), calls)
+        sig = signal(leaf) & signal(sma_above(20)) & signal(leaf)
+        sig(prices)
+        assert calls == [len(prices)]
+
+    def test_named_duplicates_merged(self):
+        a = signal("rsi_below", threshold=40)
+        b = signal("rsi_below", period=14, threshold=40)
+        plan = optimize((a & signal("sma_above", period=20) & b).node)
+        assert isinstance(plan, And)
+        assert len(plan.children) == 2
+
+    def test_commutative_keys(self):
+        a, b = signal("sma_above", period=20), signal("rsi_below")
+        assert (a & b).node.key == (b & a).node.key
+        assert (a & b).node.key != (a | b).node.key
+
+    def test_nested_sustained_fused(self):
+        plan = optimize(sustained(sustained(rsi_below(), 3), 4).node)
+        assert isinstance(plan, Sustained)
+        assert plan.days == 6
+        assert isinstance(plan.child, Leaf)
+
+    def test_and_keeps_longest_window(self):
+        inner = signal("rsi_below")
+        plan = optimize(and_signals(sustained(inner, 3), sustained(inner, 5)).node)
+        assert isinstance(plan, Sustained)
+        assert plan.days == 5
+
+    def test_or_keeps_shortest_window(self):
+        inner = signal("rsi_below")
+        plan = optimize(or_signals(sustained(inner, 3), sustained(inner, 5)).node)
+        assert isinstance(plan, Sustained)
+        assert plan.days == 3
+
+    def test_and_of_equal_windows_fused(self):
+        plan = optimize(
+            and_signals(
+                sustained(signal("rsi_below"), 3),
+                sustained(signal("sma_above", period=20), 3),
+            ).node
+        )
+        assert isinstance(plan, Sustained)
+        assert isinstance(plan.child, And)
+
+    def test_cheap_children_first(self):
+        plan = optimize(
+            (
+                signal(lambda d: d["close"] > 0)
+                & signal("sma_above", period=20)
+                & signal("day_of_week", days=[0])
+            ).node
+        )
+        assert [child.scope for child in plan.children] == [ROW, SYMBOL, FRAME]
+
+
+class TestShortCircuit:
+    def test_and_skips_when_cheap_side_false(self, prices):
+        calls = []
+        never = signal(lambda d: pd.Series(False, index=d.index))
+        never.node.func.signal_scope = ROW
+        (never & signal(_counting(rsi_below(), calls)))(prices)
+        assert calls == []
+
+    def test_or_skips_when_cheap_side_true(self, prices):
+        calls = []
+        always = signal(lambda d: pd.Series(True, index=d.index))
+        always.node.func.signal_scope = ROW
+        assert (always | signal(_counting(rsi_below(), calls)))(prices).all()
+        assert calls == []
+
+    def test_symbol_scope_sees_active_symbols_only(self, prices, monkeypatch):
+        seen = []
+        sma = sma_above(20)
+
+        def _tracked(data):
+            seen.append(sorted(data["underlying_symbol"].unique()))
+            return sma(data)
+
+        monkeypatch.setattr(_tracked, "signal_scope", SYMBOL, raising=False)
+        only_aaa = signal(lambda d: d["underlying_symbol"] == "AAA")
+        only_aaa.node.func.signal_scope = ROW
+        result = (only_aaa & signal(_tracked))(prices)
+        assert seen == [["AAA"]]
+        expected = (prices["underlying_symbol"] == "AAA") & sma(prices)
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+    def test_partial_leaves_never_hash(self, prices, monkeypatch):
+        from optopsy.data import fingerprint as fp_module
+
+        def _fail(df):
+            raise AssertionError("frame was hashed")
+
+        monkeypatch.setattr(fp_module, "_content_hash", _fail)
+        only_aaa = signal(lambda d: d["underlying_symbol"] == "AAA")
+        only_aaa.node.func.signal_scope = ROW
+        composed = only_aaa & signal(sma_above(20)) & signal(rsi_below(14, 60))
+        expected = (
+            (prices["underlying_symbol"] == "AAA")
+            & sma_above(20)(prices)
+            & rsi_below(14, 60)(prices)
+        )
+        pd.testing.assert_series_equal(composed(prices), expected, check_names=False)
+
+
+class TestParity:
+    """Optimised trees equal the nested closures they replace."""
+
+    @pytest.mark.parametrize(
+        "build, reference",
+        [
+            (
+                lambda: signal(day_of_week(0, 2)) & signal(rsi_below(14, 50)),
+                lambda d: day_of_week(0, 2)(d) & rsi_below(14, 50)(d),
+            ),
+            (
+                lambda: or_signals(
+                    day_of_week(4), sustained(sma_above(20), 3), rsi_below(14, 35)
+                ),
+                lambda d: (
+                    day_of_week(4)(d)
+                    | _closure_sustained(sma_above(20), 3)(d)
+                    | rsi_below(14, 35)(d)
+                ),
+            ),
+            (
+                lambda: sustained(
+                    and_signals(sustained(sma_above(20), 2), day_of_week(0, 1, 2, 3)),
+                    2,
+                ),
+                lambda d: _closure_sustained(
+                    lambda g: (
+                        _closure_sustained(sma_above(20), 2)(g)
+                        & day_of_week(0, 1, 2, 3)(g)
+                    ),
+                    2,
+                )(d),
+            ),
+            (
+                lambda: and_signals(
+                    sustained(rsi_below(14, 55), 2),
+                    sustained(sma_above(10), 2),
+                    sustained(rsi_below(14, 55), 4),
+                ),
+                lambda d: (
+                    _closure_sustained(rsi_below(14, 55), 2)(d)
+                    & _closure_sustained(sma_above(10), 2)(d)
+                    & _closure_sustained(rsi_below(14, 55), 4)(d)
+                ),
+            ),
+        ],
+    )
+    def test_matches_closures(self, prices, build, reference):
+        data = prices.sort_values(["quote_date", "underlying_symbol"])
+        pd.testing.assert_series_equal(
+            build()(data), reference(data), check_names=False
+        )
+
+    def test_sustained_unscoped_function_per_symbol(self, prices):
+        # A function of unknown scope sees one symbol at a time, as before
+        def _first_rows(data):
+            return pd.Series(np.arange(len(data)) < 100, index=data.index)
+
+        result = sustained(_first_rows, 5)(prices)
+        pd.testing.assert_series_equal(
+            result, _closure_sustained(_first_rows, 5)(prices), check_names=False
+        )
+
+
+class TestSerialization:
+    def test_round_trip(self, prices):
+        sig = sustained(
+            signal("rsi_below", threshold=40) | signal("day_of_week", days=[0, 4]),
+            days=2,
+        )
+        spec = json.loads(json.dumps(sig.to_dict()))
+        assert spec == {
+            "sustained": {
+                "or": [
+                    {"signal": "rsi_below", "params": {"period": 14, "threshold": 40}},
+                    {"signal": "day_of_week", "params": {"days": [0, 4]}},
+                ]
+            },
+            "days": 2,
+        }
+        rebuilt = Signal.from_dict(spec)
+        assert rebuilt.node.key == sig.node.key
+        pd.testing.assert_series_equal(rebuilt(prices), sig(prices))
+
+    def test_unnamed_leaf_not_serialisable(self):
+        with pytest.raises(ValueError, match="Cannot serialise"):
+            (signal("rsi_below") & signal(sma_above(20))).to_dict()
+
+    @pytest.mark.parametrize(
+        "spec, match",
+        [
+            ({"signal": "no_such_signal"}, "Unknown signal"),
+            ({"signal": "signal_dates"}, "Unknown signal"),
+            ({"signal": "rsi_below", "params": {"bogus": 1}}, "Invalid parameters"),
+            ({"sustained": {"signal": "rsi_below"}, "days": 0}, "days must be"),
+            ({"xor": []}, "Unknown signal expression"),
+        ],
+    )
+    def test_invalid_spec(self, spec, match):
+        with pytest.raises(ValueError, match=match):
+            Signal.from_dict(spec)
+
+    def test_repr_shows_tree(self):
+        sig = sustained(signal("rsi_below") & signal("sma_above", period=20), 3)
+        assert repr(sig) == (
+            "Signal(sustained((rsi_below(period=14, threshold=30) & "
+            "sma_above(period=20)), days=3))"
+        )
+
+
+class TestBuildSignalPlans:
+    def test_plan_reused(self, prices):
+        from optopsy.ui.tools import _signals_builder
+
+        _signals_builder._plans.clear()
+        tree = {
+            "or": [
+                {"signal": "rsi_below", "params": {"threshold": 40}},
+                {
+                    "sustained": {"signal": "sma_above", "params": {"period": 20}},
+                    "days": 3,
+                },
+            ]
+        }
+        first = _signals_builder._compiled_signal(tree)
+        again = _signals_builder._compiled_signal(json.loads(json.dumps(tree)))
+        assert again is first
+        assert len(_signals_builder._plans) == 1
+        expected = rsi_below(14, 40)(prices) | sustained(sma_above(20), 3)(prices)
+        pd.testing.assert_series_equal(first(prices), expected, check_names=False)
@@ -0,0 +1,246 @@
+"""Tests for whole-frame indicator evaluation (optopsy.signals._vectorized)."""
+
+import numpy as np
+import pandas as pd
+import pandas_ta_classic as ta
+import pytest
+
+import optopsy.signals as signals
+from optopsy.data.fingerprint import remember
+from optopsy.signals import _cache, _vectorized
+from optopsy.signals._helpers import (
+    _band_signal,
+    _crossover_signal,
+    _per_symbol_signal,
+)
+from optopsy.signals.momentum import _compute_rsi, _macd_lines
+from optopsy.signals.overlap import _ema_lines
+from optopsy.signals.volatility import _bb_bands, _compute_atr, _donchian_bands
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+@pytest.fixture
+def ohlc():
+    """Symbols of very different lengths and price levels, with gaps.
+
+    ``BBB`` is shorter than most indicator windows, ``CCC`` has enough rows
+    for the MACD line but not its signal line, and ``DDD`` has high == low.
+    """
+    rng = np.random.default_rng(3)
+    parts = []
+    for i, (symbol, n) in enumerate(
+        [("AAA", 400), ("BBB", 8), ("CCC", 30), ("DDD", 250), ("EEE", 60)]
+    ):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n))) * 10**i
+        high = close * (1 + rng.uniform(0, 0.02, n))
+        low = close * (1 - rng.uniform(0, 0.02, n))
+        if symbol == "DDD":
+            high, low = close.copy(), close.copy()
+        parts.append(
+            pd.DataFrame(
+                {
+                    "underlying_symbol": symbol,
+                    "quote_date": pd.bdate_range("2022-01-03", periods=n),
+                    "close": close,
+                    "high": high,
+                    "low": low,
+                }
+            )
+        )
+    data = pd.concat(parts, ignore_index=True)
+    data.loc[17, "close"] = np.nan
+    data.loc[500, "high"] = np.nan
+    return data
+
+
+def _layouts(data):
+    """The frame sorted by symbol, interleaved by date, and with missing symbols."""
+    interleaved = data.sort_values(["quote_date", "underlying_symbol"])
+    missing = interleaved.copy()
+    missing.loc[missing.index[:5], "underlying_symbol"] = None
+    return {"sorted": data, "interleaved": interleaved, "missing": missing}
+
+
+def _per_symbol(data, compute):
+    """Reference: *compute* per symbol with pandas_ta, NaN where it gives None."""
+    out = pd.Series(np.nan, index=data.index)
+    for _, group in data.groupby("underlying_symbol"):
+        value = compute(group)
+        if value is not None:
+            out.loc[group.index] = value
+    return out
+
+
+def _column(result, i):
+    return None if result is None else result.iloc[:, i]
+
+
+def _vectorized_indicator(data, compute):
+    frame, segs, _ = _vectorized.split(data)
+    close = frame["close"].astype(float)
+    return compute(frame, segs, close).reindex(data.index)
+
+
+class TestIndicatorParity:
+    @pytest.mark.parametrize(
+        "name, reference, vectorized",
+        [
+            (
+                "sma",
+                lambda g: ta.sma(g["close"], length=20),
+                lambda f, s, c: _vectorized.sma(c, s, 20),
+            ),
+            (
+                "ema",
+                lambda g: ta.ema(g["close"], length=12),
+                lambda f, s, c: _vectorized.ema(c, s, 12),
+            ),
+            (
+                "rsi",
+                lambda g: ta.rsi(g["close"], length=14),
+                lambda f, s, c: _vectorized.rsi(c, s, 14),
+            ),
+            (
+                "macd_signal",
+                # pandas_ta raises when the signal line cannot warm up
+                lambda g: _column(ta.macd(g["close"]), 2) if len(g) >= 34 else None,
+                lambda f, s, c: _vectorized.macd(c, s, 12, 26, 9)[1],
+            ),
+            (
+                "bbands_upper",
+                lambda g: _column(ta.bbands(g["close"], length=20, std=2.0), 2),
+                lambda f, s, c: _vectorized.bbands(c, s, 20, 2.0)[0],
+            ),
+            (
+                "atr",
+                lambda g: ta.atr(g["high"], g["low"], g["close"], length=14),
+                lambda f, s, c: _vectorized.atr(
+                    f["high"].astype(float), f["low"].astype(float), c, s, 14
+                ),
+            ),
+            (
+                "donchian_lower",
+                lambda g: _column(ta.donchian(g["high"], g["low"], 5, 20), 0),
+                lambda f, s, c: _vectorized.donchian(
+                    f["high"].astype(float), f["low"].astype(float), s, 5, 20
+                )[1],
+            ),
+        ],
+    )
+    def test_matches_pandas_ta(self, ohlc, name, reference, vectorized):
+        data = ohlc.sort_values(["quote_date", "underlying_symbol"])
+        expected = _per_symbol(data, reference)
+        result = _vectorized_indicator(data, vectorized)
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+class TestSignalParity:
+    """Whole-frame signals equal the per-symbol path they replace."""
+
+    @pytest.mark.parametrize(
+        "fast, per_symbol",
+        [
+            (
+                signals.sma_above(20),
+                _per_symbol_signal(lambda p: ta.sma(p, length=20), lambda p, s: p > s),
+            ),
+            (
+                signals.rsi_below(14, 40),
+                _per_symbol_signal(lambda p: _compute_rsi(p, 14), lambda _, r: r < 40),
+            ),
+            (
+                signals.ema_cross_below(3, 12),
+                _crossover_signal(_ema_lines(3, 12), above=False),
+            ),
+            (
+                signals.macd_cross_above(5, 10, 4),
+                _crossover_signal(_macd_lines(5, 10, 4), above=True),
+            ),
+            (
+                signals.bb_above_upper(20, 1.0),
+                _band_signal(_bb_bands(20, 1.0), above=True),
+            ),
+            (
+                signals.donchian_below_lower(5, 20),
+                _band_signal(_donchian_bands(5, 20), above=False),
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("layout", ["sorted", "interleaved", "missing"])
+    def test_matches_per_symbol(self, ohlc, fast, per_symbol, layout):
+        data = _layouts(ohlc)[layout]
+        result = fast(data)
+        assert result.index.equals(data.index)
+        pd.testing.assert_series_equal(result, per_symbol(data))
+
+    @pytest.mark.parametrize("above", [True, False])
+    def test_atr_regime(self, ohlc, above):
+        data = _layouts(ohlc)["interleaved"]
+        expected = pd.Series(False, index=data.index)
+        for _, group in data.groupby("underlying_symbol"):
+            atr = _compute_atr(group["close"], 14, group["high"], group["low"])
+            median = atr.median()
+            if pd.notna(median):
+                cmp = atr > 1.1 * median if above else atr < 1.1 * median
+                expected.loc[group.index] = cmp.fillna(False)
+        sig = signals.atr_above(14, 1.1) if above else signals.atr_below(14, 1.1)
+        pd.testing.assert_series_equal(sig(data), expected)
+
+    def test_close_only(self, ohlc):
+        data = ohlc.drop(columns=["high", "low"])
+        per_symbol = _band_signal(_donchian_bands(5, 20), above=False)
+        pd.testing.assert_series_equal(
+            signals.donchian_below_lower(5, 20)(data), per_symbol(data)
+        )
+        assert not signals.rsi_below()(data.drop(columns=["close"])).any()
+
+
+class TestWholeFrame:
+    def test_no_per_symbol_calls(self, ohlc, monkeypatch):
+        calls = []
+        for name in ("rsi", "sma", "macd", "ema", "bbands", "atr", "donchian"):
+            monkeypatch.setattr(ta, name, lambda *a, _n=name, **k: calls.append(_n))
+        signals.signal_dates(
+            ohlc,
+            signals.signal(signals.rsi_below(14, 40))
+            & signals.signal(signals.macd_cross_above())
+            & signals.signal(signals.bb_below_lower()),
+        )
+        assert calls == []
+
+    def test_indicator_cached_once_for_all_symbols(self, ohlc):
+        remember(ohlc, dataset="ohlc@1")
+        signals.rsi_below(14, 40)(ohlc)
+        signals.rsi_above(14, 60)(ohlc)
+        assert len(_cache._indicators) == 1
+
+    def test_macd_symbol_too_short_for_signal_line(self, ohlc):
+        # 30 rows: pandas_ta computes a MACD line but fails on its signal line
+        short = ohlc[ohlc["underlying_symbol"] == "CCC"]
+        assert not signals.macd_cross_above()(short).any()
+
+    def test_split_keeps_sorted_frame(self, ohlc):
+        frame, segs, order = _vectorized.split(ohlc)
+        assert frame is ohlc and order is None
+        assert segs.bounds.tolist() == [0, 400, 408, 438, 688, 748]
+
+    def test_split_orders_interleaved_frame(self, ohlc):
+        data = _layouts(ohlc)["missing"]
+        frame, segs, order = _vectorized.split(data)
+        assert len(frame) == len(data) - 5
+        for start, end in zip(segs.bounds[:-1], segs.bounds[1:]):
+            symbols = frame["underlying_symbol"].iloc[start:end]
+            assert symbols.nunique() == 1
+            assert symbols.index.is_monotonic_increasing
+
+    def test_segment_shift(self):
+        segs = _vectorized.Segments(np.array([0, 2, 5]))
+        shifted = _vectorized.shift(pd.Series([1.0, 2, 3, 4, 5]), segs)
+        expected = pd.Series([np.nan, 1.0, np.nan, 3, 4])
+        pd.testing.assert_series_equal(shifted, expected)
@@ -8,6 +8,7 @@ import pytest
 
 import optopsy as op
 from optopsy.simulator import (
+    ScoreSelector,
     SimulationResult,
     _build_trade_log,
     _derive_entry_date,
@@ -18,6 +19,7 @@ from optopsy.simulator import (
     _normalise_trades,
     _resolve_entry_date,
     _resolve_expiration,
+    _select_by_score,
     _select_highest_premium,
     _select_nearest,
     simulate,
@@ -592,6 +594,61 @@ class TestSelectors:
         result = simulate(data, op.long_calls, selector=my_selector)
         assert result.summary["total_trades"] == 1
 
+    def test_score_selector_matches_callable(self, multi_strike_data):
+        def widest(candidates):
+            return candidates.loc[candidates["strike"].idxmax()]
+
+        expected = simulate(multi_strike_data, op.long_calls, selector=widest)
+        result = simulate(
+            multi_strike_data,
+            op.long_calls,
+            selector=ScoreSelector("strike", highest=True),
+        )
+        pd.testing.assert_frame_equal(result.trade_log, expected.trade_log)
+
+    def test_score_selector_missing_column_raises(self, data):
+        with pytest.raises(ValueError, match="Score column 'nope'"):
+            simulate(data, op.long_calls, selector=ScoreSelector("nope"))
+
+    def test_score_selector_wrong_length_raises(self, data):
+        selector = ScoreSelector(lambda trades: trades["strike"].iloc[:0])
+        with pytest.raises(ValueError, match="one value per candidate"):
+            simulate(data, op.long_calls, selector=selector)
+
+
+class TestSelectByScore:
+    @pytest.fixture
+    def candidates(self):
+        day1, day2 = pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")
+        return pd.DataFrame(
+            {
+                "underlying_symbol": ["SPY", "SPY", "QQQ", "SPY", "SPY"],
+                "_entry_date": [day2, day2, day2, day1, day1],
+                "score": [2.0, 1.0, 5.0, float("nan"), 1.0],
+            },
+            index=[10, 11, 12, 13, 14],
+        )
+
+    def test_one_row_per_group_in_key_order(self, candidates):
+        cols = ["underlying_symbol", "_entry_date"]
+        result = _select_by_score(candidates, cols, ScoreSelector("score"))
+        # Same rows and order as the per-group fallback
+        expected = pd.DataFrame(
+            [
+                group.loc[group["score"].idxmin()]
+                for _, group in candidates.groupby(cols)
+            ]
+        )
+        assert list(result.index) == list(expected.index) == [12, 14, 11]
+
+    def test_highest_and_ties(self, candidates):
+        candidates["score"] = [1.0, 1.0, 5.0, 3.0, 3.0]
+        result = _select_by_score(
+            candidates, ["_entry_date"], ScoreSelector("score", highest=True)
+        )
+        # Ties go to the first candidate of each date
+        assert list(result.index) == [13, 12]
+
 
 # ---------------------------------------------------------------------------
 # Credit strategy P&L
@@ -818,6 +875,23 @@ class TestArgumentValidation:
         with pytest.raises(ValueError, match="multiplier"):
             simulate(data, op.long_calls, multiplier=0)
 
+    def test_zero_max_positions_per_symbol_raises(self, data):
+        with pytest.raises(ValueError, match="max_positions_per_symbol"):
+            simulate(data, op.long_calls, max_positions_per_symbol=0)
+
+    def test_bool_max_open_dollar_cost_raises(self, data):
+        with pytest.raises(ValueError, match="max_open_dollar_cost"):
+            simulate(data, op.long_calls, max_open_dollar_cost=True)
+
+    def test_selector_still_positional(self, data):
+        by_position = simulate(data, op.long_calls, 100_000.0, 1, 1, 100, "first")
+        by_keyword = simulate(data, op.long_calls, selector="first")
+        pd.testing.assert_frame_equal(by_position.trade_log, by_keyword.trade_log)
+
+    def test_position_caps_are_keyword_only(self, data):
+        with pytest.raises(TypeError):
+            simulate(data, op.long_calls, 100_000.0, 1, 1, 100, "first", 2)
+
 
 # ---------------------------------------------------------------------------
 # Empty result
@@ -1034,6 +1108,49 @@ class TestFilterTrades:
         assert filtered.iloc[0]["description"] == "t1"
         assert filtered.iloc[1]["description"] == "t3"
 
+    @staticmethod
+    def _overlapping_trades():
+        """Four trades open at once, each with its own expiration."""
+        return pd.DataFrame(
+            {
+                "entry_date": pd.to_datetime(
+                    ["2018-01-01", "2018-01-02", "2018-01-03", "2018-01-04"]
+                ),
+                "exit_date": pd.to_datetime(["2018-02-01"] * 4),
+                "expiration": pd.to_datetime(
+                    ["2018-02-02", "2018-02-09", "2018-02-16", "2018-02-23"]
+                ),
+                "underlying_symbol": ["SPX", "SPX", "QQQ", "SPX"],
+                "entry_cost": [2.0, 3.0, 1.0, -1.0],
+                "description": ["t1", "t2", "t3", "t4"],
+            }
+        )
+
+    def test_max_positions_per_symbol(self):
+        filtered = _filter_trades(
+            self._overlapping_trades(), max_positions=4, max_positions_per_symbol=1
+        )
+        assert list(filtered["description"]) == ["t1", "t3"]
+
+    def test_max_open_dollar_cost(self):
+        # Dollar cost per trade: 200, 300, 100, 100 -- t2 would exceed 500
+        filtered = _filter_trades(
+            self._overlapping_trades(),
+            max_positions=4,
+            max_open_dollar_cost=400,
+            lot_size=100,
+        )
+        assert list(filtered["description"]) == ["t1", "t3", "t4"]
+
+    def test_dollar_cost_freed_on_exit(self):
+        trades = self._overlapping_trades()
+        trades.loc[0, "exit_date"] = pd.Timestamp("2018-01-02")
+        filtered = _filter_trades(
+            trades, max_positions=4, max_open_dollar_cost=300, lot_size=100
+        )
+        # t1 closes on t2's entry date, freeing room for t2
+        assert list(filtered["description"]) == ["t1", "t2"]
+
     def test_ruin_truncation(self):
         """Build trade log stops at first trade where equity <= 0."""
         trades = pd.DataFrame(
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from optopsy.calendar import _find_calendar_exit_prices
 from optopsy.definitions import (
     calendar_spread_external_cols,
     calendar_spread_internal_cols,
@@ -1857,6 +1858,70 @@ def test_calendar_exit_dte_tolerance_zero_no_match(calendar_data):
     assert len(results) == 0
 
 
+@pytest.mark.parametrize("seed", [12, 62])
+def test_calendar_exit_prices_keep_merge_order_with_duplicate_quotes(seed):
+    """Duplicate exit quotes pair up in the order an inner merge gives them."""
+    rng = np.random.default_rng(seed)
+    expirations = pd.to_datetime(
+        ["2018-01-31", "2018-02-14", "2018-03-02", "2018-03-16"]
+    )
+    strikes = [100.0, 105.0, 110.0]
+    n = 400
+    data = pd.DataFrame(
+        {
+            "underlying_symbol": rng.choice(["SPX", "SPXW"], n),
+            "option_type": rng.choice(["call", "put"], n),
+            "expiration": rng.choice(expirations, n),
+            "quote_date": rng.choice(
+                pd.bdate_range("2018-01-01", "2018-03-20")[::3], n
+            ),
+            "strike": rng.choice(strikes, n),
+            "bid": rng.uniform(0, 5, n),
+        }
+    )
+    data["ask"] = data["bid"] + 0.1
+    m = 30
+    entries = pd.DataFrame(
+        {
+            "underlying_symbol": rng.choice(["SPX", "SPXW"], m),
+            "option_type": rng.choice(["call", "put"], m),
+            "expiration_leg1": rng.choice(expirations[:2], m),
+            "expiration_leg2": rng.choice(expirations[2:], m),
+            "strike_leg1": rng.choice(strikes, m),
+            "strike_leg2": rng.choice(strikes, m),
+        }
+    )
+
+    result = _find_calendar_exit_prices(entries.copy(), data, 7, same_strike=False)
+
+    expected = entries.assign(
+        exit_date=entries["expiration_leg1"] - pd.Timedelta(days=7)
+    )
+    for leg in (1, 2):
+        quotes = data.rename(
+            columns={
+                "quote_date": "exit_date",
+                "expiration": f"expiration_leg{leg}",
+                "strike": f"strike_leg{leg}",
+                "bid": f"exit_bid_leg{leg}",
+                "ask": f"exit_ask_leg{leg}",
+            }
+        )
+        keys = [
+            "underlying_symbol",
+            "exit_date",
+            "option_type",
+            f"expiration_leg{leg}",
+            f"strike_leg{leg}",
+        ]
+        quotes = quotes[quotes["exit_date"].isin(expected["exit_date"])]
+        expected = expected.merge(
+            quotes[keys + [f"exit_bid_leg{leg}", f"exit_ask_leg{leg}"]], on=keys
+        )
+    assert len(expected) > 1
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
 # =============================================================================
 # Duplicate Input Row Tests
 # =============================================================================
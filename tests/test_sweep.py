@@ -0,0 +1,167 @@
+"""Tests for parameter sweeps with shared pipeline stages (optopsy.sweep)."""
+
+import datetime
+import itertools
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+import optopsy as op
+import optopsy.contracts as contracts
+import optopsy.evaluation as evaluation
+from optopsy.stages import _StageCache
+from optopsy.sweep import _sweep_chain
+
+
+@pytest.fixture(scope="module")
+def sweep_chain_data(multi_strike_data):
+    """multi_strike_data plus extra quote dates so DTE/exit grids vary."""
+    frames = [multi_strike_data]
+    exit_rows = multi_strike_data[
+        multi_strike_data["quote_date"] == datetime.datetime(2018, 1, 31)
+    ]
+    for day in (10, 17, 24):
+        frames.append(exit_rows.assign(quote_date=datetime.datetime(2018, 1, day)))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _expected(data, strategy, grid, **kwargs):
+    names = list(grid)
+    frames = []
+    for point in itertools.product(*grid.values()):
+        params = dict(zip(names, point))
+        result = strategy(data, **kwargs, **params)
+        for pos, (name, value) in enumerate(params.items()):
+            result.insert(pos, name, [value] * len(result))
+        if not result.empty:
+            frames.append(result)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _assert_same(result, expected):
+    result = result.copy()
+    for col in result.select_dtypes("category").columns:
+        result[col] = result[col].astype(expected[col].dtype)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+class TestSweepResults:
+    @pytest.mark.parametrize(
+        "strategy", [op.long_calls, op.short_puts, op.long_straddles]
+    )
+    @pytest.mark.parametrize("raw", [True, False])
+    def test_single_and_straddle_match_individual_runs(
+        self, sweep_chain_data, strategy, raw
+    ):
+        grid = {"max_entry_dte": [30, 60, 90], "exit_dte": [0, 7, 14]}
+        result = op.sweep(sweep_chain_data, strategy, grid, raw=raw)
+        _assert_same(result, _expected(sweep_chain_data, strategy, grid, raw=raw))
+
+    @pytest.mark.parametrize(
+        "strategy", [op.long_call_spread, op.iron_condor, op.short_call_spread]
+    )
+    def test_multi_leg_match_individual_runs(self, sweep_chain_data, strategy):
+        grid = {"exit_dte": [0, 7, 14], "slippage": ["mid", "spread"]}
+        result = op.sweep(sweep_chain_data, strategy, grid, raw=True)
+        _assert_same(result, _expected(sweep_chain_data, strategy, grid, raw=True))
+
+    def test_early_exit_grid_matches(self, sweep_chain_data):
+        grid = {"stop_loss": [None, -0.25], "take_profit": [None, 0.10]}
+        result = op.sweep(sweep_chain_data, op.long_calls, grid, raw=True)
+        _assert_same(result, _expected(sweep_chain_data, op.long_calls, grid, raw=True))
+
+    def test_commission_grid_does_not_leak_columns(self, sweep_chain_data):
+        grid = {"commission": [0.65, None]}
+        result = op.sweep(
+            sweep_chain_data, op.short_puts, grid, raw=True, slippage="mid"
+        )
+        _assert_same(
+            result,
+            _expected(sweep_chain_data, op.short_puts, grid, raw=True, slippage="mid"),
+        )
+
+    def test_delta_target_grid(self, sweep_chain_data):
+        grid = {
+            "leg1_delta": [
+                {"target": 0.30, "min": 0.20, "max": 0.40},
+                {"target": 0.50, "min": 0.40, "max": 0.60},
+            ]
+        }
+        result = op.sweep(sweep_chain_data, op.long_calls, grid, raw=True)
+        _assert_same(result, _expected(sweep_chain_data, op.long_calls, grid, raw=True))
+
+    def test_calendar_grid_matches(self, calendar_data):
+        grid = {"exit_dte": [7, 14]}
+        result = op.sweep(calendar_data, op.long_call_calendar, grid, raw=True)
+        _assert_same(
+            result, _expected(calendar_data, op.long_call_calendar, grid, raw=True)
+        )
+
+    def test_param_columns_lead(self, sweep_chain_data):
+        result = op.sweep(
+            sweep_chain_data, op.long_calls, {"exit_dte": [0, 7]}, raw=True
+        )
+        assert result.columns[0] == "exit_dte"
+        assert set(result["exit_dte"]) <= {0, 7}
+
+    def test_all_points_empty(self, sweep_chain_data):
+        result = op.sweep(
+            sweep_chain_data, op.long_calls, {"max_entry_dte": [1, 2]}, exit_dte=0
+        )
+        assert result.empty
+        assert "max_entry_dte" in result.columns
+
+    def test_accepts_prepared_chain(self, sweep_chain_data):
+        grid = {"exit_dte": [0, 7]}
+        result = op.sweep(op.prepare(sweep_chain_data), op.short_puts, grid)
+        _assert_same(result, op.sweep(sweep_chain_data, op.short_puts, grid))
+
+
+class TestSweepSharing:
+    def test_delta_selection_computed_once_per_leg(self, sweep_chain_data):
+        grid = {"max_entry_dte": [30, 60, 90], "exit_dte": [0, 7, 14]}
+        with mock.patch.object(
+            evaluation,
+            "_select_closest_delta",
+            wraps=evaluation._select_closest_delta,
+        ) as select:
+            op.sweep(sweep_chain_data, op.long_call_spread, grid)
+        # Two legs with distinct delta targets, regardless of grid size
+        assert select.call_count == 2
+
+    def test_contract_index_built_once_per_partition(self, sweep_chain_data):
+        grid = {"max_entry_dte": [30, 60, 90], "exit_dte": [0, 7]}
+        with mock.patch.object(
+            contracts, "_ContractIndex", wraps=contracts._ContractIndex
+        ) as build:
+            op.sweep(sweep_chain_data, op.long_calls, grid)
+        assert build.call_count == 1
+
+    def test_trades_reused_across_output_params(self, sweep_chain_data):
+        chain = _sweep_chain(sweep_chain_data)
+        for raw in (True, False):
+            op.short_puts(chain, raw=raw)
+        assert chain.stages.hits >= 1
+
+    def test_plain_prepare_has_no_stage_cache(self, data):
+        assert op.prepare(data).stages is None
+        assert isinstance(_sweep_chain(data).stages, _StageCache)
+
+
+class TestSweepValidation:
+    def test_empty_grid(self, data):
+        with pytest.raises(ValueError, match="at least one parameter"):
+            op.sweep(data, op.long_calls, {})
+
+    def test_empty_values(self, data):
+        with pytest.raises(ValueError, match="no values"):
+            op.sweep(data, op.long_calls, {"exit_dte": []})
+
+    def test_grid_and_fixed_overlap(self, data):
+        with pytest.raises(ValueError, match="both in grid"):
+            op.sweep(data, op.long_calls, {"exit_dte": [0]}, exit_dte=7)
+
+    def test_invalid_params_raise(self, data):
+        with pytest.raises(ValueError):
+            op.sweep(data, op.long_calls, {"max_entry_dte": [-1]})
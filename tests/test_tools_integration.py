@@ -830,6 +830,40 @@ class TestOutputModelEnforcement:
             model = StrategyResultSummary(**core)
             assert model.strategy in ("long_calls", "short_puts")
 
+    def test_scan_strategies_parallel_matches_sequential(self, basic_dataset):
+        """scan_strategies with n_jobs produces the same leaderboard."""
+        args = {
+            "strategy_names": ["long_calls", "short_puts"],
+            "exit_dte_values": [0, 7],
+        }
+        sequential = execute_tool("scan_strategies", dict(args), basic_dataset)
+        parallel = execute_tool("scan_strategies", {**args, "n_jobs": 2}, basic_dataset)
+        pd.testing.assert_frame_equal(parallel._result_df, sequential._result_df)
+
+    def test_scan_strategies_ranks_cache_hits_from_summaries(
+        self, basic_dataset, tmp_path, monkeypatch
+    ):
+        """A repeated scan is answered from stored summaries without reads."""
+        from optopsy.data.providers import result_store
+
+        monkeypatch.setattr(result_store, "_RESULTS_DIR", str(tmp_path))
+        args = {
+            "strategy_names": ["long_calls", "short_puts"],
+            "_dataset_fingerprint": "fp",
+        }
+        first = execute_tool("scan_strategies", dict(args), basic_dataset)
+
+        def _no_read(*a, **kw):
+            raise AssertionError("parquet read on a summary hit")
+
+        monkeypatch.setattr(result_store.ResultStore, "read", _no_read)
+        again = execute_tool("scan_strategies", dict(args), basic_dataset)
+        pd.testing.assert_frame_equal(again._result_df, first._result_df)
+        # std is NaN for single-trade results, so compare as frames
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(again.results), pd.DataFrame(first.results)
+        )
+
     def test_simulate_result_validates_as_simulation_entry(self, basic_dataset):
         """Simulation results validate as SimulationResultEntry."""
         r = execute_tool(